@@ -33,7 +33,9 @@ def get_sensors_or_error(
 
     location = graphene_info.context.get_code_location(repository_selector.location_name)
     repository = location.get_repository(repository_selector.repository_name)
-    batch_loader = RepositoryScopedBatchLoader(graphene_info.context.instance, repository)
+    batch_loader = RepositoryScopedBatchLoader(
+        graphene_info.context.instance, repository, record_cache=graphene_info.context.record_cache
+    )
     sensors = repository.get_external_sensors()
     sensor_states = graphene_info.context.instance.all_instigator_state(
         repository_origin_id=repository.get_external_origin_id(),
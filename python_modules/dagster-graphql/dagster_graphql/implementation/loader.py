@@ -17,6 +17,7 @@
     ExternalAssetNode,
 )
 from dagster._core.scheduler.instigation import InstigatorState, InstigatorType
+from dagster._core.storage.shared_record_cache import SharedRecordCacheScope
 from dagster._core.workspace.context import WorkspaceRequestContext
 
 
@@ -45,9 +46,15 @@ class RepositoryScopedBatchLoader:
     cache.
     """
 
-    def __init__(self, instance: DagsterInstance, external_repository: ExternalRepository):
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        external_repository: ExternalRepository,
+        record_cache: Optional[SharedRecordCacheScope] = None,
+    ):
         self._instance = instance
         self._repository = external_repository
+        self._record_cache = record_cache
         self._data: Dict[RepositoryDataType, Dict[str, List[Any]]] = {}
         self._limits: Dict[RepositoryDataType, int] = {}
 
@@ -65,8 +72,11 @@ def _fetch(self, data_type: RepositoryDataType, limit: int) -> None:
 
         fetched: Dict[str, List[Any]] = defaultdict(list)
 
+        # instigator states are read through the record cache shared across requests, if any
+        instigator_state_source = self._record_cache or self._instance
+
         if data_type == RepositoryDataType.SCHEDULE_STATES:
-            schedule_states = self._instance.all_instigator_state(
+            schedule_states = instigator_state_source.all_instigator_state(
                 repository_origin_id=self._repository.get_external_origin_id(),
                 repository_selector_id=self._repository.selector_id,
                 instigator_type=InstigatorType.SCHEDULE,
@@ -75,7 +85,7 @@ def _fetch(self, data_type: RepositoryDataType, limit: int) -> None:
                 fetched[state.name].append(state)
 
         elif data_type == RepositoryDataType.SENSOR_STATES:
-            sensor_states = self._instance.all_instigator_state(
+            sensor_states = instigator_state_source.all_instigator_state(
                 repository_origin_id=self._repository.get_external_origin_id(),
                 repository_selector_id=self._repository.selector_id,
                 instigator_type=InstigatorType.SENSOR,
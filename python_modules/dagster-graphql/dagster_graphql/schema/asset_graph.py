@@ -821,6 +821,7 @@ def resolve_dependedBy(self, graphene_info: ResolveInfo) -> List[GrapheneAssetDe
         asset_record_loader = BatchAssetRecordLoader(
             instance=graphene_info.context.instance,
             asset_keys=[dep.downstream_asset_key for dep in depended_by_asset_nodes],
+            record_cache=graphene_info.context.record_cache,
         )
         asset_checks_loader = AssetChecksLoader(
             context=graphene_info.context,
@@ -875,6 +876,7 @@ def resolve_dependencies(self, graphene_info: ResolveInfo) -> Sequence[GrapheneA
         asset_record_loader = BatchAssetRecordLoader(
             instance=graphene_info.context.instance,
             asset_keys=[dep.upstream_asset_key for dep in self._external_asset_node.dependencies],
+            record_cache=graphene_info.context.record_cache,
         )
         asset_checks_loader = AssetChecksLoader(
             context=graphene_info.context,
@@ -953,12 +955,15 @@ def resolve_targetingInstigators(self, graphene_info) -> Sequence[GrapheneSensor
             if not job_name.startswith(ASSET_BASE_JOB_PREFIX)
         }
 
+        instigator_state_source = (
+            graphene_info.context.record_cache or graphene_info.context.instance
+        )
         results = []
         for external_sensor in external_sensors:
             if not self._sensor_targets_asset(external_sensor, asset_graph, job_names):
                 continue
 
-            sensor_state = graphene_info.context.instance.get_instigator_state(
+            sensor_state = instigator_state_source.get_instigator_state(
                 external_sensor.get_external_origin_id(),
                 external_sensor.selector_id,
             )
@@ -966,7 +971,7 @@ def resolve_targetingInstigators(self, graphene_info) -> Sequence[GrapheneSensor
 
         for external_schedule in external_schedules:
             if external_schedule.job_name in job_names:
-                schedule_state = graphene_info.context.instance.get_instigator_state(
+                schedule_state = instigator_state_source.get_instigator_state(
                     external_schedule.get_external_origin_id(),
                     external_schedule.selector_id,
                 )
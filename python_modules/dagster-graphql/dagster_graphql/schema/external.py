@@ -266,7 +266,9 @@ def __init__(
             repository_location, "repository_location", CodeLocation
         )
         check.inst_param(instance, "instance", DagsterInstance)
-        self._batch_loader = RepositoryScopedBatchLoader(instance, repository)
+        self._batch_loader = RepositoryScopedBatchLoader(
+            instance, repository, record_cache=workspace_context.record_cache
+        )
         self._stale_status_loader = StaleStatusLoader(
             instance=instance,
             asset_graph=lambda: repository.asset_graph,
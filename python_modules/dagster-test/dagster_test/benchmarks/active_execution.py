@@ -0,0 +1,121 @@
+# ruff: noqa: T201
+import argparse
+from typing import Iterator
+
+from dagster import DynamicOut, DynamicOutput, JobDefinition, job, op
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.plan.step import ExecutionStep
+from dagster._core.execution.retries import RetryMode
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the time ActiveExecution spends scheduling the steps of a large execution plan. The plan
+fans out `--num-outputs` dynamic outputs to a chain of `--num-mapped-ops` mapped ops, and collects
+the results of the last one, so it resolves to `--num-outputs * --num-mapped-ops + 2` steps. Steps
+are not executed: the events of each step are reported to the ActiveExecution as soon as the step
+is vended, one step at a time as in the in-process executor.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="active_execution",
+    description=DESC,
+)
+
+parser.add_argument("--num-outputs", type=int, default=10000, help="Number of dynamic outputs.")
+parser.add_argument(
+    "--num-mapped-ops", type=int, default=1, help="Number of ops mapped over each output."
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_job(num_outputs: int, num_mapped_ops: int) -> JobDefinition:
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(num_outputs):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def process(value):
+        return value
+
+    @op
+    def collect(values):
+        return values
+
+    @job
+    def fan_out_job():
+        mapped = emit()
+        for i in range(num_mapped_ops):
+            mapped = mapped.map(process.alias(f"process_{i}"))
+        collect(mapped.collect())
+
+    return fan_out_job
+
+
+def get_step_events(job_name: str, step: ExecutionStep, num_outputs: int) -> Iterator[DagsterEvent]:
+    for step_output in step.step_outputs:
+        mapping_keys = [str(i) for i in range(num_outputs)] if step_output.is_dynamic else [None]
+        for mapping_key in mapping_keys:
+            yield DagsterEvent(
+                DagsterEventType.STEP_OUTPUT.value,
+                job_name=job_name,
+                step_key=step.key,
+                event_specific_data=StepOutputData(
+                    StepOutputHandle(step.key, step_output.name, mapping_key)
+                ),
+            )
+    yield DagsterEvent(
+        DagsterEventType.STEP_SUCCESS.value,
+        job_name=job_name,
+        step_key=step.key,
+        event_specific_data=StepSuccessData(duration_ms=0.0),
+    )
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_outputs: int, num_mapped_ops: int) -> None:
+    job_def = get_job(num_outputs, num_mapped_ops)
+    plan = create_execution_plan(job_def)
+
+    session = ProfilingSession(
+        name="ActiveExecution",
+        experiment_settings={
+            "num_outputs": num_outputs,
+            "num_mapped_ops": num_mapped_ops,
+            "num_steps": num_outputs * num_mapped_ops + 2,
+        },
+    ).start()
+    session.log_start_message()
+
+    num_steps = 0
+    with session.logged_execution_time("Schedule all steps"):
+        with plan.start(retry_mode=RetryMode.DISABLED) as active_execution:
+            while not active_execution.is_complete:
+                step = active_execution.get_next_step()
+                assert step, "No step to execute while the plan is incomplete"
+                for event in get_step_events(job_def.name, step, num_outputs):
+                    active_execution.handle_event(event)
+                num_steps += 1
+                # the executors process skips and abandons after each step, which is also where
+                # newly resolved dynamic steps are picked up
+                assert not active_execution.get_steps_to_skip()
+                assert not active_execution.get_steps_to_abandon()
+
+    assert num_steps == num_outputs * num_mapped_ops + 2
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_outputs, args.num_mapped_ops)
@@ -0,0 +1,127 @@
+# ruff: noqa: T201
+import argparse
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
+
+from dagster import AssetsDefinition, Definitions, asset, define_asset_job
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.remote_representation.external_data import external_repository_data_from_def
+from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
+from dagster._serdes.serdes import ObjectSerializer, deserialize_value, serialize_value
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the execution time of serializing and deserializing the snapshots of a large code location
+with the compiled per-class packers against the uncompiled `pack_items` path. The code location
+contains `--num-assets` assets, each depending on the previous `--num-deps` assets, in
+`--num-jobs` asset jobs. Serialized output is checked to be identical between the two paths.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes",
+    description=DESC,
+)
+
+parser.add_argument("--num-assets", type=int, default=1000, help="Number of assets.")
+parser.add_argument(
+    "--num-deps", type=int, default=3, help="Number of upstream dependencies per asset."
+)
+parser.add_argument("--num-jobs", type=int, default=10, help="Number of asset jobs.")
+parser.add_argument("--iterations", type=int, default=5, help="Repetitions of each step.")
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_assets(num_assets: int, num_deps: int) -> List[AssetsDefinition]:
+    assets = []
+    for i in range(num_assets):
+        deps = [f"asset_{j}" for j in range(max(0, i - num_deps), i)]
+
+        @asset(name=f"asset_{i}", deps=deps, group_name=f"group_{i % 10}")
+        def _asset() -> None: ...
+
+        assets.append(_asset)
+    return assets
+
+
+@contextmanager
+def uncompiled_packers() -> Iterator[None]:
+    pack_items = ObjectSerializer.pack_items
+    ObjectSerializer.pack_items = ObjectSerializer.pack_items_uncompiled  # type: ignore
+    try:
+        yield
+    finally:
+        ObjectSerializer.pack_items = pack_items  # type: ignore
+
+
+def repeat(fn: Callable[[], object], iterations: int) -> None:
+    for _ in range(iterations):
+        fn()
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_assets: int, num_deps: int, num_jobs: int, iterations: int) -> None:
+    assets = get_assets(num_assets, num_deps)
+    jobs = [
+        define_asset_job(f"job_{i}", selection=[a.key for a in assets[i::num_jobs]])
+        for i in range(num_jobs)
+    ]
+    repository_def = Definitions(assets=assets, jobs=jobs).get_repository_def()
+    job_def = repository_def.get_job("__ASSET_JOB")
+
+    start = time.time()
+    repository_data = external_repository_data_from_def(repository_def)
+    plan_snapshot = snapshot_from_execution_plan(
+        create_execution_plan(job_def), job_def.get_job_snapshot_id()
+    )
+    print(f"Built snapshots in {time.time() - start:.4f} seconds")
+
+    with uncompiled_packers():
+        uncompiled_repository_data = serialize_value(repository_data)
+        uncompiled_plan_snapshot = serialize_value(plan_snapshot)
+    assert serialize_value(repository_data) == uncompiled_repository_data
+    assert serialize_value(plan_snapshot) == uncompiled_plan_snapshot
+
+    session = ProfilingSession(
+        name="Serdes",
+        experiment_settings={
+            "num_assets": num_assets,
+            "num_deps": num_deps,
+            "num_jobs": num_jobs,
+            "iterations": iterations,
+            "ExternalRepositoryData size": len(uncompiled_repository_data),
+            "ExecutionPlanSnapshot size": len(uncompiled_plan_snapshot),
+        },
+    ).start()
+    session.log_start_message()
+
+    with uncompiled_packers():
+        with session.logged_execution_time("Serialize ExternalRepositoryData (uncompiled)"):
+            repeat(lambda: serialize_value(repository_data), iterations)
+        with session.logged_execution_time("Serialize ExecutionPlanSnapshot (uncompiled)"):
+            repeat(lambda: serialize_value(plan_snapshot), iterations)
+
+    with session.logged_execution_time("Serialize ExternalRepositoryData (compiled)"):
+        repeat(lambda: serialize_value(repository_data), iterations)
+    with session.logged_execution_time("Serialize ExecutionPlanSnapshot (compiled)"):
+        repeat(lambda: serialize_value(plan_snapshot), iterations)
+
+    with session.logged_execution_time("Deserialize ExternalRepositoryData"):
+        repeat(lambda: deserialize_value(uncompiled_repository_data), iterations)
+    with session.logged_execution_time("Deserialize ExecutionPlanSnapshot"):
+        repeat(lambda: deserialize_value(uncompiled_plan_snapshot), iterations)
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_assets, args.num_deps, args.num_jobs, args.iterations)
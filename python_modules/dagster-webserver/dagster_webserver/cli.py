@@ -16,6 +16,10 @@
 )
 from dagster._cli.workspace.cli_target import WORKSPACE_TARGET_WARNING, ClickArgValue
 from dagster._core.instance import InstanceRef
+from dagster._core.storage.shared_record_cache import (
+    DEFAULT_SHARED_RECORD_CACHE_MAX_ENTRIES,
+    SharedRecordCache,
+)
 from dagster._core.telemetry import START_DAGSTER_WEBSERVER, log_action
 from dagster._core.telemetry_upload import uploading_logging_thread
 from dagster._core.workspace.context import IWorkspaceProcessContext
@@ -178,6 +182,24 @@ def create_dagster_webserver_cli():
     default=2000,
     show_default=True,
 )
+@click.option(
+    "--record-cache-ttl-seconds",
+    help=(
+        "Cache asset records, run records, and schedule and sensor states across requests for up"
+        " to this many seconds, or until new events or state changes are written to storage."
+        " Set to 0 to disable the cache."
+    ),
+    type=click.FLOAT,
+    default=0,
+    show_default=True,
+)
+@click.option(
+    "--record-cache-max-entries",
+    help="The maximum number of records held by the cross-request record cache.",
+    type=click.INT,
+    default=DEFAULT_SHARED_RECORD_CACHE_MAX_ENTRIES,
+    show_default=True,
+)
 @click.version_option(version=__version__, prog_name="dagster-webserver")
 def dagster_webserver(
     host: str,
@@ -193,6 +215,8 @@ def dagster_webserver(
     code_server_log_level: str,
     instance_ref: Optional[str],
     live_data_poll_rate: int,
+    record_cache_ttl_seconds: float,
+    record_cache_max_entries: int,
     **kwargs: ClickArgValue,
 ):
     if suppress_warnings:
@@ -221,6 +245,15 @@ def dagster_webserver(
             read_only=read_only,
             kwargs=kwargs,
             code_server_log_level=code_server_log_level,
+            shared_record_cache=(
+                SharedRecordCache(
+                    instance,
+                    ttl_seconds=record_cache_ttl_seconds,
+                    max_entries=record_cache_max_entries,
+                )
+                if record_cache_ttl_seconds > 0
+                else None
+            ),
         ) as workspace_process_context:
             host_dagster_ui_with_workspace_process_context(
                 workspace_process_context,
@@ -1,10 +1,15 @@
-from typing import TYPE_CHECKING, Mapping
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.remote_representation.external_data import (
     ExternalRepositoryData,
+    ExternalRepositoryDataDelta,
     ExternalRepositoryErrorData,
+    external_repository_data_from_delta,
+    get_external_repository_snapshots_by_id,
 )
 from dagster._serdes import deserialize_value
 
@@ -12,25 +17,184 @@
     from dagster._core.remote_representation import CodeLocation
     from dagster._grpc.client import DagsterGrpcClient
 
+MAX_CACHED_REPOSITORY_SNAPSHOTS = 256
+
+
+class ExternalRepositorySnapshotCache:
+    """Holds the jobs, asset nodes, schedules, and sensors of the repositories most recently fetched
+    from each code location, keyed by their snapshot id. When a code location is reloaded, the ids
+    are sent along with the request, and only the entries that changed are sent back.
+    """
+
+    def __init__(self, max_repositories: int = MAX_CACHED_REPOSITORY_SNAPSHOTS):
+        self._max_repositories = check.int_param(max_repositories, "max_repositories")
+        self._lock = threading.Lock()
+        self._snapshots_by_repository: OrderedDict[Tuple[str, str], Mapping[str, Any]] = (
+            OrderedDict()
+        )
+
+    def get_snapshots_by_id(
+        self, location_name: str, repository_name: str
+    ) -> Optional[Mapping[str, Any]]:
+        with self._lock:
+            key = (location_name, repository_name)
+            snapshots_by_id = self._snapshots_by_repository.get(key)
+            if snapshots_by_id is not None:
+                self._snapshots_by_repository.move_to_end(key)
+            return snapshots_by_id
+
+    def set_snapshots_by_id(
+        self, location_name: str, repository_name: str, snapshots_by_id: Mapping[str, Any]
+    ) -> None:
+        with self._lock:
+            key = (location_name, repository_name)
+            self._snapshots_by_repository[key] = snapshots_by_id
+            self._snapshots_by_repository.move_to_end(key)
+            while len(self._snapshots_by_repository) > self._max_repositories:
+                self._snapshots_by_repository.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots_by_repository.clear()
+
+
+_external_repository_snapshot_cache = ExternalRepositorySnapshotCache()
+
+
+def get_external_repository_snapshot_cache() -> ExternalRepositorySnapshotCache:
+    return _external_repository_snapshot_cache
+
+
+class _SharedRepositoryDataEntry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reference_count = 0
+        self.repository_datas: Optional[Mapping[str, ExternalRepositoryData]] = None
+
+
+class SharedRepositoryDataStats(NamedTuple):
+    loads: int
+    hits: int
+
+
+class SharedRepositoryDataCache:
+    """Holds one deserialized copy of the repository data served by each code server in the
+    process, keyed by the server's id, so that the code locations loaded for the same server by
+    every workspace in the process share it instead of each fetching their own.
+
+    Each code location acquires the data of its server when it loads and releases it when it is
+    cleaned up, and the data is dropped once no code location references it. Since a new code
+    location is loaded before the one it replaces is cleaned up, refreshing a workspace whose
+    servers have not changed reuses the data that is already loaded. A server started with a fixed
+    id keeps that id when its code is reloaded, so code locations that are loaded to pick up new
+    code invalidate the data of their server before acquiring it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _SharedRepositoryDataEntry] = {}
+        self._loads = 0
+        self._hits = 0
+
+    def acquire(
+        self,
+        server_id: str,
+        load_repository_datas: Callable[[], Mapping[str, ExternalRepositoryData]],
+    ) -> Mapping[str, ExternalRepositoryData]:
+        """Returns the repository data of the given server, calling `load_repository_datas` to
+        fetch it if no code location holds it yet. Concurrent callers for the same server wait for a
+        single load. Each call must be matched by a call to `release` with the returned data.
+        """
+        check.str_param(server_id, "server_id")
+        with self._lock:
+            entry = self._entries.setdefault(server_id, _SharedRepositoryDataEntry())
+            entry.reference_count += 1
+
+        try:
+            with entry.lock:
+                if entry.repository_datas is None:
+                    entry.repository_datas = load_repository_datas()
+                    with self._lock:
+                        self._loads += 1
+                else:
+                    with self._lock:
+                        self._hits += 1
+                return entry.repository_datas
+        except:
+            self._release_entry(server_id, entry)
+            raise
+
+    def release(
+        self, server_id: str, repository_datas: Mapping[str, ExternalRepositoryData]
+    ) -> None:
+        with self._lock:
+            entry = self._entries.get(server_id)
+            # the data of an invalidated entry is no longer shared, so there is nothing to release
+            if entry is None or entry.repository_datas is not repository_datas:
+                return
+        self._release_entry(server_id, entry)
+
+    def invalidate(self, server_id: str) -> None:
+        """Drops the repository data of the given server, so that the next code location that
+        acquires it loads it again. Code locations that already hold the data keep it.
+        """
+        with self._lock:
+            self._entries.pop(server_id, None)
+
+    def _release_entry(self, server_id: str, entry: _SharedRepositoryDataEntry) -> None:
+        with self._lock:
+            entry.reference_count -= 1
+            if entry.reference_count <= 0 and self._entries.get(server_id) is entry:
+                del self._entries[server_id]
+
+    def get_reference_count(self, server_id: str) -> int:
+        with self._lock:
+            entry = self._entries.get(server_id)
+            return entry.reference_count if entry else 0
+
+    def get_stats(self) -> SharedRepositoryDataStats:
+        with self._lock:
+            return SharedRepositoryDataStats(loads=self._loads, hits=self._hits)
+
+
+_shared_repository_data_cache = SharedRepositoryDataCache()
+
+
+def get_shared_repository_data_cache() -> SharedRepositoryDataCache:
+    return _shared_repository_data_cache
+
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    snapshot_cache: Optional[ExternalRepositorySnapshotCache] = None,
 ) -> Mapping[str, ExternalRepositoryData]:
     from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
 
     check.inst_param(code_location, "code_location", CodeLocation)
+    snapshot_cache = check.opt_inst_param(
+        snapshot_cache, "snapshot_cache", ExternalRepositorySnapshotCache
+    )
+    if snapshot_cache is None:
+        snapshot_cache = get_external_repository_snapshot_cache()
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
+        known_snapshots_by_id = (
+            snapshot_cache.get_snapshots_by_id(code_location.name, repository_name) or {}
+        )
         external_repository_chunks = list(
             api_client.streaming_external_repository(
                 external_repository_origin=RemoteRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                known_snapshot_ids=set(known_snapshots_by_id.keys()),
             )
         )
 
+        # gRPC servers from before snapshot deltas ignore the known snapshot ids and always send
+        # back the full repository data
         result = deserialize_value(
             "".join(
                 [
@@ -38,11 +202,21 @@ def sync_get_streaming_external_repositories_data_grpc(
                     for chunk in external_repository_chunks
                 ]
             ),
-            (ExternalRepositoryData, ExternalRepositoryErrorData),
+            (ExternalRepositoryData, ExternalRepositoryDataDelta, ExternalRepositoryErrorData),
         )
 
         if isinstance(result, ExternalRepositoryErrorData):
             raise DagsterUserCodeProcessError.from_error_info(result.error)
 
-        repo_datas[repository_name] = result
+        if isinstance(result, ExternalRepositoryDataDelta):
+            repo_data = external_repository_data_from_delta(result, known_snapshots_by_id)
+            snapshot_cache.set_snapshots_by_id(
+                code_location.name,
+                repository_name,
+                get_external_repository_snapshots_by_id(repo_data, result.snapshot_ids),
+            )
+        else:
+            repo_data = result
+
+        repo_datas[repository_name] = repo_data
     return repo_datas
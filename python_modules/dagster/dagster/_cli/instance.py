@@ -3,7 +3,12 @@
 import click
 
 import dagster._check as check
-from dagster._core.instance import DagsterInstance
+from dagster._core.instance import RUNLESS_RUN_ID, DagsterInstance
+from dagster._core.storage.event_log.transfer import (
+    DEFAULT_EXPORT_CHUNK_SIZE,
+    export_event_log,
+    import_event_log,
+)
 from dagster._core.storage.migration.bigint_migration import run_bigint_migration
 
 from .utils import get_instance_for_cli
@@ -89,6 +94,70 @@ def reindex_command():
         instance.reindex(click.echo)
 
 
+@instance_cli.command(
+    name="export-events",
+    help=(
+        "Export the event log of the current instance into compressed chunk files in OUTPUT_DIR. "
+        "Rerunning the command with the same OUTPUT_DIR resumes an interrupted export."
+    ),
+)
+@click.argument("output_dir", type=click.Path(file_okay=False))
+@click.option(
+    "--chunk-size",
+    type=click.INT,
+    default=DEFAULT_EXPORT_CHUNK_SIZE,
+    show_default=True,
+    help="Number of events per chunk file.",
+)
+@click.option(
+    "--max-workers",
+    type=click.INT,
+    default=1,
+    show_default=True,
+    help="Number of threads to export events with.",
+)
+def export_events_command(output_dir: str, chunk_size: int, max_workers: int):
+    with get_instance_for_cli() as instance:
+        run_ids = None
+        if instance.event_log_storage.is_run_sharded:
+            run_ids = [*instance.get_run_ids(), RUNLESS_RUN_ID]
+
+        export_event_log(
+            instance.event_log_storage,
+            output_dir,
+            run_ids=run_ids,
+            chunk_size=chunk_size,
+            max_workers=max_workers,
+            print_fn=click.echo,
+        )
+
+
+@instance_cli.command(
+    name="import-events",
+    help=(
+        "Import the events exported by `dagster instance export-events` from INPUT_DIR into the "
+        "event log of the current instance. Rerunning the command with the same INPUT_DIR resumes "
+        "an interrupted import."
+    ),
+)
+@click.argument("input_dir", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--max-workers",
+    type=click.INT,
+    default=1,
+    show_default=True,
+    help="Number of threads to import events with.",
+)
+def import_events_command(input_dir: str, max_workers: int):
+    with get_instance_for_cli() as instance:
+        import_event_log(
+            instance.event_log_storage,
+            input_dir,
+            max_workers=max_workers,
+            print_fn=click.echo,
+        )
+
+
 @instance_cli.group(name="concurrency")
 def concurrency_cli():
     """Commands for working with the instance-wide op concurrency (Experimental)."""
@@ -50,6 +50,7 @@
 from dagster._utils.hosted_user_process import recon_repository_from_origin
 
 if TYPE_CHECKING:
+    from dagster._core.storage.shared_record_cache import SharedRecordCache
     from dagster._core.workspace.context import WorkspaceProcessContext
 
 from dagster._core.remote_representation.external import ExternalJob
@@ -270,6 +271,7 @@ def get_workspace_process_context_from_kwargs(
     read_only: bool,
     kwargs: ClickArgMapping,
     code_server_log_level: str = "INFO",
+    shared_record_cache: Optional["SharedRecordCache"] = None,
 ) -> "WorkspaceProcessContext":
     from dagster._core.workspace.context import WorkspaceProcessContext
 
@@ -279,6 +281,7 @@ def get_workspace_process_context_from_kwargs(
         version=version,
         read_only=read_only,
         code_server_log_level=code_server_log_level,
+        shared_record_cache=shared_record_cache,
     )
 
 
@@ -87,6 +87,7 @@ def __init__(
         respect_materialization_data_versions: bool,
         logger: logging.Logger,
         evaluation_time: Optional[datetime.datetime] = None,
+        evaluation_max_workers: Optional[int] = None,
     ):
         from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
@@ -114,6 +115,7 @@ def __init__(
         self._auto_observe_asset_keys = auto_observe_asset_keys or set()
         self._respect_materialization_data_versions = respect_materialization_data_versions
         self._logger = logger
+        self._evaluation_max_workers = evaluation_max_workers
 
     @property
     def logger(self) -> logging.Logger:
@@ -171,6 +173,7 @@ def get_asset_condition_evaluations(
             data_time_resolver=self.data_time_resolver,
             respect_materialization_data_versions=self.respect_materialization_data_versions,
             auto_materialize_run_tags=self.auto_materialize_run_tags,
+            max_workers=self._evaluation_max_workers,
         )
         return evaluator.evaluate()
 
@@ -138,7 +138,7 @@ def to_storage_dict(
     ) -> Mapping[str, object]:
         return {
             "partitions_subsets_by_asset_key": {
-                key.to_user_string(): value.serialize()
+                key.to_user_string(): value.to_serializable_subset().serialize()
                 for key, value in self.partitions_subsets_by_asset_key.items()
             },
             "serializable_partitions_def_ids_by_asset_key": {
@@ -2,7 +2,7 @@
 import operator
 from abc import ABC, abstractmethod
 from functools import reduce
-from typing import AbstractSet, Iterable, List, Optional, Sequence, Union, cast
+from typing import AbstractSet, Hashable, Iterable, List, Optional, Sequence, Union, cast
 
 from typing_extensions import TypeAlias
 
@@ -12,12 +12,12 @@
 from dagster._core.definitions.resolved_asset_deps import resolve_similar_asset_names
 from dagster._core.errors import DagsterInvalidSubsetError
 from dagster._core.selector.subset_selector import (
+    Direction,
     fetch_connected,
-    fetch_sinks,
     fetch_sources,
     parse_clause,
 )
-from dagster._model import DagsterModel
+from dagster._model import DagsterModel, get_structural_key
 from dagster._serdes.serdes import whitelist_for_serdes
 
 from .asset_check_spec import AssetCheckKey
@@ -39,6 +39,9 @@
     "AssetSelection",
 ]
 
+# the number of resolved selections that are kept per asset graph, see AssetSelection.resolve
+MAX_RESOLVED_ASSET_SELECTIONS_PER_GRAPH = 128
+
 
 class AssetSelection(ABC, DagsterModel):
     """An AssetSelection defines a query over a set of assets and asset checks, normally all that are defined in a code location.
@@ -417,7 +420,23 @@ def resolve(
             check.iterable_param(all_assets, "all_assets", (AssetsDefinition, SourceAsset))
             asset_graph = AssetGraph.from_assets(all_assets)
 
-        return self.resolve_inner(asset_graph, allow_missing=allow_missing)
+        # selections are immutable, so the result of resolving a selection against a graph can be
+        # reused by any selection with the same structure
+        cache_key = _get_resolution_cache_key(self, allow_missing)
+        if cache_key is None:
+            return self.resolve_inner(asset_graph, allow_missing=allow_missing)
+
+        resolved_asset_selections = asset_graph.resolved_asset_selections
+        if cache_key in resolved_asset_selections:
+            resolved_asset_selections.move_to_end(cache_key)
+            return resolved_asset_selections[cache_key]
+
+        # results are shared between callers, so they're stored as frozensets
+        resolved = frozenset(self.resolve_inner(asset_graph, allow_missing=allow_missing))
+        resolved_asset_selections[cache_key] = resolved
+        if len(resolved_asset_selections) > MAX_RESOLVED_ASSET_SELECTIONS_PER_GRAPH:
+            resolved_asset_selections.popitem(last=False)
+        return resolved
 
     @abstractmethod
     def resolve_inner(
@@ -512,6 +531,41 @@ def operand__str__(self) -> str:
         return f"({self})" if self.needs_parentheses_when_operand() else str(self)
 
 
+def _get_resolution_cache_key(selection: AssetSelection, allow_missing: bool) -> Optional[Hashable]:
+    """Returns a key that is equal for selections with the same structure, or None if the selection
+    holds values that can't be hashed, in which case its resolution is not cached.
+    """
+    key = (get_structural_key(selection), allow_missing)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _fetch_all_connected(
+    selection: AbstractSet[AssetKey],
+    asset_graph: BaseAssetGraph,
+    direction: Direction,
+    depth: Optional[int],
+) -> AbstractSet[AssetKey]:
+    if depth is None:
+        return set(selection) | asset_graph.get_reachable_asset_keys(selection, direction)
+
+    return set().union(
+        selection,
+        *(
+            fetch_connected(
+                item=asset_key,
+                graph=asset_graph.asset_dep_graph,
+                direction=direction,
+                depth=depth,
+            )
+            for asset_key in selection
+        ),
+    )
+
+
 @whitelist_for_serdes
 class AllSelection(AssetSelection):
     include_sources: Optional[bool] = None
@@ -739,7 +793,19 @@ def resolve_inner(
         self, asset_graph: BaseAssetGraph, allow_missing: bool
     ) -> AbstractSet[AssetKey]:
         selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
-        return fetch_sinks(asset_graph.asset_dep_graph, selection)
+        # an asset is not a sink if one of its children is in the selection or upstream of it
+        selection_and_ancestors = set(selection) | asset_graph.get_reachable_asset_keys(
+            selection, "upstream"
+        )
+        downstream_graph = asset_graph.asset_dep_graph["downstream"]
+        return {
+            asset_key
+            for asset_key in selection
+            if not any(
+                child_key != asset_key and child_key in selection_and_ancestors
+                for child_key in downstream_graph.get(asset_key, ())
+            )
+        }
 
     def to_serializable_asset_selection(self, asset_graph: BaseAssetGraph) -> "AssetSelection":
         return self.model_copy(
@@ -793,19 +859,7 @@ def resolve_inner(
     ) -> AbstractSet[AssetKey]:
         selection = self.child.resolve_inner(asset_graph, allow_missing=allow_missing)
         return operator.sub(
-            reduce(
-                operator.or_,
-                [
-                    {asset_key}
-                    | fetch_connected(
-                        item=asset_key,
-                        graph=asset_graph.asset_dep_graph,
-                        direction="downstream",
-                        depth=self.depth,
-                    )
-                    for asset_key in selection
-                ],
-            ),
+            _fetch_all_connected(selection, asset_graph, "downstream", self.depth),
             selection if not self.include_self else set(),
         )
 
@@ -953,20 +1007,7 @@ def _fetch_all_upstream(
     include_self: bool = True,
 ) -> AbstractSet[AssetKey]:
     return operator.sub(
-        reduce(
-            operator.or_,
-            [
-                {asset_key}
-                | fetch_connected(
-                    item=asset_key,
-                    graph=asset_graph.asset_dep_graph,
-                    direction="upstream",
-                    depth=depth,
-                )
-                for asset_key in selection
-            ],
-            set(),
-        ),
+        _fetch_all_connected(selection, asset_graph, "upstream", depth),
         selection if not include_self else set(),
     )
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections import deque
+from collections import OrderedDict, deque
 from datetime import datetime
 from functools import cached_property, total_ordering
 from heapq import heapify, heappop, heappush
@@ -8,7 +8,9 @@
     AbstractSet,
     Callable,
     Dict,
+    FrozenSet,
     Generic,
+    Hashable,
     Iterable,
     Iterator,
     List,
@@ -34,7 +36,7 @@
 from dagster._core.definitions.partition_mapping import PartitionMapping
 from dagster._core.errors import DagsterInvalidInvocationError
 from dagster._core.instance import DynamicPartitionsStore
-from dagster._core.selector.subset_selector import DependencyGraph, fetch_sources
+from dagster._core.selector.subset_selector import DependencyGraph, Direction, fetch_sources
 from dagster._core.utils import toposort
 from dagster._utils.cached_method import cached_method
 
@@ -182,6 +184,36 @@ def asset_dep_graph(self) -> DependencyGraph[AssetKey]:
             "downstream": {node.key: node.child_keys for node in self.asset_nodes},
         }
 
+    def get_reachable_asset_keys(
+        self, asset_keys: Iterable[AssetKey], direction: Direction
+    ) -> AbstractSet[AssetKey]:
+        """Returns the keys of all assets that can be reached from any of the given assets by
+        following their dependencies in the given direction, i.e. all of their ancestors or all of
+        their descendants. A given asset is only included if it can be reached from one of the given
+        assets, e.g. if it depends on itself.
+
+        All of the given assets are traversed in a single breadth-first search, so each dependency
+        edge is visited at most once regardless of how many assets are given.
+        """
+        dep_graph = self.asset_dep_graph[direction]
+        reachable: Set[AssetKey] = set()
+        queue = deque(asset_keys)
+        while queue:
+            current_key = queue.popleft()
+            for next_key in dep_graph.get(current_key, ()):
+                if next_key not in reachable:
+                    reachable.add(next_key)
+                    queue.append(next_key)
+        return reachable
+
+    @cached_property
+    def resolved_asset_selections(self) -> "OrderedDict[Hashable, FrozenSet[AssetKey]]":
+        """The asset keys that asset selections have resolved to against this graph, keyed by the
+        structure of the selection, for the most recently resolved selections. See
+        AssetSelection.resolve.
+        """
+        return OrderedDict()
+
     @cached_property
     def all_asset_keys(self) -> AbstractSet[AssetKey]:
         return {node.key for node in self.asset_nodes}
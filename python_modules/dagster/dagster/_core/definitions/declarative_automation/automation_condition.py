@@ -1,6 +1,17 @@
 import datetime
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Mapping, NamedTuple, Optional, Sequence, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from dagster._annotations import experimental
 from dagster._core.asset_graph_view.asset_graph_view import AssetSlice, TemporalContext
@@ -16,7 +27,7 @@
 )
 from dagster._core.definitions.partition import AllPartitionsSubset
 from dagster._core.definitions.time_window_partitions import BaseTimeWindowPartitionsSubset
-from dagster._model import DagsterModel
+from dagster._model import DagsterModel, get_structural_key
 from dagster._time import get_current_timestamp
 from dagster._utils.security import non_secure_md5_hash_str
 
@@ -84,6 +95,36 @@ def as_auto_materialize_policy(self) -> "AutoMaterializePolicy":
     def evaluate(self, context: "AutomationContext") -> "AutomationResult":
         raise NotImplementedError()
 
+    def get_context_key(
+        self, context: "AutomationContext", asset_key: AssetKey
+    ) -> Optional[Hashable]:
+        """Returns a key of the values that evaluating this condition against the given asset reads
+        from the context, other than its candidate slice and the state that is shared by every
+        evaluation within a tick. The context is that of the parent condition, and shares its
+        cursor and root asset with the context the condition would be evaluated in.
+
+        Evaluations of the same condition against the same candidate slice with equal keys have the
+        same result, so the condition is only evaluated once per tick and the result is reused for
+        the other evaluations, with its unique ids replaced. This requires that the child results of
+        the condition are ordered by their child index. Returns None if the result of evaluating
+        the condition cannot be reused, which is the default.
+        """
+        return None
+
+    def _get_children_context_key(
+        self,
+        children: Sequence["AutomationCondition"],
+        context: "AutomationContext",
+        asset_key: AssetKey,
+    ) -> Optional[Hashable]:
+        keys = []
+        for child in children:
+            key = context.result_cache.get_context_key(child, context, asset_key)
+            if key is None:
+                return None
+            keys.append(key)
+        return tuple(keys)
+
     def __and__(self, other: "AutomationCondition") -> "AndAssetCondition":
         from .operators import AndAssetCondition
 
@@ -401,6 +442,40 @@ def create(
             child_results=[],
         )
 
+    def with_unique_id(self, condition_unique_id: str) -> "AutomationResult":
+        """Returns this result as if the condition had been evaluated at the position in the
+        condition tree with the given unique id.
+        """
+        if condition_unique_id == self.condition_unique_id:
+            return self
+
+        child_results = [
+            child_result.with_unique_id(
+                child_result.condition.get_unique_id(
+                    parent_unique_id=condition_unique_id, index=child_index
+                )
+            )
+            for child_index, child_result in enumerate(self.child_results)
+        ]
+        return self._replace(
+            condition_unique_id=condition_unique_id,
+            value_hash=_compute_value_hash(
+                condition_unique_id=condition_unique_id,
+                condition_description=self.condition.description,
+                true_slice=self.true_slice,
+                candidate_slice=self.candidate_slice,
+                subsets_with_metadata=self.serializable_evaluation.subsets_with_metadata,
+                child_results=child_results,
+            ),
+            child_results=child_results,
+            serializable_evaluation=self.serializable_evaluation._replace(
+                condition_snapshot=self.condition.get_snapshot(condition_unique_id),
+                child_evaluations=[
+                    child_result.serializable_evaluation for child_result in child_results
+                ],
+            ),
+        )
+
     def get_child_node_cursors(self) -> Mapping[str, AutomationConditionNodeCursor]:
         node_cursors = {self.condition_unique_id: self.node_cursor} if self.node_cursor else {}
         for child_result in self.child_results:
@@ -417,6 +492,73 @@ def get_new_cursor(self) -> AutomationConditionCursor:
         )
 
 
+class AutomationResultCache:
+    """Holds the results of the conditions evaluated within a tick, so that a condition which is
+    evaluated against the same slice of an asset from multiple places, such as a dependency
+    condition shared by the children of an asset, is only evaluated once. Results are keyed by the
+    structure of the condition, the candidate slice, and the context key of the condition.
+    """
+
+    def __init__(self):
+        self._results: Dict[Hashable, AutomationResult] = {}
+        # structural keys by condition object id, along with the condition to keep the id in use
+        self._structural_keys: Dict[int, Tuple[AutomationCondition, Hashable]] = {}
+        # context keys by condition object id, asset key, and root asset key, as the context key
+        # of a condition only changes between the evaluations of different root assets
+        self._context_keys: Dict[
+            Tuple[int, AssetKey, AssetKey], Tuple[AutomationCondition, Optional[Hashable]]
+        ] = {}
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def _get_structural_key(self, condition: AutomationCondition) -> Hashable:
+        entry = self._structural_keys.get(id(condition))
+        if entry is None:
+            entry = (condition, get_structural_key(condition))
+            self._structural_keys[id(condition)] = entry
+        return entry[1]
+
+    def get_context_key(
+        self, condition: AutomationCondition, context: "AutomationContext", asset_key: AssetKey
+    ) -> Optional[Hashable]:
+        memo_key = (id(condition), asset_key, context.root_context.asset_key)
+        entry = self._context_keys.get(memo_key)
+        if entry is None:
+            entry = (condition, condition.get_context_key(context, asset_key))
+            self._context_keys[memo_key] = entry
+        return entry[1]
+
+    def get_cache_key(
+        self,
+        condition: AutomationCondition,
+        candidate_slice: AssetSlice,
+        context_key: Optional[Hashable],
+    ) -> Optional[Hashable]:
+        """Returns the key to cache the result of evaluating the condition against the candidate
+        slice under, or None if it cannot be cached.
+        """
+        if context_key is None:
+            return None
+        key = (
+            self._get_structural_key(condition),
+            candidate_slice.asset_key,
+            _compute_subset_value_str(candidate_slice.convert_to_valid_asset_subset()),
+            context_key,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, cache_key: Hashable) -> Optional[AutomationResult]:
+        return self._results.get(cache_key)
+
+    def set(self, cache_key: Hashable, result: AutomationResult) -> None:
+        self._results[cache_key] = result
+
+
 def _create_node_cursor(
     true_slice: AssetSlice,
     candidate_slice: AssetSlice,
@@ -2,12 +2,16 @@
 import logging
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, AbstractSet, Dict, Mapping, Optional, Sequence, Set, Tuple
 
 import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView
 from dagster._core.definitions.data_time import CachingDataTimeResolver
-from dagster._core.definitions.declarative_automation.automation_condition import AutomationResult
+from dagster._core.definitions.declarative_automation.automation_condition import (
+    AutomationResult,
+    AutomationResultCache,
+)
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 
@@ -39,6 +43,9 @@ def __init__(
         # as https://docs.dagster.io/deployment/dagster-instance#auto-materialize
         # Should this be a supported feature in DS?
         auto_materialize_run_tags: Mapping[str, str],
+        # if set, assets within the same topological level are evaluated in parallel on up to this
+        # many threads
+        max_workers: Optional[int] = None,
     ):
         self.asset_graph = asset_graph
         self.asset_keys = asset_keys
@@ -48,6 +55,7 @@ def __init__(
         self.data_time_resolver = data_time_resolver
         self.respect_materialization_data_versions = respect_materialization_data_versions
         self.auto_materialize_run_tags = auto_materialize_run_tags
+        self.max_workers = max_workers
 
         self.current_results_by_key = {}
         self.condition_cursors = []
@@ -55,6 +63,7 @@ def __init__(
         self.to_request = set()
         self.num_checked_assets = 0
         self.num_asset_keys = len(asset_keys)
+        self.result_cache = AutomationResultCache()
 
     asset_graph: BaseAssetGraph
     asset_keys: AbstractSet[AssetKey]
@@ -64,11 +73,14 @@ def __init__(
     to_request: Set[AssetKeyPartitionKey]
     num_checked_assets: int
     num_asset_keys: int
+    # results of the conditions evaluated on this tick, which are shared between assets
+    result_cache: AutomationResultCache
     logger: logging.Logger
     cursor: AssetDaemonCursor
     data_time_resolver: CachingDataTimeResolver
     respect_materialization_data_versions: bool
     auto_materialize_run_tags: Mapping[str, str]
+    max_workers: Optional[int]
 
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
@@ -100,72 +112,113 @@ def prefetch(self) -> None:
 
     def evaluate(self) -> Tuple[Sequence[AutomationResult], AbstractSet[AssetKeyPartitionKey]]:
         self.prefetch()
-        for asset_key in self.asset_graph.toposorted_asset_keys:
-            # an asset may have already been visited if it was part of a non-subsettable multi-asset
-            if asset_key not in self.asset_keys:
-                continue
-
-            self.num_checked_assets = self.num_checked_assets + 1
-            start_time = time.time()
-            self.logger.debug(
-                "Evaluating asset"
-                f" {asset_key.to_user_string()} ({self.num_checked_assets}/{self.num_asset_keys})"
-            )
+        if self.max_workers is not None and self.max_workers > 1:
+            self._evaluate_by_level(self.max_workers)
+        else:
+            for asset_key in self.asset_graph.toposorted_asset_keys:
+                # an asset may have already been visited if it was part of a non-subsettable multi-asset
+                if asset_key not in self.asset_keys:
+                    continue
 
-            try:
-                (result, expected_data_time) = self.evaluate_asset(
-                    asset_key, self.expected_data_time_mapping, self.current_results_by_key
-                )
-            except Exception as e:
-                raise Exception(
-                    f"Error while evaluating conditions for asset {asset_key.to_user_string()}"
-                ) from e
-
-            num_requested = result.true_subset.size
-            log_fn = self.logger.info if num_requested > 0 else self.logger.debug
-
-            to_request_asset_partitions = result.true_subset.asset_partitions
-            to_request_str = ",".join(
-                [(ap.partition_key or "No partition") for ap in to_request_asset_partitions]
-            )
-            self.to_request |= to_request_asset_partitions
+                start_time = self._log_evaluation_start(asset_key)
+                result, expected_data_time = self._evaluate_asset_or_raise(asset_key)
+                self._add_result(asset_key, result, expected_data_time, start_time)
 
-            log_fn(
-                f"Asset {asset_key.to_user_string()} evaluation result: {num_requested}"
-                f" requested ({to_request_str}) ({format(time.time()-start_time, '.3f')} seconds)"
+        return list(self.current_results_by_key.values()), self.to_request
+
+    def _evaluate_by_level(self, max_workers: int) -> None:
+        """Evaluates the assets of each topological level of the asset graph in parallel. Assets
+        within a level only read the results of assets in earlier levels, and the results of a
+        level are added in the same order as in a serial evaluation, so the outcome is the same.
+        """
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="automation_condition_evaluator"
+        ) as executor:
+            for level in self.asset_graph.toposorted_asset_keys_by_level:
+                asset_keys = sorted(level & self.asset_keys)
+                futures_and_start_times = []
+                for asset_key in asset_keys:
+                    start_time = self._log_evaluation_start(asset_key)
+                    futures_and_start_times.append(
+                        (executor.submit(self._evaluate_asset_or_raise, asset_key), start_time)
+                    )
+                # wait for the entire level before adding any of its results
+                results = [future.result() for future, _ in futures_and_start_times]
+                for asset_key, (result, expected_data_time), (_, start_time) in zip(
+                    asset_keys, results, futures_and_start_times
+                ):
+                    self._add_result(asset_key, result, expected_data_time, start_time)
+
+    def _log_evaluation_start(self, asset_key: AssetKey) -> float:
+        self.num_checked_assets = self.num_checked_assets + 1
+        self.logger.debug(
+            "Evaluating asset"
+            f" {asset_key.to_user_string()} ({self.num_checked_assets}/{self.num_asset_keys})"
+        )
+        return time.time()
+
+    def _evaluate_asset_or_raise(
+        self, asset_key: AssetKey
+    ) -> Tuple[AutomationResult, Optional[datetime.datetime]]:
+        try:
+            return self.evaluate_asset(
+                asset_key, self.expected_data_time_mapping, self.current_results_by_key
             )
+        except Exception as e:
+            raise Exception(
+                f"Error while evaluating conditions for asset {asset_key.to_user_string()}"
+            ) from e
 
-            self.current_results_by_key[asset_key] = result
-            self.expected_data_time_mapping[asset_key] = expected_data_time
-
-            # if we need to materialize any partitions of a non-subsettable multi-asset, we need to
-            # materialize all of them
-            execution_set_keys = self.asset_graph.get(asset_key).execution_set_asset_keys
-            if len(execution_set_keys) > 1 and num_requested > 0:
-                for neighbor_key in execution_set_keys:
-                    self.expected_data_time_mapping[neighbor_key] = expected_data_time
-
-                    # make sure that the true_subset of the neighbor is accurate -- when it was
-                    # evaluated it may have had a different requested AssetSubset. however, because
-                    # all these neighbors must be executed as a unit, we need to union together
-                    # the subset of all required neighbors
-                    if neighbor_key in self.current_results_by_key:
-                        neighbor_result = self.current_results_by_key[neighbor_key]
-                        neighbor_true_subset = result.serializable_evaluation.true_subset._replace(
-                            asset_key=neighbor_key
-                        )
-                        neighbor_evaluation = result.serializable_evaluation._replace(
-                            true_subset=neighbor_true_subset
-                        )
-                        self.current_results_by_key[neighbor_key] = neighbor_result._replace(
-                            serializable_evaluation=neighbor_evaluation
-                        )
-                    self.to_request |= {
-                        ap._replace(asset_key=neighbor_key)
-                        for ap in result.true_subset.asset_partitions
-                    }
+    def _add_result(
+        self,
+        asset_key: AssetKey,
+        result: AutomationResult,
+        expected_data_time: Optional[datetime.datetime],
+        start_time: float,
+    ) -> None:
+        num_requested = result.true_subset.size
+        log_fn = self.logger.info if num_requested > 0 else self.logger.debug
 
-        return list(self.current_results_by_key.values()), self.to_request
+        to_request_asset_partitions = result.true_subset.asset_partitions
+        to_request_str = ",".join(
+            [(ap.partition_key or "No partition") for ap in to_request_asset_partitions]
+        )
+        self.to_request |= to_request_asset_partitions
+
+        log_fn(
+            f"Asset {asset_key.to_user_string()} evaluation result: {num_requested}"
+            f" requested ({to_request_str}) ({format(time.time()-start_time, '.3f')} seconds)"
+        )
+
+        self.current_results_by_key[asset_key] = result
+        self.expected_data_time_mapping[asset_key] = expected_data_time
+
+        # if we need to materialize any partitions of a non-subsettable multi-asset, we need to
+        # materialize all of them
+        execution_set_keys = self.asset_graph.get(asset_key).execution_set_asset_keys
+        if len(execution_set_keys) > 1 and num_requested > 0:
+            for neighbor_key in execution_set_keys:
+                self.expected_data_time_mapping[neighbor_key] = expected_data_time
+
+                # make sure that the true_subset of the neighbor is accurate -- when it was
+                # evaluated it may have had a different requested AssetSubset. however, because
+                # all these neighbors must be executed as a unit, we need to union together
+                # the subset of all required neighbors
+                if neighbor_key in self.current_results_by_key:
+                    neighbor_result = self.current_results_by_key[neighbor_key]
+                    neighbor_true_subset = result.serializable_evaluation.true_subset._replace(
+                        asset_key=neighbor_key
+                    )
+                    neighbor_evaluation = result.serializable_evaluation._replace(
+                        true_subset=neighbor_true_subset
+                    )
+                    self.current_results_by_key[neighbor_key] = neighbor_result._replace(
+                        serializable_evaluation=neighbor_evaluation
+                    )
+                self.to_request |= {
+                    ap._replace(asset_key=neighbor_key)
+                    for ap in result.true_subset.asset_partitions
+                }
 
     def evaluate_asset(
         self,
@@ -199,6 +252,7 @@ def evaluate_asset(
             current_tick_results_by_key=current_results_by_key,
             condition_cursor=self.cursor.get_previous_condition_cursor(asset_key),
             legacy_context=legacy_context,
+            result_cache=self.result_cache,
         )
 
         result = asset_condition.evaluate(context)
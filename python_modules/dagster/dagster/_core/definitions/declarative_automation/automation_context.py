@@ -15,6 +15,7 @@
 from dagster._core.definitions.declarative_automation.automation_condition import (
     AutomationCondition,
     AutomationResult,
+    AutomationResultCache,
 )
 from dagster._core.definitions.declarative_automation.legacy.asset_condition import AssetCondition
 from dagster._core.definitions.declarative_automation.serialized_objects import (
@@ -101,6 +102,9 @@ class AutomationContext(NamedTuple):
     inner_legacy_context: Any
     is_legacy_evaluation: bool
 
+    # results of the conditions evaluated so far on the current tick, which can be shared
+    result_cache: AutomationResultCache
+
     @staticmethod
     def create(
         asset_key: AssetKey,
@@ -109,6 +113,7 @@ def create(
         current_tick_results_by_key: Mapping[AssetKey, AutomationResult],
         condition_cursor: Optional[AutomationConditionCursor],
         legacy_context: "LegacyRuleEvaluationContext",
+        result_cache: Optional[AutomationResultCache] = None,
     ) -> "AutomationContext":
         asset_graph = asset_graph_view.asset_graph
         auto_materialize_policy = check.not_none(asset_graph.get(asset_key).auto_materialize_policy)
@@ -131,6 +136,7 @@ def create(
                 asset_graph_view.get_inner_queryer_for_back_compat()
             ),
             is_legacy_evaluation=_has_legacy_condition(automation_condition),
+            result_cache=result_cache if result_cache is not None else AutomationResultCache(),
         )
 
     def for_child_condition(
@@ -148,16 +154,55 @@ def for_child_condition(
             logger=self.logger,
             cursor=self.cursor,
             current_tick_results_by_key=self.current_tick_results_by_key,
+            # the legacy context is only read by legacy conditions
             inner_legacy_context=self.inner_legacy_context.for_child(
                 child_condition,
                 child_condition.get_unique_id(
                     parent_unique_id=self.condition_unique_id, index=child_index
                 ),
                 candidate_slice.convert_to_valid_asset_subset(),
-            ),
+            )
+            if self.is_legacy_evaluation
+            else self.inner_legacy_context,
             non_agv_instance_interface=self.non_agv_instance_interface,
             is_legacy_evaluation=self.is_legacy_evaluation,
+            result_cache=self.result_cache,
+        )
+
+    def evaluate_child_condition(
+        self, child_condition: AutomationCondition, child_index: int, candidate_slice: AssetSlice
+    ) -> AutomationResult:
+        """Evaluates a child condition against the candidate slice. If the same condition has
+        already been evaluated against the same slice on this tick with the same context key, the
+        result of that evaluation is returned instead.
+        """
+        cache_key = (
+            self.result_cache.get_cache_key(
+                child_condition,
+                candidate_slice,
+                self.result_cache.get_context_key(child_condition, self, candidate_slice.asset_key),
+            )
+            if not self.is_legacy_evaluation
+            else None
+        )
+        if cache_key is not None:
+            cached_result = self.result_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result.with_unique_id(
+                    child_condition.get_unique_id(
+                        parent_unique_id=self.condition_unique_id, index=child_index
+                    )
+                )
+
+        child_context = self.for_child_condition(
+            child_condition=child_condition,
+            child_index=child_index,
+            candidate_slice=candidate_slice,
         )
+        result = child_condition.evaluate(child_context)
+        if cache_key is not None:
+            self.result_cache.set(cache_key, result)
+        return result
 
     @property
     def asset_graph(self) -> "BaseAssetGraph":
@@ -1,8 +1,9 @@
 import datetime
 from abc import abstractmethod
-from typing import Optional
+from typing import Hashable, Optional
 
 from dagster._core.asset_graph_view.asset_graph_view import AssetSlice
+from dagster._core.definitions.asset_key import AssetKey
 from dagster._core.definitions.declarative_automation.utils import SerializableTimeDelta
 from dagster._serdes.serdes import whitelist_for_serdes
 from dagster._utils.schedules import reverse_cron_string_iterator
@@ -33,6 +34,9 @@ class MissingAutomationCondition(SliceAutomationCondition):
     def description(self) -> str:
         return "Missing"
 
+    def get_context_key(self, context: AutomationContext, asset_key: AssetKey) -> Hashable:
+        return ()
+
     def compute_slice(self, context: AutomationContext) -> AssetSlice:
         return context.asset_graph_view.compute_missing_subslice(
             context.asset_key, from_slice=context.candidate_slice
@@ -45,6 +49,9 @@ class InProgressAutomationCondition(SliceAutomationCondition):
     def description(self) -> str:
         return "Part of an in-progress run"
 
+    def get_context_key(self, context: AutomationContext, asset_key: AssetKey) -> Hashable:
+        return ()
+
     def compute_slice(self, context: AutomationContext) -> AssetSlice:
         return context.asset_graph_view.compute_in_progress_asset_slice(asset_key=context.asset_key)
 
@@ -55,6 +62,9 @@ class FailedAutomationCondition(SliceAutomationCondition):
     def description(self) -> str:
         return "Latest run failed"
 
+    def get_context_key(self, context: AutomationContext, asset_key: AssetKey) -> Hashable:
+        return ()
+
     def compute_slice(self, context: AutomationContext) -> AssetSlice:
         return context.asset_graph_view.compute_failed_asset_slice(asset_key=context.asset_key)
 
@@ -65,7 +75,9 @@ class WillBeRequestedCondition(SliceAutomationCondition):
     def description(self) -> str:
         return "Will be requested this tick"
 
-    def _executable_with_root_context_key(self, context: AutomationContext) -> bool:
+    def _executable_with_root_context_key(
+        self, context: AutomationContext, asset_key: AssetKey
+    ) -> bool:
         # TODO: once we can launch backfills via the asset daemon, this can be removed
         from dagster._core.definitions.asset_graph import materializable_in_same_run
 
@@ -73,7 +85,14 @@ def _executable_with_root_context_key(self, context: AutomationContext) -> bool:
         return materializable_in_same_run(
             asset_graph=context.asset_graph_view.asset_graph,
             child_key=root_key,
-            parent_key=context.asset_key,
+            parent_key=asset_key,
+        )
+
+    def get_context_key(self, context: AutomationContext, asset_key: AssetKey) -> Hashable:
+        current_result = context.current_tick_results_by_key.get(asset_key)
+        return (
+            current_result.value_hash if current_result else None,
+            self._executable_with_root_context_key(context, asset_key),
         )
 
     def compute_slice(self, context: AutomationContext) -> AssetSlice:
@@ -81,7 +100,7 @@ def compute_slice(self, context: AutomationContext) -> AssetSlice:
         if (
             current_result
             and current_result.true_slice
-            and self._executable_with_root_context_key(context)
+            and self._executable_with_root_context_key(context, context.asset_key)
         ):
             return current_result.true_slice
         else:
@@ -106,6 +125,9 @@ class NewlyUpdatedCondition(SliceAutomationCondition):
     def description(self) -> str:
         return "Updated since previous tick"
 
+    def get_context_key(self, context: AutomationContext, asset_key: AssetKey) -> Hashable:
+        return (context.cursor is None, context.previous_evaluation_max_storage_id)
+
     def compute_slice(self, context: AutomationContext) -> AssetSlice:
         # if it's the first time evaluating, just return the empty slice
         if context.cursor is None:
@@ -133,6 +155,9 @@ def _get_previous_cron_tick(self, effective_dt: datetime.datetime) -> datetime.d
         )
         return next(previous_ticks)
 
+    def get_context_key(self, context: AutomationContext, asset_key: AssetKey) -> Hashable:
+        return (context.previous_evaluation_effective_dt,)
+
     def compute_slice(self, context: AutomationContext) -> AssetSlice:
         previous_cron_tick = self._get_previous_cron_tick(context.effective_dt)
         if (
@@ -176,6 +201,9 @@ def description(self) -> str:
             else "Within latest time window"
         )
 
+    def get_context_key(self, context: AutomationContext, asset_key: AssetKey) -> Hashable:
+        return ()
+
     def compute_slice(self, context: AutomationContext) -> AssetSlice:
         return context.asset_graph_view.compute_latest_time_window_slice(
             context.asset_key, lookback_delta=self.lookback_timedelta
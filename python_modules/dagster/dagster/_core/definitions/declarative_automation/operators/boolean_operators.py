@@ -1,6 +1,7 @@
-from typing import List, Sequence
+from typing import Hashable, List, Optional, Sequence
 
 from dagster._annotations import experimental
+from dagster._core.definitions.asset_key import AssetKey
 from dagster._serdes.serdes import whitelist_for_serdes
 
 from ..automation_condition import AutomationCondition, AutomationResult
@@ -22,14 +23,18 @@ def children(self) -> Sequence[AutomationCondition]:
     def description(self) -> str:
         return "All of"
 
+    def get_context_key(
+        self, context: AutomationContext, asset_key: AssetKey
+    ) -> Optional[Hashable]:
+        return self._get_children_context_key(self.children, context, asset_key)
+
     def evaluate(self, context: AutomationContext) -> AutomationResult:
         child_results: List[AutomationResult] = []
         true_slice = context.candidate_slice
         for i, child in enumerate(self.children):
-            child_context = context.for_child_condition(
+            child_result = context.evaluate_child_condition(
                 child_condition=child, child_index=i, candidate_slice=true_slice
             )
-            child_result = child.evaluate(child_context)
             child_results.append(child_result)
             true_slice = true_slice.compute_intersection(child_result.true_slice)
         return AutomationResult.create_from_children(context, true_slice, child_results)
@@ -50,14 +55,18 @@ def children(self) -> Sequence[AutomationCondition]:
     def description(self) -> str:
         return "Any of"
 
+    def get_context_key(
+        self, context: AutomationContext, asset_key: AssetKey
+    ) -> Optional[Hashable]:
+        return self._get_children_context_key(self.children, context, asset_key)
+
     def evaluate(self, context: AutomationContext) -> AutomationResult:
         child_results: List[AutomationResult] = []
         true_slice = context.asset_graph_view.create_empty_slice(asset_key=context.asset_key)
         for i, child in enumerate(self.children):
-            child_context = context.for_child_condition(
+            child_result = context.evaluate_child_condition(
                 child_condition=child, child_index=i, candidate_slice=context.candidate_slice
             )
-            child_result = child.evaluate(child_context)
             child_results.append(child_result)
             true_slice = true_slice.compute_union(child_result.true_slice)
 
@@ -75,15 +84,19 @@ class NotAssetCondition(AutomationCondition):
     def description(self) -> str:
         return "Not"
 
+    def get_context_key(
+        self, context: AutomationContext, asset_key: AssetKey
+    ) -> Optional[Hashable]:
+        return self._get_children_context_key(self.children, context, asset_key)
+
     @property
     def children(self) -> Sequence[AutomationCondition]:
         return [self.operand]
 
     def evaluate(self, context: AutomationContext) -> AutomationResult:
-        child_context = context.for_child_condition(
+        child_result = context.evaluate_child_condition(
             child_condition=self.operand, child_index=0, candidate_slice=context.candidate_slice
         )
-        child_result = self.operand.evaluate(child_context)
         true_slice = context.candidate_slice.compute_difference(child_result.true_slice)
 
         return AutomationResult.create_from_children(context, true_slice, [child_result])
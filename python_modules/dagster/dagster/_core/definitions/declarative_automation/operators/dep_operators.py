@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import AbstractSet, Optional
+from typing import AbstractSet, Hashable, Optional
 
 from dagster._core.definitions.asset_key import AssetKey
 from dagster._core.definitions.asset_selection import AssetSelection
@@ -26,12 +26,11 @@ def description(self) -> str:
     def evaluate(self, context: AutomationContext) -> AutomationResult:
         # only evaluate parents of the current candidates
         dep_candidate_slice = context.candidate_slice.compute_parent_slice(self.dep_key)
-        dep_context = context.for_child_condition(
-            child_condition=self.operand, child_index=0, candidate_slice=dep_candidate_slice
-        )
 
         # evaluate condition against the dependency
-        dep_result = self.operand.evaluate(dep_context)
+        dep_result = context.evaluate_child_condition(
+            child_condition=self.operand, child_index=0, candidate_slice=dep_candidate_slice
+        )
 
         # find all children of the true dep slice
         true_slice = dep_result.true_slice.compute_child_slice(context.asset_key)
@@ -86,6 +85,18 @@ def _get_dep_keys(
             dep_keys -= self.ignore_selection.resolve(asset_graph)
         return dep_keys
 
+    def get_context_key(
+        self, context: AutomationContext, asset_key: AssetKey
+    ) -> Optional[Hashable]:
+        # the operand is evaluated against each of the dependencies
+        keys = []
+        for dep_key in sorted(self._get_dep_keys(asset_key, context.asset_graph)):
+            key = context.result_cache.get_context_key(self.operand, context, dep_key)
+            if key is None:
+                return None
+            keys.append(key)
+        return tuple(keys)
+
 
 @whitelist_for_serdes
 class AnyDepsCondition(DepCondition):
@@ -101,12 +112,10 @@ def evaluate(self, context: AutomationContext) -> AutomationResult:
             sorted(self._get_dep_keys(context.asset_key, context.asset_graph))
         ):
             dep_condition = DepConditionWrapperCondition(dep_key=dep_key, operand=self.operand)
-            dep_result = dep_condition.evaluate(
-                context.for_child_condition(
-                    child_condition=dep_condition,
-                    child_index=i,
-                    candidate_slice=context.candidate_slice,
-                )
+            dep_result = context.evaluate_child_condition(
+                child_condition=dep_condition,
+                child_index=i,
+                candidate_slice=context.candidate_slice,
             )
             dep_results.append(dep_result)
             true_slice = true_slice.compute_union(dep_result.true_slice)
@@ -131,12 +140,10 @@ def evaluate(self, context: AutomationContext) -> AutomationResult:
             sorted(self._get_dep_keys(context.asset_key, context.asset_graph))
         ):
             dep_condition = DepConditionWrapperCondition(dep_key=dep_key, operand=self.operand)
-            dep_result = dep_condition.evaluate(
-                context.for_child_condition(
-                    child_condition=dep_condition,
-                    child_index=i,
-                    candidate_slice=context.candidate_slice,
-                )
+            dep_result = context.evaluate_child_condition(
+                child_condition=dep_condition,
+                child_index=i,
+                candidate_slice=context.candidate_slice,
             )
             dep_results.append(dep_result)
             true_slice = true_slice.compute_intersection(dep_result.true_slice)
@@ -37,13 +37,12 @@ def _get_previous_child_true_slice(self, context: AutomationContext) -> Optional
 
     def evaluate(self, context: AutomationContext) -> AutomationResult:
         # evaluate child condition
-        child_context = context.for_child_condition(
+        child_result = context.evaluate_child_condition(
             self.operand,
             child_index=0,
             # must evaluate child condition over the entire slice to avoid missing state transitions
             candidate_slice=context.asset_graph_view.get_asset_slice(asset_key=context.asset_key),
         )
-        child_result = self.operand.evaluate(child_context)
 
         # get the set of asset partitions of the child which newly became true
         newly_true_child_slice = child_result.true_slice.compute_difference(
@@ -32,16 +32,14 @@ def evaluate(self, context: AutomationContext) -> AutomationResult:
         )
 
         # compute result for trigger condition
-        trigger_context = context.for_child_condition(
+        trigger_result = context.evaluate_child_condition(
             self.trigger_condition, child_index=0, candidate_slice=child_candidate_slice
         )
-        trigger_result = self.trigger_condition.evaluate(trigger_context)
 
         # compute result for reset condition
-        reset_context = context.for_child_condition(
+        reset_result = context.evaluate_child_condition(
             self.reset_condition, child_index=1, candidate_slice=child_candidate_slice
         )
-        reset_result = self.reset_condition.evaluate(reset_context)
 
         # take the previous slice that this was true for
         true_slice = context.previous_true_slice or context.asset_graph_view.create_empty_slice(
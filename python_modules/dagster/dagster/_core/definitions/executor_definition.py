@@ -332,12 +332,25 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    worker_pool_cfg = check.opt_nullable_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        use_worker_pool=worker_pool_cfg is not None,
+        max_steps_per_worker=(
+            check.opt_int_elem(worker_pool_cfg, "max_steps_per_worker")
+            if worker_pool_cfg is not None
+            else None
+        ),
+        max_worker_memory_mb=(
+            check.opt_int_elem(worker_pool_cfg, "max_worker_memory_mb")
+            if worker_pool_cfg is not None
+            else None
+        ),
     )
 
 
@@ -390,6 +403,32 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "worker_pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "The number of steps a worker process executes before it is replaced by a"
+                        " new one. By default, workers are reused for the whole run."
+                    ),
+                ),
+                "max_worker_memory_mb": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Replace a worker process once its peak resident memory exceeds this many"
+                        " megabytes. Not supported on Windows."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes instead of starting a new"
+                " process per step. Each worker loads the job and opens the instance once, which"
+                " reduces per-step overhead for jobs with many small ops."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -419,6 +458,19 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    By default each step runs in a freshly started process. For jobs with many small ops, the
+    optional ``worker_pool`` config instead reuses long-lived worker processes that load the job
+    and open the instance once, replacing each worker after ``max_steps_per_worker`` steps or once
+    it exceeds ``max_worker_memory_mb``:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              worker_pool:
+                max_steps_per_worker: 100
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
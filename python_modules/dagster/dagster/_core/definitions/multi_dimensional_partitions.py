@@ -1,9 +1,12 @@
 import hashlib
 import itertools
+import json
 from datetime import datetime
 from functools import lru_cache, reduce
 from typing import (
+    Any,
     Dict,
+    Iterable,
     List,
     Mapping,
     NamedTuple,
@@ -23,6 +26,7 @@
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
 from dagster._core.errors import (
     DagsterInvalidDefinitionError,
+    DagsterInvalidDeserializationVersionError,
     DagsterInvalidInvocationError,
     DagsterUnknownPartitionError,
 )
@@ -347,25 +351,25 @@ def get_partition_keys(
     def filter_valid_partition_keys(
         self, partition_keys: Set[str], dynamic_partitions_store: DynamicPartitionsStore
     ) -> Set[MultiPartitionKey]:
-        partition_keys_by_dimension = {
-            dim.name: dim.partitions_def.get_partition_keys(
-                dynamic_partitions_store=dynamic_partitions_store
+        # partition key strings list the dimension keys in dimension order, so they can be checked
+        # against the keys of each dimension without constructing MultiPartitionKeys
+        dimension_key_sets = [
+            set(
+                dim.partitions_def.get_partition_keys(
+                    dynamic_partitions_store=dynamic_partitions_store
+                )
             )
             for dim in self.partitions_defs
-        }
+        ]
         validated_partitions = set()
         for partition_key in partition_keys:
             partition_key_strs = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
-            if len(partition_key_strs) != len(self.partitions_defs):
+            if len(partition_key_strs) != len(dimension_key_sets):
                 continue
 
-            multipartition_key = MultiPartitionKey(
-                {dim.name: partition_key_strs[i] for i, dim in enumerate(self._partitions_defs)}
-            )
-
             if all(
-                key in partition_keys_by_dimension.get(dim, [])
-                for dim, key in multipartition_key.keys_by_dimension.items()
+                key in dimension_keys
+                for key, dimension_keys in zip(partition_key_strs, dimension_key_sets)
             ):
                 validated_partitions.add(partition_key)
 
@@ -548,6 +552,301 @@ def get_num_partitions(
         return reduce(lambda x, y: x * y, dimension_counts, 1)
 
 
+class MultiPartitionsSubset(PartitionsSubset):
+    """A subset of a MultiPartitionsDefinition, stored as a subset of the primary dimension for each
+    key of the secondary dimension.
+
+    When the primary dimension is time-window partitioned, each of these subsets serializes as the
+    time windows it contains, so the serialized size grows with the number of gaps rather than with
+    the number of partitions in the subset. This is used by the asset status cache, which folds newly
+    materialized partitions into the stored subsets on every refresh.
+
+    The partition keys of this subset are the plain partition key strings, e.g. "2020-01-01|a".
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 1
+
+    def __init__(
+        self,
+        partitions_def: MultiPartitionsDefinition,
+        subsets_by_secondary_key: Optional[Mapping[str, PartitionsSubset]] = None,
+    ):
+        self._partitions_def = check.inst_param(
+            partitions_def, "partitions_def", MultiPartitionsDefinition
+        )
+        self._subsets_by_secondary_key = {
+            secondary_key: subset
+            for secondary_key, subset in check.opt_mapping_param(
+                subsets_by_secondary_key,
+                "subsets_by_secondary_key",
+                key_type=str,
+                value_type=PartitionsSubset,
+            ).items()
+            if not subset.is_empty
+        }
+
+        dimension_names = partitions_def.partition_dimension_names
+        self._primary_index = dimension_names.index(partitions_def.primary_dimension.name)
+        self._secondary_index = 1 - self._primary_index
+
+    @property
+    def partitions_def(self) -> MultiPartitionsDefinition:
+        return self._partitions_def
+
+    @property
+    def subsets_by_secondary_key(self) -> Mapping[str, PartitionsSubset]:
+        return self._subsets_by_secondary_key
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._subsets_by_secondary_key
+
+    def _split_partition_key(self, partition_key: str) -> Optional[Tuple[str, str]]:
+        keys = partition_key.split(MULTIPARTITION_KEY_DELIMITER)
+        if len(keys) != 2:
+            return None
+        return keys[self._primary_index], keys[self._secondary_index]
+
+    def _join_partition_key(self, primary_key: str, secondary_key: str) -> str:
+        keys = (
+            [primary_key, secondary_key]
+            if self._primary_index == 0
+            else [secondary_key, primary_key]
+        )
+        return MULTIPARTITION_KEY_DELIMITER.join(keys)
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        return [
+            partition_key
+            for partition_key in partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            )
+            if partition_key not in self
+        ]
+
+    def get_partition_keys(self) -> Iterable[str]:
+        return [
+            self._join_partition_key(primary_key, secondary_key)
+            for secondary_key, subset in self._subsets_by_secondary_key.items()
+            for primary_key in subset.get_partition_keys()
+        ]
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        return self.to_serializable_subset().get_partition_key_ranges(
+            partitions_def,
+            current_time=current_time,
+            dynamic_partitions_store=dynamic_partitions_store,
+        )
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> "MultiPartitionsSubset":
+        new_primary_keys_by_secondary_key: Dict[str, Set[str]] = {}
+        for partition_key in partition_keys:
+            split_key = self._split_partition_key(partition_key)
+            if split_key is None:
+                check.failed(
+                    f"Partition key {partition_key} is not a key of {self._partitions_def}"
+                )
+            primary_key, secondary_key = split_key
+            new_primary_keys_by_secondary_key.setdefault(secondary_key, set()).add(primary_key)
+
+        if not new_primary_keys_by_secondary_key:
+            return self
+
+        primary_partitions_def = self._partitions_def.primary_dimension.partitions_def
+        subsets_by_secondary_key = dict(self._subsets_by_secondary_key)
+        for secondary_key, primary_keys in new_primary_keys_by_secondary_key.items():
+            subset = (
+                subsets_by_secondary_key.get(secondary_key) or primary_partitions_def.empty_subset()
+            )
+            subsets_by_secondary_key[secondary_key] = subset.with_partition_keys(primary_keys)
+
+        return MultiPartitionsSubset(self._partitions_def, subsets_by_secondary_key)
+
+    def _is_compatible(self, other: PartitionsSubset) -> bool:
+        return (
+            isinstance(other, MultiPartitionsSubset) and other.partitions_def == self.partitions_def
+        )
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if not self._is_compatible(other):
+            return super().__or__(other)
+
+        other_subsets = cast(MultiPartitionsSubset, other).subsets_by_secondary_key
+        subsets_by_secondary_key = dict(self._subsets_by_secondary_key)
+        for secondary_key, other_subset in other_subsets.items():
+            subset = subsets_by_secondary_key.get(secondary_key)
+            subsets_by_secondary_key[secondary_key] = (
+                subset | other_subset if subset is not None else other_subset
+            )
+        return MultiPartitionsSubset(self._partitions_def, subsets_by_secondary_key)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if not self._is_compatible(other):
+            return super().__sub__(other)
+
+        other_subsets = cast(MultiPartitionsSubset, other).subsets_by_secondary_key
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            {
+                secondary_key: (
+                    subset - other_subsets[secondary_key]
+                    if secondary_key in other_subsets
+                    else subset
+                )
+                for secondary_key, subset in self._subsets_by_secondary_key.items()
+            },
+        )
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if not self._is_compatible(other):
+            return super().__and__(other)
+
+        other_subsets = cast(MultiPartitionsSubset, other).subsets_by_secondary_key
+        return MultiPartitionsSubset(
+            self._partitions_def,
+            {
+                secondary_key: subset & other_subsets[secondary_key]
+                for secondary_key, subset in self._subsets_by_secondary_key.items()
+                if secondary_key in other_subsets
+            },
+        )
+
+    def serialize(self) -> str:
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "primary_dimension": self._partitions_def.primary_dimension.name,
+                # sort to ensure that equivalent partition subsets have identical serialized forms
+                "subsets": {
+                    secondary_key: self._subsets_by_secondary_key[secondary_key]
+                    .to_serializable_subset()
+                    .serialize()
+                    for secondary_key in sorted(self._subsets_by_secondary_key.keys())
+                },
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> "MultiPartitionsSubset":
+        return cls.from_serialized_data(
+            check.inst_param(partitions_def, "partitions_def", MultiPartitionsDefinition),
+            json.loads(serialized),
+        )
+
+    @classmethod
+    def is_serialized_by_primary_dimension(cls, data: Any) -> bool:
+        """Whether the parsed JSON of a serialized subset was written by `serialize`, rather than in
+        the default format that lists every partition key in the subset.
+        """
+        return isinstance(data, dict) and "primary_dimension" in data
+
+    @classmethod
+    def from_serialized_data(
+        cls, partitions_def: MultiPartitionsDefinition, data: Any
+    ) -> "MultiPartitionsSubset":
+        """Builds the subset from the parsed JSON of a serialized subset in either format."""
+        if not cls.is_serialized_by_primary_dimension(data):
+            return cls(partitions_def).with_partition_keys(
+                DefaultPartitionsSubset.from_serialized_data(data).get_partition_keys()
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+        if data.get("primary_dimension") != partitions_def.primary_dimension.name:
+            check.failed(
+                f"Serialized subset is keyed by dimension {data.get('primary_dimension')}, but the"
+                f" primary dimension of {partitions_def} is {partitions_def.primary_dimension.name}"
+            )
+
+        primary_partitions_def = partitions_def.primary_dimension.partitions_def
+        return cls(
+            partitions_def,
+            {
+                secondary_key: primary_partitions_def.deserialize_subset(serialized_subset)
+                for secondary_key, serialized_subset in data["subsets"].items()
+            },
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if not isinstance(partitions_def, MultiPartitionsDefinition):
+            return False
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if isinstance(data, list) or (isinstance(data, dict) and "subset" in data):
+            return DefaultPartitionsSubset.can_deserialize(
+                partitions_def,
+                serialized,
+                serialized_partitions_def_unique_id,
+                serialized_partitions_def_class_name,
+            )
+        return (
+            isinstance(data, dict)
+            and data.get("version") == cls.SERIALIZATION_VERSION
+            and data.get("primary_dimension") == partitions_def.primary_dimension.name
+            and data.get("subsets") is not None
+        )
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, MultiPartitionsSubset)
+            and self._partitions_def == other.partitions_def
+            and set(self.get_partition_keys()) == set(other.get_partition_keys())
+        )
+
+    def __len__(self) -> int:
+        return sum(len(subset) for subset in self._subsets_by_secondary_key.values())
+
+    def __contains__(self, value) -> bool:
+        split_key = self._split_partition_key(value) if isinstance(value, str) else None
+        if split_key is None:
+            return False
+        primary_key, secondary_key = split_key
+        subset = self._subsets_by_secondary_key.get(secondary_key)
+        return subset is not None and primary_key in subset
+
+    def __repr__(self) -> str:
+        return f"MultiPartitionsSubset(subsets_by_secondary_key={self._subsets_by_secondary_key})"
+
+    def empty_subset(
+        self, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "MultiPartitionsSubset":
+        return MultiPartitionsSubset(self._partitions_def)
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        # readers of serialized multi-partitions subsets expect the definition's default subset
+        # class, so this format is only used where it is read back explicitly
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
+
+
 def get_tags_from_multi_partition_key(multi_partition_key: MultiPartitionKey) -> Mapping[str, str]:
     check.inst_param(multi_partition_key, "multi_partition_key", MultiPartitionKey)
 
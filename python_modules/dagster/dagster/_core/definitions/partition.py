@@ -330,6 +330,18 @@ def __init__(self, partition_keys: Sequence[str]):
 
         self._partition_keys = partition_keys
 
+    @property
+    def partitions_subset_class(self) -> Type["PartitionsSubset"]:
+        from .partition_bitmap import BitmapPartitionsSubset
+
+        return BitmapPartitionsSubset
+
+    def empty_subset(self) -> "PartitionsSubset":
+        from .partition_bitmap import BitmapPartitionsSubset
+
+        # the subset is bound to the index of this definition's keys
+        return BitmapPartitionsSubset.from_partitions_def(self)
+
     @public
     def get_partition_keys(
         self,
@@ -1058,7 +1070,7 @@ def from_subset(
         dynamic_partitions_store: DynamicPartitionsStore,
     ):
         return cls(
-            serialized_subset=subset.serialize(),
+            serialized_subset=subset.to_serializable_subset().serialize(),
             serialized_partitions_def_unique_id=partitions_def.get_serializable_unique_identifier(
                 dynamic_partitions_store
             ),
@@ -1102,11 +1114,17 @@ def get_partition_keys_not_in_subset(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Iterable[str]:
-        return set(
+        from .partition_bitmap import get_partition_keys_index
+
+        # the index of the definition's keys is cached across calls, so only the keys of this
+        # subset need to be looked up
+        index = get_partition_keys_index(
+            partitions_def,
             partitions_def.get_partition_keys(
                 current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
-            )
-        ) - set(self.subset)
+            ),
+        )
+        return set(index.keys_for_bits(index.all_bits & ~index.bits_for_keys(self.subset)))
 
     def get_partition_keys(self) -> Iterable[str]:
         return self.subset
@@ -1117,26 +1135,15 @@ def get_partition_key_ranges(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[PartitionKeyRange]:
-        partition_keys = partitions_def.get_partition_keys(
-            current_time, dynamic_partitions_store=dynamic_partitions_store
-        )
-        cur_range_start = None
-        cur_range_end = None
-        result = []
-        for partition_key in partition_keys:
-            if partition_key in self.subset:
-                if cur_range_start is None:
-                    cur_range_start = partition_key
-                cur_range_end = partition_key
-            else:
-                if cur_range_start is not None and cur_range_end is not None:
-                    result.append(PartitionKeyRange(cur_range_start, cur_range_end))
-                cur_range_start = cur_range_end = None
-
-        if cur_range_start is not None and cur_range_end is not None:
-            result.append(PartitionKeyRange(cur_range_start, cur_range_end))
+        from .partition_bitmap import get_partition_keys_index
 
-        return result
+        index = get_partition_keys_index(
+            partitions_def,
+            partitions_def.get_partition_keys(
+                current_time, dynamic_partitions_store=dynamic_partitions_store
+            ),
+        )
+        return index.ranges_for_bits(index.bits_for_keys(self.subset))
 
     def with_partition_keys(self, partition_keys: Iterable[str]) -> "DefaultPartitionsSubset":
         return DefaultPartitionsSubset(
@@ -1158,9 +1165,12 @@ def serialize(self) -> str:
     def from_serialized(
         cls, partitions_def: PartitionsDefinition, serialized: str
     ) -> "PartitionsSubset":
-        # Check the version number, so only valid versions can be deserialized.
-        data = json.loads(serialized)
+        return cls.from_serialized_data(json.loads(serialized))
 
+    @classmethod
+    def from_serialized_data(cls, data: Any) -> "DefaultPartitionsSubset":
+        """Builds the subset from the parsed JSON of a serialized subset."""
+        # Check the version number, so only valid versions can be deserialized.
         if isinstance(data, list):
             # backwards compatibility
             return cls(subset=set(data))
@@ -1189,7 +1199,10 @@ def can_deserialize(
         )
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
+        if not isinstance(other, DefaultPartitionsSubset):
+            # let other subsets of the same keys, e.g. BitmapPartitionsSubset, compare themselves
+            return NotImplemented
+        return self.subset == other.subset
 
     def __len__(self) -> int:
         return len(self.subset)
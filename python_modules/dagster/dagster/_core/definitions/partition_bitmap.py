@@ -0,0 +1,370 @@
+import base64
+import hashlib
+import json
+import re
+import zlib
+from datetime import datetime
+from itertools import chain
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+import dagster._check as check
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    DefaultPartitionsSubset,
+    PartitionsDefinition,
+    PartitionsSubset,
+)
+from dagster._core.definitions.partition_key_range import PartitionKeyRange
+from dagster._core.errors import DagsterInvalidDeserializationVersionError
+from dagster._core.instance import DynamicPartitionsStore
+
+_RUN_OF_ONES = re.compile("1+")
+
+
+class PartitionKeysIndex:
+    """Maps each key of an ordered sequence of partition keys to its ordinal, so that sets of
+    partition keys can be represented as bitsets.
+
+    The index is a snapshot: it is built from the keys a PartitionsDefinition returned at a point in
+    time and never changes afterwards. Use `get_partition_keys_index` to share the index of a
+    partitions definition between callers.
+    """
+
+    def __init__(self, partition_keys: Sequence[str]):
+        self._partition_keys = check.sequence_param(partition_keys, "partition_keys")
+        self._ordinals: Dict[str, int] = {key: i for i, key in enumerate(partition_keys)}
+        self._fingerprint: Optional[str] = None
+
+    @property
+    def partition_keys(self) -> Sequence[str]:
+        return self._partition_keys
+
+    @property
+    def all_bits(self) -> int:
+        return (1 << len(self._partition_keys)) - 1
+
+    @property
+    def fingerprint(self) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = hashlib.sha1(
+                json.dumps(list(self._partition_keys)).encode("utf-8")
+            ).hexdigest()
+        return self._fingerprint
+
+    def __len__(self) -> int:
+        return len(self._partition_keys)
+
+    def __contains__(self, partition_key: str) -> bool:
+        return partition_key in self._ordinals
+
+    def ordinal(self, partition_key: str) -> Optional[int]:
+        return self._ordinals.get(partition_key)
+
+    def bits_for_keys(self, partition_keys: Iterable[str]) -> int:
+        """Returns the bitset for the given keys. Keys that are not in the index are ignored."""
+        # set bits in a byte buffer and convert once, since or-ing single bits into a python int
+        # would copy the whole int for every key
+        buffer = bytearray((len(self._partition_keys) + 7) // 8)
+        ordinals = self._ordinals
+        for partition_key in partition_keys:
+            ordinal = ordinals.get(partition_key)
+            if ordinal is not None:
+                buffer[ordinal >> 3] |= 1 << (ordinal & 7)
+        return int.from_bytes(buffer, "little")
+
+    def keys_for_bits(self, bits: int) -> Sequence[str]:
+        """Returns the keys whose bits are set, in index order."""
+        keys = self._partition_keys
+        return list(chain.from_iterable(keys[start : end + 1] for start, end in iter_runs(bits)))
+
+    def ranges_for_bits(self, bits: int) -> Sequence[PartitionKeyRange]:
+        keys = self._partition_keys
+        return [PartitionKeyRange(keys[start], keys[end]) for start, end in iter_runs(bits)]
+
+
+def iter_runs(bits: int) -> Iterator[Tuple[int, int]]:
+    """Yields the (start, end) ordinals, inclusive, of each run of consecutive set bits."""
+    # scanning the binary representation runs in C, which is much faster than shifting the
+    # int around, as every shift copies it
+    for match in _RUN_OF_ONES.finditer(bin(bits)[:1:-1]):
+        yield match.start(), match.end() - 1
+
+
+# attribute of a PartitionsDefinition that holds the index of the keys it last returned
+_PARTITION_KEYS_INDEX_ATTR = "_partition_keys_index__internal__"
+
+
+def get_partition_keys_index(
+    partitions_def: PartitionsDefinition, partition_keys: Sequence[str]
+) -> PartitionKeysIndex:
+    """Returns a PartitionKeysIndex for the given keys of the partitions definition, reusing the
+    index that was last built for the definition if its keys have not changed.
+
+    The index is stored on the definition, so it is released along with it. Time window and dynamic
+    partitions definitions return a new sequence on every call, so unchanged keys are detected by
+    comparing the sequences, which is still much cheaper than rebuilding the index.
+    """
+    index = getattr(partitions_def, _PARTITION_KEYS_INDEX_ATTR, None)
+    if index is not None and (
+        index.partition_keys is partition_keys or index.partition_keys == partition_keys
+    ):
+        return index
+
+    index = PartitionKeysIndex(partition_keys)
+    setattr(partitions_def, _PARTITION_KEYS_INDEX_ATTR, index)
+    return index
+
+
+class BitmapPartitionsSubset(PartitionsSubset):
+    """A subset of the partitions of a StaticPartitionsDefinition, stored as a bitset over the
+    ordinals of the definition's partition keys.
+
+    Union, intersection and difference with another BitmapPartitionsSubset over the same keys are
+    single big-int operations, and key ranges are computed from runs of set bits rather than by
+    testing every key of the definition for membership.
+
+    Subsets are bound to the keys that the definition had when the subset was created. Adding a key
+    that is not part of those keys degrades to a DefaultPartitionsSubset. Subsets are persisted in
+    the format of DefaultPartitionsSubset (see `to_serializable_subset`), which every reader
+    understands.
+
+    Dynamic partitions definitions do not create subsets of this class, since their empty subsets
+    are created without a dynamic partitions store to read their keys from. Their
+    DefaultPartitionsSubsets still compute key ranges and missing keys through the cached
+    PartitionKeysIndex of the definition.
+    """
+
+    # Every time we change the serialization format, we should increment the version number.
+    # This will ensure that we can gracefully degrade when deserializing old data.
+    SERIALIZATION_VERSION = 1
+
+    def __init__(self, index: PartitionKeysIndex, bits: int = 0):
+        self._index = check.inst_param(index, "index", PartitionKeysIndex)
+        self._bits = check.int_param(bits, "bits")
+
+    @classmethod
+    def from_partitions_def(
+        cls,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> "BitmapPartitionsSubset":
+        """Returns an empty subset over the current keys of the given partitions definition."""
+        return cls(
+            get_partition_keys_index(
+                partitions_def,
+                partitions_def.get_partition_keys(
+                    current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+                ),
+            )
+        )
+
+    @property
+    def index(self) -> PartitionKeysIndex:
+        return self._index
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    @property
+    def is_empty(self) -> bool:
+        return self._bits == 0
+
+    def _get_index_for_partitions_def(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime],
+        dynamic_partitions_store: Optional[DynamicPartitionsStore],
+    ) -> Tuple[PartitionKeysIndex, int]:
+        """Returns an index for the current keys of the partitions definition, along with the bits
+        of this subset rebased onto that index.
+        """
+        index = get_partition_keys_index(
+            partitions_def,
+            partitions_def.get_partition_keys(
+                current_time=current_time, dynamic_partitions_store=dynamic_partitions_store
+            ),
+        )
+        if index is self._index:
+            return index, self._bits
+        return index, index.bits_for_keys(self.get_partition_keys())
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        index, bits = self._get_index_for_partitions_def(
+            partitions_def, current_time, dynamic_partitions_store
+        )
+        return index.keys_for_bits(index.all_bits & ~bits)
+
+    def get_partition_keys(self) -> Iterable[str]:
+        # a set, like the keys of a DefaultPartitionsSubset, which this subset replaces for static
+        # partitions definitions
+        return set(self._index.keys_for_bits(self._bits))
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        index, bits = self._get_index_for_partitions_def(
+            partitions_def, current_time, dynamic_partitions_store
+        )
+        return index.ranges_for_bits(bits)
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> PartitionsSubset:
+        partition_keys = list(partition_keys)
+        if not all(partition_key in self._index for partition_key in partition_keys):
+            return DefaultPartitionsSubset(set(self.get_partition_keys()) | set(partition_keys))
+        return BitmapPartitionsSubset(
+            self._index, self._bits | self._index.bits_for_keys(partition_keys)
+        )
+
+    def _get_other_bits(self, other: PartitionsSubset) -> Optional[int]:
+        if isinstance(other, BitmapPartitionsSubset) and (
+            other.index is self._index or other.index.partition_keys == self._index.partition_keys
+        ):
+            return other.bits
+        return None
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        other_bits = self._get_other_bits(other)
+        if other_bits is None:
+            return super().__or__(other)
+        return BitmapPartitionsSubset(self._index, self._bits | other_bits)
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, AllPartitionsSubset):
+            return self.empty_subset()
+        other_bits = self._get_other_bits(other)
+        if other_bits is None:
+            other_bits = self._index.bits_for_keys(other.get_partition_keys())
+        return BitmapPartitionsSubset(self._index, self._bits & ~other_bits)
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if isinstance(other, AllPartitionsSubset):
+            return self
+        other_bits = self._get_other_bits(other)
+        if other_bits is None:
+            other_bits = self._index.bits_for_keys(other.get_partition_keys())
+        return BitmapPartitionsSubset(self._index, self._bits & other_bits)
+
+    def serialize(self) -> str:
+        # The bitset is only meaningful together with the keys it indexes, so store a fingerprint
+        # of the keys to detect a changed partitions definition on deserialization. Runs of set
+        # bits compress well, so contiguous subsets serialize to a few bytes.
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "num_keys": len(self._index),
+                "keys_fingerprint": self._index.fingerprint,
+                "bitmap": base64.b64encode(
+                    zlib.compress(
+                        self._bits.to_bytes((len(self._index) + 7) // 8, "little"),
+                    )
+                ).decode("ascii"),
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> PartitionsSubset:
+        data = json.loads(serialized)
+
+        if isinstance(data, list) or "subset" in data:
+            # subsets that were serialized as a DefaultPartitionsSubset
+            return cls.from_partitions_def(partitions_def).with_partition_keys(
+                DefaultPartitionsSubset.from_serialized(
+                    partitions_def, serialized
+                ).get_partition_keys()
+            )
+
+        if data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only version {cls.SERIALIZATION_VERSION} is supported."
+            )
+
+        index = get_partition_keys_index(partitions_def, partitions_def.get_partition_keys())
+        check.invariant(
+            index.fingerprint == data["keys_fingerprint"],
+            "Cannot deserialize a bitmap partitions subset for a partitions definition whose keys"
+            " have changed since the subset was serialized.",
+        )
+        return cls(
+            index,
+            int.from_bytes(zlib.decompress(base64.b64decode(data["bitmap"])), "little"),
+        )
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if isinstance(data, list) or "subset" in data:
+            return DefaultPartitionsSubset.can_deserialize(
+                partitions_def,
+                serialized,
+                serialized_partitions_def_unique_id,
+                serialized_partitions_def_class_name,
+            )
+
+        # the keys of the partitions definition must be known without a dynamic partitions store
+        # to map the serialized bits back to keys
+        try:
+            keys_fingerprint = get_partition_keys_index(
+                partitions_def, partitions_def.get_partition_keys()
+            ).fingerprint
+        except check.CheckError:
+            return False
+
+        return (
+            data.get("version") == cls.SERIALIZATION_VERSION
+            and data.get("keys_fingerprint") == keys_fingerprint
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BitmapPartitionsSubset):
+            other_bits = self._get_other_bits(other)
+            if other_bits is not None:
+                return self._bits == other_bits
+        # compare by keys with subsets of static partitions created before this class was used
+        if isinstance(other, (BitmapPartitionsSubset, DefaultPartitionsSubset)):
+            return self.get_partition_keys() == set(other.get_partition_keys())
+        return False
+
+    def __len__(self) -> int:
+        return bin(self._bits).count("1")
+
+    def __contains__(self, value) -> bool:
+        ordinal = self._index.ordinal(value)
+        return ordinal is not None and bool(self._bits >> ordinal & 1)
+
+    def __repr__(self) -> str:
+        return f"BitmapPartitionsSubset(subset={set(self.get_partition_keys())})"
+
+    def empty_subset(
+        self, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "BitmapPartitionsSubset":
+        return BitmapPartitionsSubset(self._index)
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        # persist the subset in the default format, which any reader of these subsets understands,
+        # including versions that predate this class
+        return DefaultPartitionsSubset(set(self.get_partition_keys()))
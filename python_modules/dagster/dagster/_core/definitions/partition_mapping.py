@@ -8,11 +8,11 @@
 from typing import (
     Collection,
     Dict,
-    List,
     Mapping,
     NamedTuple,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -22,6 +22,7 @@
 import dagster._check as check
 from dagster._annotations import PublicAttr, experimental, public
 from dagster._core.definitions.multi_dimensional_partitions import (
+    MULTIPARTITION_KEY_DELIMITER,
     MultiPartitionKey,
     MultiPartitionsDefinition,
 )
@@ -31,7 +32,12 @@
     PartitionsSubset,
     StaticPartitionsDefinition,
 )
-from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
+from dagster._core.definitions.time_window_partitions import (
+    BaseTimeWindowPartitionsSubset,
+    TimeWindow,
+    TimeWindowPartitionsDefinition,
+    TimeWindowPartitionsSubset,
+)
 from dagster._core.instance import DynamicPartitionsStore
 from dagster._serdes import whitelist_for_serdes
 from dagster._utils.cached_method import cached_method
@@ -108,6 +114,60 @@ def description(self) -> str:
         raise NotImplementedError()
 
 
+def _get_time_window_identity_subsets(
+    from_partitions_subset: PartitionsSubset,
+    from_partitions_def: Optional[PartitionsDefinition],
+    to_partitions_def: PartitionsDefinition,
+    current_time: Optional[datetime],
+) -> Optional[Tuple[PartitionsSubset, PartitionsSubset]]:
+    """When two time window partitions definitions only differ in their start or end, partitions
+    with the same key cover the same time window. So the partitions of from_partitions_subset that
+    exist in to_partitions_def can be found by intersecting time windows rather than by listing the
+    partition keys of both definitions.
+
+    Returns the subset of to_partitions_def that has the same keys as from_partitions_subset, and
+    the subset of from_partitions_subset whose keys don't exist in to_partitions_def. Returns None if
+    the partitions definitions can't be compared by time window.
+    """
+    if not (
+        isinstance(from_partitions_def, TimeWindowPartitionsDefinition)
+        and isinstance(to_partitions_def, TimeWindowPartitionsDefinition)
+        and isinstance(from_partitions_subset, BaseTimeWindowPartitionsSubset)
+        and from_partitions_def.equal_except_for_start_or_end(to_partitions_def)
+    ):
+        return None
+
+    first_window = to_partitions_def.get_first_partition_window(current_time=current_time)
+    last_window = to_partitions_def.get_last_partition_window(current_time=current_time)
+    existing_time_windows = (
+        [TimeWindow(first_window.start, last_window.end)]
+        if first_window is not None and last_window is not None
+        else []
+    )
+
+    from_time_windows_subset = TimeWindowPartitionsSubset(
+        from_partitions_def,
+        num_partitions=None,
+        included_time_windows=from_partitions_subset.included_time_windows,
+    )
+    existing_time_windows_subset = (
+        TimeWindowPartitionsSubset(
+            from_partitions_def, num_partitions=None, included_time_windows=existing_time_windows
+        )
+        & from_time_windows_subset
+    )
+    return (
+        TimeWindowPartitionsSubset(
+            to_partitions_def,
+            num_partitions=None,
+            included_time_windows=cast(
+                TimeWindowPartitionsSubset, existing_time_windows_subset
+            ).included_time_windows,
+        ),
+        from_time_windows_subset - existing_time_windows_subset,
+    )
+
+
 @whitelist_for_serdes
 class IdentityPartitionMapping(PartitionMapping, NamedTuple("_IdentityPartitionMapping", [])):
     """Expects that the upstream and downstream assets are partitioned in the same way, and maps
@@ -128,6 +188,18 @@ def get_upstream_mapped_partitions_result_for_partitions(
         if downstream_partitions_def == upstream_partitions_def:
             return UpstreamPartitionsResult(downstream_partitions_subset, [])
 
+        time_window_subsets = _get_time_window_identity_subsets(
+            downstream_partitions_subset,
+            downstream_partitions_def,
+            upstream_partitions_def,
+            current_time=current_time,
+        )
+        if time_window_subsets is not None:
+            upstream_partitions_subset, nonexistent_partitions_subset = time_window_subsets
+            return UpstreamPartitionsResult(
+                upstream_partitions_subset, list(nonexistent_partitions_subset.get_partition_keys())
+            )
+
         upstream_partition_keys = set(
             upstream_partitions_def.get_partition_keys(
                 dynamic_partitions_store=dynamic_partitions_store
@@ -156,6 +228,15 @@ def get_downstream_partitions_for_partitions(
         if upstream_partitions_def == downstream_partitions_def:
             return upstream_partitions_subset
 
+        time_window_subsets = _get_time_window_identity_subsets(
+            upstream_partitions_subset,
+            upstream_partitions_def,
+            downstream_partitions_def,
+            current_time=current_time,
+        )
+        if time_window_subsets is not None:
+            return time_window_subsets[0]
+
         upstream_partition_keys = set(upstream_partitions_subset.get_partition_keys())
         downstream_partition_keys = set(
             downstream_partitions_def.get_partition_keys(
@@ -375,32 +456,6 @@ def _get_dependency_partitions_subset(
         partition keys in the partitions definition b_partitions_def that are
         dependencies of the partition keys in a_partition_keys.
         """
-        a_partition_keys_by_dimension = defaultdict(set)
-        if isinstance(a_partitions_def, MultiPartitionsDefinition):
-            for partition_key in a_partitions_subset.get_partition_keys():
-                key = a_partitions_def.get_partition_key_from_str(partition_key)
-                for dimension_name, key in key.keys_by_dimension.items():
-                    a_partition_keys_by_dimension[dimension_name].add(key)
-        else:
-            for partition_key in a_partitions_subset.get_partition_keys():
-                a_partition_keys_by_dimension[None].add(partition_key)
-
-        # Maps the dimension name and key of a partition in a_partitions_def to the list of
-        # partition keys in b_partitions_def that are dependencies of that partition
-        dep_b_keys_by_a_dim_and_key: Dict[Optional[str], Dict[Optional[str], List[str]]] = (
-            defaultdict(lambda: defaultdict(list))
-        )
-        required_but_nonexistent_upstream_partitions = set()
-
-        b_dimension_partitions_def_by_name: Dict[Optional[str], PartitionsDefinition] = (
-            {
-                dimension.name: dimension.partitions_def
-                for dimension in b_partitions_def.partitions_defs
-            }
-            if isinstance(b_partitions_def, MultiPartitionsDefinition)
-            else {None: b_partitions_def}
-        )
-
         if a_upstream_of_b:
             # a_partitions_def is upstream of b_partitions_def, so we need to map the
             # dimension names of a_partitions_def to the corresponding dependent dimensions of
@@ -414,34 +469,6 @@ def _get_dependency_partitions_subset(
                     a_partitions_def, b_partitions_def
                 )
             }
-
-            for a_dim_name, keys in a_partition_keys_by_dimension.items():
-                if a_dim_name in a_dim_to_dependency_b_dim:
-                    (
-                        b_dim_name,
-                        dimension_mapping,
-                    ) = a_dim_to_dependency_b_dim[a_dim_name]
-                    a_dimension_partitions_def = self.get_partitions_def(
-                        a_partitions_def, a_dim_name
-                    )
-                    b_dimension_partitions_def = self.get_partitions_def(
-                        b_partitions_def, b_dim_name
-                    )
-                    for key in keys:
-                        # if downstream dimension mapping exists, for a given key, get the list of
-                        # downstream partition keys that are dependencies of that key
-                        dep_b_keys_by_a_dim_and_key[a_dim_name][key] = list(
-                            dimension_mapping.get_downstream_partitions_for_partitions(
-                                a_dimension_partitions_def.empty_subset().with_partition_keys(
-                                    [key]
-                                ),
-                                a_dimension_partitions_def,
-                                b_dimension_partitions_def,
-                                current_time=current_time,
-                                dynamic_partitions_store=dynamic_partitions_store,
-                            ).get_partition_keys()
-                        )
-
         else:
             # a_partitions_def is downstream of b_partitions_def, so we need to map the
             # dimension names of a_partitions_def to the corresponding dependency dimensions of
@@ -456,74 +483,118 @@ def _get_dependency_partitions_subset(
                 )
             }
 
-            for a_dim_name, keys in a_partition_keys_by_dimension.items():
-                if a_dim_name in a_dim_to_dependency_b_dim:
-                    (
-                        b_dim_name,
-                        partition_mapping,
-                    ) = a_dim_to_dependency_b_dim[a_dim_name]
-                    a_dimension_partitions_def = self.get_partitions_def(
-                        a_partitions_def, a_dim_name
-                    )
-                    b_dimension_partitions_def = self.get_partitions_def(
-                        b_partitions_def, b_dim_name
-                    )
-                    for key in keys:
-                        mapped_partitions_result = (
-                            partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
-                                a_dimension_partitions_def.empty_subset().with_partition_keys(
-                                    [key]
-                                ),
-                                a_dimension_partitions_def,
-                                b_dimension_partitions_def,
-                                current_time=current_time,
-                                dynamic_partitions_store=dynamic_partitions_store,
-                            )
-                        )
-                        dep_b_keys_by_a_dim_and_key[a_dim_name][key] = list(
-                            mapped_partitions_result.partitions_subset.get_partition_keys()
-                        )
-                        required_but_nonexistent_upstream_partitions.update(
-                            set(mapped_partitions_result.required_but_nonexistent_partition_keys)
-                        )
-
-        b_partition_keys = set()
+        b_dimension_partitions_def_by_name: Dict[Optional[str], PartitionsDefinition] = (
+            {
+                dimension.name: dimension.partitions_def
+                for dimension in b_partitions_def.partitions_defs
+            }
+            if isinstance(b_partitions_def, MultiPartitionsDefinition)
+            else {None: b_partitions_def}
+        )
 
-        mapped_a_dim_names = a_dim_to_dependency_b_dim.keys()
+        mapped_a_dim_names = list(a_dim_to_dependency_b_dim.keys())
         mapped_b_dim_names = [mapping[0] for mapping in a_dim_to_dependency_b_dim.values()]
         unmapped_b_dim_names = list(
             set(b_dimension_partitions_def_by_name.keys()) - set(mapped_b_dim_names)
         )
+        required_but_nonexistent_upstream_partitions = set()
+
+        def map_dimension_keys(a_dim_name: Optional[str], keys: Collection[str]) -> Sequence[str]:
+            """Returns the partition keys in the dependency dimension of b_partitions_def that are
+            dependencies of the given keys of a dimension of a_partitions_def.
+            """
+            b_dim_name, partition_mapping = a_dim_to_dependency_b_dim[a_dim_name]
+            a_dimension_partitions_def = self.get_partitions_def(a_partitions_def, a_dim_name)
+            b_dimension_partitions_def = self.get_partitions_def(b_partitions_def, b_dim_name)
+            a_dimension_partitions_subset = (
+                a_dimension_partitions_def.empty_subset().with_partition_keys(keys)
+            )
+            if a_upstream_of_b:
+                return list(
+                    partition_mapping.get_downstream_partitions_for_partitions(
+                        a_dimension_partitions_subset,
+                        a_dimension_partitions_def,
+                        b_dimension_partitions_def,
+                        current_time=current_time,
+                        dynamic_partitions_store=dynamic_partitions_store,
+                    ).get_partition_keys()
+                )
+
+            mapped_partitions_result = (
+                partition_mapping.get_upstream_mapped_partitions_result_for_partitions(
+                    a_dimension_partitions_subset,
+                    a_dimension_partitions_def,
+                    b_dimension_partitions_def,
+                    current_time=current_time,
+                    dynamic_partitions_store=dynamic_partitions_store,
+                )
+            )
+            required_but_nonexistent_upstream_partitions.update(
+                mapped_partitions_result.required_but_nonexistent_partition_keys
+            )
+            return list(mapped_partitions_result.partitions_subset.get_partition_keys())
+
+        a_dim_names: Sequence[Optional[str]] = (
+            a_partitions_def.partition_dimension_names
+            if isinstance(a_partitions_def, MultiPartitionsDefinition)
+            else [None]
+        )
+        a_keys_by_dimension = [
+            dict(zip(a_dim_names, partition_key.split(MULTIPARTITION_KEY_DELIMITER)))
+            if len(a_dim_names) > 1
+            else {None: partition_key}
+            for partition_key in a_partitions_subset.get_partition_keys()
+        ]
+
+        # Mapping a subset of partitions gives the union of the partitions that each of its keys
+        # maps to. So rather than mapping each partition key on its own, the keys are grouped by
+        # their keys in all but one of the mapped dimensions, and the keys of the remaining
+        # dimension are mapped as one subset per group. The dimension with the most distinct keys,
+        # e.g. the time dimension of a backfill, is the one that gets mapped as a subset.
+        grouped_a_dim_names = sorted(
+            mapped_a_dim_names,
+            key=lambda dim_name: len({keys[dim_name] for keys in a_keys_by_dimension}),
+        )[-1:]
+        other_a_dim_names = [
+            dim_name for dim_name in mapped_a_dim_names if dim_name not in grouped_a_dim_names
+        ]
+        grouped_keys_by_other_keys: Dict[Tuple[str, ...], Set[str]] = defaultdict(set)
+        for keys in a_keys_by_dimension:
+            grouped_keys_by_other_keys[
+                tuple(keys[dim_name] for dim_name in other_a_dim_names)
+            ].update(keys[dim_name] for dim_name in grouped_a_dim_names)
+
+        # Maps the dimension name and key of a partition in a_partitions_def to the list of
+        # partition keys in b_partitions_def that are dependencies of that partition
+        dep_b_keys_by_a_dim_and_key: Dict[Optional[str], Dict[str, Sequence[str]]] = defaultdict(
+            dict
+        )
+        unmapped_b_dim_keys = [
+            b_dimension_partitions_def_by_name[dim_name].get_partition_keys(
+                dynamic_partitions_store=dynamic_partitions_store, current_time=current_time
+            )
+            for dim_name in unmapped_b_dim_names
+        ]
+        b_dim_names = mapped_b_dim_names + unmapped_b_dim_names
+
+        b_partition_keys = set()
+        for other_keys, grouped_keys in grouped_keys_by_other_keys.items():
+            other_keys_by_dim_name = dict(zip(other_a_dim_names, other_keys))
+            dep_b_keys_by_a_dim_name: Dict[Optional[str], Sequence[str]] = {}
+            for dim_name, key in other_keys_by_dim_name.items():
+                if key not in dep_b_keys_by_a_dim_and_key[dim_name]:
+                    dep_b_keys_by_a_dim_and_key[dim_name][key] = map_dimension_keys(dim_name, [key])
+                dep_b_keys_by_a_dim_name[dim_name] = dep_b_keys_by_a_dim_and_key[dim_name][key]
+            for dim_name in grouped_a_dim_names:
+                dep_b_keys_by_a_dim_name[dim_name] = map_dimension_keys(dim_name, grouped_keys)
 
-        for key in a_partitions_subset.get_partition_keys():
             for b_key_values in itertools.product(
-                *(
-                    [
-                        dep_b_keys_by_a_dim_and_key[dim_name][
-                            (
-                                cast(MultiPartitionsDefinition, a_partitions_def)
-                                .get_partition_key_from_str(key)
-                                .keys_by_dimension[dim_name]
-                                if dim_name
-                                else key
-                            )
-                        ]
-                        for dim_name in mapped_a_dim_names
-                    ]
-                ),
-                *[
-                    b_dimension_partitions_def_by_name[dim_name].get_partition_keys(
-                        dynamic_partitions_store=dynamic_partitions_store, current_time=current_time
-                    )
-                    for dim_name in unmapped_b_dim_names
-                ],
+                *(dep_b_keys_by_a_dim_name[dim_name] for dim_name in mapped_a_dim_names),
+                *unmapped_b_dim_keys,
             ):
                 b_partition_keys.add(
                     MultiPartitionKey(
-                        {
-                            cast(str, (mapped_b_dim_names + unmapped_b_dim_names)[i]): key
-                            for i, key in enumerate(b_key_values)
-                        }
+                        {cast(str, b_dim_names[i]): key for i, key in enumerate(b_key_values)}
                     )
                     if len(b_key_values) > 1
                     else b_key_values[0]
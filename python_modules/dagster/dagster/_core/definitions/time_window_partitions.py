@@ -1,8 +1,11 @@
+import bisect
 import functools
 import hashlib
 import json
+import math
 import re
-from abc import abstractmethod, abstractproperty
+import threading
+from abc import ABC, abstractmethod, abstractproperty
 from datetime import date, datetime, timedelta
 from enum import Enum
 from functools import cached_property
@@ -38,14 +41,18 @@
     create_pendulum_time,
     to_timezone,
 )
+from dagster._time import get_timezone
 from dagster._utils.cronstring import get_fixed_minute_interval, is_basic_daily, is_basic_hourly
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import (
+    MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL,
+    apply_fold_and_post_transition,
     cron_string_iterator,
     cron_string_repeats_every_hour,
     is_valid_cron_schedule,
     reverse_cron_string_iterator,
 )
+from dagster._vendored.dateutil.relativedelta import relativedelta
 
 from ..errors import DagsterInvalidDefinitionError, DagsterInvalidDeserializationVersionError
 from .partition import (
@@ -237,6 +244,203 @@ def to_public_time_window(self) -> TimeWindow:
         return TimeWindow(start=self.start, end=self.end)
 
 
+_FIXED_CADENCE_CRON_PATTERNS = {
+    ScheduleType.HOURLY: re.compile(r"(\d+) \* \* \* \*"),
+    ScheduleType.DAILY: re.compile(r"(\d+) (\d+) \* \* \*"),
+    ScheduleType.WEEKLY: re.compile(r"(\d+) (\d+) \* \* \d+"),
+    ScheduleType.MONTHLY: re.compile(r"(\d+) (\d+) (\d+) \* \*"),
+}
+
+
+def get_fixed_cadence_schedule_type(cron_schedule: str) -> Optional[ScheduleType]:
+    """Returns the schedule type of cron schedules that tick exactly once per hour, day, week or
+    month, whose ticks can be computed arithmetically instead of by iterating the schedule.
+    """
+    for schedule_type, pattern in _FIXED_CADENCE_CRON_PATTERNS.items():
+        match = pattern.fullmatch(cron_schedule)
+        if match is None:
+            continue
+        # days of the month that don't exist in every month are skipped in some months
+        if (
+            schedule_type == ScheduleType.MONTHLY
+            and int(match.group(3)) > MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL
+        ):
+            return None
+        return schedule_type
+    return None
+
+
+class TimeWindowIndex(ABC):
+    """Maps between the ordinal of each time window of a TimeWindowPartitionsDefinition, the start
+    of the window, and its partition key. Ordinal 0 is the first window that starts at or after the
+    start of the partitions definition.
+
+    Partition keys of windows with non-negative ordinals are formatted once and memoized, so that
+    repeated calls for the keys of the definition only need to format newly elapsed windows.
+    """
+
+    def __init__(self, partitions_def: "TimeWindowPartitionsDefinition"):
+        self._partitions_def = partitions_def
+        self._lock = threading.RLock()
+        self._keys: List[str] = []
+
+    @abstractmethod
+    def start_for_ordinal(self, ordinal: int) -> datetime: ...
+
+    @abstractmethod
+    def floor_ordinal(self, timestamp: float) -> int:
+        """Returns the ordinal of the last window that starts at or before the given timestamp."""
+
+    def key_for_ordinal(self, ordinal: int) -> str:
+        partitions_def = self._partitions_def
+        return dst_safe_strftime(
+            self.start_for_ordinal(ordinal),
+            partitions_def.timezone,
+            partitions_def.fmt,
+            partitions_def.cron_schedule,
+        )
+
+    def keys_for_ordinals(self, start: int, end: int) -> List[str]:
+        """Returns the keys of the windows with ordinals in [start, end)."""
+        if end <= start:
+            return []
+
+        with self._lock:
+            # only memoize keys that extend the memoized prefix, so that looking up windows far
+            # away from the start does not materialize all windows in between
+            if 0 <= start <= len(self._keys):
+                for ordinal in range(len(self._keys), end):
+                    self._keys.append(self.key_for_ordinal(ordinal))
+                return self._keys[start:end]
+
+            if start < 0 < end:
+                return [
+                    self.key_for_ordinal(ordinal) for ordinal in range(start, 0)
+                ] + self.keys_for_ordinals(0, end)
+
+            return [self.key_for_ordinal(ordinal) for ordinal in range(start, end)]
+
+
+class FixedCadenceTimeWindowIndex(TimeWindowIndex):
+    """Computes the windows of hourly, daily, weekly and monthly cron schedules arithmetically,
+    replicating the DST handling of `cron_string_iterator`: hourly ticks are an hour of elapsed time
+    apart, and other ticks fall on the same wall clock time of the day, moved past non-existent
+    times and to the later of two ambiguous times.
+    """
+
+    def __init__(
+        self, partitions_def: "TimeWindowPartitionsDefinition", schedule_type: ScheduleType
+    ):
+        super().__init__(partitions_def)
+        self._schedule_type = schedule_type
+        self._tz = get_timezone(partitions_def.timezone)
+
+        cron_parts = partitions_def.cron_schedule.split(" ")
+        self._minute = int(cron_parts[0])
+        self._hour = int(cron_parts[1]) if schedule_type != ScheduleType.HOURLY else 0
+
+        origin = next(iter(partitions_def._iterate_time_windows(partitions_def.start))).start  # noqa: SLF001
+        self._origin_timestamp = origin.timestamp()
+        self._origin_date = date(origin.year, origin.month, origin.day)
+
+    def start_for_ordinal(self, ordinal: int) -> datetime:
+        if self._schedule_type == ScheduleType.HOURLY:
+            return datetime.fromtimestamp(self._origin_timestamp + ordinal * 3600, tz=self._tz)
+
+        if self._schedule_type == ScheduleType.DAILY:
+            start_date = self._origin_date + timedelta(days=ordinal)
+        elif self._schedule_type == ScheduleType.WEEKLY:
+            start_date = self._origin_date + timedelta(weeks=ordinal)
+        else:
+            start_date = self._origin_date + relativedelta(months=ordinal)
+
+        return apply_fold_and_post_transition(
+            datetime(
+                start_date.year,
+                start_date.month,
+                start_date.day,
+                self._hour,
+                self._minute,
+                tzinfo=self._tz,
+            )
+        )
+
+    def floor_ordinal(self, timestamp: float) -> int:
+        if self._schedule_type == ScheduleType.HOURLY:
+            return math.floor((timestamp - self._origin_timestamp) / 3600)
+
+        local_dt = datetime.fromtimestamp(timestamp, tz=self._tz)
+        if self._schedule_type == ScheduleType.MONTHLY:
+            ordinal = (local_dt.year - self._origin_date.year) * 12 + (
+                local_dt.month - self._origin_date.month
+            )
+        else:
+            days = (local_dt.date() - self._origin_date).days
+            ordinal = days if self._schedule_type == ScheduleType.DAILY else days // 7
+
+        # the window of the timestamp's calendar day/week/month may start later in that period
+        while self.start_for_ordinal(ordinal).timestamp() > timestamp:
+            ordinal -= 1
+        while self.start_for_ordinal(ordinal + 1).timestamp() <= timestamp:
+            ordinal += 1
+        return ordinal
+
+    def ceil_ordinal(self, timestamp: float) -> int:
+        """Returns the ordinal of the first window that starts at or after the given timestamp."""
+        ordinal = self.floor_ordinal(timestamp)
+        if self.start_for_ordinal(ordinal).timestamp() < timestamp:
+            ordinal += 1
+        return ordinal
+
+    def ordinal_for_key(self, partition_key: str) -> Optional[int]:
+        """Returns the ordinal of the window with the given partition key, or None if the key does
+        not represent the start of a window.
+        """
+        partitions_def = self._partitions_def
+        try:
+            partition_key_dt = dst_safe_strptime(
+                partition_key, partitions_def.timezone, partitions_def.fmt
+            )
+        except ValueError:
+            return None
+
+        # the format might not include every component of the window start, e.g. for
+        # cron_schedule="0 7 * * *" and fmt="%Y-%m-%d", so the key belongs to the first window that
+        # starts at or after the parsed time
+        ordinal = self.ceil_ordinal(partition_key_dt.timestamp())
+        return ordinal if self.key_for_ordinal(ordinal) == partition_key else None
+
+
+class IteratedTimeWindowIndex(TimeWindowIndex):
+    """Materializes the windows of arbitrary cron schedules by iterating the schedule, extending
+    the materialized windows as later windows are requested.
+    """
+
+    def __init__(self, partitions_def: "TimeWindowPartitionsDefinition"):
+        super().__init__(partitions_def)
+        self._windows_iter = iter(partitions_def._iterate_time_windows(partitions_def.start))  # noqa: SLF001
+        self._starts: List[datetime] = []
+        self._start_timestamps: List[float] = []
+
+    def _materialize_window(self) -> None:
+        start = next(self._windows_iter).start
+        self._starts.append(start)
+        self._start_timestamps.append(start.timestamp())
+
+    def start_for_ordinal(self, ordinal: int) -> datetime:
+        check.param_invariant(ordinal >= 0, "ordinal")
+        with self._lock:
+            while len(self._starts) <= ordinal:
+                self._materialize_window()
+            return self._starts[ordinal]
+
+    def floor_ordinal(self, timestamp: float) -> int:
+        with self._lock:
+            while not self._start_timestamps or self._start_timestamps[-1] <= timestamp:
+                self._materialize_window()
+            return bisect.bisect_right(self._start_timestamps, timestamp) - 1
+
+
 @whitelist_for_serdes(is_pickleable=False)
 class TimeWindowPartitionsDefinition(
     PartitionsDefinition,
@@ -382,7 +586,37 @@ def get_current_timestamp(self, current_time: Optional[datetime] = None) -> floa
             else pendulum.now(self.timezone)
         ).timestamp()
 
+    @cached_property
+    def _time_window_index(self) -> TimeWindowIndex:
+        schedule_type = get_fixed_cadence_schedule_type(self.cron_schedule)
+        if schedule_type is not None:
+            return FixedCadenceTimeWindowIndex(self, schedule_type)
+        return IteratedTimeWindowIndex(self)
+
+    @property
+    def _fixed_cadence_index(self) -> Optional[FixedCadenceTimeWindowIndex]:
+        index = self._time_window_index
+        return index if isinstance(index, FixedCadenceTimeWindowIndex) else None
+
+    def _get_num_partitions_from_index(self, current_time: Optional[datetime] = None) -> int:
+        index = self._time_window_index
+        current_timestamp = self.get_current_timestamp(current_time=current_time)
+
+        # windows that ended before the current time, plus end_offset windows after them
+        num_partitions = max(index.floor_ordinal(current_timestamp), 0) + max(self.end_offset, 0)
+        if self.end:
+            num_partitions = min(num_partitions, max(index.floor_ordinal(self.end.timestamp()), 0))
+        if self.end_offset < 0:
+            num_partitions = max(num_partitions + self.end_offset, 0)
+        return num_partitions
+
     def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
+        fixed_cadence_index = self._fixed_cadence_index
+        if fixed_cadence_index:
+            return fixed_cadence_index.ceil_ordinal(
+                time_window.end.timestamp()
+            ) - fixed_cadence_index.ceil_ordinal(time_window.start.timestamp())
+
         if self.is_basic_daily:
             return (
                 date(
@@ -409,6 +643,9 @@ def get_num_partitions(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> int:
+        if self._fixed_cadence_index:
+            return self._get_num_partitions_from_index(current_time)
+
         last_partition_window = self.get_last_partition_window(current_time)
         first_partition_window = self.get_first_partition_window(current_time)
 
@@ -426,6 +663,12 @@ def get_partition_keys_between_indexes(
         # Start index is inclusive, end index is exclusive.
         # Method added for performance reasons, to only string format
         # partition keys included within the indices.
+        fixed_cadence_index = self._fixed_cadence_index
+        if fixed_cadence_index:
+            return fixed_cadence_index.keys_for_ordinals(
+                start_idx, min(end_idx, self._get_num_partitions_from_index(current_time))
+            )
+
         current_timestamp = self.get_current_timestamp(current_time=current_time)
 
         partitions_past_current_time = 0
@@ -464,32 +707,9 @@ def get_partition_keys(
         current_time: Optional[datetime] = None,
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> Sequence[str]:
-        current_timestamp = self.get_current_timestamp(current_time=current_time)
-
-        partitions_past_current_time = 0
-        partition_keys: List[str] = []
-        for time_window in self._iterate_time_windows(self.start):
-            if self.end and time_window.end.timestamp() > self.end.timestamp():
-                break
-            if (
-                time_window.end.timestamp() <= current_timestamp
-                or partitions_past_current_time < self.end_offset
-            ):
-                partition_keys.append(
-                    dst_safe_strftime(
-                        time_window.start, self.timezone, self.fmt, self.cron_schedule
-                    )
-                )
-
-                if time_window.end.timestamp() > current_timestamp:
-                    partitions_past_current_time += 1
-            else:
-                break
-
-        if self.end_offset < 0:
-            partition_keys = partition_keys[: self.end_offset]
-
-        return partition_keys
+        return self._time_window_index.keys_for_ordinals(
+            0, self._get_num_partitions_from_index(current_time)
+        )
 
     def __str__(self) -> str:
         schedule_str = (
@@ -749,6 +969,13 @@ def end_time_for_partition_key(self, partition_key: str) -> datetime:
 
     @functools.lru_cache(maxsize=5)
     def get_partition_keys_in_time_window(self, time_window: TimeWindow) -> Sequence[str]:
+        fixed_cadence_index = self._fixed_cadence_index
+        if fixed_cadence_index:
+            return fixed_cadence_index.keys_for_ordinals(
+                fixed_cadence_index.ceil_ordinal(time_window.start.timestamp()),
+                fixed_cadence_index.ceil_ordinal(time_window.end.timestamp()),
+            )
+
         result: List[str] = []
         time_window_end_timestamp = time_window.end.timestamp()
         for partition_time_window in self._iterate_time_windows(time_window.start):
@@ -1011,6 +1238,13 @@ def has_partition_key(
         dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
     ) -> bool:
         """Returns a boolean representing if the given partition key is valid."""
+        fixed_cadence_index = self._fixed_cadence_index
+        if fixed_cadence_index:
+            ordinal = fixed_cadence_index.ordinal_for_key(partition_key)
+            return ordinal is not None and 0 <= ordinal < self._get_num_partitions_from_index(
+                current_time
+            )
+
         try:
             partition_start_time = self.start_time_for_partition_key(partition_key)
             partition_start_timestamp = partition_start_time.timestamp()
@@ -237,7 +237,8 @@ class DagsterEventType(str, Enum):
 
 PIPELINE_RUN_STATUS_TO_EVENT_TYPE = {v: k for k, v in EVENT_TYPE_TO_PIPELINE_RUN_STATUS.items()}
 
-# These are the only events currently supported in `EventLogStorage.store_event_batch`
+# These are the only events that are explicitly batched by `DagsterEventBatchMetadata`. Any other
+# event emitted from within a step may also be batched when step event buffering is enabled.
 BATCH_WRITABLE_EVENTS = {
     DagsterEventType.ASSET_MATERIALIZATION,
     DagsterEventType.ASSET_OBSERVATION,
@@ -254,6 +255,17 @@ class DagsterEventType(str, Enum):
     DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED,
 }
 
+# Events that mark the start or end of a step. Buffered step events are always written before any
+# of these.
+STEP_BOUNDARY_EVENTS = {
+    DagsterEventType.STEP_START,
+    DagsterEventType.STEP_SUCCESS,
+    DagsterEventType.STEP_FAILURE,
+    DagsterEventType.STEP_SKIPPED,
+    DagsterEventType.STEP_UP_FOR_RETRY,
+    DagsterEventType.STEP_RESTARTED,
+}
+
 
 class RunFailureReasonSerializer(EnumSerializer):
     def unpack(self, value: str):
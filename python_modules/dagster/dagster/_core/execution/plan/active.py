@@ -1,6 +1,11 @@
+import heapq
 import time
+from bisect import bisect_right
+from collections import defaultdict
+from itertools import count
 from types import TracebackType
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     Dict,
@@ -10,6 +15,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -86,8 +92,20 @@ def __init__(
         # We decide what steps to skip based on what outputs are yielded by upstream steps
         self._step_outputs: Set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
+        # orders steps that are otherwise tied by the order in which they reached each state
+        self._order = count()
+
         # All steps to be executed start out here in _pending
-        self._pending: Dict[str, Set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: Dict[str, AbstractSet[str]] = {}
+        self._pending_order: Dict[str, int] = {}
+        # each pending step tracks how many of its deps are unresolved, and each unresolved dep
+        # tracks the pending steps that depend on it, so resolving a step only visits its dependents
+        self._num_unresolved_deps: Dict[str, int] = {}
+        self._pending_dependents: Dict[str, Set[str]] = defaultdict(set)
+        # pending steps with no unresolved deps, which are moved out of _pending by _update
+        self._ready: Set[str] = set()
+        # deps of every step that has been pending, used to requeue steps for retry
+        self._step_deps: Dict[str, AbstractSet[str]] = {}
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -102,11 +120,16 @@ def __init__(
         self._skipped_deps: Dict[str, Sequence[str]] = {}
 
         # steps move in to these buckets as a result of _update calls
+        # _executable is kept sorted by _executable_sort_keys, the sort key of each step followed
+        # by the order in which it became executable
         self._executable: List[str] = []
+        self._executable_sort_keys: List[Tuple[float, int]] = []
         self._pending_skip: List[str] = []
         self._pending_retry: List[str] = []
         self._pending_abandon: List[str] = []
         self._waiting_to_retry: Dict[str, float] = {}
+        # heap of (retry time, order, step key) for the steps in _waiting_to_retry
+        self._waiting_to_retry_heap: List[Tuple[float, int, str]] = []
         self._messaged_concurrency_slots: Dict[str, float] = {}
 
         # then are considered _in_flight when vended via get_steps_to_*
@@ -123,6 +146,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -198,16 +224,62 @@ def _pending_state_str(self) -> str:
             ),
         )
 
-    def _should_skip_step(self, step_key: str, successful_or_skipped_steps: Set[str]) -> bool:
+    def _is_resolved(self, step_key: str) -> bool:
+        return (
+            step_key in self._success
+            or step_key in self._skipped
+            or step_key in self._failed
+            or step_key in self._abandoned
+        )
+
+    def _add_pending(self, step_key: str, deps: AbstractSet[str]) -> None:
+        if step_key in self._pending:
+            # keep the position of the step, as reassigning a dict key does
+            for dep_key in self._pending[step_key]:
+                dependents = self._pending_dependents.get(dep_key)
+                if dependents:
+                    dependents.discard(step_key)
+        else:
+            self._pending_order[step_key] = next(self._order)
+
+        self._pending[step_key] = deps
+        self._step_deps[step_key] = deps
+
+        num_unresolved_deps = 0
+        for dep_key in deps:
+            if not self._is_resolved(dep_key):
+                self._pending_dependents[dep_key].add(step_key)
+                num_unresolved_deps += 1
+
+        self._num_unresolved_deps[step_key] = num_unresolved_deps
+        if num_unresolved_deps == 0:
+            self._ready.add(step_key)
+        else:
+            self._ready.discard(step_key)
+
+    def _resolve(self, step_key: str) -> None:
+        """Called when a step reaches a terminal state, to update the steps that depend on it."""
+        for dependent_key in self._pending_dependents.pop(step_key, ()):
+            self._num_unresolved_deps[dependent_key] -= 1
+            if self._num_unresolved_deps[dependent_key] == 0:
+                self._ready.add(dependent_key)
+
+    def _add_executable(self, step_key: str) -> None:
+        sort_key = (self._sort_key_fn(self.get_step_by_key(step_key)), next(self._order))
+        index = bisect_right(self._executable_sort_keys, sort_key)
+        self._executable_sort_keys.insert(index, sort_key)
+        self._executable.insert(index, step_key)
+
+    def _should_skip_step(self, step_key: str) -> bool:
         step = self.get_step_by_key(step_key)
         for step_input in step.step_inputs:
             missing_source_handles = []
 
             for source_handle in step_input.get_step_output_handle_dependencies():
                 if (
-                    source_handle.step_key in successful_or_skipped_steps
-                    and source_handle not in self._step_outputs
-                ):
+                    source_handle.step_key in self._success
+                    or source_handle.step_key in self._skipped
+                ) and source_handle not in self._step_outputs:
                     missing_source_handles.append(source_handle)
 
             if missing_source_handles:
@@ -224,58 +296,46 @@ def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
         """
-        new_steps_to_execute: List[str] = []
-        new_steps_to_skip: List[str] = []
-        new_steps_to_abandon: List[str] = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-        resolved_steps = self._success | self._skipped | self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, depends_on_steps in self._pending.items():
-            if depends_on_steps.issubset(resolved_steps):
-                if self._should_skip_step(step_key, successful_or_skipped_steps):
-                    new_steps_to_skip.append(step_key)
-                elif depends_on_steps.intersection(failed_or_abandoned_steps):
-                    new_steps_to_abandon.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
-
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+        # visit the steps whose deps are all resolved in the order they were added to _pending
+        for step_key in sorted(self._ready, key=self._pending_order.__getitem__):
+            depends_on_steps = self._pending.pop(step_key)
+            del self._pending_order[step_key]
+            del self._num_unresolved_deps[step_key]
+
+            if self._should_skip_step(step_key):
+                self._pending_skip.append(step_key)
+            elif any(
+                dep_key in self._failed or dep_key in self._abandoned
+                for dep_key in depends_on_steps
+            ):
+                self._pending_abandon.append(step_key)
+            else:
+                self._add_executable(step_key)
 
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+        self._ready.clear()
 
         ready_to_retry = []
         tick_time = time.time()
-        for key, at_time in self._waiting_to_retry.items():
-            if tick_time >= at_time:
-                ready_to_retry.append(key)
+        while self._waiting_to_retry_heap and self._waiting_to_retry_heap[0][0] <= tick_time:
+            ready_to_retry.append(heapq.heappop(self._waiting_to_retry_heap))
 
-        for key in ready_to_retry:
-            self._executable.append(key)
+        # steps that are ready at the same time are retried in the order they were marked
+        for _, _, key in sorted(ready_to_retry, key=lambda entry: entry[1]):
+            self._add_executable(key)
             del self._waiting_to_retry[key]
 
     def sleep_interval(self):
         now = time.time()
         intervals = []
-        if self._waiting_to_retry:
-            for t in self._waiting_to_retry.values():
-                intervals.append(t - now)
+        if self._waiting_to_retry_heap:
+            intervals.append(self._waiting_to_retry_heap[0][0] - now)
         if (
             self._instance_concurrency_context
             and self._instance_concurrency_context.has_pending_claims()
@@ -319,11 +379,6 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
         run_scoped_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
             in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
@@ -333,8 +388,10 @@ def get_steps_to_execute(
             )
 
         batch: List[ExecutionStep] = []
+        batch_indices: List[int] = []
 
-        for step in steps:
+        # _executable is already sorted, so only the steps up to the last one launched are visited
+        for index, step_key in enumerate(self._executable):
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -344,6 +401,7 @@ def get_steps_to_execute(
             ):
                 break
 
+            step = self.get_step_by_key(step_key)
             if run_scoped_concurrency_limits_counter:
                 if run_scoped_concurrency_limits_counter.is_blocked(step):
                     continue
@@ -364,10 +422,14 @@ def get_steps_to_execute(
                     continue
 
             batch.append(step)
+            batch_indices.append(index)
+
+        for index in reversed(batch_indices):
+            del self._executable[index]
+            del self._executable_sort_keys[index]
 
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -376,13 +438,12 @@ def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
-            self._gathering_dynamic_outputs  # noqa: B018
             self._skip_for_dynamic_outputs(step)
 
         return sorted(steps, key=self._sort_key_fn)
@@ -391,11 +452,11 @@ def get_steps_to_abandon(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -447,20 +508,24 @@ def plan_events_iterator(
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._resolve(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._resolve(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._resolve(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._resolve(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -479,12 +544,14 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
         if self._retry_mode.enabled:
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
+                heapq.heappush(self._waiting_to_retry_heap, (at_time, next(self._order), step_key))
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._step_deps[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._resolve(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
@@ -4,20 +4,36 @@
 import queue
 import sys
 from abc import ABC, abstractmethod
+from contextlib import ExitStack
 from multiprocessing import Queue
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
-from typing import TYPE_CHECKING, Iterator, NamedTuple, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import Literal
 
 import dagster._check as check
 from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._utils import start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.interrupts import capture_interrupts
 
 if TYPE_CHECKING:
     from dagster._core.events import DagsterEvent
 
+T = TypeVar("T")
+
 
 class ChildProcessEvent:
     pass
@@ -42,6 +58,12 @@ class ChildProcessSystemErrorEvent(
     pass
 
 
+class ChildProcessWorkerRetiredEvent(
+    NamedTuple("ChildProcessWorkerRetiredEvent", [("pid", int)]), ChildProcessEvent
+):
+    """Emitted by a ChildProcessWorker before the done event of the last command it will execute."""
+
+
 class ChildProcessCommand(ABC):
     """Inherit from this class in order to use this library.
 
@@ -64,6 +86,39 @@ def __init__(self, exit_code=None):
         super().__init__()
 
 
+class ChildProcessWorkerState:
+    """Resources owned by a ChildProcessWorker that outlive any single command.
+
+    Context managers entered through get_or_enter are exited when the worker process shuts down.
+    """
+
+    def __init__(self, exit_stack: ExitStack):
+        self._exit_stack = exit_stack
+        self._resources: Dict[str, Any] = {}
+
+    def get_or_enter(self, key: str, context_manager_fn: Callable[[], ContextManager[T]]) -> T:
+        if key not in self._resources:
+            self._resources[key] = self._exit_stack.enter_context(context_manager_fn())
+        return self._resources[key]
+
+
+class ChildProcessWorkerCommand(ChildProcessCommand):
+    """A ChildProcessCommand that can also be executed by a long-lived ChildProcessWorker.
+
+    The worker passes its ChildProcessWorkerState so that expensive setup (e.g. opening a
+    DagsterInstance) can be shared by all of the commands it executes.
+    """
+
+    @abstractmethod
+    def execute_in_worker(
+        self, worker_state: ChildProcessWorkerState
+    ) -> Iterator[Union[ChildProcessEvent, "DagsterEvent"]]:
+        """This method is invoked in the worker process.
+
+        Yields a sequence of events to be handled by ChildProcessWorker.execute_command.
+        """
+
+
 def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessCommand):
     """Wraps the execution of a ChildProcessCommand.
 
@@ -175,3 +230,206 @@ def execute_child_process_command(
         process.join()
     finally:
         event_queue.close()
+
+
+def _get_peak_memory_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        # not available on windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return max_rss / (1024 * 1024) if sys.platform == "darwin" else max_rss / 1024
+
+
+def _execute_commands_in_worker_process(
+    command_queue: Queue,
+    event_queue: Queue,
+    term_event: Any,
+    max_commands: Optional[int],
+    max_memory_mb: Optional[int],
+):
+    """Wraps the execution of a sequence of ChildProcessWorkerCommands in a single process.
+
+    Commands are read from the command queue until a None sentinel is received, the worker has
+    executed max_commands commands, or its peak memory exceeds max_memory_mb. A worker whose
+    command fails with a system error or is interrupted is not reused.
+    """
+    with capture_interrupts():
+        pid = os.getpid()
+        start_termination_thread(term_event)
+
+        with ExitStack() as exit_stack:
+            worker_state = ChildProcessWorkerState(exit_stack)
+            num_executed = 0
+            while True:
+                command = command_queue.get()
+                if command is None:
+                    return
+
+                check.inst(command, ChildProcessWorkerCommand)
+                event_queue.put(ChildProcessStartEvent(pid=pid))
+                try:
+                    for step_event in command.execute_in_worker(worker_state):
+                        event_queue.put(step_event)
+                except (
+                    Exception,
+                    KeyboardInterrupt,
+                    DagsterExecutionInterruptedError,
+                ):
+                    event_queue.put(
+                        ChildProcessSystemErrorEvent(
+                            pid=pid,
+                            error_info=serializable_error_info_from_exc_info(sys.exc_info()),
+                        )
+                    )
+                    return
+
+                num_executed += 1
+                peak_memory_mb = _get_peak_memory_mb() if max_memory_mb else None
+                should_retire = bool(max_commands and num_executed >= max_commands) or bool(
+                    max_memory_mb and peak_memory_mb and peak_memory_mb >= max_memory_mb
+                )
+                if should_retire:
+                    event_queue.put(ChildProcessWorkerRetiredEvent(pid=pid))
+                event_queue.put(ChildProcessDoneEvent(pid=pid))
+                if should_retire:
+                    return
+
+
+class ChildProcessWorker:
+    """A long-lived child process that executes ChildProcessWorkerCommands one at a time.
+
+    Unlike execute_child_process_command, which starts a new process per command, a worker pays
+    its process startup cost once and can then be reused until it retires.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands: Optional[int] = None,
+        max_memory_mb: Optional[int] = None,
+    ):
+        self.term_event = multiprocessing_ctx.Event()  # type: ignore
+        self._command_queue = multiprocessing_ctx.Queue()  # type: ignore
+        self._event_queue = multiprocessing_ctx.Queue()  # type: ignore
+        self._process = multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_commands_in_worker_process,
+            args=(
+                self._command_queue,
+                self._event_queue,
+                self.term_event,
+                check.opt_int_param(max_commands, "max_commands"),
+                check.opt_int_param(max_memory_mb, "max_memory_mb"),
+            ),
+        )
+        self._process.start()
+        self._is_retired = False
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid
+
+    @property
+    def is_retired(self) -> bool:
+        return self._is_retired
+
+    def execute_command(
+        self, command: ChildProcessWorkerCommand
+    ) -> Iterator[Optional["DagsterEvent"]]:
+        """Execute a ChildProcessWorkerCommand in this worker.
+
+        Yields the same family of objects as execute_child_process_command, and raises a
+        ChildProcessCrashException if the worker process dies before the command completes.
+        """
+        check.inst_param(command, "command", ChildProcessWorkerCommand)
+        check.invariant(not self._is_retired, "Cannot execute a command on a retired worker")
+
+        self._command_queue.put(command)
+
+        completed_properly = False
+        while not completed_properly:
+            event = _poll_for_event(self._process, self._event_queue)
+
+            if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                break
+
+            if isinstance(event, (ChildProcessWorkerRetiredEvent, ChildProcessSystemErrorEvent)):
+                self._is_retired = True
+
+            yield event
+
+            if isinstance(event, (ChildProcessDoneEvent, ChildProcessSystemErrorEvent)):
+                completed_properly = True
+
+        if not completed_properly:
+            self._is_retired = True
+            raise ChildProcessCrashException(exit_code=self._process.exitcode)
+
+    def shutdown(self) -> None:
+        if not self._is_retired and self._process.is_alive():
+            self._command_queue.put(None)
+        self._is_retired = True
+        self._process.join()
+        self._command_queue.close()
+        self._event_queue.close()
+
+
+class ChildProcessWorkerPool:
+    """Hands out idle ChildProcessWorkers, starting new ones as needed.
+
+    Workers are returned to the pool with release, and are shut down instead of reused once they
+    have retired.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        max_commands_per_worker: Optional[int] = None,
+        max_memory_mb_per_worker: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._max_commands_per_worker = check.opt_int_param(
+            max_commands_per_worker, "max_commands_per_worker"
+        )
+        self._max_memory_mb_per_worker = check.opt_int_param(
+            max_memory_mb_per_worker, "max_memory_mb_per_worker"
+        )
+        self._idle_workers: List[ChildProcessWorker] = []
+        self._all_workers: List[ChildProcessWorker] = []
+
+    def __enter__(self) -> "ChildProcessWorkerPool":
+        return self
+
+    def __exit__(self, _exception_type, _exception_value, _traceback):
+        self.shutdown()
+
+    def acquire(self) -> ChildProcessWorker:
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if not worker.is_retired:
+                return worker
+
+        worker = ChildProcessWorker(
+            self._multiprocessing_ctx,
+            max_commands=self._max_commands_per_worker,
+            max_memory_mb=self._max_memory_mb_per_worker,
+        )
+        self._all_workers.append(worker)
+        return worker
+
+    def release(self, worker: ChildProcessWorker) -> None:
+        check.inst_param(worker, "worker", ChildProcessWorker)
+        if worker.is_retired:
+            worker.shutdown()
+            self._all_workers.remove(worker)
+        else:
+            self._idle_workers.append(worker)
+
+    def shutdown(self) -> None:
+        for worker in self._all_workers:
+            worker.shutdown()
+        self._idle_workers = []
+        self._all_workers = []
@@ -36,6 +36,10 @@
     ChildProcessCrashException,
     ChildProcessEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorker,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
+    ChildProcessWorkerState,
     execute_child_process_command,
 )
 
@@ -70,36 +74,84 @@ def __init__(
         self.repository_load_data = repository_load_data
 
     def execute(self) -> Iterator[DagsterEvent]:
-        recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             start_termination_thread(self.term_event)
+            yield from self._execute_step(
+                instance, message=f'Executing step "{self.step_key}" in subprocess.'
+            )
 
-            log_manager = create_context_free_log_manager(instance, self.dagster_run)
+    def _execute_step(self, instance: DagsterInstance, message: str) -> Iterator[DagsterEvent]:
+        recon_job = self.recon_pipeline
+        log_manager = create_context_free_log_manager(instance, self.dagster_run)
+
+        yield DagsterEvent.step_worker_started(
+            log_manager,
+            self.dagster_run.job_name,
+            message=message,
+            metadata={
+                "pid": MetadataValue.text(str(os.getpid())),
+            },
+            step_key=self.step_key,
+        )
+        execution_plan = create_execution_plan(
+            job=recon_job,
+            run_config=self.run_config,
+            step_keys_to_execute=[self.step_key],
+            known_state=self.known_state,
+            repository_load_data=self.repository_load_data,
+        )
+        yield from execute_plan_iterator(
+            execution_plan,
+            recon_job,
+            self.dagster_run,
+            run_config=self.run_config,
+            retry_mode=self.retry_mode.for_inner_plan(),
+            instance=instance,
+        )
 
-            yield DagsterEvent.step_worker_started(
-                log_manager,
-                self.dagster_run.job_name,
-                message=f'Executing step "{self.step_key}" in subprocess.',
-                metadata={
-                    "pid": MetadataValue.text(str(os.getpid())),
-                },
-                step_key=self.step_key,
-            )
-            execution_plan = create_execution_plan(
-                job=recon_job,
-                run_config=self.run_config,
-                step_keys_to_execute=[self.step_key],
-                known_state=self.known_state,
-                repository_load_data=self.repository_load_data,
-            )
-            yield from execute_plan_iterator(
-                execution_plan,
-                recon_job,
-                self.dagster_run,
-                run_config=self.run_config,
-                retry_mode=self.retry_mode.for_inner_plan(),
-                instance=instance,
-            )
+
+class MultiprocessExecutorWorkerCommand(
+    MultiprocessExecutorChildProcessCommand, ChildProcessWorkerCommand
+):
+    """Executes a step in a long-lived worker process.
+
+    The instance is opened once per worker and the job definition is cached by the
+    ReconstructableJob, so only the execution plan is rebuilt for each step.
+    """
+
+    def __init__(
+        self,
+        run_config: Mapping[str, object],
+        dagster_run: "DagsterRun",
+        step_key: str,
+        instance_ref: "InstanceRef",
+        recon_pipeline: ReconstructableJob,
+        retry_mode: RetryMode,
+        known_state: Optional[KnownExecutionState],
+        repository_load_data: Optional[RepositoryLoadData],
+    ):
+        # the worker owns the termination event, since events can only be shared with a process
+        # when it is started
+        super().__init__(
+            run_config=run_config,
+            dagster_run=dagster_run,
+            step_key=step_key,
+            instance_ref=instance_ref,
+            term_event=None,
+            recon_pipeline=recon_pipeline,
+            retry_mode=retry_mode,
+            known_state=known_state,
+            repository_load_data=repository_load_data,
+        )
+
+    def execute_in_worker(self, worker_state: ChildProcessWorkerState) -> Iterator[DagsterEvent]:
+        instance = worker_state.get_or_enter(
+            "instance", lambda: DagsterInstance.from_ref(self.instance_ref)
+        )
+        yield from self._execute_step(
+            instance,
+            message=f'Executing step "{self.step_key}" in worker process.',
+        )
 
 
 class MultiprocessExecutor(Executor):
@@ -110,6 +162,9 @@ def __init__(
         tag_concurrency_limits: Optional[List[Dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        max_worker_memory_mb: Optional[int] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -135,6 +190,13 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_worker_memory_mb = check.opt_int_param(
+            max_worker_memory_mb, "max_worker_memory_mb"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -197,6 +259,17 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool = (
+                stack.enter_context(
+                    ChildProcessWorkerPool(
+                        multiproc_ctx,
+                        max_commands_per_worker=self._max_steps_per_worker,
+                        max_memory_mb_per_worker=self._max_worker_memory_mb,
+                    )
+                )
+                if self._use_worker_pool
+                else None
+            )
             active_iters: Dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: Dict[int, SerializableErrorInfo] = {}
             term_events: Dict[str, Any] = {}
@@ -227,6 +300,22 @@ def execute(
 
                     for step in steps:
                         step_context = plan_context.for_step(step)
+                        if worker_pool:
+                            worker = worker_pool.acquire()
+                            term_events[step.key] = worker.term_event
+                            active_iters[step.key] = execute_step_in_worker(
+                                worker_pool,
+                                worker,
+                                job,
+                                step_context,
+                                step,
+                                errors,
+                                self.retries,
+                                active_execution.get_known_state(),
+                                execution_plan.repository_load_data,
+                            )
+                            continue
+
                         term_events[step.key] = multiproc_ctx.Event()
                         active_iters[step.key] = execute_step_out_of_process(
                             multiproc_ctx,
@@ -361,3 +450,44 @@ def execute_step_out_of_process(
                 errors[ret.pid] = ret.error_info
         else:
             check.failed(f"Unexpected return value from child process {type(ret)}")
+
+
+def execute_step_in_worker(
+    worker_pool: ChildProcessWorkerPool,
+    worker: ChildProcessWorker,
+    recon_job: ReconstructableJob,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: Dict[int, SerializableErrorInfo],
+    retries: RetryMode,
+    known_state: KnownExecutionState,
+    repository_load_data: Optional[RepositoryLoadData],
+) -> Iterator[Optional[DagsterEvent]]:
+    command = MultiprocessExecutorWorkerCommand(
+        run_config=step_context.run_config,
+        dagster_run=step_context.dagster_run,
+        step_key=step.key,
+        instance_ref=step_context.instance.get_ref(),
+        recon_pipeline=recon_job,
+        retry_mode=retries,
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Sending "{step.key}" to worker process (pid: {worker.pid}).',
+        metadata={},
+    )
+
+    try:
+        for ret in worker.execute_command(command):
+            if ret is None or isinstance(ret, DagsterEvent):
+                yield ret
+            elif isinstance(ret, ChildProcessEvent):
+                if isinstance(ret, ChildProcessSystemErrorEvent):
+                    errors[ret.pid] = ret.error_info
+            else:
+                check.failed(f"Unexpected return value from worker process {type(ret)}")
+    finally:
+        worker_pool.release(worker)
@@ -0,0 +1,129 @@
+from collections import deque
+from typing import Deque, List, Optional, Sequence, Set
+
+import dagster._check as check
+from dagster._core.event_api import EventLogCursor, EventLogRecord
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.instance import DagsterInstance
+
+
+class RunEventTailer:
+    """Tails the dagster events of a run from the event log.
+
+    Events are read in storage id order after a watermark, the greatest storage id read so far, so
+    that each event is only loaded once. Some storages can commit events out of storage id order, so
+    if `rewind_window` is set, the storage ids of the run's events within `rewind_window` below the
+    watermark are checked for events that were committed late. Only the storage ids read within
+    that window are remembered, and the ids in the window are queried without loading the events,
+    so that only late events are loaded.
+
+    The number of events fetched per query doubles while the run produces events faster than they
+    are read, up to `max_batch_size`, and shrinks back to `batch_size` once the tailer catches up.
+    """
+
+    def __init__(
+        self,
+        run_id: str,
+        batch_size: int,
+        max_batch_size: Optional[int] = None,
+        rewind_window: int = 0,
+    ):
+        self._run_id = check.str_param(run_id, "run_id")
+        self._min_batch_size = check.int_param(batch_size, "batch_size")
+        self._max_batch_size = max(
+            check.opt_int_param(max_batch_size, "max_batch_size", default=batch_size), batch_size
+        )
+        self._rewind_window = check.int_param(rewind_window, "rewind_window")
+        check.invariant(self._min_batch_size > 0, "batch_size must be > 0")
+        check.invariant(self._rewind_window >= 0, "rewind_window must be >= 0")
+
+        self._batch_size = self._min_batch_size
+        self._watermark = -1
+        # storage ids read within the rewind window, in ascending order
+        self._window_storage_ids: Deque[int] = deque()
+        self._window_storage_id_set: Set[int] = set()
+
+    @property
+    def watermark(self) -> int:
+        return self._watermark
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def pop_events(self, instance: DagsterInstance) -> Sequence[DagsterEvent]:
+        """Returns the dagster events of the run that have not been returned before."""
+        records: List[EventLogRecord] = []
+        if self._rewind_window and self._watermark >= 0:
+            records.extend(self._fetch_late_records(instance))
+
+        conn = instance.get_records_for_run(
+            self._run_id,
+            EventLogCursor.from_storage_id(self._watermark).to_string(),
+            of_type=set(DagsterEventType),
+            limit=self._batch_size,
+        )
+        records.extend(conn.records)
+        self._adapt_batch_size(len(conn.records))
+
+        for record in records:
+            self._mark_read(record.storage_id)
+
+        return [
+            record.event_log_entry.dagster_event
+            for record in records
+            if record.event_log_entry.dagster_event
+        ]
+
+    def _fetch_late_records(self, instance: DagsterInstance) -> Sequence[EventLogRecord]:
+        window_start = max(self._watermark - self._rewind_window, -1)
+        storage_ids = instance.event_log_storage.get_storage_ids_for_run(
+            self._run_id,
+            after_storage_id=window_start,
+            up_to_storage_id=self._watermark,
+            of_type=set(DagsterEventType),
+        )
+        late_storage_ids = {
+            storage_id
+            for storage_id in storage_ids
+            if storage_id not in self._window_storage_id_set
+        }
+        if not late_storage_ids:
+            return []
+
+        first_late_storage_id = min(late_storage_ids)
+        conn = instance.get_records_for_run(
+            self._run_id,
+            EventLogCursor.from_storage_id(first_late_storage_id - 1).to_string(),
+            of_type=set(DagsterEventType),
+            limit=len(
+                [storage_id for storage_id in storage_ids if storage_id >= first_late_storage_id]
+            ),
+        )
+        return [record for record in conn.records if record.storage_id in late_storage_ids]
+
+    def _mark_read(self, storage_id: int) -> None:
+        if storage_id > self._watermark:
+            self._watermark = storage_id
+
+        if not self._rewind_window:
+            return
+
+        if storage_id not in self._window_storage_id_set:
+            self._window_storage_id_set.add(storage_id)
+            if self._window_storage_ids and storage_id < self._window_storage_ids[-1]:
+                # late events are rare, so re-sorting the window is cheap enough
+                self._window_storage_ids = deque(sorted([*self._window_storage_ids, storage_id]))
+            else:
+                self._window_storage_ids.append(storage_id)
+
+        # forget the storage ids that have fallen out of the rewind window
+        window_start = self._watermark - self._rewind_window
+        while self._window_storage_ids and self._window_storage_ids[0] <= window_start:
+            self._window_storage_id_set.discard(self._window_storage_ids.popleft())
+
+    def _adapt_batch_size(self, num_fetched: int) -> None:
+        if num_fetched >= self._batch_size:
+            self._batch_size = min(self._batch_size * 2, self._max_batch_size)
+        elif num_fetched < self._batch_size // 2:
+            self._batch_size = max(self._batch_size // 2, self._min_batch_size)
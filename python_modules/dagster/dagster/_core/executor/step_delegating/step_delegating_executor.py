@@ -1,20 +1,19 @@
 import os
 import sys
 import time
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, cast
 
 import dagster._check as check
 from dagster._core.definitions.metadata import MetadataValue
-from dagster._core.event_api import EventLogCursor
-from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events import DagsterEvent, EngineEventData
 from dagster._core.execution.context.system import PlanOrchestrationContext
 from dagster._core.execution.plan.active import ActiveExecution
 from dagster._core.execution.plan.instance_concurrency_context import InstanceConcurrencyContext
 from dagster._core.execution.plan.objects import StepFailureData
 from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.retries import RetryMode
+from dagster._core.executor.step_delegating.event_tailer import RunEventTailer
 from dagster._core.executor.step_delegating.step_handler.base import StepHandler, StepHandlerContext
-from dagster._core.instance import DagsterInstance
 from dagster._grpc.types import ExecuteStepArgs
 from dagster._time import get_current_datetime
 from dagster._utils.error import serializable_error_info_from_exc_info
@@ -69,52 +68,25 @@ def __init__(
         )
         self._should_verify_step = should_verify_step
 
-        self._event_cursor: Optional[str] = None
         self._pop_events_offset = int(os.getenv("DAGSTER_EXECUTOR_POP_EVENTS_OFFSET", "0"))
-
-        if self._pop_events_offset:
-            # ensure that the offset can never result in looping over the same events over and
-            # over again if every event is from this run
-            self._pop_events_limit = self._pop_events_offset + 1
-        else:
-            self._pop_events_limit = int(os.getenv("DAGSTER_EXECUTOR_POP_EVENTS_LIMIT", "1000"))
+        self._pop_events_limit = int(os.getenv("DAGSTER_EXECUTOR_POP_EVENTS_LIMIT", "1000"))
+        self._pop_events_max_limit = int(
+            os.getenv("DAGSTER_EXECUTOR_POP_EVENTS_MAX_LIMIT", "10000")
+        )
 
     @property
     def retries(self):
         return self._retries
 
-    def _pop_events(
-        self, instance: DagsterInstance, run_id: str, seen_storage_ids: Set[int]
-    ) -> Sequence[DagsterEvent]:
-        adjusted_cursor = self._event_cursor
-
-        if self._pop_events_offset > 0 and self._event_cursor:
-            cursor_obj = EventLogCursor.parse(self._event_cursor)
-            check.invariant(
-                cursor_obj.is_id_cursor(),
-                "Applying a tailer offset only works with an id-based cursor",
-            )
-            adjusted_cursor = EventLogCursor.from_storage_id(
-                cursor_obj.storage_id() - self._pop_events_offset
-            ).to_string()
-
-        conn = instance.get_records_for_run(
+    def _get_event_tailer(self, run_id: str) -> RunEventTailer:
+        # the tailer only reads past the greatest storage id it has seen, so it makes progress
+        # regardless of how the offset compares to the limit
+        return RunEventTailer(
             run_id,
-            adjusted_cursor,
-            of_type=set(DagsterEventType),
-            limit=self._pop_events_limit,
+            batch_size=self._pop_events_limit,
+            max_batch_size=self._pop_events_max_limit,
+            rewind_window=self._pop_events_offset,
         )
-        self._event_cursor = conn.cursor
-
-        dagster_events = [
-            record.event_log_entry.dagster_event
-            for record in conn.records
-            if record.event_log_entry.dagster_event and record.storage_id not in seen_storage_ids
-        ]
-
-        seen_storage_ids.update(record.storage_id for record in conn.records)
-
-        return dagster_events
 
     def _get_step_handler_context(
         self, plan_context, steps, active_execution
@@ -139,7 +111,7 @@ def _get_step_handler_context(
     def execute(self, plan_context: PlanOrchestrationContext, execution_plan: ExecutionPlan):
         check.inst_param(plan_context, "plan_context", PlanOrchestrationContext)
         check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
-        seen_storage_ids = set()
+        event_tailer = self._get_event_tailer(plan_context.run_id)
 
         DagsterEvent.engine_event(
             plan_context,
@@ -165,11 +137,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         EngineEventData(),
                     )
 
-                    prior_events = self._pop_events(
-                        plan_context.instance,
-                        plan_context.run_id,
-                        seen_storage_ids,
-                    )
+                    prior_events = event_tailer.pop_events(plan_context.instance)
                     for dagster_event in prior_events:
                         yield dagster_event
 
@@ -264,11 +232,7 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         return
 
                     if active_execution.has_in_flight_steps:
-                        for dagster_event in self._pop_events(
-                            plan_context.instance,
-                            plan_context.run_id,
-                            seen_storage_ids,
-                        ):
+                        for dagster_event in event_tailer.pop_events(plan_context.instance):
                             yield dagster_event
                             # STEP_SKIPPED events are only emitted by ActiveExecution, which already handles
                             # and yields them.
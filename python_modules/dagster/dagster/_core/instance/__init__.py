@@ -125,6 +125,7 @@
     from dagster._core.execution.plan.plan import ExecutionPlan
     from dagster._core.execution.plan.resume_retry import ReexecutionStrategy
     from dagster._core.execution.stats import RunStepKeyStatsSnapshot
+    from dagster._core.instance.event_buffer import StepEventWriteBuffer
     from dagster._core.launcher import RunLauncher
     from dagster._core.remote_representation import (
         CodeLocation,
@@ -195,6 +196,19 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# When batch writing is enabled, setting this buffers every event emitted from within a running
+# step (logs, outputs, handled outputs, asset and asset check events, ...) instead of only
+# explicitly batched events. See `StepEventWriteBuffer`.
+def _is_step_event_buffering_enabled() -> bool:
+    buffer_step_events = os.getenv("DAGSTER_BUFFER_STEP_EVENTS", "").lower() in ("1", "true")
+    return buffer_step_events and _is_batch_writing_enabled()
+
+
+# The maximum number of seconds a buffered step event is held before being written.
+def _get_event_batch_flush_interval() -> float:
+    return float(os.getenv("DAGSTER_EVENT_BATCH_FLUSH_INTERVAL", "1.0"))
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, Tuple[Any, Any]]:
@@ -418,8 +432,8 @@ def __init__(
         self._local_artifact_storage = check.inst_param(
             local_artifact_storage, "local_artifact_storage", LocalArtifactStorage
         )
-        self._event_storage = check.inst_param(event_storage, "event_storage", EventLogStorage)
-        self._event_storage.register_instance(self)
+        self._event_log_storage = check.inst_param(event_storage, "event_storage", EventLogStorage)
+        self._event_log_storage.register_instance(self)
 
         self._run_storage = check.inst_param(run_storage, "run_storage", RunStorage)
         self._run_storage.register_instance(self)
@@ -497,6 +511,7 @@ def __init__(
 
         # Used for batched event handling
         self._event_buffer: Dict[str, List[EventLogEntry]] = defaultdict(list)
+        self._step_event_write_buffer: Optional["StepEventWriteBuffer"] = None
 
     # ctors
 
@@ -758,6 +773,14 @@ def run_storage(self) -> "RunStorage":
     def event_log_storage(self) -> "EventLogStorage":
         return self._event_storage
 
+    @property
+    def _event_storage(self) -> "EventLogStorage":
+        # Flush any step events held in the write buffer first, so that reads of the event log in
+        # this process see every event handled so far (see `handle_new_event`).
+        if self._step_event_write_buffer:
+            self._step_event_write_buffer.flush()
+        return self._event_log_storage
+
     @property
     def daemon_cursor_storage(self) -> "DaemonCursorStorage":
         return self._run_storage
@@ -956,6 +979,10 @@ def auto_materialize_max_tick_retries(self) -> int:
     def auto_materialize_use_sensors(self) -> int:
         return self.get_settings("auto_materialize").get("use_sensors", False)
 
+    @property
+    def auto_materialize_num_evaluation_workers(self) -> Optional[int]:
+        return self.get_settings("auto_materialize").get("num_evaluation_workers")
+
     @property
     def global_op_concurrency_default_limit(self) -> Optional[int]:
         return self.get_settings("concurrency").get("default_op_concurrency_limit")
@@ -1017,6 +1044,9 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        if self._step_event_write_buffer:
+            self._step_event_write_buffer.shutdown()
+            self._step_event_write_buffer = None
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1817,6 +1847,17 @@ def get_run_ids(
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         return self._run_storage.get_runs_count(filters)
 
+    @traced
+    def get_runs_for_run_keys(
+        self,
+        run_keys: Sequence[str],
+        sensor_name: str,
+        repository_selector_id: str,
+    ) -> Sequence[DagsterRun]:
+        return self._run_storage.get_runs_for_run_keys(
+            run_keys, sensor_name, repository_selector_id
+        )
+
     @public
     @traced
     def get_run_records(
@@ -2385,10 +2426,32 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If step event buffering is also enabled (`DAGSTER_BUFFER_STEP_EVENTS`), every event emitted
+        from within a running step is buffered per run, regardless of `batch_metadata`, and written
+        in a single batch once the buffer reaches the event batch size or its oldest event is older
+        than `DAGSTER_EVENT_BATCH_FLUSH_INTERVAL` seconds. A run's buffer is always flushed before
+        a step boundary event, a run event, or any other unbuffered event for that run is written,
+        and all buffers are flushed before the event log storage of this instance is accessed.
+        Subscribers are still notified of each event on the calling thread when it is handled,
+        which may be before a buffered event is written.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
+        if _is_step_event_buffering_enabled():
+            from dagster._core.instance.event_buffer import StepEventWriteBuffer
+
+            if not self._step_event_write_buffer:
+                self._step_event_write_buffer = StepEventWriteBuffer(
+                    self._store_events,
+                    max_size=_get_event_batch_size(),
+                    flush_interval=_get_event_batch_flush_interval(),
+                )
+            self._step_event_write_buffer.handle_event(event)
+            self._notify_events([event])
+            return
+
         if batch_metadata is None or not _is_batch_writing_enabled():
             events = [event]
         else:
@@ -2400,11 +2463,20 @@ def handle_new_event(
             else:
                 return
 
+        self._store_and_notify_events(events)
+
+    def _store_and_notify_events(self, events: Sequence["EventLogEntry"]) -> None:
+        self._store_events(events)
+        self._notify_events(events)
+
+    def _store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        # writes to the underlying storage directly, since this is also how the step event write
+        # buffer is flushed
         if len(events) == 1:
-            self._event_storage.store_event(events[0])
+            self._event_log_storage.store_event(events[0])
         else:
             try:
-                self._event_storage.store_event_batch(events)
+                self._event_log_storage.store_event_batch(events)
 
             # Fall back to storing events one by one if writing a batch fails. We catch a generic
             # Exception because that is the parent class of the actually received error,
@@ -2416,8 +2488,9 @@ def handle_new_event(
                     "Falling back to storing multiple single-event storage requests...\n"
                 )
                 for event in events:
-                    self._event_storage.store_event(event)
+                    self._event_log_storage.store_event(event)
 
+    def _notify_events(self, events: Sequence["EventLogEntry"]) -> None:
         for event in events:
             run_id = event.run_id
             if event.is_dagster_event and event.get_dagster_event().is_job_event:
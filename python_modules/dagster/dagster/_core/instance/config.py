@@ -287,6 +287,15 @@ def sensors_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "num_worker_processes": Field(
+                int,
+                is_required=False,
+                description=(
+                    "How many processes to split sensor evaluation across. Each sensor is assigned"
+                    " to one process by a hash of its id, and each process loads its own copy of"
+                    " the workspace."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -413,6 +422,13 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                         "How many threads to use to process ticks from multiple automation policy sensors in parallel"
                     ),
                 ),
+                "num_evaluation_workers": Field(
+                    int,
+                    is_required=False,
+                    description=(
+                        "How many threads to use to evaluate the automation conditions of assets in the same topological level of the asset graph in parallel. If not set, assets are evaluated one at a time"
+                    ),
+                ),
             }
         ),
         "concurrency": Field(
@@ -0,0 +1,121 @@
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence
+
+import dagster._check as check
+from dagster._core.events import PIPELINE_EVENTS, STEP_BOUNDARY_EVENTS
+from dagster._core.events.log import EventLogEntry
+
+
+def is_bufferable_step_event(event: EventLogEntry) -> bool:
+    """Whether an event may be held in a StepEventWriteBuffer: any event emitted from within a
+    running step (logs, outputs, handled outputs, asset and asset check events, ...), except for
+    the events that mark a step boundary.
+    """
+    if not event.step_key:
+        return False
+
+    if not event.is_dagster_event:
+        return True
+
+    event_type = event.get_dagster_event().event_type
+    return event_type not in STEP_BOUNDARY_EVENTS and event_type not in PIPELINE_EVENTS
+
+
+class StepEventWriteBuffer:
+    """Write-behind buffer for the events emitted from within running steps.
+
+    Bufferable events are held per run and handed to `write_fn` in a single batch once the run's
+    buffer reaches `max_size` events or its oldest event is older than `flush_interval` seconds.
+    Any other event for a run (step boundaries, run events, events outside of a step) first
+    flushes that run's buffer, so events are always written in the order they were handled.
+
+    A background thread flushes buffers that have gone quiet, so that e.g. a log message emitted
+    right before a long computation is not held back until the step finishes.
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Sequence[EventLogEntry]], None],
+        max_size: int,
+        flush_interval: float,
+    ):
+        self._write_fn = check.callable_param(write_fn, "write_fn")
+        self._max_size = check.int_param(max_size, "max_size")
+        self._flush_interval = check.numeric_param(flush_interval, "flush_interval")
+
+        self._lock = threading.RLock()
+        self._buffers: Dict[str, List[EventLogEntry]] = {}
+        self._first_buffered_at: Dict[str, float] = {}
+
+        self._shutdown_event = threading.Event()
+        self._flush_thread: Optional[threading.Thread] = None
+
+    def handle_event(self, event: EventLogEntry) -> None:
+        check.inst_param(event, "event", EventLogEntry)
+
+        with self._lock:
+            run_id = event.run_id
+            if not is_bufferable_step_event(event):
+                self._flush_run(run_id)
+                self._write_fn([event])
+                return
+
+            buffer = self._buffers.setdefault(run_id, [])
+            buffer.append(event)
+            first_buffered_at = self._first_buffered_at.setdefault(run_id, time.monotonic())
+
+            if (
+                len(buffer) >= self._max_size
+                or time.monotonic() - first_buffered_at >= self._flush_interval
+            ):
+                self._flush_run(run_id)
+            else:
+                self._ensure_flush_thread()
+
+    def flush(self, run_id: Optional[str] = None) -> None:
+        """Write out the buffered events for the given run, or for all runs if no run is given."""
+        with self._lock:
+            run_ids = [run_id] if run_id is not None else list(self._buffers.keys())
+            for buffered_run_id in run_ids:
+                self._flush_run(buffered_run_id)
+
+    def shutdown(self) -> None:
+        self._shutdown_event.set()
+        if self._flush_thread:
+            self._flush_thread.join()
+            self._flush_thread = None
+        self.flush()
+
+    def _flush_run(self, run_id: str) -> None:
+        events = self._buffers.pop(run_id, None)
+        self._first_buffered_at.pop(run_id, None)
+        if events:
+            self._write_fn(events)
+
+    def _ensure_flush_thread(self) -> None:
+        if self._flush_thread or self._shutdown_event.is_set():
+            return
+
+        self._flush_thread = threading.Thread(
+            target=self._flush_stale_buffers_loop,
+            name="step-event-write-buffer",
+            daemon=True,
+        )
+        self._flush_thread.start()
+
+    def _flush_stale_buffers_loop(self) -> None:
+        while not self._shutdown_event.wait(self._flush_interval / 2):
+            with self._lock:
+                now = time.monotonic()
+                stale_run_ids = [
+                    run_id
+                    for run_id, first_buffered_at in self._first_buffered_at.items()
+                    if now - first_buffered_at >= self._flush_interval
+                ]
+                for run_id in stale_run_ids:
+                    try:
+                        self._flush_run(run_id)
+                    except Exception as e:
+                        sys.stderr.write(f"Exception while flushing buffered step events: {e}\n")
@@ -37,9 +37,11 @@
     has_one_dimension_time_window_partitioning,
 )
 from dagster._core.errors import DagsterPipesExecutionError
-from dagster._core.events import EngineEventData
+from dagster._core.events import DagsterEventBatchMetadata, EngineEventData, generate_event_batch_id
 from dagster._core.execution.context.compute import OpExecutionContext
 from dagster._core.execution.context.invocation import BaseDirectExecutionContext
+from dagster._core.log_manager import LOG_RECORD_EVENT_BATCH_METADATA_ATTR
+from dagster._core.utils import PYTHON_LOGGING_LEVELS_NAMES, coerce_valid_log_level
 from dagster._utils.error import (
     ExceptionInfo,
     SerializableErrorInfo,
@@ -158,6 +160,58 @@ def handle_message(self, message: PipesMessage) -> None:
         else:
             raise DagsterPipesExecutionError(f"Unknown message method: {message['method']}")
 
+    def handle_message_batch(self, messages: Sequence[PipesMessage]) -> None:
+        """Process a sequence of messages read from the external process at the same time.
+
+        Messages are handled in order, as with :py:meth:`handle_message`. Consecutive log messages
+        are logged as a single event batch, so that they are written to the event log in one
+        operation when batch writing is enabled (`DAGSTER_EVENT_BATCH_SIZE`).
+
+        Asset materialization and check messages are not batched: handling them does not write
+        events, it only queues results, which are turned into events when the op returns them.
+        """
+        i = 0
+        while i < len(messages):
+            end = i
+            while end < len(messages) and self._is_batchable_log_message(messages[end]):
+                end += 1
+            if end - i > 1:
+                batch_id = generate_event_batch_id()
+                for j in range(i, end):
+                    params = messages[j]["params"]
+                    self._context.log.log(
+                        params.get("level", "info"),  # type: ignore
+                        params["message"],  # type: ignore
+                        extra={
+                            LOG_RECORD_EVENT_BATCH_METADATA_ATTR: DagsterEventBatchMetadata(
+                                batch_id, is_end=j == end - 1
+                            )
+                        },
+                    )
+                i = end
+            else:
+                self.handle_message(messages[i])
+                i += 1
+
+    def _is_batchable_log_message(self, message: PipesMessage) -> bool:
+        # Only log messages that are known to be logged without error can be part of a batch, since
+        # the batch is only written once its last message is logged.
+        if self._received_closed_msg or message["method"] != "log":
+            return False
+        params = message["params"]
+        if (
+            not isinstance(params, dict)
+            or not params.keys() <= {"message", "level"}
+            or not isinstance(params.get("message"), str)
+        ):
+            return False
+        level = params.get("level", "info")
+        return (
+            isinstance(level, str)
+            and level.lower() in PYTHON_LOGGING_LEVELS_NAMES
+            and self._context.log.isEnabledFor(coerce_valid_log_level(level))
+        )
+
     def _handle_opened(self, opened_payload: PipesOpenedData) -> None:
         self._received_opened_msg = True
         self._context.log.info("[pipes] external process successfully opened dagster pipes.")
@@ -8,7 +8,7 @@
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from threading import Event, Thread
-from typing import Iterator, Optional, Sequence, TextIO
+from typing import TYPE_CHECKING, Callable, Iterator, Optional, Sequence, TextIO
 
 from dagster_pipes import (
     PIPES_PROTOCOL_VERSION_FIELD,
@@ -32,11 +32,20 @@
     PipesSession,
     build_external_execution_context_data,
 )
-from dagster._utils import tail_file
+
+if TYPE_CHECKING:
+    from watchdog.observers.api import BaseObserver
 
 _CONTEXT_INJECTOR_FILENAME = "context"
 _MESSAGE_READER_FILENAME = "messages"
 
+# number of bytes read from a tailed message file at once
+_TAIL_CHUNK_SIZE = 1024 * 1024
+# how long to wait for a modification of a tailed message file before reading it anyway. File
+# system events are used when available, polling otherwise.
+_TAIL_EVENT_WAIT_INTERVAL = 0.1
+_TAIL_POLL_INTERVAL = 0.01
+
 
 @experimental
 class PipesFileContextInjector(PipesContextInjector):
@@ -155,26 +164,36 @@ def read_messages(
             pipes protocol messages.
         """
         is_session_closed = Event()
+        is_file_modified = Event()
         thread = None
         try:
             open(self._path, "w").close()  # create file
             thread = Thread(
-                target=self._reader_thread, args=(handler, is_session_closed), daemon=True
+                target=self._reader_thread,
+                args=(handler, is_session_closed, is_file_modified),
+                daemon=True,
             )
             thread.start()
             yield {PipesDefaultMessageWriter.FILE_PATH_KEY: self._path}
         finally:
             is_session_closed.set()
+            is_file_modified.set()  # wake up the reader thread to read the rest of the file
             if thread:
                 thread.join()
             if os.path.exists(self._path):
                 os.remove(self._path)
 
-    def _reader_thread(self, handler: "PipesMessageHandler", is_resource_complete: Event) -> None:
+    def _reader_thread(
+        self,
+        handler: "PipesMessageHandler",
+        is_resource_complete: Event,
+        is_file_modified: Event,
+    ) -> None:
         try:
-            for line in tail_file(self._path, lambda: is_resource_complete.is_set()):
-                message = json.loads(line)
-                handler.handle_message(message)
+            for lines in _tail_file_lines(
+                self._path, is_resource_complete.is_set, is_file_modified
+            ):
+                _handle_message_lines(handler, lines)
         except:
             handler.report_pipes_framework_exception(
                 f"{self.__class__.__name__} reader thread",
@@ -350,9 +369,7 @@ def _messages_thread(
                     start_or_last_download = now
                     chunk = self.download_messages_chunk(self.counter, params)
                     if chunk:
-                        for line in chunk.split("\n"):
-                            message = json.loads(line)
-                            handler.handle_message(message)
+                        _handle_message_lines(handler, chunk.split("\n"))
                         self.counter += 1
                     elif is_session_closed.is_set():
                         break
@@ -517,6 +534,72 @@ def _join_thread(thread: Thread, thread_name: str) -> None:
         raise DagsterPipesExecutionError(f"Timed out waiting for {thread_name} thread to finish.")
 
 
+def _handle_message_lines(handler: "PipesMessageHandler", lines: Sequence[str]) -> None:
+    messages = []
+    try:
+        for line in lines:
+            messages.append(json.loads(line))
+    finally:
+        # messages preceding an invalid line are still handled
+        handler.handle_message_batch(messages)
+
+
+def _tail_file_lines(
+    path: str, should_stop: Callable[[], bool], is_modified: Event
+) -> Iterator[Sequence[str]]:
+    """Yield the non-empty lines appended to a file, in batches of the complete lines read at once,
+    until `should_stop` returns True and the end of the file is reached.
+
+    Between reads, waits for `is_modified` to be set, which happens when file system events (inotify
+    on Linux) report a modification of the file. If file system events can't be watched, the file
+    is polled instead.
+    """
+    observer = _start_file_modified_observer(path, is_modified)
+    wait_interval = _TAIL_EVENT_WAIT_INTERVAL if observer else _TAIL_POLL_INTERVAL
+    try:
+        with open(path, "rb") as file:
+            partial_line = b""
+            while True:
+                is_modified.clear()
+                chunk = file.read(_TAIL_CHUNK_SIZE)
+                if chunk:
+                    *lines, partial_line = (partial_line + chunk).split(b"\n")
+                    batch = [line.decode("utf-8") for line in lines if line.strip()]
+                    if batch:
+                        yield batch
+                elif should_stop():
+                    if partial_line.strip():
+                        yield [partial_line.decode("utf-8")]
+                    break
+                else:
+                    is_modified.wait(wait_interval)
+    finally:
+        if observer:
+            observer.stop()
+            observer.join()
+
+
+def _start_file_modified_observer(path: str, is_modified: Event) -> Optional["BaseObserver"]:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    abs_path = os.path.abspath(path)
+
+    class FileModifiedHandler(FileSystemEventHandler):
+        def on_modified(self, event: FileSystemEvent) -> None:
+            if event.src_path == abs_path:
+                is_modified.set()
+
+    observer = Observer()
+    try:
+        observer.schedule(FileModifiedHandler(), os.path.dirname(abs_path))
+        observer.start()
+    except OSError:
+        # e.g. the inotify watch or instance limits are reached, fall back to polling
+        return None
+    return observer
+
+
 def extract_message_or_forward_to_stdout(handler: "PipesMessageHandler", log_line: str):
     # exceptions as control flow, you love to see it
     try:
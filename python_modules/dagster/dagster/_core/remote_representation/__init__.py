@@ -27,7 +27,9 @@
     ExternalPartitionTagsData as ExternalPartitionTagsData,
     ExternalPresetData as ExternalPresetData,
     ExternalRepositoryData as ExternalRepositoryData,
+    ExternalRepositoryDataDelta as ExternalRepositoryDataDelta,
     ExternalRepositoryErrorData as ExternalRepositoryErrorData,
+    ExternalRepositorySnapshotIds as ExternalRepositorySnapshotIds,
     ExternalScheduleExecutionErrorData as ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData as ExternalSensorExecutionErrorData,
     ExternalTargetData as ExternalTargetData,
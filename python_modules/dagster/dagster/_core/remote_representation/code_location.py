@@ -16,7 +16,10 @@
     sync_get_external_partition_set_execution_param_data_grpc,
     sync_get_external_partition_tags_grpc,
 )
-from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster._api.snapshot_repository import (
+    get_shared_repository_data_cache,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster._api.snapshot_schedule import sync_get_external_schedule_execution_data_grpc
 from dagster._core.code_pointer import CodePointer
 from dagster._core.definitions.partition import PartitionsDefinition
@@ -599,6 +602,7 @@ def __init__(
         watch_server: Optional[bool] = True,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         grpc_metadata: Optional[Sequence[Tuple[str, str]]] = None,
+        reload_repository_data: bool = False,
     ):
         from dagster._grpc.client import DagsterGrpcClient, client_heartbeat_thread
 
@@ -628,6 +632,8 @@ def __init__(
 
         self.server_id = None
         self._external_repositories_data = None
+        # the server id that the repository data was acquired from the shared cache for
+        self._shared_repository_data_server_id = None
 
         self._executable_path = None
         self._container_image = None
@@ -677,10 +683,17 @@ def __init__(
 
             self._container_context = list_repositories_response.container_context
 
-            self._external_repositories_data = sync_get_streaming_external_repositories_data_grpc(
-                self.client,
-                self,
+            # every code location loaded for the same server in this process shares one copy of
+            # its repository data, unless the location is being reloaded to pick up new code on a
+            # server that may have kept its id
+            shared_repository_data_cache = get_shared_repository_data_cache()
+            if reload_repository_data:
+                shared_repository_data_cache.invalidate(self.server_id)
+            self._external_repositories_data = shared_repository_data_cache.acquire(
+                self.server_id,
+                lambda: sync_get_streaming_external_repositories_data_grpc(self.client, self),
             )
+            self._shared_repository_data_server_id = self.server_id
 
             self.external_repositories = {
                 repo_name: ExternalRepository(
@@ -755,6 +768,13 @@ def cleanup(self) -> None:
             self._heartbeat_thread.join()
             self._heartbeat_thread = None
 
+        if self._shared_repository_data_server_id:
+            get_shared_repository_data_cache().release(
+                self._shared_repository_data_server_id,
+                check.not_none(self._external_repositories_data),
+            )
+            self._shared_repository_data_server_id = None
+
     @property
     def is_reload_supported(self) -> bool:
         return True
@@ -10,6 +10,7 @@
 from collections import defaultdict
 from enum import Enum
 from typing import (
+    AbstractSet,
     Any,
     Dict,
     Iterable,
@@ -96,6 +97,7 @@
 from dagster._core.utils import is_valid_email
 from dagster._serdes import whitelist_for_serdes
 from dagster._serdes.serdes import FieldSerializer, is_whitelisted_for_serdes_object
+from dagster._serdes.utils import create_snapshot_id
 from dagster._utils.error import SerializableErrorInfo
 
 DEFAULT_MODE_NAME = "default"
@@ -253,6 +255,78 @@ def get_external_sensor_data(self, name):
         check.failed("Could not find sensor data named " + name)
 
 
+@whitelist_for_serdes
+class ExternalRepositorySnapshotIds(
+    NamedTuple(
+        "_ExternalRepositorySnapshotIds",
+        [
+            ("job_snapshot_ids", Sequence[str]),
+            ("asset_node_snapshot_ids", Sequence[str]),
+            ("schedule_snapshot_ids", Sequence[str]),
+            ("sensor_snapshot_ids", Sequence[str]),
+        ],
+    )
+):
+    """Content-addressed ids of the jobs, asset nodes, schedules, and sensors of an
+    ExternalRepositoryData, in the same order as the entries of the repository data.
+    """
+
+    def __new__(
+        cls,
+        job_snapshot_ids: Sequence[str],
+        asset_node_snapshot_ids: Sequence[str],
+        schedule_snapshot_ids: Sequence[str],
+        sensor_snapshot_ids: Sequence[str],
+    ):
+        return super(ExternalRepositorySnapshotIds, cls).__new__(
+            cls,
+            job_snapshot_ids=check.sequence_param(
+                job_snapshot_ids, "job_snapshot_ids", of_type=str
+            ),
+            asset_node_snapshot_ids=check.sequence_param(
+                asset_node_snapshot_ids, "asset_node_snapshot_ids", of_type=str
+            ),
+            schedule_snapshot_ids=check.sequence_param(
+                schedule_snapshot_ids, "schedule_snapshot_ids", of_type=str
+            ),
+            sensor_snapshot_ids=check.sequence_param(
+                sensor_snapshot_ids, "sensor_snapshot_ids", of_type=str
+            ),
+        )
+
+
+@whitelist_for_serdes
+class ExternalRepositoryDataDelta(
+    NamedTuple(
+        "_ExternalRepositoryDataDelta",
+        [
+            ("external_repository_data", ExternalRepositoryData),
+            ("snapshot_ids", ExternalRepositorySnapshotIds),
+        ],
+    )
+):
+    """An ExternalRepositoryData with the jobs, asset nodes, schedules, and sensors that the caller
+    already holds left out. `snapshot_ids` lists the ids of every entry of the full repository
+    data, so that the caller can put the full repository data back together from the entries it
+    holds.
+    """
+
+    def __new__(
+        cls,
+        external_repository_data: ExternalRepositoryData,
+        snapshot_ids: ExternalRepositorySnapshotIds,
+    ):
+        return super(ExternalRepositoryDataDelta, cls).__new__(
+            cls,
+            external_repository_data=check.inst_param(
+                external_repository_data, "external_repository_data", ExternalRepositoryData
+            ),
+            snapshot_ids=check.inst_param(
+                snapshot_ids, "snapshot_ids", ExternalRepositorySnapshotIds
+            ),
+        )
+
+
 @whitelist_for_serdes(
     storage_name="ExternalPipelineSubsetResult",
     storage_field_names={"external_job_data": "external_pipeline_data"},
@@ -1643,6 +1717,110 @@ def external_repository_data_from_def(
     )
 
 
+def _get_snapshot_id_field_names(
+    repository_data: ExternalRepositoryData,
+) -> Sequence[Tuple[str, str]]:
+    # (field of ExternalRepositoryData, field of ExternalRepositorySnapshotIds) pairs
+    job_field_name = (
+        "external_job_refs" if repository_data.external_job_datas is None else "external_job_datas"
+    )
+    return [
+        (job_field_name, "job_snapshot_ids"),
+        ("external_asset_graph_data", "asset_node_snapshot_ids"),
+        ("external_schedule_datas", "schedule_snapshot_ids"),
+        ("external_sensor_datas", "sensor_snapshot_ids"),
+    ]
+
+
+def get_external_repository_snapshot_ids(
+    repository_data: ExternalRepositoryData,
+) -> ExternalRepositorySnapshotIds:
+    """The content-addressed ids of the jobs, asset nodes, schedules, and sensors of the repository
+    data. Computing them serializes every entry, so callers that serve the same repository data
+    more than once should compute them once and hold on to them.
+    """
+    check.inst_param(repository_data, "repository_data", ExternalRepositoryData)
+
+    snapshot_ids: Dict[str, Sequence[str]] = {}
+    for field_name, ids_field_name in _get_snapshot_id_field_names(repository_data):
+        entries = getattr(repository_data, field_name) or []
+        snapshot_ids[ids_field_name] = [create_snapshot_id(entry) for entry in entries]
+    return ExternalRepositorySnapshotIds(**snapshot_ids)
+
+
+def external_repository_data_delta_from_data(
+    repository_data: ExternalRepositoryData,
+    known_snapshot_ids: AbstractSet[str],
+    snapshot_ids: Optional[ExternalRepositorySnapshotIds] = None,
+) -> ExternalRepositoryDataDelta:
+    """Leaves out of the repository data the jobs, asset nodes, schedules, and sensors whose
+    snapshot id is in `known_snapshot_ids`. `snapshot_ids` are the ids of the entries of the
+    repository data, and are computed if they are not passed.
+    """
+    check.inst_param(repository_data, "repository_data", ExternalRepositoryData)
+    check.set_param(known_snapshot_ids, "known_snapshot_ids", of_type=str)
+    snapshot_ids = check.opt_inst_param(
+        snapshot_ids, "snapshot_ids", ExternalRepositorySnapshotIds
+    ) or get_external_repository_snapshot_ids(repository_data)
+
+    unknown_entries: Dict[str, Sequence[Any]] = {}
+    for field_name, ids_field_name in _get_snapshot_id_field_names(repository_data):
+        entries = getattr(repository_data, field_name) or []
+        unknown_entries[field_name] = [
+            entry
+            for entry, entry_id in zip(entries, getattr(snapshot_ids, ids_field_name))
+            if entry_id not in known_snapshot_ids
+        ]
+
+    return ExternalRepositoryDataDelta(
+        # _replace skips the param checks, which the entries already passed
+        external_repository_data=repository_data._replace(**unknown_entries),
+        snapshot_ids=snapshot_ids,
+    )
+
+
+def get_external_repository_snapshots_by_id(
+    repository_data: ExternalRepositoryData,
+    snapshot_ids: ExternalRepositorySnapshotIds,
+) -> Mapping[str, Any]:
+    """The jobs, asset nodes, schedules, and sensors of the repository data, keyed by their snapshot
+    id.
+    """
+    snapshots_by_id = {}
+    for field_name, ids_field_name in _get_snapshot_id_field_names(repository_data):
+        entries = getattr(repository_data, field_name) or []
+        snapshots_by_id.update(zip(getattr(snapshot_ids, ids_field_name), entries))
+    return snapshots_by_id
+
+
+def external_repository_data_from_delta(
+    delta: ExternalRepositoryDataDelta,
+    known_snapshots_by_id: Mapping[str, Any],
+) -> ExternalRepositoryData:
+    """Puts the full repository data back together from a delta that was requested with the keys of
+    `known_snapshots_by_id` as the known snapshot ids.
+    """
+    check.inst_param(delta, "delta", ExternalRepositoryDataDelta)
+    check.mapping_param(known_snapshots_by_id, "known_snapshots_by_id", key_type=str)
+
+    repository_data = delta.external_repository_data
+    entries_by_field_name: Dict[str, Sequence[Any]] = {}
+    for field_name, ids_field_name in _get_snapshot_id_field_names(repository_data):
+        unknown_entries = iter(getattr(repository_data, field_name) or [])
+        entries_by_field_name[field_name] = [
+            known_snapshots_by_id[entry_id]
+            if entry_id in known_snapshots_by_id
+            else next(unknown_entries)
+            for entry_id in getattr(delta.snapshot_ids, ids_field_name)
+        ]
+        check.invariant(
+            next(unknown_entries, None) is None,
+            f"Repository snapshot delta has more {field_name} entries than snapshot ids",
+        )
+
+    return repository_data._replace(**entries_by_field_name)
+
+
 def external_asset_checks_from_defs(
     job_defs: Sequence[JobDefinition],
     asset_graph: AssetGraph,
@@ -355,7 +355,7 @@ def reload_location(self, instance: "DagsterInstance") -> "GrpcServerCodeLocatio
             else:
                 raise
 
-        return GrpcServerCodeLocation(self, instance=instance)
+        return GrpcServerCodeLocation(self, instance=instance, reload_repository_data=True)
 
     def create_location(self, instance: "DagsterInstance") -> "GrpcServerCodeLocation":
         from dagster._core.remote_representation.code_location import GrpcServerCodeLocation
@@ -0,0 +1,51 @@
+"""add run keys table
+
+Revision ID: d773d6ba376f
+Revises: 46b412388816
+Create Date: 2026-10-17 10:12:31.462101
+
+"""
+
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "d773d6ba376f"
+down_revision = "46b412388816"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("runs"):
+        return
+
+    if not has_table("run_keys"):
+        op.create_table(
+            "run_keys",
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("run_id", db.String(255), db.ForeignKey("runs.run_id", ondelete="CASCADE")),
+            db.Column("run_key", db.Text, nullable=False),
+            db.Column("sensor_name", db.Text),
+            db.Column("repository_selector_id", db.Text),
+        )
+        op.create_index(
+            "idx_run_keys",
+            "run_keys",
+            ["run_key", "sensor_name"],
+            mysql_length={"run_key": 64, "sensor_name": 64},
+        )
+
+
+def downgrade():
+    if has_table("run_keys"):
+        if has_index("run_keys", "idx_run_keys"):
+            op.drop_index("idx_run_keys", "run_keys")
+        op.drop_table("run_keys")
@@ -7,15 +7,23 @@
 
 if TYPE_CHECKING:
     from dagster._core.storage.event_log.base import AssetRecord
+    from dagster._core.storage.shared_record_cache import SharedRecordCacheScope
 
 
 class BatchAssetRecordLoader:
     """A batch loader that fetches asset records.  This loader is expected to be
-    instantiated with a set of asset keys.
+    instantiated with a set of asset keys. If a record cache is given, records are read through it
+    instead of directly from the instance.
     """
 
-    def __init__(self, instance: DagsterInstance, asset_keys: Iterable[AssetKey]):
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        asset_keys: Iterable[AssetKey],
+        record_cache: Optional["SharedRecordCacheScope"] = None,
+    ):
         self._instance = instance
+        self._record_cache = record_cache
         self._unfetched_asset_keys: Set[AssetKey] = set(asset_keys)
         self._asset_records: Mapping[AssetKey, Optional["AssetRecord"]] = {}
 
@@ -72,9 +80,14 @@ def fetch(self) -> None:
         if not self._unfetched_asset_keys:
             return
 
+        asset_keys = list(self._unfetched_asset_keys)
         new_records = {
             record.asset_entry.asset_key: record
-            for record in self._instance.get_asset_records(list(self._unfetched_asset_keys))
+            for record in (
+                self._record_cache.get_asset_records(asset_keys)
+                if self._record_cache
+                else self._instance.get_asset_records(asset_keys)
+            )
         }
 
         self._asset_records = {
@@ -45,6 +45,11 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 
+# the number of records to load per query when the default get_storage_ids_for_run pages through
+# the events of a run
+STORAGE_IDS_FOR_RUN_PAGE_SIZE = 1000
+
+
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
     cursor: str
@@ -209,6 +214,41 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    def get_storage_ids_for_run(
+        self,
+        run_id: str,
+        after_storage_id: int,
+        up_to_storage_id: int,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+    ) -> Sequence[int]:
+        """Get the storage ids of the events of a run within a range of storage ids, in ascending
+        order. Storages can override this to avoid loading the events themselves.
+
+        Args:
+            run_id (str): The id of the run for which to fetch storage ids.
+            after_storage_id (int): Only storage ids greater than this are returned.
+            up_to_storage_id (int): Only storage ids up to and including this are returned.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the events.
+        """
+        storage_ids = []
+        cursor = EventLogCursor.from_storage_id(after_storage_id).to_string()
+        while True:
+            connection = self.get_records_for_run(
+                run_id, cursor=cursor, of_type=of_type, limit=STORAGE_IDS_FOR_RUN_PAGE_SIZE
+            )
+            storage_ids.extend(
+                record.storage_id
+                for record in connection.records
+                if record.storage_id <= up_to_storage_id
+            )
+            if (
+                not connection.has_more
+                or not connection.records
+                or connection.records[-1].storage_id >= up_to_storage_id
+            ):
+                return storage_ids
+            cursor = connection.cursor
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(run_id, self.get_logs_for_run(run_id))
@@ -297,14 +337,28 @@ def get_logs_for_all_runs_by_log_id(
         after_cursor: int = -1,
         dagster_event_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
         limit: Optional[int] = None,
+        run_ids: Optional[Sequence[str]] = None,
     ) -> Mapping[int, "EventLogEntry"]:
-        """Get event records across all runs. Only supported for non sharded sql storage."""
+        """Get event records across all runs, or across the given runs if `run_ids` is set. Only
+        supported for non sharded sql storage.
+        """
         raise NotImplementedError()
 
     def get_maximum_record_id(self) -> Optional[int]:
         """Get the current greatest record id in the event log. Only supported for non sharded sql storage."""
         raise NotImplementedError()
 
+    def get_asset_event_cursors(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Optional[Mapping[AssetKey, str]]:
+        """Return a value for each of the given assets that changes whenever an event is stored for
+        the asset, the asset is wiped, or its cached status is updated, or None if the storage
+        cannot cheaply tell. Assets that have no record are left out. On storages that only keep
+        timestamps to the second, events stored for an asset by the same run within the same
+        second may leave the value unchanged.
+        """
+        return None
+
     @abstractmethod
     def can_read_asset_status_cache(self) -> bool:
         """Whether the storage can access cached status information for each asset."""
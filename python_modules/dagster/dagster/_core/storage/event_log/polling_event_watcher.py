@@ -1,6 +1,8 @@
+import logging
 import os
 import threading
-from typing import Callable, List, MutableMapping, NamedTuple, Optional
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, MutableMapping, NamedTuple, Optional
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
@@ -185,3 +187,203 @@ def run(self) -> None:
                                 str(EventLogCursor.from_storage_id(event_record.storage_id)),
                             )
             wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+
+
+class EventLogNotifier(ABC):
+    """Hook that lets an event log storage push new-event signals to a
+    SqlPollingMultiRunEventWatcher (e.g. via Postgres LISTEN/NOTIFY), so that the watcher polls as
+    soon as events are written instead of waiting out its polling backoff.
+    """
+
+    @abstractmethod
+    def wait(self, timeout: float) -> bool:
+        """Block until new events may have been written or `timeout` seconds have passed.
+
+        Returns True if woken up by a notification.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release any held resources and wake up any pending call to `wait`."""
+
+
+class _WatchedRun:
+    def __init__(self, cursor: int):
+        # storage id of the last record that was dispatched for this run
+        self.cursor = cursor
+        self.callbacks: List[CallbackAfterCursor] = []
+
+
+def _storage_id_from_cursor(cursor: Optional[str]) -> int:
+    return EventLogCursor.parse(cursor).storage_id() if cursor else -1
+
+
+class SqlPollingMultiRunEventWatcher:
+    """Event Log Watcher that uses a single thread to poll the event log for all watched run_ids.
+
+    Each tick issues one query for new records across every watched run (using
+    `get_logs_for_all_runs_by_log_id` filtered by run id), and fans the records out to the
+    callbacks registered for their run. Requires an event log storage with storage ids that are
+    unique across runs, i.e. non-sharded sql storage.
+
+    An optional EventLogNotifier can wake up the polling thread as soon as new events are written.
+
+    LOCKING INFO:
+        INVARIANTS: _lock protects _watched_runs and the callbacks of each watched run
+    """
+
+    def __init__(
+        self,
+        event_log_storage: EventLogStorage,
+        notifier: Optional[EventLogNotifier] = None,
+    ):
+        self._event_log_storage = check.inst_param(
+            event_log_storage, "event_log_storage", EventLogStorage
+        )
+        self._notifier = check.opt_inst_param(notifier, "notifier", EventLogNotifier)
+
+        self._lock: threading.Lock = threading.Lock()
+        self._watched_runs: Dict[str, _WatchedRun] = {}
+        self._should_thread_exit = threading.Event()
+        self._has_watched_runs = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._disposed = False
+
+    def has_run_id(self, run_id: str) -> bool:
+        run_id = check.str_param(run_id, "run_id")
+        with self._lock:
+            return run_id in self._watched_runs
+
+    def watch_run(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        cursor = check.opt_str_param(cursor, "cursor")
+        callback = check.callable_param(callback, "callback")
+        check.invariant(not self._disposed, "Attempted to watch_run after close")
+
+        with self._lock:
+            if run_id not in self._watched_runs:
+                self._watched_runs[run_id] = _WatchedRun(_storage_id_from_cursor(cursor))
+            self._watched_runs[run_id].callbacks.append(CallbackAfterCursor(cursor, callback))
+            self._has_watched_runs.set()
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._poll_loop,
+                    name="sql-event-watch-multi-run",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def unwatch_run(
+        self,
+        run_id: str,
+        handler: Callable[[EventLogEntry, str], None],
+    ) -> None:
+        run_id = check.str_param(run_id, "run_id")
+        handler = check.callable_param(handler, "handler")
+        with self._lock:
+            watched_run = self._watched_runs.get(run_id)
+            if not watched_run:
+                return
+
+            watched_run.callbacks = [
+                callback_with_cursor
+                for callback_with_cursor in watched_run.callbacks
+                if callback_with_cursor.callback != handler
+            ]
+            if not watched_run.callbacks:
+                del self._watched_runs[run_id]
+            if not self._watched_runs:
+                self._has_watched_runs.clear()
+
+    def close(self) -> None:
+        if not self._disposed:
+            self._disposed = True
+            self._should_thread_exit.set()
+            # wake up the polling thread if it is waiting for runs to be watched
+            self._has_watched_runs.set()
+            if self._notifier:
+                self._notifier.close()
+            if self._thread:
+                self._thread.join()
+                self._thread = None
+            with self._lock:
+                self._watched_runs = {}
+
+    def _wait(self, wait_time: float) -> None:
+        if self._notifier:
+            self._notifier.wait(wait_time)
+        else:
+            self._should_thread_exit.wait(wait_time)
+
+    def _poll_loop(self) -> None:
+        wait_time = INIT_POLL_PERIOD
+        chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
+
+        while not self._should_thread_exit.is_set():
+            # sleep without polling while nothing is being watched
+            self._has_watched_runs.wait()
+            self._wait(wait_time)
+            if self._should_thread_exit.is_set():
+                break
+
+            with self._lock:
+                cursors_by_run_id = {
+                    run_id: watched_run.cursor for run_id, watched_run in self._watched_runs.items()
+                }
+            if not cursors_by_run_id:
+                continue
+
+            try:
+                has_new_records = self._poll_watched_runs(cursors_by_run_id, chunk_limit)
+            except Exception:
+                # keep polling, since this thread serves every watched run in the process
+                logging.exception("Exception while polling for events of watched runs.")
+                wait_time = min(wait_time * 2, MAX_POLL_PERIOD)
+                continue
+
+            wait_time = INIT_POLL_PERIOD if has_new_records else min(wait_time * 2, MAX_POLL_PERIOD)
+
+    def _poll_watched_runs(self, cursors_by_run_id: Dict[str, int], chunk_limit: int) -> bool:
+        records = self._event_log_storage.get_logs_for_all_runs_by_log_id(
+            after_cursor=min(cursors_by_run_id.values()),
+            limit=chunk_limit,
+            run_ids=list(cursors_by_run_id.keys()),
+        )
+
+        with self._lock:
+            for storage_id, event_log_entry in records.items():
+                watched_run = self._watched_runs.get(event_log_entry.run_id)
+                if not watched_run or storage_id <= watched_run.cursor:
+                    continue
+
+                watched_run.cursor = storage_id
+                for callback_with_cursor in watched_run.callbacks:
+                    if _storage_id_from_cursor(callback_with_cursor.cursor) < storage_id:
+                        # one failing subscriber must not stop the others from getting events
+                        try:
+                            callback_with_cursor.callback(
+                                event_log_entry,
+                                str(EventLogCursor.from_storage_id(storage_id)),
+                            )
+                        except Exception:
+                            logging.exception(
+                                "Exception in callback for event watch on run %s.",
+                                event_log_entry.run_id,
+                            )
+
+            if records:
+                # every record for the polled runs up to the last returned storage id has now
+                # been seen, so runs without new events can skip ahead too
+                last_storage_id = max(records.keys())
+                for run_id in cursors_by_run_id:
+                    watched_run = self._watched_runs.get(run_id)
+                    if watched_run:
+                        watched_run.cursor = max(watched_run.cursor, last_storage_id)
+
+        return bool(records)
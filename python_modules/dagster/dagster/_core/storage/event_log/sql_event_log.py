@@ -5,6 +5,7 @@
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from functools import cached_property
+from itertools import groupby
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -138,6 +139,21 @@ def enforce_max_records_limit(limit: int):
 SqlDbConnection: TypeAlias = Any
 
 
+def requires_single_insert(event: EventLogEntry) -> bool:
+    """Whether storing the event updates the asset, asset check, or run status indexes, which need
+    the storage id of the event's row, so the event cannot be part of a multi-row insert.
+    """
+    if not event.is_dagster_event:
+        return False
+
+    event_type = event.get_dagster_event().event_type
+    return (
+        event_type in ASSET_EVENTS
+        or event_type in ASSET_CHECK_EVENTS
+        or event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+    )
+
+
 class SqlEventLogStorage(EventLogStorage):
     """Base class for SQL backed event log storages.
 
@@ -460,6 +476,30 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events, inserting consecutive events for the same run with a single
+        multi-row statement.
+
+        Events that also update the asset, asset check, or run status indexes need the storage id
+        of their inserted row, which not every SQL backend can return from a multi-row insert, so
+        those are stored individually, in order.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        for (run_id, is_single_insert), group in groupby(
+            events, key=lambda event: (event.run_id, requires_single_insert(event))
+        ):
+            run_events = list(group)
+            if is_single_insert or len(run_events) == 1:
+                for event in run_events:
+                    self.store_event(event)
+            else:
+                with self.run_connection(run_id) as conn:
+                    conn.execute(self.prepare_insert_event_batch(run_events))
+
     def get_records_for_run(
         self,
         run_id,
@@ -553,6 +593,44 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_storage_ids_for_run(
+        self,
+        run_id: str,
+        after_storage_id: int,
+        up_to_storage_id: int,
+        of_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
+    ) -> Sequence[int]:
+        check.str_param(run_id, "run_id")
+        check.int_param(after_storage_id, "after_storage_id")
+        check.int_param(up_to_storage_id, "up_to_storage_id")
+
+        dagster_event_types = (
+            {of_type}
+            if isinstance(of_type, DagsterEventType)
+            else check.opt_set_param(of_type, "dagster_event_type", of_type=DagsterEventType)
+        )
+
+        query = (
+            db_select([SqlEventLogStorageTable.c.id])
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.run_id == run_id,
+                    SqlEventLogStorageTable.c.id > after_storage_id,
+                    SqlEventLogStorageTable.c.id <= up_to_storage_id,
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if dagster_event_types:
+            query = query.where(
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [dagster_event_type.value for dagster_event_type in dagster_event_types]
+                )
+            )
+
+        with self.run_connection(run_id) as conn:
+            return [row[0] for row in conn.execute(query).fetchall()]
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
@@ -1123,8 +1201,10 @@ def get_logs_for_all_runs_by_log_id(
         after_cursor: int = -1,
         dagster_event_type: Optional[Union[DagsterEventType, Set[DagsterEventType]]] = None,
         limit: Optional[int] = None,
+        run_ids: Optional[Sequence[str]] = None,
     ) -> Mapping[int, EventLogEntry]:
         check.int_param(after_cursor, "after_cursor")
+        check.opt_sequence_param(run_ids, "run_ids", of_type=str)
         check.invariant(
             after_cursor >= -1,
             f"Don't know what to do with negative cursor {after_cursor}",
@@ -1158,6 +1238,9 @@ def get_logs_for_all_runs_by_log_id(
                 )
             )
 
+        if run_ids is not None:
+            query = query.where(SqlEventLogStorageTable.c.run_id.in_(run_ids))
+
         if limit:
             query = query.limit(limit)
 
@@ -1182,6 +1265,41 @@ def get_maximum_record_id(self) -> Optional[int]:
             result = conn.execute(db_select([db.func.max(SqlEventLogStorageTable.c.id)])).fetchone()
             return result[0]  # type: ignore
 
+    def get_asset_event_cursors(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Optional[Mapping[AssetKey, str]]:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+
+        # observations only update the asset row through the secondary index columns
+        if not self.has_asset_key_index_cols():
+            return None
+
+        if not asset_keys:
+            return {}
+
+        # the asset row is updated when an event is stored for the asset, when the asset is wiped,
+        # and when its status cache is updated, so its columns make up the cursor without scanning
+        # the events of the asset
+        cursor_columns = [
+            AssetKeyTable.c.last_materialization_timestamp,
+            AssetKeyTable.c.last_run_id,
+            AssetKeyTable.c.wipe_timestamp,
+            AssetKeyTable.c.asset_details,
+            AssetKeyTable.c.cached_status_data,
+        ]
+        query = db_select([AssetKeyTable.c.asset_key, *cursor_columns]).where(
+            AssetKeyTable.c.asset_key.in_([asset_key.to_string() for asset_key in asset_keys])
+        )
+        with self.index_connection() as conn:
+            rows = db_fetch_mappings(conn, query)
+
+        cursors = {}
+        for row in rows:
+            asset_key = AssetKey.from_db_string(cast(Optional[str], row["asset_key"]))
+            if asset_key:
+                cursors[asset_key] = ":".join(str(row[column.name]) for column in cursor_columns)
+        return cursors
+
     def _construct_asset_record_from_row(
         self,
         row,
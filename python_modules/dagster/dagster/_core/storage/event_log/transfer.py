@@ -0,0 +1,482 @@
+"""Streaming export and import of event log records, for moving history between instances.
+
+Events are written to gzipped chunk files with one line per event, holding the storage id of the
+event in the exported storage followed by the serialized event. Each chunk file is named after the
+stream it belongs to and the range of storage ids it covers,
+`<stream>_<after_storage_id>_<last_storage_id>.events.gz`, so that an interrupted export can resume
+from the last complete chunk. An interrupted import resumes after the last event it stored.
+
+Storages that are not run sharded are exported as a single stream in storage id order. Run sharded
+storages (e.g. the default SqliteEventLogStorage) do not have storage ids that are unique across
+runs, so they are exported as one stream per run.
+"""
+
+import gzip
+import json
+import os
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import dagster._check as check
+from dagster._core.event_api import EventLogCursor
+from dagster._core.events.log import EventLogEntry
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._utils import PrintFn
+
+from .base import EventLogStorage
+from .sql_event_log import requires_single_insert
+
+EVENT_LOG_CHUNK_SUFFIX = ".events.gz"
+EVENT_LOG_IMPORT_CURSORS_FILENAME = "import_cursors.json"
+ALL_RUNS_STREAM = "all"
+RUNLESS_STREAM = "runless"
+RUN_STREAM_PREFIX = "run-"
+DEFAULT_EXPORT_CHUNK_SIZE = 10000
+
+
+class EventLogChunkFile(NamedTuple):
+    """A chunk file of exported events, holding the events of `stream` with storage ids greater
+    than `after_storage_id`, up to and including `last_storage_id`.
+    """
+
+    stream: str
+    after_storage_id: int
+    last_storage_id: int
+    path: str
+
+    @staticmethod
+    def from_path(path: str) -> Optional["EventLogChunkFile"]:
+        filename = os.path.basename(path)
+        if not filename.endswith(EVENT_LOG_CHUNK_SUFFIX):
+            return None
+
+        parts = filename[: -len(EVENT_LOG_CHUNK_SUFFIX)].rsplit("_", 2)
+        if len(parts) != 3:
+            return None
+
+        stream, after_storage_id, last_storage_id = parts
+        try:
+            return EventLogChunkFile(stream, int(after_storage_id), int(last_storage_id), path)
+        except ValueError:
+            return None
+
+    @staticmethod
+    def path_for(directory: str, stream: str, after_storage_id: int, last_storage_id: int) -> str:
+        return os.path.join(
+            directory, f"{stream}_{after_storage_id}_{last_storage_id}{EVENT_LOG_CHUNK_SUFFIX}"
+        )
+
+
+def stream_for_run_id(run_id: str) -> str:
+    return f"{RUN_STREAM_PREFIX}{run_id}" if run_id else RUNLESS_STREAM
+
+
+def get_event_log_chunk_files(
+    directory: str,
+) -> Tuple[Mapping[str, Sequence[EventLogChunkFile]], Sequence[EventLogChunkFile]]:
+    """Returns the chunk files in the directory, as a mapping of stream to the chain of chunks that
+    follow each other without gaps, and a list of the chunks that are not part of such a chain
+    (e.g. chunks written by a parallel export after an earlier chunk failed).
+    """
+    chunks_by_stream: Dict[str, List[EventLogChunkFile]] = defaultdict(list)
+    for filename in os.listdir(directory):
+        chunk = EventLogChunkFile.from_path(os.path.join(directory, filename))
+        if chunk:
+            chunks_by_stream[chunk.stream].append(chunk)
+
+    chains: Dict[str, List[EventLogChunkFile]] = {}
+    orphans: List[EventLogChunkFile] = []
+    for stream, chunks in chunks_by_stream.items():
+        chunks_by_after_storage_id = {chunk.after_storage_id: chunk for chunk in chunks}
+        chain = []
+        chunk = chunks_by_after_storage_id.get(min(chunks_by_after_storage_id.keys()))
+        while chunk:
+            chain.append(chunk)
+            chunk = chunks_by_after_storage_id.get(chunk.last_storage_id)
+        chains[stream] = chain
+        chain_paths = {chunk.path for chunk in chain}
+        orphans.extend(chunk for chunk in chunks if chunk.path not in chain_paths)
+
+    return chains, orphans
+
+
+def read_event_log_chunk_records(path: str) -> Sequence[Tuple[int, EventLogEntry]]:
+    """Returns the events of a chunk file along with their storage ids in the exported storage."""
+    records = []
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                storage_id, serialized_event = line.split(" ", 1)
+                records.append(
+                    (int(storage_id), deserialize_value(serialized_event, EventLogEntry))
+                )
+    return records
+
+
+def read_event_log_chunk(path: str) -> Sequence[EventLogEntry]:
+    return [event for _storage_id, event in read_event_log_chunk_records(path)]
+
+
+def _write_event_log_chunk(
+    directory: str,
+    stream: str,
+    after_storage_id: int,
+    records: Sequence[Tuple[int, EventLogEntry]],
+) -> EventLogChunkFile:
+    last_storage_id = records[-1][0]
+    path = EventLogChunkFile.path_for(directory, stream, after_storage_id, last_storage_id)
+    # write to a temporary file first, so that only complete chunks are ever picked up on resume
+    tmp_path = f"{path}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+        for storage_id, event in records:
+            f.write(f"{storage_id} {serialize_value(event)}\n")
+    os.replace(tmp_path, path)
+    return EventLogChunkFile(stream, after_storage_id, last_storage_id, path)
+
+
+def _export_stream(
+    output_dir: str,
+    stream: str,
+    after_storage_id: int,
+    fetch_records: Callable[[int], Sequence[Tuple[int, EventLogEntry]]],
+    executor: Optional[ThreadPoolExecutor] = None,
+    max_pending_writes: int = 1,
+) -> int:
+    """Exports the records returned by `fetch_records` (given the storage id to fetch after) into
+    chunk files, until no more records are returned. If an executor is given, chunk files are
+    compressed and written in the background while the next chunk is fetched.
+    """
+    count = 0
+    pending_writes: List[Future] = []
+    while True:
+        records = fetch_records(after_storage_id)
+        if not records:
+            break
+
+        if executor:
+            pending_writes.append(
+                executor.submit(
+                    _write_event_log_chunk, output_dir, stream, after_storage_id, records
+                )
+            )
+            # bound the number of fetched chunks held in memory
+            while len(pending_writes) >= max_pending_writes:
+                pending_writes.pop(0).result()
+        else:
+            _write_event_log_chunk(output_dir, stream, after_storage_id, records)
+
+        count += len(records)
+        after_storage_id = records[-1][0]
+
+    for future in pending_writes:
+        future.result()
+
+    return count
+
+
+def export_event_log(
+    event_log_storage: EventLogStorage,
+    output_dir: str,
+    run_ids: Optional[Sequence[str]] = None,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK_SIZE,
+    max_workers: int = 1,
+    print_fn: Optional[PrintFn] = None,
+) -> int:
+    """Streams the events in the event log storage into gzipped chunk files in `output_dir`, holding
+    at most a few chunks of `chunk_size` events in memory at a time.
+
+    If `output_dir` already contains chunk files from an earlier export, the export resumes after
+    the last complete chunk of each stream.
+
+    Args:
+        event_log_storage (EventLogStorage): The storage to export events from.
+        output_dir (str): The directory to write chunk files to.
+        run_ids (Optional[Sequence[str]]): The runs to export events for. Required for run sharded
+            storages. For other storages, all events are exported if this is not set.
+        chunk_size (int): The number of events to write per chunk file.
+        max_workers (int): The number of threads to use. Run sharded storages export this many runs
+            at a time, other storages write this many chunk files while the next one is fetched.
+        print_fn (Optional[PrintFn]): Function to report progress with.
+
+    Returns:
+        int: The number of exported events.
+    """
+    check.inst_param(event_log_storage, "event_log_storage", EventLogStorage)
+    check.str_param(output_dir, "output_dir")
+    check.opt_sequence_param(run_ids, "run_ids", of_type=str)
+    check.int_param(chunk_size, "chunk_size")
+    check.int_param(max_workers, "max_workers")
+    check.invariant(chunk_size > 0, "chunk_size must be positive")
+    check.invariant(max_workers > 0, "max_workers must be positive")
+
+    os.makedirs(output_dir, exist_ok=True)
+    chains, orphans = get_event_log_chunk_files(output_dir)
+    for orphan in orphans:
+        # events after a gap are exported again, so drop the chunks that were written past it
+        os.remove(orphan.path)
+
+    def _resume_cursor(stream: str) -> int:
+        chain = chains.get(stream)
+        return chain[-1].last_storage_id if chain else -1
+
+    if not event_log_storage.is_run_sharded:
+
+        def _fetch_all_runs(after_storage_id: int) -> Sequence[Tuple[int, EventLogEntry]]:
+            return list(
+                event_log_storage.get_logs_for_all_runs_by_log_id(
+                    after_cursor=after_storage_id, limit=chunk_size, run_ids=run_ids
+                ).items()
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="event_log_export"
+        ) as executor:
+            count = _export_stream(
+                output_dir,
+                ALL_RUNS_STREAM,
+                _resume_cursor(ALL_RUNS_STREAM),
+                _fetch_all_runs,
+                executor=executor,
+                max_pending_writes=max_workers,
+            )
+        if print_fn:
+            print_fn(f"Exported {count} events.")
+        return count
+
+    check.invariant(
+        run_ids is not None,
+        "run_ids must be provided to export events from a run sharded event log storage",
+    )
+
+    def _export_run(run_id: str) -> int:
+        def _fetch_run(after_storage_id: int) -> Sequence[Tuple[int, EventLogEntry]]:
+            connection = event_log_storage.get_records_for_run(
+                run_id,
+                cursor=EventLogCursor.from_storage_id(after_storage_id).to_string(),
+                limit=chunk_size,
+            )
+            return [(record.storage_id, record.event_log_entry) for record in connection.records]
+
+        stream = stream_for_run_id(run_id)
+        run_count = _export_stream(output_dir, stream, _resume_cursor(stream), _fetch_run)
+        if print_fn and run_count:
+            print_fn(f"Exported {run_count} events for run {run_id or '(runless events)'}.")
+        return run_count
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="event_log_export"
+    ) as executor:
+        count = sum(executor.map(_export_run, check.not_none(run_ids)))
+
+    if print_fn:
+        print_fn(f"Exported {count} events.")
+    return count
+
+
+class _ImportCursors:
+    """Tracks the progress of an import in a file, so that an interrupted import can resume after
+    the last stored event.
+
+    For each stream, this holds the last storage id of the last fully imported chunk, and for the
+    chunk being imported, the storage id of the last stored event of each run. The events of a run
+    are always stored in order, so this identifies every stored event of the chunk even though the
+    events of different runs are stored in parallel.
+
+    Updates are appended to the file as json lines, so recording progress does not rewrite the
+    cursors of the streams that were already imported. The file is replayed on load.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._lock = threading.Lock()
+        self._chunk_cursors: Dict[str, int] = {}
+        self._run_cursors: Dict[str, Dict[str, int]] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        update = json.loads(line)
+                    except json.JSONDecodeError:
+                        # a partial line written by an interrupted import
+                        continue
+                    self._apply(update.get("chunks", {}), update.get("runs", {}))
+
+    def _apply(
+        self, chunk_cursors: Mapping[str, int], run_cursors: Mapping[str, Mapping[str, int]]
+    ) -> None:
+        for stream, last_storage_id in chunk_cursors.items():
+            self._chunk_cursors[stream] = last_storage_id
+            # the run cursors only cover the chunk that is being imported
+            self._run_cursors.pop(stream, None)
+        for stream, cursors_by_run_id in run_cursors.items():
+            self._run_cursors.setdefault(stream, {}).update(cursors_by_run_id)
+
+    def get_chunk_cursor(self, stream: str) -> int:
+        with self._lock:
+            return self._chunk_cursors.get(stream, -1)
+
+    def get_run_cursor(self, stream: str, run_id: str) -> int:
+        with self._lock:
+            return self._run_cursors.get(stream, {}).get(run_id, -1)
+
+    def set_run_cursors(self, stream: str, storage_ids_by_run_id: Mapping[str, int]) -> None:
+        with self._lock:
+            self._apply({}, {stream: storage_ids_by_run_id})
+            self._append({"runs": {stream: storage_ids_by_run_id}})
+
+    def set_chunk_cursor(self, stream: str, last_storage_id: int) -> None:
+        with self._lock:
+            self._apply({stream: last_storage_id}, {})
+            self._append({"chunks": {stream: last_storage_id}})
+
+    def _append(self, update: Mapping[str, object]) -> None:
+        with open(self._path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(update) + "\n")
+
+
+def _store_events(
+    event_log_storage: EventLogStorage,
+    records: Sequence[Tuple[int, EventLogEntry]],
+    executor: Optional[ThreadPoolExecutor],
+    on_stored: Callable[[Mapping[str, int]], None],
+) -> None:
+    """Stores events in order. Consecutive events that do not update the asset, asset check, or run
+    status indexes only need to stay ordered within their run, so they are batched per run, and the
+    batches for different runs are stored in parallel.
+
+    Before each batch is stored, `on_stored` is called with the run ids and exported storage ids of
+    the last stored events since it was last called, so progress is recorded once per batch rather
+    than once per event. The progress of the last writes is left to the caller to record, e.g. along
+    with the completed chunk.
+    """
+    batch_by_run_id: Dict[str, List[Tuple[int, EventLogEntry]]] = defaultdict(list)
+    unrecorded_storage_ids_by_run_id: Dict[str, int] = {}
+
+    def _store_batch(run_records: Sequence[Tuple[int, EventLogEntry]]) -> None:
+        event_log_storage.store_event_batch([event for _storage_id, event in run_records])
+
+    def _flush() -> None:
+        if not batch_by_run_id:
+            return
+        if unrecorded_storage_ids_by_run_id:
+            on_stored(dict(unrecorded_storage_ids_by_run_id))
+            unrecorded_storage_ids_by_run_id.clear()
+
+        if executor and len(batch_by_run_id) > 1:
+            for future in [
+                executor.submit(_store_batch, run_records)
+                for run_records in batch_by_run_id.values()
+            ]:
+                future.result()
+        else:
+            for run_records in batch_by_run_id.values():
+                _store_batch(run_records)
+
+        for run_id, run_records in batch_by_run_id.items():
+            unrecorded_storage_ids_by_run_id[run_id] = run_records[-1][0]
+        batch_by_run_id.clear()
+
+    for storage_id, event in records:
+        if requires_single_insert(event):
+            _flush()
+            event_log_storage.store_event(event)
+            unrecorded_storage_ids_by_run_id[event.run_id] = storage_id
+        else:
+            batch_by_run_id[event.run_id].append((storage_id, event))
+    _flush()
+
+
+def import_event_log(
+    event_log_storage: EventLogStorage,
+    input_dir: str,
+    max_workers: int = 1,
+    cursors_path: Optional[str] = None,
+    print_fn: Optional[PrintFn] = None,
+) -> int:
+    """Stores the events from the chunk files written by `export_event_log` into the event log
+    storage, one chunk at a time.
+
+    Progress is recorded in a cursors file before every batched write to the storage and after
+    every chunk, so that running the import again resumes after the last recorded event, also
+    within a chunk that was interrupted midway. Only the events stored since progress was last
+    recorded can be stored twice.
+
+    Events of an export from a non run sharded storage are imported in storage id order, storing
+    the events of different runs in parallel where their relative order does not matter. Events of
+    an export from a run sharded storage are imported run by run, in the order of the first event
+    of each run, importing `max_workers` runs at a time.
+
+    Args:
+        event_log_storage (EventLogStorage): The storage to import events into.
+        input_dir (str): The directory containing the chunk files.
+        max_workers (int): The number of threads to store events with.
+        cursors_path (Optional[str]): The file to track import progress in. Defaults to a file in
+            the input directory.
+        print_fn (Optional[PrintFn]): Function to report progress with.
+
+    Returns:
+        int: The number of imported events.
+    """
+    check.inst_param(event_log_storage, "event_log_storage", EventLogStorage)
+    check.str_param(input_dir, "input_dir")
+    check.int_param(max_workers, "max_workers")
+    check.invariant(max_workers > 0, "max_workers must be positive")
+
+    cursors = _ImportCursors(
+        check.opt_str_param(cursors_path, "cursors_path")
+        or os.path.join(input_dir, EVENT_LOG_IMPORT_CURSORS_FILENAME)
+    )
+    chains, _orphans = get_event_log_chunk_files(input_dir)
+
+    def _import_stream(stream: str, executor: Optional[ThreadPoolExecutor] = None) -> int:
+        stream_count = 0
+        for chunk in chains[stream]:
+            if chunk.last_storage_id <= cursors.get_chunk_cursor(stream):
+                continue
+            records = [
+                (storage_id, event)
+                for storage_id, event in read_event_log_chunk_records(chunk.path)
+                # skip the events that were stored by an interrupted import of this chunk
+                if storage_id > cursors.get_run_cursor(stream, event.run_id)
+            ]
+            _store_events(
+                event_log_storage,
+                records,
+                executor,
+                lambda storage_ids_by_run_id: cursors.set_run_cursors(
+                    stream, storage_ids_by_run_id
+                ),
+            )
+            cursors.set_chunk_cursor(stream, chunk.last_storage_id)
+            stream_count += len(records)
+            if print_fn and stream == ALL_RUNS_STREAM:
+                print_fn(f"Imported events up to storage id {chunk.last_storage_id}.")
+        return stream_count
+
+    count = 0
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="event_log_import"
+    ) as executor:
+        if ALL_RUNS_STREAM in chains:
+            count += _import_stream(ALL_RUNS_STREAM, executor)
+
+        run_streams = [stream for stream in chains.keys() if stream != ALL_RUNS_STREAM]
+        if run_streams:
+            count += sum(executor.map(_import_stream, _sort_by_first_event(chains, run_streams)))
+
+    if print_fn:
+        print_fn(f"Imported {count} events.")
+    return count
+
+
+def _sort_by_first_event(
+    chains: Mapping[str, Sequence[EventLogChunkFile]], streams: Sequence[str]
+) -> Sequence[str]:
+    def _first_timestamp(stream: str) -> float:
+        with gzip.open(chains[stream][0].path, "rt", encoding="utf-8") as f:
+            _storage_id, serialized_event = f.readline().split(" ", 1)
+            return deserialize_value(serialized_event, EventLogEntry).timestamp
+
+    return sorted(streams, key=_first_timestamp)
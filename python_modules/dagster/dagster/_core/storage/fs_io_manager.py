@@ -1,7 +1,10 @@
+import mmap
 import os
 import pickle
-from typing import TYPE_CHECKING, Any, Optional
+import uuid
+from typing import TYPE_CHECKING, Any, List, Optional
 
+from fsspec.implementations.local import LocalFileSystem
 from pydantic import Field
 
 import dagster._check as check
@@ -48,6 +51,13 @@ class FilesystemIOManager(ConfigurableIOManagerFactory["PickledObjectFilesystemI
     `AssetKey(["one", "two", "three"])` would be stored in a file called "three" in a directory
     with path "/my/base/path/one/two/".
 
+    If "memory_map_buffers" is set, values are pickled with protocol 5, and the out-of-band buffers
+    of objects that support them, such as NumPy arrays and Arrow tables, are written as separate
+    files in a "<path>.buffers-<id>/" directory next to the pickle file. When loading from a local
+    filesystem, these files are memory-mapped instead of being read, so steps on the same machine
+    that load the same value share its pages rather than each holding a copy. Values are loaded
+    whichever way they were written, so the option can be turned on or off for existing assets.
+
     Example usage:
 
 
@@ -122,6 +132,27 @@ def job():
     """
 
     base_dir: Optional[str] = Field(default=None, description="Base directory for storing files.")
+    memory_map_buffers: bool = Field(
+        default=False,
+        description=(
+            "Whether to write the out-of-band buffers of pickled values to separate files, which"
+            " are memory-mapped when loaded from a local filesystem."
+        ),
+    )
+    max_partition_io_workers: Optional[int] = Field(
+        default=None,
+        description=(
+            "If set, inputs and outputs spanning multiple partitions are loaded and written on a"
+            " thread pool of up to this many threads."
+        ),
+    )
+    index_partition_paths: bool = Field(
+        default=False,
+        description=(
+            "Whether to list the files of an asset once when loading multiple partitions, instead"
+            " of attempting to load each missing partition."
+        ),
+    )
 
     @classmethod
     def _is_dagster_maintained(cls) -> bool:
@@ -129,7 +160,12 @@ def _is_dagster_maintained(cls) -> bool:
 
     def create_io_manager(self, context: InitResourceContext) -> "PickledObjectFilesystemIOManager":
         base_dir = self.base_dir or check.not_none(context.instance).storage_directory()
-        return PickledObjectFilesystemIOManager(base_dir=base_dir)
+        return PickledObjectFilesystemIOManager(
+            base_dir=base_dir,
+            memory_map_buffers=self.memory_map_buffers,
+            max_partition_io_workers=self.max_partition_io_workers,
+            index_partition_paths=self.index_partition_paths,
+        )
 
 
 @dagster_maintained_io_manager
@@ -159,6 +195,9 @@ def fs_io_manager(init_context: InitResourceContext) -> "PickledObjectFilesystem
     `AssetKey(["one", "two", "three"])` would be stored in a file called "three" in a directory
     with path "/my/base/path/one/two/".
 
+    Set the "memory_map_buffers" configuration value to write the out-of-band buffers of pickled
+    values, such as NumPy arrays, to separate files that are memory-mapped when loaded locally.
+
     Example usage:
 
 
@@ -234,6 +273,11 @@ def job():
     return FilesystemIOManager.from_resource_context(init_context)
 
 
+# the first object in pickle files written with memory_map_buffers, followed by the name of the
+# directory that holds the out-of-band buffers of the value
+_BUFFERS_HEADER = "dagster_pickle_buffers"
+
+
 class PickledObjectFilesystemIOManager(UPathIOManager):
     """Built-in filesystem IO manager that stores and retrieves values using pickling.
     Is compatible with local and remote filesystems via `universal-pathlib` and `fsspec`.
@@ -242,22 +286,44 @@ class PickledObjectFilesystemIOManager(UPathIOManager):
     Args:
         base_dir (Optional[str]): base directory where all the step outputs which use this object
             manager will be stored in.
+        memory_map_buffers (bool): whether to pickle with protocol 5 and write out-of-band buffers
+            to separate files, which are memory-mapped when loaded from a local filesystem. Values
+            written with this option must also be loaded with it.
+        max_partition_io_workers (Optional[int]): if set, multiple partitions are loaded and written
+            on a thread pool of up to this many threads.
+        index_partition_paths (bool): whether to list the files of an asset once when loading
+            partitions, to skip missing partitions without attempting to load them.
         **kwargs: additional keyword arguments for `universal_pathlib.UPath`.
     """
 
     extension: str = ""  # TODO: maybe change this to .pickle? Leaving blank for compatibility.
 
-    def __init__(self, base_dir=None, **kwargs):
+    def __init__(
+        self,
+        base_dir=None,
+        memory_map_buffers: bool = False,
+        max_partition_io_workers: Optional[int] = None,
+        index_partition_paths: bool = False,
+        **kwargs,
+    ):
         from upath import UPath
 
         self.base_dir = check.opt_str_param(base_dir, "base_dir")
+        self.memory_map_buffers = check.bool_param(memory_map_buffers, "memory_map_buffers")
 
-        super().__init__(base_path=UPath(base_dir, **kwargs))
+        super().__init__(
+            base_path=UPath(base_dir, **kwargs),
+            max_partition_io_workers=max_partition_io_workers,
+            index_partition_paths=index_partition_paths,
+        )
 
     def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
         try:
-            with path.open("wb") as file:
-                pickle.dump(obj, file, PICKLE_PROTOCOL)
+            if self.memory_map_buffers:
+                self._dump_with_buffers(obj, path)
+            else:
+                with path.open("wb") as file:
+                    pickle.dump(obj, file, PICKLE_PROTOCOL)
         except (AttributeError, RecursionError, ImportError, pickle.PicklingError) as e:
             executor = context.step_context.job_def.executor_def
 
@@ -280,8 +346,98 @@ def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
             ) from e
 
     def load_from_path(self, context: InputContext, path: "UPath") -> Any:
+        # the format of the file is detected rather than taken from `memory_map_buffers`, so that
+        # values written before the option was changed can still be loaded
+        try:
+            return self._load_with_buffers(path)
+        except (FileNotFoundError, pickle.UnpicklingError):
+            # the value was overwritten and its buffers removed between reading the pickle file and
+            # its buffers, so load the new value
+            return self._load_with_buffers(path)
+
+    def _dump_with_buffers(self, obj: Any, path: "UPath") -> None:
+        # the buffers are written to a new directory, which is named in a header of the pickle file,
+        # and the pickle file is replaced last, so that a concurrent load never pairs the pickle of
+        # one value with the buffers of another
+        buffers_path = path.with_name(f"{path.name}.buffers-{uuid.uuid4().hex}")
+        previous_buffers_path = self._read_buffers_path(path) if self.path_exists(path) else None
+
+        local = _is_local_path(path)
+        pickle_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp") if local else path
+        buffers: List[pickle.PickleBuffer] = []
+        with pickle_path.open("wb") as file:
+            pickle.dump((_BUFFERS_HEADER, buffers_path.name), file, PICKLE_PROTOCOL)
+            pickle.dump(obj, file, protocol=5, buffer_callback=buffers.append)
+
+            if buffers:
+                self.make_directory(buffers_path)
+                for i, buffer in enumerate(buffers):
+                    with (buffers_path / str(i)).open("wb") as buffer_file:
+                        buffer_file.write(buffer.raw())
+        if local:
+            os.replace(pickle_path.path, path.path)
+
+        # the buffers of the previous value are unlinked rather than overwritten, as they may still
+        # be memory-mapped by a step that loaded it
+        if previous_buffers_path and self.path_exists(previous_buffers_path):
+            for buffer_path in previous_buffers_path.iterdir():
+                self.unlink(buffer_path)
+            if _is_local_path(previous_buffers_path):
+                previous_buffers_path.rmdir()
+
+    def _read_buffers_path(self, path: "UPath") -> Optional["UPath"]:
+        try:
+            with path.open("rb") as file:
+                return _get_buffers_path(path, pickle.load(file))
+        except Exception:
+            return None
+
+    def _load_with_buffers(self, path: "UPath") -> Any:
         with path.open("rb") as file:
-            return pickle.load(file)
+            obj = pickle.load(file)
+            buffers_path = _get_buffers_path(path, obj)
+            if buffers_path is None:
+                # a plain pickle, written without `memory_map_buffers`
+                return obj
+            return pickle.load(file, buffers=self._load_buffers(buffers_path))
+
+    def _load_buffers(self, buffers_path: "UPath") -> List[Any]:
+        if not self.path_exists(buffers_path):
+            return []
+
+        buffer_paths = sorted(buffers_path.iterdir(), key=lambda buffer_path: int(buffer_path.name))
+        if not _is_local_path(buffers_path):
+            # buffers are copied so that the loaded values are writable, as they are when mapped
+            return [bytearray(buffer_path.read_bytes()) for buffer_path in buffer_paths]
+
+        buffers = []
+        for buffer_path in buffer_paths:
+            with buffer_path.open("rb") as file:
+                if os.fstat(file.fileno()).st_size == 0:
+                    # empty files can't be memory-mapped
+                    buffers.append(bytearray())
+                else:
+                    # copy-on-write, so the loaded values are writable without changing the file
+                    buffers.append(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY))
+        return buffers
+
+
+def _get_buffers_path(path: "UPath", header: Any) -> Optional["UPath"]:
+    # values written with `memory_map_buffers` start with a header that names their buffers
+    if not (
+        isinstance(header, tuple)
+        and len(header) == 2
+        and header[0] == _BUFFERS_HEADER
+        and isinstance(header[1], str)
+    ):
+        return None
+    return path.with_name(header[1])
+
+
+def _is_local_path(path: "UPath") -> bool:
+    from upath import UPath
+
+    return not isinstance(path, UPath) or isinstance(path.fs, LocalFileSystem)
 
 
 class CustomPathPickledObjectFilesystemIOManager(IOManager):
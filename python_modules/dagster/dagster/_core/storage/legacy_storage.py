@@ -211,6 +211,16 @@ def get_run_ids(
     def get_runs_count(self, filters: Optional["RunsFilter"] = None) -> int:
         return self._storage.run_storage.get_runs_count(filters)
 
+    def get_runs_for_run_keys(
+        self,
+        run_keys: Sequence[str],
+        sensor_name: str,
+        repository_selector_id: str,
+    ) -> Sequence["DagsterRun"]:
+        return self._storage.run_storage.get_runs_for_run_keys(
+            run_keys, sensor_name, repository_selector_id
+        )
+
     def get_run_group(self, run_id: str) -> Optional[Tuple[str, Iterable["DagsterRun"]]]:
         return self._storage.run_storage.get_run_group(run_id)
 
@@ -227,6 +237,9 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    def get_run_record_cursors(self, run_ids: Sequence[str]) -> Optional[Mapping[str, str]]:
+        return self._storage.run_storage.get_run_record_cursors(run_ids)
+
     def get_run_tags(
         self,
         tag_keys: Sequence[str],
@@ -494,6 +507,11 @@ def get_asset_records(
     ) -> Iterable[AssetRecord]:
         return self._storage.event_log_storage.get_asset_records(asset_keys)
 
+    def get_asset_event_cursors(
+        self, asset_keys: Sequence["AssetKey"]
+    ) -> Optional[Mapping["AssetKey", str]]:
+        return self._storage.event_log_storage.get_asset_event_cursors(asset_keys)
+
     def get_asset_check_summary_records(
         self, asset_check_keys: Sequence["AssetCheckKey"]
     ) -> Mapping["AssetCheckKey", AssetCheckSummaryRecord]:
@@ -616,6 +634,17 @@ def get_records_for_run(
             run_id, cursor, of_type, limit, ascending
         )
 
+    def get_storage_ids_for_run(
+        self,
+        run_id: str,
+        after_storage_id: int,
+        up_to_storage_id: int,
+        of_type: Optional[Union["DagsterEventType", Set["DagsterEventType"]]] = None,
+    ) -> Sequence[int]:
+        return self._storage.event_log_storage.get_storage_ids_for_run(
+            run_id, after_storage_id, up_to_storage_id, of_type
+        )
+
     def initialize_concurrency_limit_to_default(self, concurrency_key: str) -> bool:
         return self._storage.event_log_storage.initialize_concurrency_limit_to_default(
             concurrency_key
@@ -736,6 +765,9 @@ def update_instigator_state(self, state: "InstigatorState") -> "InstigatorState"
     def delete_instigator_state(self, origin_id: str, selector_id: str) -> None:
         return self._storage.schedule_storage.delete_instigator_state(origin_id, selector_id)
 
+    def get_instigator_states_cursor(self) -> Optional[str]:
+        return self._storage.schedule_storage.get_instigator_states_cursor()
+
     @property
     def supports_batch_queries(self) -> bool:
         return self._storage.schedule_storage.supports_batch_queries
@@ -1,3 +1,5 @@
+import json
+import os
 from enum import Enum
 from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Set, Tuple
 
@@ -12,8 +14,10 @@
 from dagster._core.definitions.multi_dimensional_partitions import (
     MultiPartitionKey,
     MultiPartitionsDefinition,
+    MultiPartitionsSubset,
 )
 from dagster._core.definitions.partition import (
+    DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
     PartitionsDefinition,
     PartitionsSubset,
@@ -52,6 +56,65 @@ class AssetPartitionStatus(Enum):
     FAILED = "FAILED"
 
 
+# Multi-partitioned subsets are only written by primary dimension (see MultiPartitionsSubset) when
+# this is set, since versions that predate that format cannot read it. Enable it once every process
+# that reads the asset status cache runs a version that can.
+def _use_compact_multi_partitions_cache_subsets() -> bool:
+    return os.getenv("DAGSTER_COMPACT_MULTI_PARTITIONS_STATUS_CACHE", "").lower() in ("1", "true")
+
+
+def _empty_cache_subset(partitions_def: PartitionsDefinition) -> PartitionsSubset:
+    if (
+        isinstance(partitions_def, MultiPartitionsDefinition)
+        and _use_compact_multi_partitions_cache_subsets()
+    ):
+        return MultiPartitionsSubset(partitions_def)
+    return partitions_def.empty_subset()
+
+
+def _deserialize_cache_subset(
+    partitions_def: PartitionsDefinition, serialized: Optional[str]
+) -> PartitionsSubset:
+    """Deserializes a subset stored in the status cache. Multi-partitioned subsets are only read as
+    a MultiPartitionsSubset when compact cache subsets are enabled, so that the default path does
+    not convert every cached subset between formats.
+    """
+    if not serialized:
+        return _empty_cache_subset(partitions_def)
+    if isinstance(partitions_def, MultiPartitionsDefinition):
+        # both formats are told apart by their keys, so the subset is only parsed once
+        data = json.loads(serialized)
+        if _use_compact_multi_partitions_cache_subsets():
+            return MultiPartitionsSubset.from_serialized_data(partitions_def, data)
+        if MultiPartitionsSubset.is_serialized_by_primary_dimension(data):
+            # written while compact cache subsets were enabled
+            return MultiPartitionsSubset.from_serialized_data(
+                partitions_def, data
+            ).to_serializable_subset()
+        return DefaultPartitionsSubset.from_serialized_data(data)
+    return partitions_def.deserialize_subset(serialized)
+
+
+def _serialize_cache_subset(partitions_def: PartitionsDefinition, subset: PartitionsSubset) -> str:
+    if (
+        isinstance(partitions_def, MultiPartitionsDefinition)
+        and _use_compact_multi_partitions_cache_subsets()
+    ):
+        if not isinstance(subset, MultiPartitionsSubset):
+            subset = MultiPartitionsSubset(partitions_def).with_partition_keys(
+                subset.get_partition_keys()
+            )
+        return subset.serialize()
+    return subset.to_serializable_subset().serialize()
+
+
+def _get_public_cache_subset(subset: PartitionsSubset) -> PartitionsSubset:
+    # callers of the deserialize methods expect the subset class of the partitions definition
+    if isinstance(subset, MultiPartitionsSubset):
+        return subset.to_serializable_subset()
+    return subset
+
+
 def is_cacheable_partition_type(partitions_def: PartitionsDefinition) -> bool:
     check.inst_param(partitions_def, "partitions_def", PartitionsDefinition)
     if not isinstance(partitions_def, CACHEABLE_PARTITION_TYPES):
@@ -97,6 +160,9 @@ class AssetStatusCacheValue(
             partition subsets, up to the latest storage id. None if the asset is unpartitioned.
         serialized_in_progress_partition_subset (Optional(str)): The serialized representation of the
             in progress partition subsets, up to the latest storage id. None if the asset is unpartitioned.
+            For multi-partitioned assets, the serialized subsets are written by primary dimension
+            (see MultiPartitionsSubset) when DAGSTER_COMPACT_MULTI_PARTITIONS_STATUS_CACHE is set,
+            and in the default format otherwise. Either format can be read.
         earliest_in_progress_materialization_event_id (Optional(int)): The event id of the earliest
             materialization planned event for a run that is still in progress. This is used to check
             on the status of runs that are still in progress.
@@ -147,26 +213,23 @@ def from_db_string(db_string: str) -> Optional["AssetStatusCacheValue"]:
     def deserialize_materialized_partition_subsets(
         self, partitions_def: PartitionsDefinition
     ) -> PartitionsSubset:
-        if not self.serialized_materialized_partition_subset:
-            return partitions_def.empty_subset()
-
-        return partitions_def.deserialize_subset(self.serialized_materialized_partition_subset)
+        return _get_public_cache_subset(
+            _deserialize_cache_subset(partitions_def, self.serialized_materialized_partition_subset)
+        )
 
     def deserialize_failed_partition_subsets(
         self, partitions_def: PartitionsDefinition
     ) -> PartitionsSubset:
-        if not self.serialized_failed_partition_subset:
-            return partitions_def.empty_subset()
-
-        return partitions_def.deserialize_subset(self.serialized_failed_partition_subset)
+        return _get_public_cache_subset(
+            _deserialize_cache_subset(partitions_def, self.serialized_failed_partition_subset)
+        )
 
     def deserialize_in_progress_partition_subsets(
         self, partitions_def: PartitionsDefinition
     ) -> PartitionsSubset:
-        if not self.serialized_in_progress_partition_subset:
-            return partitions_def.empty_subset()
-
-        return partitions_def.deserialize_subset(self.serialized_in_progress_partition_subset)
+        return _get_public_cache_subset(
+            _deserialize_cache_subset(partitions_def, self.serialized_in_progress_partition_subset)
+        )
 
 
 def get_materialized_multipartitions(
@@ -271,7 +334,9 @@ def _build_status_cache(
         return AssetStatusCacheValue(latest_storage_id=latest_storage_id)
 
     failed_subset = (
-        partitions_def.deserialize_subset(stored_cache_value.serialized_failed_partition_subset)
+        _deserialize_cache_subset(
+            partitions_def, stored_cache_value.serialized_failed_partition_subset
+        )
         if stored_cache_value and stored_cache_value.serialized_failed_partition_subset
         else None
     )
@@ -302,24 +367,20 @@ def _build_status_cache(
                 ),
             )
 
-        materialized_subset: PartitionsSubset = (
-            partitions_def.deserialize_subset(
-                stored_cache_value.serialized_materialized_partition_subset
-            )
-            if stored_cache_value.serialized_materialized_partition_subset
-            else partitions_def.empty_subset()
+        materialized_subset = _deserialize_cache_subset(
+            partitions_def, stored_cache_value.serialized_materialized_partition_subset
         )
 
         if new_partitions:
             materialized_subset = materialized_subset.with_partition_keys(new_partitions)
 
         if failed_subset and new_partitions:
-            failed_subset = failed_subset - partitions_def.empty_subset().with_partition_keys(
+            failed_subset = failed_subset - _empty_cache_subset(partitions_def).with_partition_keys(
                 new_partitions
             )
 
     else:
-        materialized_subset = partitions_def.empty_subset().with_partition_keys(
+        materialized_subset = _empty_cache_subset(partitions_def).with_partition_keys(
             get_validated_partition_keys(
                 dynamic_partitions_store,
                 partitions_def,
@@ -346,9 +407,13 @@ def _build_status_cache(
         partitions_def_id=partitions_def.get_serializable_unique_identifier(
             dynamic_partitions_store=dynamic_partitions_store
         ),
-        serialized_materialized_partition_subset=materialized_subset.serialize(),
-        serialized_failed_partition_subset=failed_subset.serialize(),
-        serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+        serialized_materialized_partition_subset=_serialize_cache_subset(
+            partitions_def, materialized_subset
+        ),
+        serialized_failed_partition_subset=_serialize_cache_subset(partitions_def, failed_subset),
+        serialized_in_progress_partition_subset=_serialize_cache_subset(
+            partitions_def, in_progress_subset
+        ),
         earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
     )
 
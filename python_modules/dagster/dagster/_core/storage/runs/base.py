@@ -17,6 +17,7 @@
     TagBucket,
 )
 from dagster._core.storage.sql import AlembicVersion
+from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._utils import PrintFn
 
@@ -159,6 +160,56 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    def get_run_record_cursors(self, run_ids: Sequence[str]) -> Optional[Mapping[str, str]]:
+        """Return a value for each of the given runs that exists that changes whenever the run is
+        updated, or None if the storage cannot cheaply tell. On storages that only keep timestamps
+        to the second, an update that does not change the status of the run may leave the value
+        unchanged if the run was last updated within the same second.
+
+        Args:
+            run_ids (Sequence[str]): The run ids to look up.
+
+        Returns:
+            Optional[Mapping[str, str]]: The cursors, keyed by run id.
+        """
+        return None
+
+    def get_runs_for_run_keys(
+        self,
+        run_keys: Sequence[str],
+        sensor_name: str,
+        repository_selector_id: str,
+    ) -> Sequence[DagsterRun]:
+        """Return the runs launched by a sensor for any of the given run keys.
+
+        Runs are matched on the sensor name tag and, if the run has a job origin, on the selector
+        id of the origin's repository, so that sensors with the same name in different
+        repositories do not affect each other.
+
+        Args:
+            run_keys (Sequence[str]): The run keys to look up.
+            sensor_name (str): The name of the sensor that launched the runs.
+            repository_selector_id (str): The selector id of the sensor's repository.
+
+        Returns:
+            Sequence[DagsterRun]: The matching runs, in descending order for each run key.
+        """
+        runs = []
+        for run_key in run_keys:
+            # do serial fetching, which has better perf than a single query with an IN clause, due
+            # to how the query planner does the runs/run_tags join
+            runs.extend(
+                run
+                for run in self.get_runs(filters=RunsFilter(tags={RUN_KEY_TAG: run_key}))
+                if run.tags.get(SENSOR_NAME_TAG) == sensor_name
+                and (
+                    run.external_job_origin is None
+                    or run.external_job_origin.repository_origin.get_selector_id()
+                    == repository_selector_id
+                )
+            )
+        return runs
+
     @abstractmethod
     def get_run_tags(
         self,
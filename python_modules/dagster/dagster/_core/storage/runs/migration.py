@@ -14,8 +14,14 @@
 from ...execution.job_backfill import PartitionBackfill
 from ..dagster_run import DagsterRun, DagsterRunStatus, RunRecord
 from ..runs.base import RunStorage
-from ..runs.schema import BulkActionsTable, RunsTable, RunTagsTable
-from ..tags import PARTITION_NAME_TAG, PARTITION_SET_TAG, REPOSITORY_LABEL_TAG
+from ..runs.schema import BulkActionsTable, RunKeysTable, RunsTable, RunTagsTable
+from ..tags import (
+    PARTITION_NAME_TAG,
+    PARTITION_SET_TAG,
+    REPOSITORY_LABEL_TAG,
+    RUN_KEY_TAG,
+    SENSOR_NAME_TAG,
+)
 
 RUN_PARTITIONS = "run_partitions"
 RUN_START_END = (  # was run_start_end, but renamed to overwrite bad timestamps written
@@ -23,6 +29,7 @@
 )
 RUN_REPO_LABEL_TAGS = "run_repo_label_tags"
 BULK_ACTION_TYPES = "bulk_action_types"
+RUN_KEYS = "run_keys"
 
 PrintFn: TypeAlias = Callable[[Any], None]
 MigrationFn: TypeAlias = Callable[[RunStorage, Optional[PrintFn]], None]
@@ -32,6 +39,7 @@
     RUN_PARTITIONS: lambda: migrate_run_partition,
     RUN_REPO_LABEL_TAGS: lambda: migrate_run_repo_tags,
     BULK_ACTION_TYPES: lambda: migrate_bulk_actions,
+    RUN_KEYS: lambda: migrate_run_keys,
 }
 # for `dagster instance reindex`, optionally run for better read performance
 OPTIONAL_DATA_MIGRATIONS: Final[Mapping[str, Callable[[], MigrationFn]]] = {
@@ -260,3 +268,74 @@ def migrate_bulk_actions(run_storage: RunStorage, print_fn: Optional[PrintFn] =
                     .where(BulkActionsTable.c.id == storage_id)
                 )
                 cursor = storage_id
+
+
+def migrate_run_keys(run_storage: RunStorage, print_fn: Optional[PrintFn] = None) -> None:
+    from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
+
+    if not isinstance(run_storage, SqlRunStorage):
+        return
+
+    if print_fn:
+        print_fn("Querying run storage.")
+
+    tag_subquery = (
+        db_select([RunTagsTable.c.run_id.label("tags_run_id")])
+        .where(RunTagsTable.c.key == RUN_KEY_TAG)
+        .alias("tag_subquery")
+    )
+    run_key_subquery = db_select([RunKeysTable.c.run_id.label("run_keys_run_id")]).alias(
+        "run_key_subquery"
+    )
+    base_query = (
+        db_select([RunsTable.c.run_body, RunsTable.c.id])
+        .select_from(
+            RunsTable.join(tag_subquery, RunsTable.c.run_id == tag_subquery.c.tags_run_id).join(
+                run_key_subquery,
+                RunsTable.c.run_id == run_key_subquery.c.run_keys_run_id,
+                isouter=True,
+            )
+        )
+        .where(run_key_subquery.c.run_keys_run_id.is_(None))
+        .order_by(db.asc(RunsTable.c.id))
+        .limit(CHUNK_SIZE)
+    )
+
+    cursor = None
+    has_more = True
+    while has_more:
+        if cursor:
+            query = base_query.where(RunsTable.c.id > cursor)
+        else:
+            query = base_query
+
+        with run_storage.connect() as conn:
+            result_proxy = conn.execute(query)
+            rows = result_proxy.fetchall()
+            result_proxy.close()
+
+            has_more = len(rows) >= CHUNK_SIZE
+            for row in rows:
+                run = deserialize_value(cast(str, row[0]), DagsterRun)
+                cursor = row[1]
+                write_run_key(conn, run)
+
+
+def write_run_key(conn: Connection, run: DagsterRun) -> None:
+    run_key = run.tags.get(RUN_KEY_TAG)
+    if not run_key:
+        # nothing to do
+        return
+
+    conn.execute(
+        RunKeysTable.insert().values(
+            run_id=run.run_id,
+            run_key=run_key,
+            sensor_name=run.tags.get(SENSOR_NAME_TAG),
+            repository_selector_id=(
+                run.external_job_origin.repository_origin.get_selector_id()
+                if run.external_job_origin
+                else None
+            ),
+        )
+    )
@@ -76,6 +76,23 @@
     db.Column("value", db.Text),
 )
 
+# Index of the run keys of runs, used to look up the runs that a sensor has already launched for a
+# set of run keys without joining against the run_tags table.
+RunKeysTable = db.Table(
+    "run_keys",
+    RunStorageSqlMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", None, db.ForeignKey("runs.run_id", ondelete="CASCADE")),
+    db.Column("run_key", db.Text, nullable=False),
+    db.Column("sensor_name", db.Text),
+    db.Column("repository_selector_id", db.Text),
+)
+
 SnapshotsTable = db.Table(
     "snapshots",
     RunStorageSqlMetadata,
@@ -148,6 +165,12 @@
 )
 
 db.Index("idx_run_tags", RunTagsTable.c.key, RunTagsTable.c.value, mysql_length=64)
+db.Index(
+    "idx_run_keys",
+    RunKeysTable.c.run_key,
+    RunKeysTable.c.sensor_name,
+    mysql_length={"run_key": 64, "sensor_name": 64},
+)
 db.Index("idx_run_partitions", RunsTable.c.partition_set, RunsTable.c.partition, mysql_length=64)
 db.Index(
     "idx_runs_by_job",
@@ -59,9 +59,16 @@
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
     RUN_FAILURE_REASON_TAG,
+    RUN_KEY_TAG,
+    SENSOR_NAME_TAG,
 )
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import deserialize_value, serialize_value
+from dagster._serdes import (
+    SerializationFormat,
+    deserialize_value,
+    serialize_value,
+    serialize_value_to_bytes,
+)
 from dagster._seven import JSONDecodeError
 from dagster._time import datetime_from_timestamp, get_current_datetime, utc_datetime_from_naive
 from dagster._utils import PrintFn
@@ -80,20 +87,27 @@
 from .migration import (
     OPTIONAL_DATA_MIGRATIONS,
     REQUIRED_DATA_MIGRATIONS,
+    RUN_KEYS,
     RUN_PARTITIONS,
     MigrationFn,
+    write_run_key,
 )
 from .schema import (
     BulkActionsTable,
     DaemonHeartbeatsTable,
     InstanceInfo,
     KeyValueStoreTable,
+    RunKeysTable,
     RunsTable,
     RunTagsTable,
     SecondaryIndexMigrationTable,
     SnapshotsTable,
 )
 
+# maximum number of run keys in the IN clause of a single query, to stay under the bind parameter
+# limits of the underlying databases
+RUN_KEYS_QUERY_CHUNK_SIZE = 500
+
 
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
@@ -113,6 +127,13 @@ def upgrade(self) -> None:
         out-of-date instance of the storage up to date.
         """
 
+    @property
+    def snapshot_serialization_format(self) -> SerializationFormat:
+        """The encoding that job and execution plan snapshots are written in. Snapshots in any
+        format can be read.
+        """
+        return SerializationFormat.JSON
+
     def fetchall(self, query: SqlAlchemyQuery) -> Sequence[Any]:
         with self.connect() as conn:
             return db_fetch_mappings(conn, query)
@@ -161,6 +182,9 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
                     ],
                 )
 
+            if self.has_run_keys_table:
+                write_run_key(conn, dagster_run)
+
         return dagster_run
 
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
@@ -445,6 +469,60 @@ def get_run_records(
             for row in rows
         ]
 
+    def get_run_record_cursors(self, run_ids: Sequence[str]) -> Mapping[str, str]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+
+        if not run_ids:
+            return {}
+
+        # status and tag changes bump the update timestamp of a run, so they can be detected
+        # without fetching and deserializing the run bodies. The status is included since the
+        # timestamp may only be stored to the second.
+        query = db_select(
+            [RunsTable.c.run_id, RunsTable.c.status, RunsTable.c.update_timestamp]
+        ).where(RunsTable.c.run_id.in_(run_ids))
+        rows = self.fetchall(query)
+        return {row["run_id"]: f"{row['status']}:{row['update_timestamp']}" for row in rows}
+
+    def get_runs_for_run_keys(
+        self,
+        run_keys: Sequence[str],
+        sensor_name: str,
+        repository_selector_id: str,
+    ) -> Sequence[DagsterRun]:
+        check.sequence_param(run_keys, "run_keys", of_type=str)
+        check.str_param(sensor_name, "sensor_name")
+        check.str_param(repository_selector_id, "repository_selector_id")
+
+        if not run_keys:
+            return []
+
+        if not self.has_run_keys_table or not self.has_built_index(RUN_KEYS):
+            return super().get_runs_for_run_keys(run_keys, sensor_name, repository_selector_id)
+
+        unique_run_keys = list(dict.fromkeys(run_keys))
+        rows = []
+        for i in range(0, len(unique_run_keys), RUN_KEYS_QUERY_CHUNK_SIZE):
+            query = (
+                db_select([RunsTable.c.id, RunsTable.c.run_body, RunsTable.c.status])
+                .select_from(
+                    RunsTable.join(RunKeysTable, RunsTable.c.run_id == RunKeysTable.c.run_id)
+                )
+                .where(
+                    RunKeysTable.c.run_key.in_(unique_run_keys[i : i + RUN_KEYS_QUERY_CHUNK_SIZE])
+                )
+                .where(RunKeysTable.c.sensor_name == sensor_name)
+                .where(
+                    db.or_(
+                        RunKeysTable.c.repository_selector_id.is_(None),
+                        RunKeysTable.c.repository_selector_id == repository_selector_id,
+                    )
+                )
+            )
+            rows.extend(self.fetchall(query))
+
+        return self._rows_to_runs(sorted(rows, key=lambda row: row["id"], reverse=True))
+
     def get_run_tags(
         self,
         tag_keys: Sequence[str],
@@ -518,6 +596,12 @@ def add_run_tags(self, run_id: str, new_tags: Mapping[str, str]) -> None:
                     [dict(run_id=run_id, key=tag, value=new_tags[tag]) for tag in added_tags],
                 )
 
+            if self.has_run_keys_table and (
+                RUN_KEY_TAG in new_tags_set or SENSOR_NAME_TAG in new_tags_set
+            ):
+                conn.execute(RunKeysTable.delete().where(RunKeysTable.c.run_id == run_id))
+                write_run_key(conn, run.with_tags(all_tags))
+
     def get_run_group(self, run_id: str) -> Tuple[str, Sequence[DagsterRun]]:
         check.str_param(run_id, "run_id")
         dagster_run = self._get_run_by_id(run_id)
@@ -623,7 +707,11 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                snapshot_body=zlib.compress(
+                    serialize_value_to_bytes(
+                        snapshot_obj, serialization_format=self.snapshot_serialization_format
+                    )
+                ),
                 snapshot_type=snapshot_type.value,
             )
             try:
@@ -800,6 +888,16 @@ def has_bulk_actions_selector_cols(self) -> bool:
             ]
             return "selector_id" in column_names
 
+    @property
+    def has_run_keys_table(self) -> bool:
+        # This table was added later, and to avoid forcing a migration
+        # we handle in the code if its been added or not. Only its presence is cached, since it
+        # can be added by a migration while the storage is in use.
+        if not getattr(self, "_has_run_keys_table", False):
+            with self.connect() as conn:
+                self._has_run_keys_table = RunKeysTable.name in db.inspect(conn).get_table_names()
+        return self._has_run_keys_table
+
     # Daemon heartbeats
 
     def add_daemon_heartbeat(self, daemon_heartbeat: DaemonHeartbeat) -> None:
@@ -838,6 +936,8 @@ def wipe(self) -> None:
             # https://stackoverflow.com/a/54386260/324449
             conn.execute(RunsTable.delete())
             conn.execute(RunTagsTable.delete())
+            if self.has_run_keys_table:
+                conn.execute(RunKeysTable.delete())
             conn.execute(SnapshotsTable.delete())
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
@@ -952,6 +1052,12 @@ def replace_job_origin(self, run: DagsterRun, job_origin: RemoteJobOrigin) -> No
                 .where(RunTagsTable.c.key == REPOSITORY_LABEL_TAG)
                 .values(value=new_label)
             )
+            if self.has_run_keys_table:
+                conn.execute(
+                    RunKeysTable.update()
+                    .where(RunKeysTable.c.run_id == run.run_id)
+                    .values(repository_selector_id=job_origin.repository_origin.get_selector_id())
+                )
 
 
 GET_PIPELINE_SNAPSHOT_QUERY_ID = "get-pipeline-snapshot"
@@ -977,13 +1083,10 @@ def _warn(msg: str) -> None:
         return None
 
     try:
-        decoded_str = uncompressed_bytes.decode("utf-8")
+        return deserialize_value(uncompressed_bytes, (ExecutionPlanSnapshot, JobSnapshot))
     except UnicodeDecodeError:
         _warn("Could not unicode decode decompressed bytes stored in snapshot table.")
         return None
-
-    try:
-        return deserialize_value(decoded_str, (ExecutionPlanSnapshot, JobSnapshot))
     except JSONDecodeError:
         _warn("Could not parse json in snapshot table.")
         return None
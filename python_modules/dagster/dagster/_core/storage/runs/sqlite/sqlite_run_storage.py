@@ -9,6 +9,9 @@
 from typing_extensions import Self
 
 from dagster import (
+    Enum as ConfigEnum,
+    EnumValue,
+    Field,
     StringSource,
     _check as check,
 )
@@ -23,10 +26,10 @@
     stamp_alembic_rev,
 )
 from dagster._core.storage.sqlite import create_db_conn_string
-from dagster._serdes import ConfigurableClass, ConfigurableClassData
+from dagster._serdes import ConfigurableClass, ConfigurableClassData, SerializationFormat
 from dagster._utils import mkdir_p
 
-from ..schema import InstanceInfo, RunsTable, RunStorageSqlMetadata, RunTagsTable
+from ..schema import InstanceInfo, RunKeysTable, RunsTable, RunStorageSqlMetadata, RunTagsTable
 from ..sql_run_storage import SqlRunStorage
 
 if TYPE_CHECKING:
@@ -54,22 +57,45 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
           config:
             base_dir: /path/to/dir
 
-    The ``base_dir`` param tells the run storage where on disk to store the database.
+    The ``base_dir`` param tells the run storage where on disk to store the database. The optional
+    ``snapshot_serialization_format`` param (``json`` or ``msgpack``) sets the encoding that job
+    and execution plan snapshots are written in. ``msgpack`` requires the ``msgpack`` package.
     """
 
-    def __init__(self, conn_string: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        conn_string: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        snapshot_serialization_format: SerializationFormat = SerializationFormat.JSON,
+    ):
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._snapshot_serialization_format = check.inst_param(
+            snapshot_serialization_format, "snapshot_serialization_format", SerializationFormat
+        )
         super().__init__()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
         return self._inst_data
 
+    @property
+    def snapshot_serialization_format(self) -> SerializationFormat:
+        return self._snapshot_serialization_format
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "snapshot_serialization_format": Field(
+                ConfigEnum(
+                    "SerializationFormat",
+                    [EnumValue(f.value, python_value=f) for f in SerializationFormat],
+                ),
+                is_required=False,
+            ),
+        }
 
     @classmethod
     def from_config_value(
@@ -78,7 +104,12 @@ def from_config_value(
         return SqliteRunStorage.from_local(inst_data=inst_data, **config_value)
 
     @classmethod
-    def from_local(cls, base_dir: str, inst_data: Optional[ConfigurableClassData] = None) -> Self:
+    def from_local(
+        cls,
+        base_dir: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        snapshot_serialization_format: Optional[SerializationFormat] = None,
+    ) -> Self:
         check.str_param(base_dir, "base_dir")
         mkdir_p(base_dir)
         conn_string = create_db_conn_string(base_dir, "runs")
@@ -98,7 +129,11 @@ def from_local(cls, base_dir: str, inst_data: Optional[ConfigurableClassData] =
             if "instance_info" not in table_names:
                 InstanceInfo.create(engine)
 
-        run_storage = cls(conn_string, inst_data)
+        run_storage = cls(
+            conn_string,
+            inst_data,
+            snapshot_serialization_format=snapshot_serialization_format or SerializationFormat.JSON,
+        )
 
         if should_mark_indexes:
             run_storage.migrate()
@@ -153,6 +188,8 @@ def delete_run(self, run_id: str) -> None:
         remove_run = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
         with self.connect() as conn:
             conn.execute(remove_tags)
+            if self.has_run_keys_table:
+                conn.execute(db.delete(RunKeysTable).where(RunKeysTable.c.run_id == run_id))
             conn.execute(remove_run)
 
     def alembic_version(self) -> AlembicVersion:
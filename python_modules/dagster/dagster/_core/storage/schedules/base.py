@@ -77,6 +77,12 @@ def delete_instigator_state(self, origin_id: str, selector_id: str) -> None:
             selector_id (str): The logical instigator identifier
         """
 
+    def get_instigator_states_cursor(self) -> Optional[str]:
+        """Return a value that changes whenever an instigator state is added, updated, or deleted,
+        or None if the storage cannot cheaply tell.
+        """
+        return None
+
     @property
     def supports_batch_queries(self) -> bool:
         return False
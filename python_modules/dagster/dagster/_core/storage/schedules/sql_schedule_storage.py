@@ -133,6 +133,16 @@ def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional[Ins
         rows = self.execute(query)
         return self._deserialize_rows(rows[:1], InstigatorState)[0] if len(rows) else None
 
+    def get_instigator_states_cursor(self) -> Optional[str]:
+        # every add, update, and delete of an instigator state writes to the jobs table, and either
+        # bumps an update timestamp or changes the number of rows
+        query = db_select([db.func.count(), db.func.max(JobTable.c.update_timestamp)]).select_from(
+            JobTable
+        )
+        rows = self.execute(query)
+        count, max_update_timestamp = rows[0]
+        return f"{count}:{max_update_timestamp}"
+
     def _has_instigator_state_by_selector(self, selector_id: str) -> bool:
         check.str_param(selector_id, "selector_id")
 
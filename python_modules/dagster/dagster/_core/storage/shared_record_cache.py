@@ -0,0 +1,273 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import dagster._check as check
+from dagster._core.definitions.events import AssetKey
+from dagster._core.instance import DagsterInstance
+from dagster._core.scheduler.instigation import InstigatorState, InstigatorType
+from dagster._core.storage.dagster_run import RunRecord, RunsFilter
+
+if TYPE_CHECKING:
+    from dagster._core.storage.event_log.base import AssetRecord
+
+DEFAULT_SHARED_RECORD_CACHE_TTL_SECONDS = 10.0
+DEFAULT_SHARED_RECORD_CACHE_MAX_ENTRIES = 10000
+
+ASSET_RECORDS = "asset_records"
+RUN_RECORDS = "run_records"
+INSTIGATOR_STATES = "instigator_states"
+RECORD_KINDS = (ASSET_RECORDS, RUN_RECORDS, INSTIGATOR_STATES)
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    cursor: Hashable
+    expires_at: float
+
+
+class SharedRecordCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+
+
+class SharedRecordCache:
+    """A process-scoped cache of asset records, run records, and instigator states that is shared
+    by every request served by a process, so that concurrent requests for the same records do not
+    each fetch them from storage.
+
+    An entry is served until `ttl_seconds` have passed since it was fetched, or until the storage
+    cursor it was fetched at moves. Each asset record is keyed on its own asset's event cursor and
+    each run record on its own run's record cursor, so that writes to one asset or run do not
+    invalidate the others. Instigator states are keyed on the schedule storage's instigator states
+    cursor. Changes that storages cannot report a cursor for are only picked up once the TTL
+    expires, as are the writes that a cursor misses on storages that only keep timestamps to the
+    second. At most `max_entries` entries are held, evicting the least recently used ones.
+
+    Reads go through a `SharedRecordCacheScope`, which reads the cursor of each record at most
+    once, so that a request sees the writes to that record that its cursor reflects.
+    """
+
+    def __init__(
+        self,
+        instance: DagsterInstance,
+        ttl_seconds: float = DEFAULT_SHARED_RECORD_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_SHARED_RECORD_CACHE_MAX_ENTRIES,
+    ):
+        self._instance = check.inst_param(instance, "instance", DagsterInstance)
+        self._ttl_seconds = check.numeric_param(ttl_seconds, "ttl_seconds")
+        self._max_entries = check.int_param(max_entries, "max_entries")
+        check.invariant(self._max_entries > 0, "max_entries must be positive")
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Tuple[str, Hashable], _CacheEntry] = OrderedDict()
+        self._hits = {kind: 0 for kind in RECORD_KINDS}
+        self._misses = {kind: 0 for kind in RECORD_KINDS}
+        self._evictions = {kind: 0 for kind in RECORD_KINDS}
+
+    @property
+    def instance(self) -> DagsterInstance:
+        return self._instance
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def scoped(self) -> "SharedRecordCacheScope":
+        return SharedRecordCacheScope(self)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Mapping[str, SharedRecordCacheStats]:
+        with self._lock:
+            return {
+                kind: SharedRecordCacheStats(
+                    hits=self._hits[kind],
+                    misses=self._misses[kind],
+                    evictions=self._evictions[kind],
+                )
+                for kind in RECORD_KINDS
+            }
+
+    def get_many(self, kind: str, cursors: Mapping[Hashable, Hashable]) -> Dict[Hashable, Any]:
+        """Returns the cached values of the keys that were fetched at the given cursor of each key
+        and have not expired. Keys without a valid entry are left out.
+        """
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for key, cursor in cursors.items():
+                entry = self._entries.get((kind, key))
+                if entry is None or entry.cursor != cursor or entry.expires_at <= now:
+                    self._misses[kind] += 1
+                    continue
+
+                self._hits[kind] += 1
+                self._entries.move_to_end((kind, key))
+                found[key] = entry.value
+        return found
+
+    def set_many(
+        self, kind: str, values: Mapping[Hashable, Any], cursors: Mapping[Hashable, Hashable]
+    ) -> None:
+        expires_at = time.monotonic() + self._ttl_seconds
+        with self._lock:
+            for key, value in values.items():
+                self._entries[(kind, key)] = _CacheEntry(value, cursors[key], expires_at)
+                self._entries.move_to_end((kind, key))
+
+            while len(self._entries) > self._max_entries:
+                (evicted_kind, _), _ = self._entries.popitem(last=False)
+                self._evictions[evicted_kind] += 1
+
+
+class SharedRecordCacheScope:
+    """Reads records through a SharedRecordCache for the duration of one request. The cursor of
+    each record is read the first time the record is requested, and reused for the rest of the
+    scope.
+    """
+
+    def __init__(self, cache: SharedRecordCache):
+        self._cache = check.inst_param(cache, "cache", SharedRecordCache)
+        self._instance = cache.instance
+        self._asset_event_cursors: Dict[AssetKey, Optional[str]] = {}
+        self._run_record_cursors: Dict[str, Optional[str]] = {}
+        self._instigator_states_cursor: Optional[str] = None
+        self._has_instigator_states_cursor = False
+
+    def _get_asset_event_cursors(
+        self, asset_keys: Sequence[AssetKey]
+    ) -> Mapping[AssetKey, Optional[str]]:
+        missing_keys = [
+            asset_key for asset_key in asset_keys if asset_key not in self._asset_event_cursors
+        ]
+        if missing_keys:
+            # assets without a record get a None cursor, which moves once their first event is
+            # stored
+            cursors = self._instance.event_log_storage.get_asset_event_cursors(missing_keys) or {}
+            for asset_key in missing_keys:
+                self._asset_event_cursors[asset_key] = cursors.get(asset_key)
+        return {asset_key: self._asset_event_cursors[asset_key] for asset_key in asset_keys}
+
+    def _get_run_record_cursors(self, run_ids: Sequence[str]) -> Mapping[str, Optional[str]]:
+        missing_run_ids = [run_id for run_id in run_ids if run_id not in self._run_record_cursors]
+        if missing_run_ids:
+            cursors = self._instance.run_storage.get_run_record_cursors(missing_run_ids) or {}
+            for run_id in missing_run_ids:
+                self._run_record_cursors[run_id] = cursors.get(run_id)
+        return {run_id: self._run_record_cursors[run_id] for run_id in run_ids}
+
+    def _get_instigator_states_cursor(self) -> Optional[str]:
+        if not self._has_instigator_states_cursor:
+            schedule_storage = self._instance.schedule_storage
+            self._instigator_states_cursor = (
+                schedule_storage.get_instigator_states_cursor() if schedule_storage else None
+            )
+            self._has_instigator_states_cursor = True
+        return self._instigator_states_cursor
+
+    def get_asset_records(self, asset_keys: Sequence[AssetKey]) -> Sequence["AssetRecord"]:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+
+        # the cursors are read before fetching, so that records written in between are refetched
+        cursors = self._get_asset_event_cursors(asset_keys)
+        records_by_key = self._cache.get_many(ASSET_RECORDS, cursors)
+        missing_keys = [asset_key for asset_key in asset_keys if asset_key not in records_by_key]
+        if missing_keys:
+            fetched_records = {
+                record.asset_entry.asset_key: record
+                for record in self._instance.get_asset_records(missing_keys)
+            }
+            # assets without a record are cached too, since most assets in a large graph have never
+            # been materialized
+            fetched = {asset_key: fetched_records.get(asset_key) for asset_key in missing_keys}
+            self._cache.set_many(ASSET_RECORDS, fetched, cursors)
+            records_by_key.update(fetched)
+
+        return [
+            records_by_key[asset_key]
+            for asset_key in asset_keys
+            if records_by_key[asset_key] is not None
+        ]
+
+    def get_run_records(self, run_ids: Sequence[str]) -> Mapping[str, RunRecord]:
+        check.sequence_param(run_ids, "run_ids", of_type=str)
+
+        cursors = self._get_run_record_cursors(run_ids)
+        records_by_run_id = self._cache.get_many(RUN_RECORDS, cursors)
+        missing_run_ids = [run_id for run_id in run_ids if run_id not in records_by_run_id]
+        if missing_run_ids:
+            # runs that are not found are not cached, since they are looked up far less often than
+            # assets without a record
+            fetched = {
+                record.dagster_run.run_id: record
+                for record in self._instance.get_run_records(RunsFilter(run_ids=missing_run_ids))
+            }
+            self._cache.set_many(RUN_RECORDS, fetched, cursors)
+            records_by_run_id.update(fetched)
+
+        return records_by_run_id
+
+    async def batch_load_run_records(self, run_ids: Iterable[str]) -> Iterable[Optional[RunRecord]]:
+        run_ids = list(run_ids)
+        records_by_run_id = self.get_run_records(run_ids)
+        return [records_by_run_id.get(run_id) for run_id in run_ids]
+
+    def get_instigator_state(self, origin_id: str, selector_id: str) -> Optional[InstigatorState]:
+        check.str_param(origin_id, "origin_id")
+        check.str_param(selector_id, "selector_id")
+
+        key = ("instigator_state", origin_id, selector_id)
+        cursors = {key: self._get_instigator_states_cursor()}
+        cached = self._cache.get_many(INSTIGATOR_STATES, cursors)
+        if key in cached:
+            return cached[key]
+
+        state = self._instance.get_instigator_state(origin_id, selector_id)
+        self._cache.set_many(INSTIGATOR_STATES, {key: state}, cursors)
+        return state
+
+    def all_instigator_state(
+        self,
+        repository_origin_id: Optional[str] = None,
+        repository_selector_id: Optional[str] = None,
+        instigator_type: Optional[InstigatorType] = None,
+    ) -> Sequence[InstigatorState]:
+        check.opt_str_param(repository_origin_id, "repository_origin_id")
+        check.opt_str_param(repository_selector_id, "repository_selector_id")
+        check.opt_inst_param(instigator_type, "instigator_type", InstigatorType)
+
+        key = (
+            "all_instigator_state",
+            repository_origin_id,
+            repository_selector_id,
+            instigator_type,
+        )
+        cursors = {key: self._get_instigator_states_cursor()}
+        cached = self._cache.get_many(INSTIGATOR_STATES, cursors)
+        if key in cached:
+            return cached[key]
+
+        states = list(
+            self._instance.all_instigator_state(
+                repository_origin_id=repository_origin_id,
+                repository_selector_id=repository_selector_id,
+                instigator_type=instigator_type,
+            )
+        )
+        self._cache.set_many(INSTIGATOR_STATES, {key: states}, cursors)
+        return states
@@ -1,8 +1,21 @@
 import asyncio
 import inspect
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from fsspec import AbstractFileSystem
 from fsspec.implementations.local import LocalFileSystem
@@ -19,6 +32,8 @@
 if TYPE_CHECKING:
     from upath import UPath
 
+T = TypeVar("T")
+
 
 class UPathIOManager(MemoizableIOManager):
     """Abstract IOManager base class compatible with local and cloud storage via `universal-pathlib` and `fsspec`.
@@ -28,6 +43,12 @@ class UPathIOManager(MemoizableIOManager):
      - handles loading a single upstream partition
      - handles loading multiple upstream partitions (with respect to :py:class:`PartitionMapping`)
      - supports loading multiple partitions concurrently with async `load_from_path` method
+     - supports loading and writing multiple partitions concurrently on a thread pool with
+       `max_partition_io_workers`, in which case `load_from_path` and `dump_to_path` must be thread-safe
+     - writes outputs associated with multiple partitions (e.g. from single-run backfills) if the
+       output is a dictionary with an entry for each partition key
+     - can list the asset directory once when loading partitions with `index_partition_paths`,
+       instead of attempting to load each missing partition from object storage
      - the `get_metadata` method can be customized to add additional metadata to the output
      - the `allow_missing_partitions` metadata value can be set to `True` to skip missing partitions
        (the default behavior is to raise an error)
@@ -35,15 +56,30 @@ class UPathIOManager(MemoizableIOManager):
     """
 
     extension: Optional[str] = None  # override in child class
+    # if set, multiple partitions are loaded and written on a thread pool of up to this many threads
+    max_partition_io_workers: Optional[int] = None
+    # if set, the files under the asset directory are listed once when loading partitions, to find
+    # the partitions that are missing or only stored at their backcompat path without loading them
+    index_partition_paths: bool = False
 
     def __init__(
         self,
         base_path: Optional["UPath"] = None,
+        max_partition_io_workers: Optional[int] = None,
+        index_partition_paths: Optional[bool] = None,
     ):
         from upath import UPath
 
         assert not self.extension or "." in self.extension
         self._base_path = base_path or UPath(".")
+        if max_partition_io_workers is not None:
+            self.max_partition_io_workers = check.int_param(
+                max_partition_io_workers, "max_partition_io_workers"
+            )
+        if index_partition_paths is not None:
+            self.index_partition_paths = check.bool_param(
+                index_partition_paths, "index_partition_paths"
+            )
 
     @abstractmethod
     def dump_to_path(self, context: OutputContext, obj: Any, path: "UPath"):
@@ -69,15 +105,28 @@ def load_partitions(self, context: InputContext):
 
         context.log.debug(f"Loading {len(context.asset_partition_keys)} partitions...")
 
+        if self.index_partition_paths and len(context.asset_partition_keys) > 1:
+            paths, backcompat_paths = self._get_indexed_partition_paths(
+                context, paths, backcompat_paths
+            )
+        # partitions that are missing and allowed to be are skipped by the index
+        partition_keys = [key for key in context.asset_partition_keys if key in paths]
+
         if len(context.asset_partition_keys) == 1:
-            partition_key = context.asset_partition_keys[0]
+            if not partition_keys:
+                return None
+            partition_key = partition_keys[0]
             return self._load_partition_from_path(
                 context, partition_key, paths[partition_key], backcompat_paths.get(partition_key)
             )
+        elif self._is_partition_io_concurrent() and partition_keys:
+            return self._load_partitions_concurrently(
+                context, partition_keys, paths, backcompat_paths
+            )
         else:
             objs = {}
 
-            for partition_key in context.asset_partition_keys:
+            for partition_key in partition_keys:
                 obj = self._load_partition_from_path(
                     context,
                     partition_key,
@@ -89,6 +138,113 @@ def load_partitions(self, context: InputContext):
 
             return objs
 
+    def _is_partition_io_concurrent(self) -> bool:
+        return self.max_partition_io_workers is not None and self.max_partition_io_workers > 1
+
+    def _map_partitions(self, fn: Callable[[str], T], partition_keys: Sequence[str]) -> List[T]:
+        """Calls fn for each partition key on a thread pool, and returns the results in order."""
+        with ThreadPoolExecutor(
+            max_workers=min(check.not_none(self.max_partition_io_workers), len(partition_keys)),
+            thread_name_prefix="upath_io_manager",
+        ) as executor:
+            return list(executor.map(fn, partition_keys))
+
+    def _load_partitions_concurrently(
+        self,
+        context: InputContext,
+        partition_keys: Sequence[str],
+        paths: Mapping[str, "UPath"],
+        backcompat_paths: Mapping[str, "UPath"],
+    ) -> Dict[str, Any]:
+        # only load_from_path runs on the thread pool, so that the context is only used to log from
+        # the calling thread
+        for partition_key in partition_keys:
+            context.log.debug(
+                self.get_loading_input_partition_log_message(paths[partition_key], partition_key)
+            )
+
+        def _load(partition_key: str) -> Tuple[bool, Any]:
+            try:
+                return True, self.load_from_path(context=context, path=paths[partition_key])
+            except FileNotFoundError:
+                return False, None
+
+        objs = {}
+        for partition_key, (found, loaded_obj) in zip(
+            partition_keys, self._map_partitions(_load, partition_keys)
+        ):
+            if found:
+                obj = loaded_obj
+            else:
+                # fall back to the backcompat path, or skip or raise for the missing partition
+                obj = self._load_partition_from_path(
+                    context,
+                    partition_key,
+                    paths[partition_key],
+                    backcompat_paths.get(partition_key),
+                )
+            if obj is not None:  # in case some partitions were skipped
+                objs[partition_key] = obj
+
+        return objs
+
+    def _get_indexed_partition_paths(
+        self,
+        context: InputContext,
+        paths: Mapping[str, "UPath"],
+        backcompat_paths: Mapping[str, "UPath"],
+    ) -> Tuple[Dict[str, "UPath"], Dict[str, "UPath"]]:
+        """Lists the files under the asset directory, and uses the listing to pick the path that
+        each partition is loaded from. Partitions that are missing and allowed to be are left out,
+        while other partitions that can't be found are left to fail when loaded.
+        """
+        asset_path = self._strip_protocol(self._get_path_without_extension(context))
+        existing_paths = set(self.fs.find(asset_path, withdirs=True))
+
+        def _exists(path: "UPath") -> Optional[bool]:
+            # the listing can only tell whether paths under the asset directory exist
+            stripped_path = self._strip_protocol(path)
+            if not stripped_path.startswith(asset_path.rstrip("/") + "/"):
+                return None
+            return stripped_path in existing_paths
+
+        allow_missing_partitions = (
+            context.definition_metadata.get("allow_missing_partitions", False)
+            if context.definition_metadata is not None
+            else False
+        )
+
+        indexed_paths = {}
+        indexed_backcompat_paths = {}
+        for partition_key, path in paths.items():
+            backcompat_path = backcompat_paths.get(partition_key)
+            path_exists = _exists(path)
+            backcompat_path_exists = _exists(backcompat_path) if backcompat_path else False
+
+            if path_exists:
+                indexed_paths[partition_key] = path
+            elif path_exists is False and backcompat_path_exists:
+                context.log.debug(
+                    f"File not found at {path}. Loading instead from backcompat path:"
+                    f" {backcompat_path}"
+                )
+                indexed_paths[partition_key] = check.not_none(backcompat_path)
+            elif (
+                path_exists is False
+                and backcompat_path_exists is False
+                and allow_missing_partitions
+            ):
+                context.log.warning(self.get_missing_partition_log_message(partition_key))
+            else:
+                indexed_paths[partition_key] = path
+                if backcompat_path is not None:
+                    indexed_backcompat_paths[partition_key] = backcompat_path
+
+        return indexed_paths, indexed_backcompat_paths
+
+    def _strip_protocol(self, path: "UPath") -> str:
+        return self.fs._strip_protocol(str(path))  # noqa: SLF001
+
     @property
     def fs(self) -> AbstractFileSystem:
         """Utility function to get the IOManager filesystem.
@@ -425,25 +581,52 @@ def _handle_transition_to_partitioned_asset(self, context: OutputContext, path:
             )
             path.unlink(missing_ok=True)
 
+    def _dump_partitions(
+        self, context: OutputContext, obj: Any, paths: Mapping[str, "UPath"]
+    ) -> None:
+        check.invariant(
+            isinstance(obj, Mapping) and set(obj.keys()) == set(paths.keys()),
+            f"The current IO manager {type(self)} can only persist an output associated with"
+            " multiple partitions if the output is a dictionary with an entry for each partition"
+            " key. This error is likely occurring because a backfill was launched using the"
+            " 'single run' option. Either return a dictionary keyed by partition key, or launch"
+            " the backfill with the 'multiple runs' option.",
+        )
+
+        for parent_path in sorted({path.parent for path in paths.values()}, key=str):
+            self._handle_transition_to_partitioned_asset(context, parent_path)
+            self.make_directory(parent_path)
+
+        for path in paths.values():
+            context.log.debug(self.get_writing_output_log_message(path))
+
+        def _dump(partition_key: str) -> None:
+            self.dump_to_path(context=context, obj=obj[partition_key], path=paths[partition_key])
+
+        if self._is_partition_io_concurrent():
+            self._map_partitions(_dump, list(paths.keys()))
+        else:
+            for partition_key in paths.keys():
+                _dump(partition_key)
+
     def handle_output(self, context: OutputContext, obj: Any):
         if context.has_asset_partitions:
             paths = self._get_paths_for_partitions(context)
 
-            check.invariant(
-                len(paths) == 1,
-                f"The current IO manager {type(self)} does not support persisting an output"
-                " associated with multiple partitions. This error is likely occurring because a"
-                " backfill was launched using the 'single run' option. Instead, launch the"
-                " backfill with the 'multiple runs' option.",
-            )
-
-            path = next(iter(paths.values()))
-            self._handle_transition_to_partitioned_asset(context, path.parent)
+            if len(paths) > 1:
+                self._dump_partitions(context, obj, paths)
+                path = self._get_path_without_extension(context)
+            else:
+                path = next(iter(paths.values()))
+                self._handle_transition_to_partitioned_asset(context, path.parent)
+                self.make_directory(path.parent)
+                context.log.debug(self.get_writing_output_log_message(path))
+                self.dump_to_path(context=context, obj=obj, path=path)
         else:
             path = self._get_path(context)
-        self.make_directory(path.parent)
-        context.log.debug(self.get_writing_output_log_message(path))
-        self.dump_to_path(context=context, obj=obj, path=path)
+            self.make_directory(path.parent)
+            context.log.debug(self.get_writing_output_log_message(path))
+            self.dump_to_path(context=context, obj=obj, path=path)
 
         # Usually, when the value is None, it means that the user didn't intend to use an IO manager
         # at all, but ended up with one because they didn't set None as their return type
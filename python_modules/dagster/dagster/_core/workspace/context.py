@@ -35,10 +35,12 @@
     ManagedGrpcPythonEnvCodeLocationOrigin,
 )
 from dagster._core.storage.batch_asset_record_loader import BatchAssetRecordLoader
+from dagster._core.storage.dagster_run import RunRecord
+from dagster._core.storage.shared_record_cache import SharedRecordCache, SharedRecordCacheScope
 from dagster._utils.aiodataloader import DataLoader
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 
-from ..loader import LoadingContext
+from ..loader import InstanceLoadableBy, LoadingContext
 from .load_target import WorkspaceLoadTarget
 from .permissions import (
     PermissionResult,
@@ -320,6 +322,13 @@ def get_base_deployment_context(self) -> Optional["BaseWorkspaceRequestContext"]
     def asset_record_loader(self) -> BatchAssetRecordLoader:
         pass
 
+    @property
+    def record_cache(self) -> Optional[SharedRecordCacheScope]:
+        """Reads asset records, run records, and instigator states through the cache shared by
+        the requests of the process, if the process context has one.
+        """
+        return None
+
 
 class WorkspaceRequestContext(BaseWorkspaceRequestContext):
     def __init__(
@@ -331,6 +340,7 @@ def __init__(
         source: Optional[object],
         read_only: bool,
         read_only_locations: Optional[Mapping[str, bool]] = None,
+        shared_record_cache: Optional[SharedRecordCache] = None,
     ):
         self._instance = instance
         self._workspace_snapshot = workspace_snapshot
@@ -342,13 +352,31 @@ def __init__(
             read_only_locations, "read_only_locations"
         )
         self._checked_permissions: Set[str] = set()
-        self._asset_record_loader = BatchAssetRecordLoader(self._instance, {})
+        self._record_cache = (
+            check.inst_param(shared_record_cache, "shared_record_cache", SharedRecordCache).scoped()
+            if shared_record_cache is not None
+            else None
+        )
+        self._asset_record_loader = BatchAssetRecordLoader(
+            self._instance, {}, record_cache=self._record_cache
+        )
         self._loaders = {}
 
     @property
     def asset_record_loader(self) -> BatchAssetRecordLoader:
         return self._asset_record_loader
 
+    @property
+    def record_cache(self) -> Optional[SharedRecordCacheScope]:
+        return self._record_cache
+
+    def get_loader_for(self, ttype: Type["InstanceLoadableBy"]) -> DataLoader:
+        if ttype is RunRecord and self._record_cache and ttype not in self.loaders:
+            self.loaders[ttype] = DataLoader(
+                batch_load_fn=self._record_cache.batch_load_run_records
+            )
+        return super().get_loader_for(ttype)
+
     @property
     def instance(self) -> DagsterInstance:
         return self._instance
@@ -482,6 +510,7 @@ def __init__(
         read_only: bool = False,
         grpc_server_registry: Optional[GrpcServerRegistry] = None,
         code_server_log_level: str = "INFO",
+        shared_record_cache: Optional[SharedRecordCache] = None,
     ):
         self._stack = ExitStack()
 
@@ -497,6 +526,10 @@ def __init__(
 
         self._version = version
 
+        self._shared_record_cache = check.opt_inst_param(
+            shared_record_cache, "shared_record_cache", SharedRecordCache
+        )
+
         # Guards changes to _location_entry_dict, _watch_thread_shutdown_events and _watch_threads
         self._lock = threading.Lock()
         self._watch_thread_shutdown_events: Dict[str, threading.Event] = {}
@@ -627,6 +660,7 @@ def _load_location(self, origin: CodeLocationOrigin, reload: bool) -> CodeLocati
                     watch_server=False,
                     grpc_server_registry=self._grpc_server_registry,
                     instance=self._instance,
+                    reload_repository_data=reload,
                 )
             else:
                 location = (
@@ -742,8 +776,13 @@ def create_request_context(self, source: Optional[object] = None) -> WorkspaceRe
             version=self.version,
             source=source,
             read_only=self._read_only,
+            shared_record_cache=self._shared_record_cache,
         )
 
+    @property
+    def shared_record_cache(self) -> Optional[SharedRecordCache]:
+        return self._shared_record_cache
+
     def _location_state_events_handler(self, event: LocationStateChangeEvent) -> None:
         # If the server was updated or we were not able to reconnect, we immediately reload the
         # location handle
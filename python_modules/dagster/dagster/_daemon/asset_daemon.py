@@ -904,6 +904,7 @@ def _evaluate_auto_materialize_tick(
                     auto_observe_asset_keys=auto_observe_asset_keys,
                     respect_materialization_data_versions=instance.auto_materialize_respect_materialization_data_versions,
                     logger=self._logger,
+                    evaluation_max_workers=instance.auto_materialize_num_evaluation_workers,
                 ).evaluate()
 
             check.invariant(new_cursor.evaluation_id == evaluation_id)
@@ -1,5 +1,6 @@
 import datetime
 import logging
+import multiprocessing
 import os
 import random
 import sys
@@ -10,7 +11,7 @@
 from contextlib import AbstractContextManager, ExitStack
 from enum import Enum
 from threading import Event
-from typing import Any, Generator, Generic, Mapping, Optional, TypeVar, Union
+from typing import Any, Dict, Generator, Generic, Mapping, Optional, TypeVar, Union
 
 from typing_extensions import TypeAlias
 
@@ -18,21 +19,24 @@
     DagsterInstance,
     _check as check,
 )
+from dagster._core.instance.ref import InstanceRef
 from dagster._core.scheduler.scheduler import DagsterDaemonScheduler
 from dagster._core.telemetry import DAEMON_ALIVE, log_action
 from dagster._core.utils import InheritContextThreadPoolExecutor
-from dagster._core.workspace.context import IWorkspaceProcessContext
+from dagster._core.workspace.context import IWorkspaceProcessContext, WorkspaceProcessContext
+from dagster._core.workspace.load_target import WorkspaceLoadTarget
 from dagster._daemon.backfill import execute_backfill_iteration
 from dagster._daemon.monitoring import (
     execute_concurrency_slots_iteration,
     execute_run_monitoring_iteration,
 )
-from dagster._daemon.sensor import execute_sensor_iteration_loop
+from dagster._daemon.sensor import SensorShard, execute_sensor_iteration_loop
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._scheduler.scheduler import execute_scheduler_iteration_loop
 from dagster._time import get_current_datetime
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
+from dagster._utils.log import configure_loggers
 
 
 def get_default_daemon_logger(daemon_name) -> logging.Logger:
@@ -288,14 +292,56 @@ def core_loop(
         )
 
 
+# How often the sensor daemon checks on its worker processes when sharded across processes
+SENSOR_WORKER_PROCESS_CHECK_INTERVAL_SECONDS = 5
+# How long to wait for sensor worker processes to finish their tick before terminating them
+SENSOR_WORKER_PROCESS_SHUTDOWN_TIMEOUT_SECONDS = 60
+# How long a sensor worker process can go without reporting progress before the sensor daemon
+# stops heartbeating, so that a hung worker shows up in the daemon's health
+SENSOR_WORKER_PROCESS_PROGRESS_TIMEOUT_SECONDS = 300
+# How often sensor worker processes report progress to the sensor daemon
+SENSOR_WORKER_PROCESS_PROGRESS_INTERVAL_SECONDS = 5
+# Worker processes that exit are restarted after a delay that doubles with each consecutive exit
+# without progress, up to the max
+SENSOR_WORKER_PROCESS_RESTART_BACKOFF_SECONDS = 5
+SENSOR_WORKER_PROCESS_MAX_RESTART_BACKOFF_SECONDS = 300
+
+
+class _SensorWorkerProcessState:
+    def __init__(self, process: Any, start_time: float, num_failures: int):
+        self.process = process
+        self.start_time = start_time
+        # the number of times the worker exited since it last reported progress
+        self.num_failures = num_failures
+        self.last_progress_time: Optional[float] = None
+
+    def is_healthy(self, now: float) -> bool:
+        return (
+            self.process.is_alive()
+            and self.num_failures == 0
+            and now - (self.last_progress_time or self.start_time)
+            < SENSOR_WORKER_PROCESS_PROGRESS_TIMEOUT_SECONDS
+        )
+
+
 class SensorDaemon(DagsterDaemon):
-    def __init__(self, settings: Mapping[str, Any]) -> None:
+    def __init__(
+        self, settings: Mapping[str, Any], sensor_shard: Optional[SensorShard] = None
+    ) -> None:
         super().__init__()
         self._exit_stack = ExitStack()
         self._threadpool_executor: Optional[InheritContextThreadPoolExecutor] = None
         self._submit_threadpool_executor: Optional[InheritContextThreadPoolExecutor] = None
+        self._sensor_shard = check.opt_inst_param(sensor_shard, "sensor_shard", SensorShard)
 
-        if settings.get("use_threads"):
+        # when sharded across processes, this daemon only supervises the worker processes, each of
+        # which runs a SensorDaemon for a single shard
+        num_worker_processes = settings.get("num_worker_processes")
+        self._num_worker_processes: Optional[int] = (
+            num_worker_processes if num_worker_processes and sensor_shard is None else None
+        )
+
+        if settings.get("use_threads") and not self._num_worker_processes:
             self._threadpool_executor = self._exit_stack.enter_context(
                 InheritContextThreadPoolExecutor(
                     max_workers=settings.get("num_workers"),
@@ -324,13 +370,161 @@ def core_loop(
         workspace_process_context: IWorkspaceProcessContext,
         shutdown_event: Event,
     ) -> DaemonIterator:
+        if self._num_worker_processes:
+            yield from self._worker_processes_loop(
+                workspace_process_context, shutdown_event, self._num_worker_processes
+            )
+            return
+
         yield from execute_sensor_iteration_loop(
             workspace_process_context,
             self._logger,
             shutdown_event,
             threadpool_executor=self._threadpool_executor,
             submit_threadpool_executor=self._submit_threadpool_executor,
+            sensor_shard=self._sensor_shard,
+        )
+
+    def _worker_processes_loop(
+        self,
+        workspace_process_context: IWorkspaceProcessContext,
+        shutdown_event: Event,
+        num_worker_processes: int,
+    ) -> DaemonIterator:
+        """Evaluates sensors in `num_worker_processes` spawned processes, each of which loads its
+        own workspace and evaluates the sensors of one shard. Worker processes that exit are
+        restarted, and the errors they raise are reported by this daemon's heartbeats.
+        """
+        if not isinstance(workspace_process_context, WorkspaceProcessContext):
+            check.failed("Sensor worker processes require a WorkspaceProcessContext")
+        workspace_load_target = workspace_process_context.workspace_load_target
+        if workspace_load_target is None:
+            check.failed("Sensor worker processes require a workspace load target")
+
+        instance_ref = workspace_process_context.instance.get_ref()
+        log_level = logging.getLogger("dagster").getEffectiveLevel()
+        mp_context = multiprocessing.get_context("spawn")
+        worker_shutdown_event = mp_context.Event()
+        # workers report (shard index, error or None for progress) tuples
+        worker_queue = mp_context.Queue()
+        workers: Dict[int, _SensorWorkerProcessState] = {}
+        restart_times: Dict[int, float] = {}
+
+        try:
+            while not shutdown_event.is_set():
+                now = time.time()
+                for index in range(num_worker_processes):
+                    worker = workers.get(index)
+                    if worker is not None and worker.process.is_alive():
+                        continue
+
+                    num_failures = 0
+                    if worker is not None:
+                        if index not in restart_times:
+                            num_failures = worker.num_failures + 1
+                            backoff = min(
+                                SENSOR_WORKER_PROCESS_RESTART_BACKOFF_SECONDS
+                                * 2 ** (num_failures - 1),
+                                SENSOR_WORKER_PROCESS_MAX_RESTART_BACKOFF_SECONDS,
+                            )
+                            worker.num_failures = num_failures
+                            restart_times[index] = now + backoff
+                            self._logger.warning(
+                                f"Sensor worker process for shard {index} exited with code"
+                                f" {worker.process.exitcode}, restarting it in {backoff} seconds."
+                            )
+                        if now < restart_times[index]:
+                            continue
+                        num_failures = worker.num_failures
+                        del restart_times[index]
+
+                    process = mp_context.Process(
+                        target=_run_sensor_worker_process,
+                        args=(
+                            instance_ref,
+                            workspace_load_target,
+                            SensorShard(index, num_worker_processes),
+                            worker_shutdown_event,
+                            worker_queue,
+                            log_level,
+                        ),
+                        name=f"sensor_daemon_worker_{index}",
+                        daemon=True,
+                    )
+                    process.start()
+                    workers[index] = _SensorWorkerProcessState(process, now, num_failures)
+
+                while not worker_queue.empty():
+                    index, error_info = worker_queue.get()
+                    if error_info is None:
+                        workers[index].last_progress_time = time.time()
+                        workers[index].num_failures = 0
+                    else:
+                        yield error_info
+
+                # only heartbeat while every worker is running and making progress, so that the
+                # daemon's health reflects workers that crash or hang
+                now = time.time()
+                if all(worker.is_healthy(now) for worker in workers.values()):
+                    yield None
+                shutdown_event.wait(SENSOR_WORKER_PROCESS_CHECK_INTERVAL_SECONDS)
+        finally:
+            worker_shutdown_event.set()
+            deadline = time.time() + SENSOR_WORKER_PROCESS_SHUTDOWN_TIMEOUT_SECONDS
+            for worker in workers.values():
+                worker.process.join(max(deadline - time.time(), 0))
+            for worker in workers.values():
+                if worker.process.is_alive():
+                    worker.process.terminate()
+            worker_queue.close()
+
+
+def _run_sensor_worker_process(
+    instance_ref: InstanceRef,
+    workspace_load_target: WorkspaceLoadTarget,
+    sensor_shard: SensorShard,
+    shutdown_event: Any,
+    worker_queue: Any,
+    log_level: int,
+) -> None:
+    from dagster._daemon.controller import create_daemon_grpc_server_registry
+
+    configure_loggers(log_level=log_level)
+    try:
+        with ExitStack() as stack:
+            instance = stack.enter_context(DagsterInstance.from_ref(instance_ref))
+            grpc_server_registry = stack.enter_context(create_daemon_grpc_server_registry(instance))
+            workspace_process_context = stack.enter_context(
+                WorkspaceProcessContext(
+                    instance, workspace_load_target, grpc_server_registry=grpc_server_registry
+                )
+            )
+            daemon = stack.enter_context(
+                SensorDaemon(instance.get_sensor_settings(), sensor_shard=sensor_shard)
+            )
+            parent_process = multiprocessing.parent_process()
+            last_progress_time = None
+            for result in daemon.core_loop(workspace_process_context, shutdown_event):
+                if isinstance(result, SerializableErrorInfo):
+                    worker_queue.put((sensor_shard.index, result))
+                elif result is None and (
+                    last_progress_time is None
+                    or time.time() - last_progress_time
+                    >= SENSOR_WORKER_PROCESS_PROGRESS_INTERVAL_SECONDS
+                ):
+                    last_progress_time = time.time()
+                    worker_queue.put((sensor_shard.index, None))
+                # stop once the daemon is shutting down, or if it exited without signalling the
+                # workers
+                if shutdown_event.is_set() or (parent_process and not parent_process.is_alive()):
+                    break
+    except Exception:
+        # report errors raised while setting up the worker as well, which would otherwise only
+        # reach the worker's stderr
+        worker_queue.put(
+            (sensor_shard.index, serializable_error_info_from_exc_info(sys.exc_info()))
         )
+        raise
 
 
 class BackfillDaemon(IntervalDaemon):
@@ -4,7 +4,7 @@
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import ExitStack
-from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+from typing import AbstractSet, Dict, Iterator, List, Optional, Sequence, Set
 
 from dagster import (
     DagsterEvent,
@@ -27,16 +27,18 @@
     RunRecord,
     RunsFilter,
 )
-from dagster._core.storage.tags import PRIORITY_TAG
 from dagster._core.utils import InheritContextThreadPoolExecutor
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._core.workspace.workspace import IWorkspace
 from dagster._daemon.daemon import DaemonIterator, IntervalDaemon
+from dagster._daemon.run_coordinator.queued_run_queue import QueuedRunGroupKey, QueuedRunQueue
 from dagster._daemon.utils import DaemonErrorCapture
 from dagster._utils.tags import TagConcurrencyLimitsCounter
 
 PAGE_SIZE = 100
 CONCURRENCY_BLOCKED_MESSAGE_INTERVAL = 300
+FULL_REFRESH_INTERVAL_SECONDS = 300
+UPDATE_OVERLAP_SECONDS = 10
 
 
 class QueuedRunCoordinatorDaemon(IntervalDaemon):
@@ -44,12 +46,23 @@ class QueuedRunCoordinatorDaemon(IntervalDaemon):
     store and launches them.
     """
 
-    def __init__(self, interval_seconds, page_size=PAGE_SIZE) -> None:
+    def __init__(
+        self,
+        interval_seconds,
+        page_size=PAGE_SIZE,
+        full_refresh_interval_seconds=FULL_REFRESH_INTERVAL_SECONDS,
+    ) -> None:
         self._exit_stack = ExitStack()
         self._executor: Optional[ThreadPoolExecutor] = None
         self._location_timeouts_lock = threading.Lock()
         self._location_timeouts: Dict[str, float] = {}
         self._page_size = page_size
+        # kept across iterations, so that each iteration only reads the runs that changed
+        self._queue = QueuedRunQueue(
+            page_size=page_size,
+            full_refresh_interval_seconds=full_refresh_interval_seconds,
+            update_overlap_seconds=UPDATE_OVERLAP_SECONDS,
+        )
         super().__init__(interval_seconds)
 
     def _get_executor(self, max_workers) -> ThreadPoolExecutor:
@@ -198,7 +211,6 @@ def _get_runs_to_dequeue(
         tag_concurrency_limits = run_queue_config.tag_concurrency_limits
 
         in_progress_run_records = self._get_in_progress_run_records(instance)
-        in_progress_runs = [record.dagster_run for record in in_progress_run_records]
 
         max_concurrent_runs_enabled = max_concurrent_runs != -1  # setting to -1 disables the limit
         max_runs_to_launch = max_concurrent_runs - len(in_progress_run_records)
@@ -210,10 +222,6 @@ def _get_runs_to_dequeue(
                 )
                 return []
 
-        cursor = None
-        has_more = True
-        batch: List[DagsterRun] = []
-
         now = fixed_iteration_time or time.time()
 
         with self._location_timeouts_lock:
@@ -230,106 +238,111 @@ def _get_runs_to_dequeue(
                 + ",".join(list(paused_location_names))
             )
 
-        logged_this_iteration = False
-        # Paginate through our runs list so we don't need to hold every run
-        # in memory at once. The maximum number of runs we'll hold in memory is
-        # max_runs_to_launch + page_size.
-        while has_more:
-            queued_runs = instance.get_runs(
-                RunsFilter(statuses=[DagsterRunStatus.QUEUED]),
-                cursor=cursor,
-                limit=self._page_size,
-                ascending=True,
-            )
-            has_more = len(queued_runs) >= self._page_size
+        self._queue.refresh(instance, tag_concurrency_limits, now)
+        if not len(self._queue):
+            return []
 
-            if not queued_runs:
-                has_more = False
+        self._logger.info(
+            "Priority sorting and checking tag concurrency limits for queued runs."
+            + locations_clause
+        )
+
+        while True:
+            batch = self._select_runs_to_dequeue(
+                instance,
+                run_queue_config,
+                in_progress_run_records,
+                paused_location_names,
+                max_runs_to_launch if max_concurrent_runs_enabled else None,
+            )
+            if not batch:
                 return batch
 
-            if not logged_this_iteration:
-                logged_this_iteration = True
-                self._logger.info(
-                    "Priority sorting and checking tag concurrency limits for queued runs."
-                    + locations_clause
+            # the queue may lag behind the run storage, so make sure that the selected runs are
+            # still queued before they take up any of the available slots
+            statuses = {
+                record.dagster_run.run_id: record.dagster_run.status
+                for record in instance.get_run_records(
+                    RunsFilter(run_ids=[run.run_id for run in batch])
                 )
+            }
+            stale_run_ids = [
+                run.run_id for run in batch if statuses.get(run.run_id) != DagsterRunStatus.QUEUED
+            ]
+            if not stale_run_ids:
+                return batch
 
-            cursor = queued_runs[-1].run_id
+            for run_id in stale_run_ids:
+                self._queue.remove(run_id)
 
-            tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
-                tag_concurrency_limits, in_progress_runs
-            )
-            batch += queued_runs
-            batch = self._priority_sort(batch)
-
-            if run_queue_config.should_block_op_concurrency_limited_runs:
-                try:
-                    global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
-                        instance,
-                        batch,
-                        in_progress_run_records,
-                        run_queue_config.op_concurrency_slot_buffer,
-                    )
-                except:
-                    self._logger.exception("Failed to initialize op concurrency counter")
-                    # when we cannot initialize the global concurrency counter, we should fall back
-                    # to not blocking any runs based on op concurrency limits
-                    global_concurrency_limits_counter = None
-            else:
+    def _select_runs_to_dequeue(
+        self,
+        instance: DagsterInstance,
+        run_queue_config: RunQueueConfig,
+        in_progress_run_records: Sequence[RunRecord],
+        paused_location_names: AbstractSet[str],
+        max_runs_to_launch: Optional[int],
+    ) -> List[DagsterRun]:
+        tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+            run_queue_config.tag_concurrency_limits,
+            [record.dagster_run for record in in_progress_run_records],
+        )
+
+        if run_queue_config.should_block_op_concurrency_limited_runs:
+            try:
+                global_concurrency_limits_counter = GlobalOpConcurrencyLimitsCounter(
+                    instance,
+                    self._queue.op_concurrency_runs,
+                    in_progress_run_records,
+                    run_queue_config.op_concurrency_slot_buffer,
+                )
+            except:
+                self._logger.exception("Failed to initialize op concurrency counter")
+                # when we cannot initialize the global concurrency counter, we should fall back
+                # to not blocking any runs based on op concurrency limits
                 global_concurrency_limits_counter = None
+        else:
+            global_concurrency_limits_counter = None
 
-            to_remove = []
-            for run in batch:
-                if tag_concurrency_limits_counter.is_blocked(run):
-                    to_remove.append(run)
-                    continue
-                else:
-                    tag_concurrency_limits_counter.update_counters_with_launched_item(run)
-
-                if (
-                    global_concurrency_limits_counter
-                    and global_concurrency_limits_counter.is_blocked(run)
-                ):
-                    concurrency_blocked_info = json.dumps(
-                        global_concurrency_limits_counter.get_blocked_run_debug_info(run)
-                    )
-                    self._logger.info(
-                        f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
-                    )
-                    to_remove.append(run)
-                    continue
-                elif global_concurrency_limits_counter:
-                    global_concurrency_limits_counter.update_counters_with_launched_item(run)
+        batch: List[DagsterRun] = []
+        skipped_groups: Set[QueuedRunGroupKey] = set()
+        for entry in self._queue.iter_by_priority(skipped_groups):
+            run = entry.run
+
+            location_name = entry.group_key[0]
+            if location_name and location_name in paused_location_names:
+                skipped_groups.add(entry.group_key)
+                continue
+
+            if tag_concurrency_limits_counter.is_blocked(run):
+                # the rest of the group is blocked by the same tag concurrency limits
+                skipped_groups.add(entry.group_key)
+                continue
+            else:
+                tag_concurrency_limits_counter.update_counters_with_launched_item(run)
 
-                location_name = (
-                    run.external_job_origin.location_name if run.external_job_origin else None
+            if global_concurrency_limits_counter and global_concurrency_limits_counter.is_blocked(
+                run
+            ):
+                concurrency_blocked_info = json.dumps(
+                    global_concurrency_limits_counter.get_blocked_run_debug_info(run)
                 )
-                if location_name and location_name in paused_location_names:
-                    to_remove.append(run)
-                    continue
-
-            for run in to_remove:
-                batch.remove(run)
+                self._logger.info(
+                    f"Run {run.run_id} is blocked by global concurrency limits: {concurrency_blocked_info}"
+                )
+                continue
+            elif global_concurrency_limits_counter:
+                global_concurrency_limits_counter.update_counters_with_launched_item(run)
 
-            if max_runs_to_launch >= 1:
-                batch = batch[:max_runs_to_launch]
+            batch.append(run)
+            if max_runs_to_launch is not None and len(batch) >= max_runs_to_launch:
+                break
 
         return batch
 
     def _get_in_progress_run_records(self, instance: DagsterInstance) -> Sequence[RunRecord]:
         return instance.get_run_records(filters=RunsFilter(statuses=IN_PROGRESS_RUN_STATUSES))
 
-    def _priority_sort(self, runs: Iterable[DagsterRun]) -> List[DagsterRun]:
-        def get_priority(run: DagsterRun) -> int:
-            priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
-            try:
-                return int(priority_tag_value)
-            except ValueError:
-                return 0
-
-        # sorted is stable, so fifo is maintained
-        return sorted(runs, key=get_priority, reverse=True)
-
     def _is_location_pausing_dequeues(self, location_name: str, now: float) -> bool:
         with self._location_timeouts_lock:
             return (
@@ -0,0 +1,220 @@
+import heapq
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import (
+    AbstractSet,
+    Any,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from dagster import _check as check
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunRecord, RunsFilter
+from dagster._core.storage.tags import PRIORITY_TAG
+from dagster._time import get_current_datetime
+from dagster._utils.tags import TagConcurrencyLimitsCounter
+
+# runs with the same group key are blocked by the same tag concurrency limits and location timeouts
+QueuedRunGroupKey = Tuple[Optional[str], FrozenSet[Tuple[str, str]]]
+
+# (-priority, storage id), so that higher priority runs sort first and runs with equal priority are
+# dequeued in the order they were created
+QueuedRunSortKey = Tuple[int, int]
+
+
+def get_run_priority(run: DagsterRun) -> int:
+    priority_tag_value = run.tags.get(PRIORITY_TAG, "0")
+    try:
+        return int(priority_tag_value)
+    except ValueError:
+        return 0
+
+
+class QueuedRunEntry(NamedTuple):
+    run: DagsterRun
+    sort_key: QueuedRunSortKey
+    group_key: QueuedRunGroupKey
+
+
+class QueuedRunQueue:
+    """The QUEUED runs of an instance, held in memory in priority order across the iterations of the
+    QueuedRunCoordinatorDaemon.
+
+    The first refresh loads every queued run. Later refreshes only read the runs whose
+    update_timestamp is past a cursor, so that the cost of a refresh scales with the number of runs
+    whose status or tags changed since the previous refresh rather than with the depth of the
+    queue. Runs that left the QUEUED status are dropped, and runs that entered it are added.
+    Because update timestamps are written by different processes, each refresh re-reads the runs
+    updated within `update_overlap_seconds` before the cursor, and the queue is rebuilt from
+    scratch every `full_refresh_interval_seconds` to pick up anything the cursor missed, such as
+    deleted runs.
+
+    Runs are grouped by their code location and by the tags that count towards a tag concurrency
+    limit. Runs in the same group are blocked by exactly the same limits, so once the highest
+    priority run of a group is blocked, the rest of the group can be skipped without being looked
+    at.
+    """
+
+    def __init__(
+        self,
+        page_size: int,
+        full_refresh_interval_seconds: float,
+        update_overlap_seconds: float,
+    ):
+        self._page_size = check.int_param(page_size, "page_size")
+        self._full_refresh_interval_seconds = check.numeric_param(
+            full_refresh_interval_seconds, "full_refresh_interval_seconds"
+        )
+        self._update_overlap = timedelta(
+            seconds=check.numeric_param(update_overlap_seconds, "update_overlap_seconds")
+        )
+
+        self._entries: Dict[str, QueuedRunEntry] = {}
+        # sort keys and run ids of each group, in ascending sort key order
+        self._groups: Dict[QueuedRunGroupKey, List[Tuple[QueuedRunSortKey, str]]] = {}
+        # runs whose root steps are limited by op concurrency keys
+        self._op_concurrency_runs: Dict[str, DagsterRun] = {}
+
+        self._tag_concurrency_limits: Optional[Sequence[Mapping[str, Any]]] = None
+        self._tag_concurrency_limits_counter = TagConcurrencyLimitsCounter([], [])
+        self._last_full_refresh_time: Optional[float] = None
+        self._update_cursor: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, run_id: object) -> bool:
+        return run_id in self._entries
+
+    @property
+    def op_concurrency_runs(self) -> Sequence[DagsterRun]:
+        """The queued runs with root steps that are limited by op concurrency keys."""
+        return list(self._op_concurrency_runs.values())
+
+    def refresh(
+        self,
+        instance: DagsterInstance,
+        tag_concurrency_limits: Sequence[Mapping[str, Any]],
+        now: float,
+    ) -> None:
+        """Brings the queue up to date with the QUEUED runs in the run storage."""
+        if tag_concurrency_limits != self._tag_concurrency_limits:
+            self._regroup(tag_concurrency_limits)
+
+        if (
+            self._last_full_refresh_time is None
+            or now < self._last_full_refresh_time
+            or now - self._last_full_refresh_time >= self._full_refresh_interval_seconds
+        ):
+            self._full_refresh(instance)
+            self._last_full_refresh_time = now
+        else:
+            self._incremental_refresh(instance)
+
+    def _full_refresh(self, instance: DagsterInstance) -> None:
+        update_cursor = get_current_datetime()
+        self._entries.clear()
+        self._groups.clear()
+        self._op_concurrency_runs.clear()
+
+        for record in self._iter_run_records(
+            instance, RunsFilter(statuses=[DagsterRunStatus.QUEUED])
+        ):
+            self._add(record)
+
+        self._update_cursor = update_cursor
+
+    def _incremental_refresh(self, instance: DagsterInstance) -> None:
+        update_cursor = get_current_datetime()
+        for record in self._iter_run_records(
+            instance,
+            RunsFilter(updated_after=check.not_none(self._update_cursor) - self._update_overlap),
+        ):
+            if record.dagster_run.status == DagsterRunStatus.QUEUED:
+                self._add(record)
+            else:
+                self.remove(record.dagster_run.run_id)
+
+        self._update_cursor = update_cursor
+
+    def _iter_run_records(
+        self, instance: DagsterInstance, filters: RunsFilter
+    ) -> Iterator[RunRecord]:
+        cursor = None
+        has_more = True
+        # Paginate through the runs so that they are deserialized a page at a time
+        while has_more:
+            records = instance.get_run_records(
+                filters, cursor=cursor, limit=self._page_size, ascending=True
+            )
+            has_more = len(records) >= self._page_size
+            yield from records
+            if records:
+                cursor = records[-1].dagster_run.run_id
+
+    def _regroup(self, tag_concurrency_limits: Sequence[Mapping[str, Any]]) -> None:
+        self._tag_concurrency_limits = tag_concurrency_limits
+        self._tag_concurrency_limits_counter = TagConcurrencyLimitsCounter(
+            list(tag_concurrency_limits), []
+        )
+        entries = list(self._entries.values())
+        self._entries.clear()
+        self._groups.clear()
+        for entry in entries:
+            self._insert(entry.run, entry.sort_key)
+
+    def _add(self, record: RunRecord) -> None:
+        run = record.dagster_run
+        sort_key = (-get_run_priority(run), record.storage_id)
+        self.remove(run.run_id)
+        self._insert(run, sort_key)
+
+    def _insert(self, run: DagsterRun, sort_key: QueuedRunSortKey) -> None:
+        location_name = run.external_job_origin.location_name if run.external_job_origin else None
+        group_key = (
+            location_name,
+            self._tag_concurrency_limits_counter.get_limited_tags(run),
+        )
+        self._entries[run.run_id] = QueuedRunEntry(run, sort_key, group_key)
+        insort(self._groups.setdefault(group_key, []), (sort_key, run.run_id))
+        if run.run_op_concurrency:
+            self._op_concurrency_runs[run.run_id] = run
+
+    def remove(self, run_id: str) -> None:
+        entry = self._entries.pop(run_id, None)
+        if not entry:
+            return
+
+        self._op_concurrency_runs.pop(run_id, None)
+        group = self._groups[entry.group_key]
+        del group[bisect_left(group, (entry.sort_key, run_id))]
+        if not group:
+            del self._groups[entry.group_key]
+
+    def iter_by_priority(
+        self, skipped_groups: AbstractSet[QueuedRunGroupKey]
+    ) -> Iterator[QueuedRunEntry]:
+        """Yields the queued runs in priority order, merging the groups of runs. Adding the group key
+        of a yielded entry to `skipped_groups` skips the remaining runs of that group.
+        """
+        heads = [
+            (group[0][0], group_key, 0)
+            for group_key, group in self._groups.items()
+            if group_key not in skipped_groups
+        ]
+        heapq.heapify(heads)
+        while heads:
+            _, group_key, index = heapq.heappop(heads)
+            group = self._groups[group_key]
+            yield self._entries[group[index][1]]
+
+            if group_key not in skipped_groups and index + 1 < len(group):
+                heapq.heappush(heads, (group[index + 1][0], group_key, index + 1))
@@ -1,4 +1,5 @@
 import datetime
+import hashlib
 import logging
 import sys
 import threading
@@ -6,18 +7,7 @@
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import AbstractContextManager
 from types import TracebackType
-from typing import (
-    TYPE_CHECKING,
-    Dict,
-    List,
-    Mapping,
-    NamedTuple,
-    Optional,
-    Sequence,
-    Type,
-    Union,
-    cast,
-)
+from typing import TYPE_CHECKING, Dict, Mapping, NamedTuple, Optional, Sequence, Type, Union, cast
 
 from typing_extensions import Self
 
@@ -47,8 +37,8 @@
     TickData,
     TickStatus,
 )
-from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
-from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
+from dagster._core.storage.tags import RUN_KEY_TAG
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._daemon.utils import DaemonErrorCapture
@@ -71,6 +61,25 @@ class DagsterSensorDaemonError(DagsterError):
     """Error when running the SensorDaemon."""
 
 
+class SensorShard(NamedTuple):
+    """One of `num_shards` disjoint sets of sensors, which each sensor is assigned to by a hash of
+    its selector id. When the sensor daemon is configured with `num_worker_processes`, each shard
+    is evaluated in its own process.
+    """
+
+    index: int
+    num_shards: int
+
+    def contains(self, selector_id: str) -> bool:
+        return get_sensor_shard_index(selector_id, self.num_shards) == self.index
+
+
+def get_sensor_shard_index(selector_id: str, num_shards: int) -> int:
+    # hash() is salted differently in each process, so every process would assign sensors to
+    # different shards
+    return int(hashlib.sha1(selector_id.encode("utf-8")).hexdigest(), 16) % num_shards
+
+
 class SkippedSensorRun(NamedTuple):
     """Placeholder for runs that are skipped during the run_key idempotence check."""
 
@@ -245,11 +254,14 @@ def execute_sensor_iteration_loop(
     until: Optional[float] = None,
     threadpool_executor: Optional[ThreadPoolExecutor] = None,
     submit_threadpool_executor: Optional[ThreadPoolExecutor] = None,
+    sensor_shard: Optional[SensorShard] = None,
 ) -> "DaemonIterator":
     """Helper function that performs sensor evaluations on a tighter loop, while reusing grpc locations
     within a given daemon interval.  Rather than relying on the daemon machinery to run the
     iteration loop every 30 seconds, sensors are continuously evaluated, every 5 seconds. We rely on
     each sensor definition's min_interval to check that sensor evaluations are spaced appropriately.
+
+    If a sensor_shard is passed, only the sensors in that shard are evaluated.
     """
     from dagster._daemon.daemon import SpanMarker
 
@@ -269,6 +281,7 @@ def execute_sensor_iteration_loop(
                 threadpool_executor=threadpool_executor,
                 submit_threadpool_executor=submit_threadpool_executor,
                 sensor_tick_futures=sensor_tick_futures,
+                sensor_shard=sensor_shard,
             )
         except Exception:
             error_info = DaemonErrorCapture.on_exception(
@@ -297,6 +310,7 @@ def execute_sensor_iteration(
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_tick_futures: Optional[Dict[str, Future]] = None,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
+    sensor_shard: Optional[SensorShard] = None,
 ):
     instance = workspace_process_context.instance
 
@@ -329,6 +343,11 @@ def execute_sensor_iteration(
                         continue
 
                     selector_id = sensor.selector_id
+                    # each sensor's state is only read and written by the process evaluating its
+                    # shard, so shards never evaluate the same sensor
+                    if sensor_shard and not sensor_shard.contains(selector_id):
+                        continue
+
                     if sensor.get_current_instigator_state(
                         all_sensor_states.get(selector_id)
                     ).is_running:
@@ -902,37 +921,14 @@ def _fetch_existing_runs(
     if not run_keys:
         return {}
 
-    # fetch runs from the DB with only the run key tag
-    # note: while possible to filter more at DB level with tags - it is avoided here due to observed
-    # perf problems
-    runs_with_run_keys = []
-    for run_key in run_keys:
-        # do serial fetching, which has better perf than a single query with an IN clause, due to
-        # how the query planner does the runs/run_tags join
-        runs_with_run_keys.extend(
-            instance.get_runs(filters=RunsFilter(tags={RUN_KEY_TAG: run_key}))
-        )
-
-    # filter down to runs with run_key that match the sensor name and its namespace (repository)
-    valid_runs: List[DagsterRun] = []
-    for run in runs_with_run_keys:
-        # if the run doesn't have a set origin, just match on sensor name
-        if (
-            run.external_job_origin is None
-            and run.tags.get(SENSOR_NAME_TAG) == external_sensor.name
-        ):
-            valid_runs.append(run)
-        # otherwise prevent the same named sensor across repos from effecting each other
-        elif (
-            run.external_job_origin is not None
-            and run.external_job_origin.repository_origin.get_selector_id()
-            == external_sensor.get_external_origin().repository_origin.get_selector_id()
-            and run.tags.get(SENSOR_NAME_TAG) == external_sensor.name
-        ):
-            valid_runs.append(run)
+    runs_with_run_keys = instance.get_runs_for_run_keys(
+        run_keys,
+        sensor_name=external_sensor.name,
+        repository_selector_id=external_sensor.get_external_origin().repository_origin.get_selector_id(),
+    )
 
     existing_runs = {}
-    for run in valid_runs:
+    for run in runs_with_run_keys:
         tags = run.tags or {}
         run_key = tags.get(RUN_KEY_TAG)
         existing_runs[run_key] = run
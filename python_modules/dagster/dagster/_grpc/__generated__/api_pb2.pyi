@@ -422,19 +422,24 @@ class ExternalRepositoryRequest(google.protobuf.message.Message):
 
     SERIALIZED_REPOSITORY_PYTHON_ORIGIN_FIELD_NUMBER: builtins.int
     DEFER_SNAPSHOTS_FIELD_NUMBER: builtins.int
+    SERIALIZED_KNOWN_SNAPSHOT_IDS_FIELD_NUMBER: builtins.int
     serialized_repository_python_origin: builtins.str
     defer_snapshots: builtins.bool
+    serialized_known_snapshot_ids: builtins.str
     def __init__(
         self,
         *,
         serialized_repository_python_origin: builtins.str = ...,
         defer_snapshots: builtins.bool = ...,
+        serialized_known_snapshot_ids: builtins.str = ...,
     ) -> None: ...
     def ClearField(
         self,
         field_name: typing_extensions.Literal[
             "defer_snapshots",
             b"defer_snapshots",
+            "serialized_known_snapshot_ids",
+            b"serialized_known_snapshot_ids",
             "serialized_repository_python_origin",
             b"serialized_repository_python_origin",
         ],
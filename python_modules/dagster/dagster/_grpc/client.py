@@ -2,7 +2,7 @@
 import sys
 from contextlib import contextmanager
 from threading import Event
-from typing import Any, Dict, Iterator, NoReturn, Optional, Sequence, Tuple, Type, cast
+from typing import AbstractSet, Any, Dict, Iterator, NoReturn, Optional, Sequence, Tuple, Type, cast
 
 import google.protobuf.message
 import grpc
@@ -62,6 +62,14 @@ def client_heartbeat_thread(client: "DagsterGrpcClient", shutdown_event: Event)
             continue
 
 
+def _serialize_known_snapshot_ids(known_snapshot_ids: Optional[AbstractSet[str]]) -> str:
+    # An empty string asks for the full repository data, while an empty list of known ids asks for
+    # a delta that holds every entry along with its snapshot id
+    if known_snapshot_ids is None:
+        return ""
+    return serialize_value(sorted(known_snapshot_ids))
+
+
 class DagsterGrpcClient:
     def __init__(
         self,
@@ -326,12 +334,14 @@ def external_repository(
         self,
         external_repository_origin: RemoteRepositoryOrigin,
         defer_snapshots: bool = False,
+        known_snapshot_ids: Optional[AbstractSet[str]] = None,
     ) -> str:
         check.inst_param(
             external_repository_origin,
             "external_repository_origin",
             RemoteRepositoryOrigin,
         )
+        check.opt_set_param(known_snapshot_ids, "known_snapshot_ids", of_type=str)
 
         res = self._query(
             "ExternalRepository",
@@ -339,6 +349,7 @@ def external_repository(
             # rename this param name
             serialized_repository_python_origin=serialize_value(external_repository_origin),
             defer_snapshots=defer_snapshots,
+            serialized_known_snapshot_ids=_serialize_known_snapshot_ids(known_snapshot_ids),
         )
 
         return res.serialized_external_repository_data
@@ -366,13 +377,17 @@ def streaming_external_repository(
         external_repository_origin: RemoteRepositoryOrigin,
         defer_snapshots: bool = False,
         timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
+        known_snapshot_ids: Optional[AbstractSet[str]] = None,
     ) -> Iterator[dict]:
+        check.opt_set_param(known_snapshot_ids, "known_snapshot_ids", of_type=str)
+
         for res in self._streaming_query(
             "StreamingExternalRepository",
             api_pb2.ExternalRepositoryRequest,
             # Rename parameter
             serialized_repository_python_origin=serialize_value(external_repository_origin),
             defer_snapshots=defer_snapshots,
+            serialized_known_snapshot_ids=_serialize_known_snapshot_ids(known_snapshot_ids),
             timeout=timeout,
         ):
             yield {
@@ -207,7 +207,9 @@ def Ping(self, request, context):
         return self._query("Ping", request, context)
 
     def GetServerId(self, request, context):
-        return self._fixed_server_id or self._query("GetServerId", request, context)
+        if self._fixed_server_id:
+            return api_pb2.GetServerIdReply(server_id=self._fixed_server_id)
+        return self._query("GetServerId", request, context)
 
     def GetCurrentImage(self, request, context):
         return self._query("GetCurrentImage", request, context)
@@ -48,11 +48,15 @@
 from dagster._core.remote_representation.external_data import (
     ExternalJobSubsetResult,
     ExternalPartitionExecutionErrorData,
+    ExternalRepositoryData,
     ExternalRepositoryErrorData,
+    ExternalRepositorySnapshotIds,
     ExternalScheduleExecutionErrorData,
     ExternalSensorExecutionErrorData,
     external_job_data_from_def,
+    external_repository_data_delta_from_data,
     external_repository_data_from_def,
+    get_external_repository_snapshot_ids,
 )
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.types.loadable_target_origin import (
@@ -227,6 +231,11 @@ def __init__(
         self._repo_defs_by_name: Dict[str, RepositoryDefinition] = {}
         self._loadable_repository_symbols: List[LoadableRepositorySymbol] = []
 
+        self._external_repository_datas_lock = threading.Lock()
+        self._external_repository_datas: Dict[
+            Tuple[str, bool], Tuple[ExternalRepositoryData, ExternalRepositorySnapshotIds]
+        ] = {}
+
         if not loadable_target_origin:
             # empty workspace
             return
@@ -294,6 +303,25 @@ def definitions_by_name(self) -> Mapping[str, RepositoryDefinition]:
     def reconstructables_by_name(self) -> Mapping[str, ReconstructableRepository]:
         return self._recon_repos_by_name
 
+    def get_external_repository_data(
+        self, repository_name: str, defer_snapshots: bool
+    ) -> Tuple[ExternalRepositoryData, ExternalRepositorySnapshotIds]:
+        """Returns the repository data of the given repository along with the snapshot ids of its
+        entries. Both are computed once per loaded repository, since the ids are only valid for
+        the repository data they were computed from.
+        """
+        key = (repository_name, defer_snapshots)
+        with self._external_repository_datas_lock:
+            if key in self._external_repository_datas:
+                return self._external_repository_datas[key]
+
+        repository_data = external_repository_data_from_def(
+            self._repo_defs_by_name[repository_name], defer_snapshots=defer_snapshots
+        )
+        snapshot_ids = get_external_repository_snapshot_ids(repository_data)
+        with self._external_repository_datas_lock:
+            return self._external_repository_datas.setdefault(key, (repository_data, snapshot_ids))
+
 
 def _get_code_pointer(
     loadable_target_origin: LoadableTargetOrigin,
@@ -766,12 +794,25 @@ def _get_serialized_external_repository_data(
                 RemoteRepositoryOrigin,
             )
 
-            return serialize_value(
-                external_repository_data_from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
-                )
+            # checks that the repository exists
+            self._get_repo_for_origin(repository_origin)
+            external_repository_data, snapshot_ids = check.not_none(
+                self._loaded_repositories
+            ).get_external_repository_data(
+                repository_origin.repository_name, request.defer_snapshots
             )
+
+            # Callers that hold snapshots from an earlier request send their ids, and only get back
+            # the jobs, asset nodes, schedules, and sensors that changed since then
+            if request.serialized_known_snapshot_ids:
+                known_snapshot_ids = deserialize_value(request.serialized_known_snapshot_ids, list)
+                return serialize_value(
+                    external_repository_data_delta_from_data(
+                        external_repository_data, set(known_snapshot_ids), snapshot_ids
+                    )
+                )
+
+            return serialize_value(external_repository_data)
         except Exception:
             return serialize_value(
                 ExternalRepositoryErrorData(serializable_error_info_from_exc_info(sys.exc_info()))
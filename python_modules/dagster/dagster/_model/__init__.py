@@ -1,10 +1,10 @@
-from functools import cached_property
-from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, TypeVar
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, ConfigDict, PrivateAttr
 from typing_extensions import Annotated, Self, TypeAlias
 
-from .pydantic_compat_layer import USING_PYDANTIC_2
+from .pydantic_compat_layer import USING_PYDANTIC_2, model_fields
 
 if USING_PYDANTIC_2:
     from pydantic import InstanceOf as InstanceOf  # type: ignore
@@ -58,3 +58,27 @@ def model_construct(cls, **kwargs: Any) -> Self:
             return super().model_construct(**kwargs)  # type: ignore
         else:
             return super().construct(**kwargs)
+
+
+@lru_cache(maxsize=None)
+def _get_model_field_names(model_type: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(model_fields(model_type).keys())
+
+
+def get_structural_key(value: Any) -> Hashable:
+    """Returns a key that is equal for DagsterModels with the same type and field values, with the
+    lists in them converted to tuples, as frozen models that hold lists cannot be hashed. The key
+    is only hashable if all of the field values are.
+    """
+    if isinstance(value, DagsterModel):
+        return (
+            type(value),
+            tuple(
+                (field_name, get_structural_key(getattr(value, field_name)))
+                for field_name in _get_model_field_names(type(value))
+            ),
+        )
+    elif type(value) in (list, tuple):
+        return tuple(get_structural_key(item) for item in value)
+    else:
+        return value
@@ -7,10 +7,12 @@
     EnumSerializer as EnumSerializer,
     NamedTupleSerializer as NamedTupleSerializer,
     SerializableNonScalarKeyMapping as SerializableNonScalarKeyMapping,
+    SerializationFormat as SerializationFormat,
     WhitelistMap as WhitelistMap,
     deserialize_value as deserialize_value,
     pack_value as pack_value,
     serialize_value as serialize_value,
+    serialize_value_to_bytes as serialize_value_to_bytes,
     unpack_value as unpack_value,
     whitelist_for_serdes as whitelist_for_serdes,
 )
@@ -28,6 +28,7 @@
     Dict,
     FrozenSet,
     Generic,
+    Iterable,
     Iterator,
     List,
     Mapping,
@@ -113,6 +114,16 @@
     "DataclassInstance",
 ]
 
+_Packer: TypeAlias = Callable[
+    [
+        Any,
+        "WhitelistMap",
+        Callable[[SerializableObject, "WhitelistMap", str], JsonSerializableValue],
+        str,
+    ],
+    Iterable[Tuple[str, JsonSerializableValue]],
+]
+
 _K = TypeVar("_K")
 _V = TypeVar("_V")
 
@@ -539,15 +550,16 @@ def unpack(
     ) -> T:
         try:
             unpacked_dict = self.before_unpack(context, unpacked_dict)
+            unpack_plan = self._unpack_plan
             unpacked: Dict[str, PackableValue] = {}
             for key, value in unpacked_dict.items():
-                loaded_name = self.loaded_field_names.get(key, key)
+                field_plan = unpack_plan.get(key)
                 # Naively implements backwards compatibility by filtering arguments that aren't present in
                 # the constructor. If a property is present in the serialized object, but doesn't exist in
                 # the version of the class loaded into memory, that property will be completely ignored.
-                if loaded_name in self.constructor_param_names:
+                if field_plan is not None:
+                    loaded_name, custom = field_plan
                     # custom unpack regardless of hook vs recursive descent
-                    custom = self.field_serializers.get(loaded_name)
                     if custom:
                         unpacked[loaded_name] = custom.unpack(
                             value,
@@ -589,15 +601,60 @@ def handle_unpack_error(
     ) -> Any:
         raise exc
 
+    @cached_property
+    def _unpack_plan(self) -> Mapping[str, Tuple[str, Optional["FieldSerializer"]]]:
+        # maps each storage key that is loaded into a constructor param to the param name and its
+        # custom field serializer, if any
+        param_names = set(self.constructor_param_names)
+        plan: Dict[str, Tuple[str, Optional[FieldSerializer]]] = {}
+        for key in param_names:
+            if key not in self.loaded_field_names:
+                plan[key] = (key, self.field_serializers.get(key))
+        for key, loaded_name in self.loaded_field_names.items():
+            if loaded_name in param_names:
+                plan[key] = (loaded_name, self.field_serializers.get(loaded_name))
+        return plan
+
     def pack_items(
         self,
         value: T,
         whitelist_map: WhitelistMap,
         object_handler: Callable[[SerializableObject, WhitelistMap, str], JsonSerializableValue],
         descent_path: str,
+    ) -> Iterable[Tuple[str, JsonSerializableValue]]:
+        return self._packer(value, whitelist_map, object_handler, descent_path)
+
+    @cached_property
+    def _packer(self) -> "_Packer":
+        # Compiled once per serializer, produces the same items as `pack_items_uncompiled`
+        return self._compile_packer() or self.pack_items_uncompiled
+
+    # Hook: Compile a function that produces the same items as `pack_items_uncompiled` for the
+    # objects of this class, or return None if it can't be compiled.
+    def _compile_packer(self) -> Optional["_Packer"]:
+        return None
+
+    def pack_items_uncompiled(
+        self,
+        value: T,
+        whitelist_map: WhitelistMap,
+        object_handler: Callable[[SerializableObject, WhitelistMap, str], JsonSerializableValue],
+        descent_path: str,
+    ) -> Iterator[Tuple[str, JsonSerializableValue]]:
+        return self._pack_prepared_items(
+            self.before_pack(value), whitelist_map, object_handler, descent_path
+        )
+
+    def _pack_prepared_items(
+        self,
+        value: T,
+        whitelist_map: WhitelistMap,
+        object_handler: Callable[[SerializableObject, WhitelistMap, str], JsonSerializableValue],
+        descent_path: str,
     ) -> Iterator[Tuple[str, JsonSerializableValue]]:
+        # packs a value that before_pack has already been applied to
         yield "__class__", self.get_storage_name()
-        for key, inner_value in self.object_as_mapping(self.before_pack(value)).items():
+        for key, inner_value in self.object_as_mapping(value).items():
             if key in self.skip_when_empty_fields and inner_value in EMPTY_VALUES_TO_SKIP:
                 continue
             storage_key = self.storage_field_names.get(key, key)
@@ -653,6 +710,66 @@ def constructor_param_names(self) -> Sequence[str]:
 
         return list(signature(self.klass.__new__).parameters.keys())
 
+    def _compile_packer(self) -> Optional[_Packer]:
+        klass = self.klass
+        if type(self).object_as_mapping is not NamedTupleSerializer.object_as_mapping:
+            return None
+        if not is_record(klass) and klass.__iter__ is not tuple.__iter__:
+            return None
+
+        # Generates a function that reads the fields straight off the tuple, with the per-field
+        # decisions made by `pack_items_uncompiled` resolved ahead of time. Scalars are returned
+        # as-is without a call to _transform_for_serialization.
+        fields = list(klass._fields)
+        namespace: Dict[str, Any] = {
+            "klass": klass,
+            "tuple_iter": tuple.__iter__,
+            "transform": _transform_for_serialization,
+            "scalar_types": (int, float, str, bool),
+            "empty_values": EMPTY_VALUES_TO_SKIP,
+            "pack_prepared": self._pack_prepared_items,
+            "before_pack": self.before_pack,
+            "storage_name": self.get_storage_name(),
+            "old_items": list(self.old_fields.items()),
+        }
+        lines = ["def pack(value, whitelist_map, object_handler, descent_path):"]
+        if type(self).before_pack is not ObjectSerializer.before_pack:
+            lines.append("    value = before_pack(value)")
+        lines.append("    if type(value) is not klass:")
+        lines.append(
+            "        return pack_prepared(value, whitelist_map, object_handler, descent_path)"
+        )
+        if fields:
+            lines.append(
+                f"    {', '.join(f'v{i}' for i in range(len(fields)))}, = tuple_iter(value)"
+            )
+        lines.append('    items = [("__class__", storage_name)]')
+        for i, field in enumerate(fields):
+            namespace[f"key_{i}"] = self.storage_field_names.get(field, field)
+            namespace[f"path_{i}"] = f".{field}"
+            indent = "    "
+            if field in self.skip_when_empty_fields:
+                lines.append(f"    if v{i} not in empty_values:")
+                indent = "        "
+            custom = self.field_serializers.get(field)
+            if custom:
+                namespace[f"custom_{i}"] = custom
+                packed = (
+                    f"custom_{i}.pack(v{i}, whitelist_map=whitelist_map,"
+                    f" descent_path=descent_path + path_{i})"
+                )
+            else:
+                packed = (
+                    f"v{i} if v{i} is None or type(v{i}) in scalar_types else"
+                    f" transform(v{i}, whitelist_map, object_handler, descent_path + path_{i})"
+                )
+            lines.append(f"{indent}items.append((key_{i}, {packed}))")
+        lines.append("    items.extend(old_items)")
+        lines.append("    return items")
+
+        exec(compile("\n".join(lines), f"<serdes packer {klass.__name__}>", "exec"), namespace)
+        return namespace["pack"]
+
 
 T_Dataclass = TypeVar("T_Dataclass", bound="DataclassInstance", default="DataclassInstance")
 
@@ -764,6 +881,98 @@ def serialize_value(
     return seven.json.dumps(serializable_value, **json_kwargs)
 
 
+class SerializationFormat(Enum):
+    """The encodings that serialized values can be stored in.
+
+    JSON is human readable and can be stored in text columns. MSGPACK is a compact binary encoding
+    that requires the `msgpack` package, in which the field names of each whitelisted class are
+    written once per payload instead of once per object.
+    """
+
+    JSON = "json"
+    MSGPACK = "msgpack"
+
+
+# Prefix for msgpack payloads. JSON text never starts with a null byte, so payloads can be told apart.
+_MSGPACK_HEADER: Final = b"\x00msgpack\x01"
+_MSGPACK_SHAPE_EXT_CODE: Final = 1
+
+
+def serialize_value_to_bytes(
+    val: PackableValue,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+    serialization_format: SerializationFormat = SerializationFormat.MSGPACK,
+) -> bytes:
+    """Serialize an object to bytes in the given format, to be read with `deserialize_value`.
+
+    For MSGPACK, each whitelisted object is written as an array of its packed field values,
+    preceded by a reference to a table of the distinct class and field names in the payload. Values
+    that msgpack can't represent, like integers that don't fit in 64 bits, are written as JSON.
+    """
+    check.inst_param(serialization_format, "serialization_format", SerializationFormat)
+    if serialization_format == SerializationFormat.JSON:
+        return serialize_value(val, whitelist_map).encode("utf-8")
+
+    msgpack = _import_msgpack(SerializationError)
+
+    # maps each storage name and sequence of storage keys to the ext marker referencing it in the
+    # shape table
+    shapes: Dict[Tuple[Optional[str], Tuple[str, ...]], Any] = {}
+
+    def _object_handler(
+        obj: SerializableObject, whitelist_map: WhitelistMap, descent_path: str
+    ) -> JsonSerializableValue:
+        serializer = whitelist_map.object_serializers[obj.__class__.__name__]
+        storage_name = None
+        keys = []
+        packed = [None]
+        for key, value in serializer.pack_items(obj, whitelist_map, _object_handler, descent_path):
+            if key == "__class__":
+                storage_name = value
+            else:
+                keys.append(key)
+                packed.append(value)
+        shape = (storage_name, tuple(keys))
+        marker = shapes.get(shape)
+        if marker is None:
+            marker = shapes[shape] = msgpack.ExtType(
+                _MSGPACK_SHAPE_EXT_CODE, len(shapes).to_bytes(4, "big")
+            )
+        packed[0] = marker
+        return packed
+
+    body = _transform_for_serialization(
+        val,
+        whitelist_map=whitelist_map,
+        object_handler=_object_handler,
+        descent_path=_root(val),
+    )
+    try:
+        return b"".join(
+            [
+                _MSGPACK_HEADER,
+                msgpack.packb(
+                    [[storage_name, list(keys)] for storage_name, keys in shapes],
+                    use_bin_type=True,
+                ),
+                msgpack.packb(body, use_bin_type=True),
+            ]
+        )
+    except OverflowError:
+        return serialize_value(val, whitelist_map).encode("utf-8")
+
+
+def _import_msgpack(error_cls: Type[Exception]) -> Any:
+    try:
+        import msgpack
+    except ImportError:
+        raise error_cls(
+            "The msgpack serialization format requires the msgpack package. Install it with"
+            " `pip install msgpack`."
+        )
+    return msgpack
+
+
 @overload
 def pack_value(
     val: T_Scalar,
@@ -1013,7 +1222,7 @@ def _wrap_object(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Tuple[Type[T_PackableValue], Type[U_PackableValue]],
     whitelist_map: WhitelistMap = ...,
 ) -> Union[T_PackableValue, U_PackableValue]: ...
@@ -1021,7 +1230,7 @@ def deserialize_value(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Type[T_PackableValue],
     whitelist_map: WhitelistMap = ...,
 ) -> T_PackableValue: ...
@@ -1029,36 +1238,39 @@ def deserialize_value(
 
 @overload
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: None = ...,
     whitelist_map: WhitelistMap = ...,
 ) -> PackableValue: ...
 
 
 def deserialize_value(
-    val: str,
+    val: Union[str, bytes],
     as_type: Optional[
         Union[Type[T_PackableValue], Tuple[Type[T_PackableValue], Type[U_PackableValue]]]
     ] = None,
     whitelist_map: WhitelistMap = _WHITELIST_MAP,
 ) -> Union[PackableValue, T_PackableValue, Union[T_PackableValue, U_PackableValue]]:
-    """Deserialize a json encoded string to a Python object.
+    """Deserialize a json encoded string, or bytes from `serialize_value_to_bytes`, to a Python
+    object.
 
     Two steps:
 
-    - Parse the input string as JSON with an object_hook for custom types.
+    - Parse the input as JSON or msgpack with hooks for custom types.
     - Optionally, check that the resulting object is of the expected type.
     """
-    check.str_param(val, "val")
+    check.inst_param(val, "val", (str, bytes))
 
     # Never issue warnings when deserializing deprecated objects.
     with disable_dagster_warnings(), check.EvalContext.contextual_namespace(
         whitelist_map.get_type_map()
     ):
         context = UnpackContext()
-        unpacked_value = seven.json.loads(
-            val, object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context)
-        )
+        object_hook = partial(_unpack_object, whitelist_map=whitelist_map, context=context)
+        if isinstance(val, bytes) and val.startswith(_MSGPACK_HEADER):
+            unpacked_value = _loads_msgpack(val, object_hook)
+        else:
+            unpacked_value = seven.json.loads(val, object_hook=object_hook)
         unpacked_value = context.finalize_unpack(unpacked_value)
         if as_type and not (
             is_named_tuple_instance(unpacked_value)
@@ -1072,6 +1284,44 @@ def deserialize_value(
     return unpacked_value
 
 
+class _MsgpackShape(NamedTuple):
+    """The storage name and storage keys of an object in a msgpack payload."""
+
+    storage_name: Optional[str]
+    keys: Sequence[str]
+
+
+def _loads_msgpack(val: bytes, object_hook: Callable[[dict], UnpackedValue]) -> UnpackedValue:
+    msgpack = _import_msgpack(DeserializationError)
+    shapes: List[_MsgpackShape] = []
+
+    def _ext_hook(code: int, data: bytes) -> Any:
+        if code != _MSGPACK_SHAPE_EXT_CODE:
+            raise DeserializationError(f"Unknown msgpack extension type {code}.")
+        return shapes[int.from_bytes(data, "big")]
+
+    def _list_hook(items: list) -> UnpackedValue:
+        if items and type(items[0]) is _MsgpackShape:
+            storage_name, keys = items[0]
+            val = dict(zip(keys, items[1:]))
+            if storage_name is not None:
+                val["__class__"] = storage_name
+            return object_hook(val)
+        return items
+
+    unpacker = msgpack.Unpacker(
+        object_hook=object_hook,
+        list_hook=_list_hook,
+        ext_hook=_ext_hook,
+        raw=False,
+        strict_map_key=False,
+        max_buffer_size=len(val),
+    )
+    unpacker.feed(memoryview(val)[len(_MSGPACK_HEADER) :])
+    shapes.extend(_MsgpackShape(storage_name, keys) for storage_name, keys in unpacker.unpack())
+    return unpacker.unpack()
+
+
 class UnknownSerdesValue:
     def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
         self.message = message
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Mapping, Optional, Sequence, Tuple, Union
 
 from dagster import _check as check
 
@@ -71,6 +71,20 @@ def is_blocked(self, item: Union["DagsterRun", "ExecutionStep"]) -> bool:
 
         return False
 
+    def get_limited_tags(
+        self, item: Union["DagsterRun", "ExecutionStep"]
+    ) -> FrozenSet[Tuple[str, str]]:
+        """The tags of the item that count towards a limit. Items with the same limited tags are
+        always either all blocked or all unblocked.
+        """
+        return frozenset(
+            (key, value)
+            for key, value in item.tags.items()
+            if key in self._key_limits
+            or (key, value) in self._key_value_limits
+            or key in self._unique_value_limits
+        )
+
     def update_counters_with_launched_item(
         self, item: Union["DagsterRun", "ExecutionStep"]
     ) -> None:
@@ -509,6 +509,27 @@ def test_delete_state_not_found(self, storage):
         with pytest.raises(Exception):
             storage.delete_instigator_state(state.instigator_origin_id, state.selector_id)
 
+    def test_instigator_states_cursor(self, storage):
+        assert storage
+
+        cursor = storage.get_instigator_states_cursor()
+        if cursor is None:
+            pytest.skip("Storage does not have an instigator states cursor")
+
+        state = self.build_sensor("my_sensor")
+        storage.add_instigator_state(state)
+        added_cursor = storage.get_instigator_states_cursor()
+        assert added_cursor != cursor
+
+        storage.update_instigator_state(state.with_status(InstigatorStatus.RUNNING))
+        updated_cursor = storage.get_instigator_states_cursor()
+        assert updated_cursor != added_cursor
+        assert storage.get_instigator_states_cursor() == updated_cursor
+
+        if self.can_delete():
+            storage.delete_instigator_state(state.instigator_origin_id, state.selector_id)
+            assert storage.get_instigator_states_cursor() != updated_cursor
+
     def test_add_state_with_same_name(self, storage):
         assert storage
 
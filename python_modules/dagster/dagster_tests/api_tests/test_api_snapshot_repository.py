@@ -1,22 +1,41 @@
+import subprocess
 import sys
 from contextlib import contextmanager
 
 import pytest
-from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
-from dagster._api.snapshot_repository import sync_get_streaming_external_repositories_data_grpc
+from dagster import IntMetadataValue, TextMetadataValue, file_relative_path, job, op, repository
+from dagster._api.snapshot_repository import (
+    ExternalRepositorySnapshotCache,
+    get_shared_repository_data_cache,
+    sync_get_streaming_external_repositories_data_grpc,
+)
 from dagster._core.errors import DagsterUserCodeProcessError
 from dagster._core.instance import DagsterInstance
+from dagster._core.origin import DEFAULT_DAGSTER_ENTRY_POINT
 from dagster._core.remote_representation import (
     ExternalRepositoryData,
     ManagedGrpcPythonEnvCodeLocationOrigin,
+    external_data as external_data_module,
 )
 from dagster._core.remote_representation.external import ExternalRepository
-from dagster._core.remote_representation.external_data import ExternalJobData
+from dagster._core.remote_representation.external_data import (
+    ExternalJobData,
+    ExternalRepositoryDataDelta,
+    external_repository_data_delta_from_data,
+    external_repository_data_from_def,
+    external_repository_data_from_delta,
+    get_external_repository_snapshots_by_id,
+)
 from dagster._core.remote_representation.handle import RepositoryHandle
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import GrpcServerTarget, PythonFileTarget
+from dagster._grpc.client import DagsterGrpcClient
+from dagster._grpc.server import LoadedRepositories, wait_for_grpc_server
 from dagster._serdes.serdes import deserialize_value
+from dagster._utils import find_free_port
 
 from .utils import get_bar_repo_code_location
 
@@ -51,6 +70,241 @@ def test_streaming_external_repositories_error(instance):
             sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)
 
 
+def test_streaming_external_repositories_snapshot_delta(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        snapshot_cache = ExternalRepositorySnapshotCache()
+        full_repo_data = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location, snapshot_cache
+        )["bar_repo"]
+        known_snapshots_by_id = snapshot_cache.get_snapshots_by_id(code_location.name, "bar_repo")
+        assert known_snapshots_by_id
+        assert full_repo_data.external_job_datas
+        assert len(known_snapshots_by_id) == (
+            len(full_repo_data.external_job_datas)
+            + len(full_repo_data.external_asset_graph_data)
+            + len(full_repo_data.external_schedule_datas)
+            + len(full_repo_data.external_sensor_datas)
+        )
+
+        # nothing changed, so none of the entries are sent again
+        delta = deserialize_value(
+            "".join(
+                chunk["serialized_external_repository_chunk"]
+                for chunk in code_location.client.streaming_external_repository(
+                    RemoteRepositoryOrigin(code_location.origin, "bar_repo"),
+                    known_snapshot_ids=set(known_snapshots_by_id.keys()),
+                )
+            ),
+            ExternalRepositoryDataDelta,
+        )
+        assert delta.external_repository_data.external_job_datas == []
+        assert delta.external_repository_data.external_schedule_datas == []
+        assert delta.external_repository_data.external_sensor_datas == []
+        assert delta.external_repository_data.external_asset_graph_data == []
+
+        patched_repo_data = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location, snapshot_cache
+        )["bar_repo"]
+        assert patched_repo_data == full_repo_data
+        # unchanged entries are shared with the cached repository data
+        assert all(
+            patched_job_data is job_data
+            for patched_job_data, job_data in zip(
+                patched_repo_data.external_job_datas, full_repo_data.external_job_datas
+            )
+        )
+
+
+def test_server_computes_snapshot_ids_once_per_loaded_repository(monkeypatch):
+    loaded_repositories = LoadedRepositories(
+        LoadableTargetOrigin(
+            executable_path=sys.executable,
+            python_file=file_relative_path(__file__, "api_tests_repo.py"),
+            attribute="bar_repo",
+        ),
+        entry_point=DEFAULT_DAGSTER_ENTRY_POINT,
+    )
+    num_snapshot_ids = 0
+    create_snapshot_id = external_data_module.create_snapshot_id
+
+    def _create_snapshot_id(snapshot):
+        nonlocal num_snapshot_ids
+        num_snapshot_ids += 1
+        return create_snapshot_id(snapshot)
+
+    monkeypatch.setattr(external_data_module, "create_snapshot_id", _create_snapshot_id)
+
+    repo_data, snapshot_ids = loaded_repositories.get_external_repository_data(
+        "bar_repo", defer_snapshots=False
+    )
+    assert num_snapshot_ids == len(get_external_repository_snapshots_by_id(repo_data, snapshot_ids))
+    assert snapshot_ids == external_repository_data_delta_from_data(repo_data, set()).snapshot_ids
+
+    num_snapshot_ids = 0
+    assert loaded_repositories.get_external_repository_data("bar_repo", defer_snapshots=False) == (
+        repo_data,
+        snapshot_ids,
+    )
+    assert num_snapshot_ids == 0
+
+    # deferring snapshots changes the job entries, so their ids are computed separately
+    deferred_repo_data, _ = loaded_repositories.get_external_repository_data(
+        "bar_repo", defer_snapshots=True
+    )
+    assert deferred_repo_data.external_job_refs
+    assert num_snapshot_ids > 0
+
+
+def test_shared_repository_data_across_workspace_refreshes(instance):
+    shared_cache = get_shared_repository_data_cache()
+    with WorkspaceProcessContext(
+        instance,
+        PythonFileTarget(
+            python_file=file_relative_path(__file__, "api_tests_repo.py"),
+            attribute="bar_repo",
+            working_directory=None,
+            location_name="bar_code_location",
+        ),
+    ) as process_context:
+        location = process_context.create_request_context().get_code_location("bar_code_location")
+        server_id = location.server_id
+        assert shared_cache.get_reference_count(server_id) == 1
+        repo_data = location.get_repository("bar_repo").external_repository_data
+
+        # the server is unchanged, so the refreshed location shares the loaded repository data
+        hits = shared_cache.get_stats().hits
+        process_context.refresh_workspace()
+        refreshed_location = process_context.create_request_context().get_code_location(
+            "bar_code_location"
+        )
+        assert refreshed_location is not location
+        assert refreshed_location.server_id == server_id
+        assert refreshed_location.get_repository("bar_repo").external_repository_data is repo_data
+        assert shared_cache.get_stats().hits == hits + 1
+        assert shared_cache.get_reference_count(server_id) == 1
+
+    assert shared_cache.get_reference_count(server_id) == 0
+
+
+_FIXED_SERVER_ID_REPO = """
+from dagster import job, op, repository
+
+@op
+def my_op():
+    return 1
+
+@job
+def {job_name}():
+    my_op()
+
+@repository
+def fixed_server_id_repo():
+    return [{job_name}]
+"""
+
+
+def test_shared_repository_data_reloads_fixed_server_id(instance, tmp_path):
+    shared_cache = get_shared_repository_data_cache()
+    port = find_free_port()
+    python_file = tmp_path / "fixed_server_id_repo.py"
+    python_file.write_text(_FIXED_SERVER_ID_REPO.format(job_name="old_job"))
+
+    subprocess_args = [
+        "dagster",
+        "code-server",
+        "start",
+        "--port",
+        str(port),
+        "--python-file",
+        str(python_file),
+        "--fixed-server-id",
+        "fixed_id",
+    ]
+    process = subprocess.Popen(subprocess_args)
+    try:
+        wait_for_grpc_server(process, DagsterGrpcClient(port=port), subprocess_args)
+        with WorkspaceProcessContext(
+            instance,
+            GrpcServerTarget(
+                host="localhost", port=port, socket=None, location_name="fixed_id_location"
+            ),
+        ) as process_context:
+            location = process_context.create_request_context().get_code_location(
+                "fixed_id_location"
+            )
+            assert location.server_id == "fixed_id"
+            assert location.get_repository("fixed_server_id_repo").has_external_job("old_job")
+
+            # the reloaded server keeps its id, but its new definitions are loaded
+            python_file.write_text(_FIXED_SERVER_ID_REPO.format(job_name="new_job"))
+            loads = shared_cache.get_stats().loads
+            process_context.reload_code_location("fixed_id_location")
+            reloaded_location = process_context.create_request_context().get_code_location(
+                "fixed_id_location"
+            )
+            assert reloaded_location.server_id == "fixed_id"
+            reloaded_repository = reloaded_location.get_repository("fixed_server_id_repo")
+            assert reloaded_repository.has_external_job("new_job")
+            assert not reloaded_repository.has_external_job("old_job")
+            assert shared_cache.get_stats().loads == loads + 1
+
+            # cleaning up the replaced location does not release the reloaded data
+            location.cleanup()
+            assert shared_cache.get_reference_count("fixed_id") == 1
+
+        assert shared_cache.get_reference_count("fixed_id") == 0
+    finally:
+        process.terminate()
+        process.wait()
+
+
+@op
+def unchanged_op():
+    return 1
+
+
+@job
+def unchanged_job():
+    unchanged_op()
+
+
+@job
+def changed_job():
+    unchanged_op()
+
+
+@repository
+def changed_repo():
+    return [unchanged_job, changed_job]
+
+
+@repository
+def changed_repo_with_new_job():
+    return [unchanged_job, changed_job.graph.to_job(name="changed_job", tags={"foo": "bar"})]
+
+
+@pytest.mark.parametrize("defer_snapshots", [True, False])
+def test_external_repository_data_delta(defer_snapshots):
+    old_repo_data = external_repository_data_from_def(changed_repo, defer_snapshots)
+    new_repo_data = external_repository_data_from_def(changed_repo_with_new_job, defer_snapshots)
+
+    old_snapshots_by_id = get_external_repository_snapshots_by_id(
+        old_repo_data,
+        external_repository_data_delta_from_data(old_repo_data, set()).snapshot_ids,
+    )
+    delta = external_repository_data_delta_from_data(new_repo_data, set(old_snapshots_by_id.keys()))
+    job_entries = (
+        delta.external_repository_data.external_job_refs
+        if defer_snapshots
+        else delta.external_repository_data.external_job_datas
+    )
+    assert [entry.name for entry in job_entries] == ["changed_job"]
+
+    patched_repo_data = external_repository_data_from_delta(delta, old_snapshots_by_id)
+    assert patched_repo_data.name == "changed_repo_with_new_job"
+    assert patched_repo_data._replace(name=new_repo_data.name) == new_repo_data
+
+
 @op
 def do_something():
     return 1
@@ -569,6 +569,32 @@ def test_identity_partition_mapping():
     assert result.get_partition_keys() == set(["x"])
 
 
+def test_identity_partition_mapping_time_windows():
+    early = DailyPartitionsDefinition(start_date="2023-01-01")
+    late = DailyPartitionsDefinition(start_date="2023-01-10", end_date="2023-02-01")
+    current_time = datetime(2023, 3, 1)
+    early_subset = early.empty_subset().with_partition_keys(
+        ["2023-01-08", "2023-01-09", "2023-01-10", "2023-01-11", "2023-02-01", "2023-02-02"]
+    )
+
+    result = IdentityPartitionMapping().get_upstream_mapped_partitions_result_for_partitions(
+        early_subset, early, late, current_time=current_time
+    )
+    assert result.partitions_subset.partitions_def == late
+    assert set(result.partitions_subset.get_partition_keys()) == {"2023-01-10", "2023-01-11"}
+    assert sorted(result.required_but_nonexistent_partition_keys) == [
+        "2023-01-08",
+        "2023-01-09",
+        "2023-02-01",
+        "2023-02-02",
+    ]
+
+    result = IdentityPartitionMapping().get_downstream_partitions_for_partitions(
+        early_subset, early, late, current_time=current_time
+    )
+    assert set(result.get_partition_keys()) == {"2023-01-10", "2023-01-11"}
+
+
 def test_partition_mapping_with_asset_deps():
     partitions_def = DailyPartitionsDefinition(start_date="2023-08-15")
 
@@ -951,6 +951,67 @@ def test_dynamic_dimension_multipartition_mapping():
     assert result.partitions_subset == foo_bar.empty_subset().with_partition_keys(["2|a", "1|a"])
 
 
+def test_multipartitions_mapping_subset_is_union_of_keys():
+    upstream_partitions_def = MultiPartitionsDefinition(
+        {
+            "daily": DailyPartitionsDefinition("2023-01-01"),
+            "abc": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    downstream_partitions_def = MultiPartitionsDefinition(
+        {
+            "daily": DailyPartitionsDefinition("2023-01-01"),
+            "xyz": StaticPartitionsDefinition(["x", "y", "z"]),
+        }
+    )
+    mapping = MultiPartitionMapping(
+        {
+            "daily": DimensionPartitionMapping(
+                dimension_name="daily",
+                partition_mapping=TimeWindowPartitionMapping(start_offset=-1, end_offset=0),
+            ),
+            "abc": DimensionPartitionMapping(
+                dimension_name="xyz",
+                partition_mapping=StaticPartitionMapping({"a": "x", "b": ["y", "z"]}),
+            ),
+        }
+    )
+    current_time = datetime(2023, 1, 20)
+    upstream_keys = [
+        key
+        for key in upstream_partitions_def.get_partition_keys(current_time=current_time)
+        if not key.startswith("2023-01-1")
+    ]
+
+    downstream_subset = mapping.get_downstream_partitions_for_partitions(
+        upstream_partitions_def.subset_with_partition_keys(upstream_keys),
+        upstream_partitions_def,
+        downstream_partitions_def,
+    )
+    assert set(downstream_subset.get_partition_keys()) == {
+        downstream_key
+        for upstream_key in upstream_keys
+        for downstream_key in mapping.get_downstream_partitions_for_partitions(
+            upstream_partitions_def.subset_with_partition_keys([upstream_key]),
+            upstream_partitions_def,
+            downstream_partitions_def,
+        ).get_partition_keys()
+    }
+
+    upstream_result = mapping.get_upstream_mapped_partitions_result_for_partitions(
+        downstream_subset, downstream_partitions_def, upstream_partitions_def
+    )
+    assert set(upstream_result.partitions_subset.get_partition_keys()) == {
+        upstream_key
+        for downstream_key in downstream_subset.get_partition_keys()
+        for upstream_key in mapping.get_upstream_mapped_partitions_result_for_partitions(
+            downstream_partitions_def.subset_with_partition_keys([downstream_key]),
+            downstream_partitions_def,
+            upstream_partitions_def,
+        ).partitions_subset.get_partition_keys()
+    }
+
+
 def test_description():
     description = MultiPartitionMapping(
         {
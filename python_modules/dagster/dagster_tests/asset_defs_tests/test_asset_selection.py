@@ -23,6 +23,7 @@
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.asset_graph import AssetGraph
 from dagster._core.definitions.asset_selection import (
+    MAX_RESOLVED_ASSET_SELECTIONS_PER_GRAPH,
     AllAssetCheckSelection,
     AllSelection,
     AndAssetSelection,
@@ -43,6 +44,7 @@
 from dagster._core.definitions.assets import AssetsDefinition
 from dagster._core.definitions.base_asset_graph import BaseAssetGraph
 from dagster._core.definitions.events import AssetKey
+from dagster._core.selector.subset_selector import fetch_connected
 from dagster._serdes import deserialize_value
 from dagster._serdes.serdes import _WHITELIST_MAP
 from pydantic import ValidationError
@@ -780,3 +782,58 @@ def assets(): ...
         AssetKey("asset5"),
         AssetKey("asset6"),
     }
+
+
+def test_reachable_asset_keys(all_assets: _AssetList):
+    asset_graph = AssetGraph.from_assets(all_assets)
+
+    assert asset_graph.get_reachable_asset_keys([danny.key], "downstream") == {
+        edgar.key,
+        fiona.key,
+        george.key,
+    }
+    assert asset_graph.get_reachable_asset_keys([earth.key], "downstream") == _asset_keys_of(
+        [alice, bob, candace, danny, edgar, fiona, george]
+    )
+    assert asset_graph.get_reachable_asset_keys([george.key], "upstream") == _asset_keys_of(
+        [earth, alice, bob, candace, danny, fiona]
+    )
+    assert asset_graph.get_reachable_asset_keys([zebra.key], "upstream") == set()
+    assert asset_graph.get_reachable_asset_keys([danny.key, zebra.key], "downstream") == {
+        edgar.key,
+        fiona.key,
+        george.key,
+    }
+
+    for asset_key in asset_graph.all_asset_keys:
+        assert asset_graph.get_reachable_asset_keys([asset_key], "upstream") == fetch_connected(
+            asset_key, asset_graph.asset_dep_graph, direction="upstream"
+        )
+        assert asset_graph.get_reachable_asset_keys([asset_key], "downstream") == fetch_connected(
+            asset_key, asset_graph.asset_dep_graph, direction="downstream"
+        )
+
+
+def test_resolution_cached_per_graph(all_assets: _AssetList):
+    asset_graph = AssetGraph.from_assets(all_assets)
+    selection = AssetSelection.groups("ladies").downstream() - AssetSelection.keys("george")
+
+    resolved = selection.resolve(asset_graph)
+    assert resolved == _asset_keys_of([alice, bob, candace, danny, edgar, fiona])
+    # an equal selection built separately reuses the resolved keys
+    equal_selection = AssetSelection.groups("ladies").downstream() - AssetSelection.keys("george")
+    assert equal_selection.resolve(asset_graph) is resolved
+    assert selection.resolve(asset_graph, allow_missing=True) is not resolved
+
+    # cached results are shared, so they can't be modified
+    assert isinstance(resolved, frozenset)
+
+    other_graph = AssetGraph.from_assets([earth, alice, bob])
+    assert selection.resolve(other_graph, allow_missing=True) == {alice.key, bob.key}
+
+
+def test_resolution_cache_bounded(all_assets: _AssetList):
+    asset_graph = AssetGraph.from_assets(all_assets)
+    for i in range(MAX_RESOLVED_ASSET_SELECTIONS_PER_GRAPH + 10):
+        AssetSelection.keys(f"asset_{i}").resolve(asset_graph, allow_missing=True)
+    assert len(asset_graph.resolved_asset_selections) == MAX_RESOLVED_ASSET_SELECTIONS_PER_GRAPH
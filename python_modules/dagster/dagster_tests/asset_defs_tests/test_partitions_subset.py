@@ -1,9 +1,24 @@
+import json
 from typing import cast
 from unittest.mock import Mock
 
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster import (
+    DailyPartitionsDefinition,
+    DynamicPartitionsDefinition,
+    MultiPartitionsDefinition,
+    PartitionKeyRange,
+    StaticPartitionsDefinition,
+)
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    DefaultPartitionsSubset,
+    SerializedPartitionsSubset,
+)
+from dagster._core.definitions.partition_bitmap import (
+    BitmapPartitionsSubset,
+    get_partition_keys_index,
+)
 from dagster._core.definitions.time_window_partitions import (
     PartitionKeysTimeWindowPartitionsSubset,
     PersistedTimeWindow,
@@ -11,7 +26,7 @@
     TimeWindowPartitionsSubset,
 )
 from dagster._core.errors import DagsterInvalidDeserializationVersionError
-from dagster._core.test_utils import freeze_time
+from dagster._core.test_utils import freeze_time, instance_for_test
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime, get_current_datetime
 
@@ -83,7 +98,7 @@ def test_get_subset_type():
 
 
 def test_empty_subsets():
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(static_partitions.empty_subset()) is BitmapPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is PartitionKeysTimeWindowPartitionsSubset
 
 
@@ -213,3 +228,160 @@ def test_partitions_set_short_circuiting() -> None:
 
     # Test short-circuiting of -. Returns an empty DefaultPartitionsSubset
     assert (default_ps - all_ps) == DefaultPartitionsSubset.empty_subset()
+
+
+def test_bitmap_partitions_subset_set_operations() -> None:
+    static_partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d", "e"])
+    empty = BitmapPartitionsSubset.from_partitions_def(static_partitions_def)
+    abc = empty.with_partition_keys(["c", "a", "b"])
+    bcd = empty.with_partition_keys(["b", "c", "d"])
+
+    assert isinstance(abc, BitmapPartitionsSubset)
+    assert abc.get_partition_keys() == {"a", "b", "c"}
+    assert len(abc) == 3
+    assert "a" in abc and "d" not in abc and "z" not in abc
+
+    assert abc | bcd == empty.with_partition_keys(["a", "b", "c", "d"])
+    assert abc & bcd == empty.with_partition_keys(["b", "c"])
+    assert abc - bcd == empty.with_partition_keys(["a"])
+    assert (abc - abc).is_empty
+
+    # falls back to key-based operations for other subset types
+    assert set((abc | DefaultPartitionsSubset({"e"})).get_partition_keys()) == {"a", "b", "c", "e"}
+    assert set((abc - DefaultPartitionsSubset({"a"})).get_partition_keys()) == {"b", "c"}
+
+    # keys outside of the indexed keys degrade to a DefaultPartitionsSubset
+    assert abc.with_partition_keys(["z"]) == DefaultPartitionsSubset({"a", "b", "c", "z"})
+
+
+def test_bitmap_partitions_subset_ranges() -> None:
+    static_partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d", "e", "f"])
+    subset = BitmapPartitionsSubset.from_partitions_def(static_partitions_def).with_partition_keys(
+        ["a", "b", "d", "f"]
+    )
+
+    assert subset.get_partition_key_ranges(static_partitions_def) == [
+        PartitionKeyRange("a", "b"),
+        PartitionKeyRange("d", "d"),
+        PartitionKeyRange("f", "f"),
+    ]
+    assert list(subset.get_partition_keys_not_in_subset(static_partitions_def)) == ["c", "e"]
+    assert DefaultPartitionsSubset({"a", "b", "d", "f"}).get_partition_key_ranges(
+        static_partitions_def
+    ) == subset.get_partition_key_ranges(static_partitions_def)
+    assert DefaultPartitionsSubset({"a", "b", "d", "f"}).get_partition_keys_not_in_subset(
+        static_partitions_def
+    ) == {"c", "e"}
+
+
+def test_bitmap_partitions_subset_dynamic_partitions() -> None:
+    dynamic_partitions_def = DynamicPartitionsDefinition(name="fruits")
+    with instance_for_test() as instance:
+        instance.add_dynamic_partitions("fruits", ["apple", "banana", "cherry"])
+        subset = BitmapPartitionsSubset.from_partitions_def(
+            dynamic_partitions_def, dynamic_partitions_store=instance
+        ).with_partition_keys(["apple", "banana"])
+
+        instance.add_dynamic_partitions("fruits", ["durian"])
+        instance.delete_dynamic_partition("fruits", "apple")
+
+        # the subset is rebased onto the current keys of the definition
+        assert subset.get_partition_key_ranges(
+            dynamic_partitions_def, dynamic_partitions_store=instance
+        ) == [PartitionKeyRange("banana", "banana")]
+        assert list(
+            subset.get_partition_keys_not_in_subset(
+                dynamic_partitions_def, dynamic_partitions_store=instance
+            )
+        ) == ["cherry", "durian"]
+
+
+def test_bitmap_partitions_subset_serialization() -> None:
+    partition_keys = [f"key_{i}" for i in range(10_000)]
+    static_partitions_def = StaticPartitionsDefinition(partition_keys)
+    subset = BitmapPartitionsSubset.from_partitions_def(static_partitions_def).with_partition_keys(
+        partition_keys[100:9_000]
+    )
+
+    serialized = subset.serialize()
+    assert (
+        len(serialized)
+        < len(DefaultPartitionsSubset(set(partition_keys[100:9_000])).serialize()) / 100
+    )
+    assert BitmapPartitionsSubset.can_deserialize(
+        static_partitions_def, serialized, None, StaticPartitionsDefinition.__name__
+    )
+    assert BitmapPartitionsSubset.from_serialized(static_partitions_def, serialized) == subset
+
+    # default serialized subsets can be read as bitmaps
+    default_serialized = subset.to_serializable_subset().serialize()
+    assert static_partitions_def.deserialize_subset(default_serialized) == DefaultPartitionsSubset(
+        set(partition_keys[100:9_000])
+    )
+    assert (
+        BitmapPartitionsSubset.from_serialized(static_partitions_def, default_serialized) == subset
+    )
+
+    # bitmaps cannot be read once the keys of the partitions definition changed
+    changed_partitions_def = StaticPartitionsDefinition([*partition_keys, "new_key"])
+    assert not BitmapPartitionsSubset.can_deserialize(
+        changed_partitions_def, serialized, None, StaticPartitionsDefinition.__name__
+    )
+
+
+def test_static_partitions_subsets_are_bitmaps() -> None:
+    static_partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+    subset = static_partitions_def.subset_with_partition_keys(["a", "c"])
+    assert isinstance(subset, BitmapPartitionsSubset)
+    assert subset == DefaultPartitionsSubset({"a", "c"})
+    assert DefaultPartitionsSubset({"a", "c"}) == subset
+    assert subset - DefaultPartitionsSubset(
+        {"a"}
+    ) == static_partitions_def.subset_with_partition_keys(["c"])
+    assert subset & DefaultPartitionsSubset({"c", "d"}) == DefaultPartitionsSubset({"c"})
+
+    # persisted in the default format, which readers of older versions understand
+    serialized = SerializedPartitionsSubset.from_subset(
+        subset, static_partitions_def, Mock()
+    ).serialized_subset
+    data = json.loads(serialized)
+    assert data["version"] == 1
+    assert sorted(data["subset"]) == ["a", "c"]
+    assert static_partitions_def.deserialize_subset(serialized) == subset
+
+
+def test_partition_keys_index_cached_by_partitions_def() -> None:
+    static_partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+    index = get_partition_keys_index(
+        static_partitions_def, static_partitions_def.get_partition_keys()
+    )
+    assert (
+        get_partition_keys_index(static_partitions_def, static_partitions_def.get_partition_keys())
+        is index
+    )
+    # an equal definition has its own index
+    assert (
+        get_partition_keys_index(
+            StaticPartitionsDefinition(["a", "b", "c"]), static_partitions_def.get_partition_keys()
+        )
+        is not index
+    )
+
+    # definitions that return a new sequence on every call reuse the index while keys are unchanged
+    daily_partitions_def = DailyPartitionsDefinition(start_date="2023-01-01")
+    current_time = create_datetime(2023, 2, 1)
+    daily_index = get_partition_keys_index(
+        daily_partitions_def, daily_partitions_def.get_partition_keys(current_time)
+    )
+    assert (
+        get_partition_keys_index(
+            daily_partitions_def, daily_partitions_def.get_partition_keys(current_time)
+        )
+        is daily_index
+    )
+    later_index = get_partition_keys_index(
+        daily_partitions_def,
+        daily_partitions_def.get_partition_keys(create_datetime(2023, 2, 2)),
+    )
+    assert later_index is not daily_index
+    assert len(later_index) == len(daily_index) + 1
@@ -0,0 +1,206 @@
+import threading
+import time
+from unittest.mock import patch
+
+from dagster import AssetKey, AssetMaterialization, Output, job, op
+from dagster._core.events import (
+    DagsterEvent,
+    DagsterEventType,
+    StepMaterializationData,
+    StepSuccessData,
+)
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance.event_buffer import StepEventWriteBuffer, is_bufferable_step_event
+from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+from dagster._core.test_utils import environ, instance_for_test
+
+_EVENT_SPECIFIC_DATA = {
+    DagsterEventType.ASSET_MATERIALIZATION: StepMaterializationData(
+        AssetMaterialization(asset_key="foo")
+    ),
+    DagsterEventType.STEP_SUCCESS: StepSuccessData(duration_ms=1.0),
+}
+
+
+def _log_event(run_id: str, message: str, step_key=None) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="INFO",
+        user_message=message,
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key=step_key,
+    )
+
+
+def _dagster_event(run_id: str, event_type: DagsterEventType, step_key="foo") -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="DEBUG",
+        user_message="",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key=step_key,
+        dagster_event=DagsterEvent(
+            event_type.value,
+            "nonce",
+            step_key=step_key,
+            event_specific_data=_EVENT_SPECIFIC_DATA.get(event_type),
+        ),
+    )
+
+
+def test_is_bufferable_step_event():
+    assert is_bufferable_step_event(_log_event("a", "hi", step_key="foo"))
+    assert not is_bufferable_step_event(_log_event("a", "hi"))
+    assert is_bufferable_step_event(_dagster_event("a", DagsterEventType.ASSET_MATERIALIZATION))
+    assert not is_bufferable_step_event(_dagster_event("a", DagsterEventType.STEP_SUCCESS))
+    assert not is_bufferable_step_event(
+        _dagster_event("a", DagsterEventType.RUN_SUCCESS, step_key=None)
+    )
+
+
+def test_flush_on_size():
+    batches = []
+    buffer = StepEventWriteBuffer(batches.append, max_size=3, flush_interval=60)
+
+    for i in range(7):
+        buffer.handle_event(_log_event("a", str(i), step_key="foo"))
+
+    assert [[e.user_message for e in batch] for batch in batches] == [
+        ["0", "1", "2"],
+        ["3", "4", "5"],
+    ]
+
+    buffer.shutdown()
+    assert [e.user_message for e in batches[-1]] == ["6"]
+
+
+def test_flush_on_boundary_preserves_order():
+    batches = []
+    buffer = StepEventWriteBuffer(batches.append, max_size=100, flush_interval=60)
+
+    buffer.handle_event(_log_event("a", "a0", step_key="foo"))
+    buffer.handle_event(_log_event("b", "b0", step_key="foo"))
+    buffer.handle_event(_log_event("a", "a1", step_key="foo"))
+    buffer.handle_event(_dagster_event("a", DagsterEventType.STEP_SUCCESS))
+
+    # only the run with a step boundary is flushed, before the boundary event is written
+    assert [[e.user_message or e.dagster_event_type for e in batch] for batch in batches] == [
+        ["a0", "a1"],
+        [DagsterEventType.STEP_SUCCESS],
+    ]
+
+    buffer.handle_event(_log_event("b", "outside of step"))
+    assert [e.user_message for e in batches[-2]] == ["b0"]
+    assert [e.user_message for e in batches[-1]] == ["outside of step"]
+
+    buffer.shutdown()
+
+
+def test_flush_on_interval():
+    batches = []
+    buffer = StepEventWriteBuffer(batches.append, max_size=100, flush_interval=0.1)
+
+    buffer.handle_event(_log_event("a", "quiet", step_key="foo"))
+    assert not batches
+
+    start = time.time()
+    while not batches:
+        assert time.time() - start < 5
+        time.sleep(0.05)
+
+    assert [e.user_message for e in batches[0]] == ["quiet"]
+    buffer.shutdown()
+
+
+@op
+def chatty_op(context):
+    for i in range(10):
+        context.log.info(f"log {i}")
+    yield AssetMaterialization(asset_key="chatty")
+    yield Output(1)
+
+
+@job
+def chatty_job():
+    chatty_op()
+
+
+def test_instance_buffers_step_events():
+    with environ({"DAGSTER_EVENT_BATCH_SIZE": "100", "DAGSTER_BUFFER_STEP_EVENTS": "1"}):
+        with instance_for_test() as instance:
+            with patch.object(
+                SqlEventLogStorage,
+                "store_event_batch",
+                autospec=True,
+                side_effect=SqlEventLogStorage.store_event_batch,
+            ) as store_event_batch:
+                result = chatty_job.execute_in_process(instance=instance)
+                assert result.success
+                assert store_event_batch.call_count >= 1
+
+            logs = instance.all_logs(result.run_id)
+            messages = [log.user_message for log in logs if log.user_message.startswith("log ")]
+            assert messages == [f"log {i}" for i in range(10)]
+            assert instance.get_latest_materialization_event(AssetKey("chatty"))
+
+
+@op
+def read_own_materialization_op(context):
+    context.log_event(AssetMaterialization(asset_key="own"))
+    # the materialization is still buffered, but reads through the instance flush it first
+    assert context.instance.get_latest_materialization_event(AssetKey("own"))
+    yield Output(1)
+
+
+@job
+def read_own_materialization_job():
+    read_own_materialization_op()
+
+
+def test_instance_flushes_step_events_before_reads():
+    with environ(
+        {
+            "DAGSTER_EVENT_BATCH_SIZE": "100",
+            "DAGSTER_BUFFER_STEP_EVENTS": "1",
+            "DAGSTER_EVENT_BATCH_FLUSH_INTERVAL": "60",
+        }
+    ):
+        with instance_for_test() as instance:
+            result = read_own_materialization_job.execute_in_process(instance=instance)
+            assert result.success
+
+
+def test_instance_notifies_subscribers_synchronously():
+    with environ(
+        {
+            "DAGSTER_EVENT_BATCH_SIZE": "100",
+            "DAGSTER_BUFFER_STEP_EVENTS": "1",
+            "DAGSTER_EVENT_BATCH_FLUSH_INTERVAL": "60",
+        }
+    ):
+        with instance_for_test() as instance:
+            notified = []
+            instance.add_event_listener(
+                "a", lambda event: notified.append((event.user_message, threading.get_ident()))
+            )
+            with patch.object(
+                SqlEventLogStorage,
+                "store_event_batch",
+                autospec=True,
+                side_effect=SqlEventLogStorage.store_event_batch,
+            ) as store_event_batch:
+                instance.handle_new_event(_log_event("a", "buffered", step_key="foo"))
+                # notified on this thread before the buffered event is written
+                assert notified == [("buffered", threading.get_ident())]
+                assert store_event_batch.call_count == 0
+
+                instance.handle_new_event(_log_event("a", "also buffered", step_key="foo"))
+                assert [message for message, _ in notified] == ["buffered", "also buffered"]
+
+                assert [log.user_message for log in instance.all_logs("a")] == [
+                    "buffered",
+                    "also buffered",
+                ]
+                assert store_event_batch.call_count == 1
@@ -88,10 +88,20 @@
     wait_for_futures,
 )
 from dagster._core.workspace.context import WorkspaceProcessContext
-from dagster._daemon import get_default_daemon_logger
-from dagster._daemon.daemon import SpanMarker
-from dagster._daemon.sensor import execute_sensor_iteration, execute_sensor_iteration_loop
+from dagster._daemon import (
+    daemon as daemon_module,
+    get_default_daemon_logger,
+)
+from dagster._daemon.daemon import SensorDaemon, SpanMarker
+from dagster._daemon.sensor import (
+    SensorShard,
+    execute_sensor_iteration,
+    execute_sensor_iteration_loop,
+    get_sensor_shard_index,
+)
+from dagster._serdes.config_class import ConfigurableClassData
 from dagster._time import create_datetime, get_current_datetime
+from dagster._utils.error import SerializableErrorInfo
 from dagster._vendored.dateutil.relativedelta import relativedelta
 
 from .conftest import create_workspace_load_target
@@ -999,7 +1009,13 @@ def asset_sensor_repo():
 FUTURES_TIMEOUT = 75
 
 
-def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=FUTURES_TIMEOUT):
+def evaluate_sensors(
+    workspace_context,
+    executor,
+    submit_executor=None,
+    timeout=FUTURES_TIMEOUT,
+    sensor_shard=None,
+):
     logger = get_default_daemon_logger("SensorDaemon")
     futures = {}
     list(
@@ -1009,6 +1025,7 @@ def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=
             threadpool_executor=executor,
             sensor_tick_futures=futures,
             submit_threadpool_executor=submit_executor,
+            sensor_shard=sensor_shard,
         )
     )
 
@@ -1171,6 +1188,102 @@ def test_simple_sensor(instance, workspace_context, external_repo, executor):
         )
 
 
+def test_sensor_shards(
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+    external_repo: ExternalRepository,
+    executor: ThreadPoolExecutor,
+):
+    freeze_datetime = create_datetime(year=2019, month=2, day=27, hour=23, minute=59, second=59)
+    sensor_names = [
+        "simple_sensor",
+        "always_on_sensor",
+        "run_key_sensor",
+        "custom_interval_sensor",
+        "skip_cursor_sensor",
+        "start_skip_sensor",
+    ]
+    external_sensors = [external_repo.get_external_sensor(name) for name in sensor_names]
+    shards = [SensorShard(index, 2) for index in range(2)]
+    # both shards have sensors to evaluate
+    assert all(
+        any(shard.contains(external_sensor.selector_id) for external_sensor in external_sensors)
+        for shard in shards
+    )
+
+    with freeze_time(freeze_datetime):
+        for external_sensor in external_sensors:
+            instance.add_instigator_state(
+                InstigatorState(
+                    external_sensor.get_external_origin(),
+                    InstigatorType.SENSOR,
+                    InstigatorStatus.RUNNING,
+                )
+            )
+
+        evaluated_sensor_names = set()
+        for shard in shards:
+            evaluate_sensors(workspace_context, executor, sensor_shard=shard)
+
+            for external_sensor in external_sensors:
+                ticks = instance.get_ticks(
+                    external_sensor.get_external_origin_id(), external_sensor.selector_id
+                )
+                if shard.contains(external_sensor.selector_id):
+                    assert len(ticks) == 1
+                    assert external_sensor.name not in evaluated_sensor_names
+                    evaluated_sensor_names.add(external_sensor.name)
+                elif external_sensor.name not in evaluated_sensor_names:
+                    assert len(ticks) == 0
+
+        assert evaluated_sensor_names == set(sensor_names)
+
+
+def test_sensor_shard_index():
+    selector_ids = [f"selector_{i}" for i in range(100)]
+    indices = [get_sensor_shard_index(selector_id, 4) for selector_id in selector_ids]
+    assert set(indices) == {0, 1, 2, 3}
+    # shards are assigned by a stable hash, so that every process agrees on them
+    assert indices == [get_sensor_shard_index(selector_id, 4) for selector_id in selector_ids]
+    assert all(
+        SensorShard(index, 4).contains(selector_id)
+        for selector_id, index in zip(selector_ids, indices)
+    )
+
+
+def test_sensor_worker_process_setup_error(
+    monkeypatch,
+    instance: DagsterInstance,
+    workspace_context: WorkspaceProcessContext,
+):
+    monkeypatch.setattr(daemon_module, "SENSOR_WORKER_PROCESS_CHECK_INTERVAL_SECONDS", 0.1)
+    monkeypatch.setattr(daemon_module, "SENSOR_WORKER_PROCESS_RESTART_BACKOFF_SECONDS", 0.5)
+    # the worker processes fail to load their instance
+    broken_instance_ref = instance.get_ref()._replace(
+        storage_data=ConfigurableClassData("dagster_tests_missing_module", "Storage", "{}")
+    )
+    monkeypatch.setattr(instance, "get_ref", lambda: broken_instance_ref)
+
+    shutdown_event = threading.Event()
+    results = []
+    with SensorDaemon({"num_worker_processes": 1}) as daemon:
+        daemon_loop = daemon.core_loop(workspace_context, shutdown_event)
+        start_time = time.time()
+        # the worker is restarted after it fails, and fails again
+        while len([result for result in results if result is not None]) < 3:
+            assert time.time() - start_time < 120
+            results.append(next(daemon_loop))
+        shutdown_event.set()
+        list(daemon_loop)
+
+    errors = [result for result in results if result is not None]
+    assert all(isinstance(error, SerializableErrorInfo) for error in errors)
+    assert all("dagster_tests_missing_module" in error.to_string() for error in errors)
+    # once the worker has failed, the daemon stops heartbeating until it makes progress again
+    error_indices = [i for i, result in enumerate(results) if result is not None]
+    assert None not in results[error_indices[1] :]
+
+
 def test_sensors_keyed_on_selector_not_origin(
     instance: DagsterInstance,
     workspace_context: WorkspaceProcessContext,
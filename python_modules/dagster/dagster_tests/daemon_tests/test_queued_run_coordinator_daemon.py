@@ -1,4 +1,5 @@
 import datetime
+import random
 import time
 from abc import ABC, abstractmethod
 from typing import Iterator
@@ -22,6 +23,7 @@
 from dagster._core.utils import make_new_run_id
 from dagster._core.workspace.load_target import EmptyWorkspaceTarget, PythonFileTarget
 from dagster._daemon.run_coordinator.queued_run_coordinator_daemon import QueuedRunCoordinatorDaemon
+from dagster._daemon.run_coordinator.queued_run_queue import QueuedRunQueue
 from dagster._time import create_datetime
 from dagster._utils import file_relative_path
 
@@ -295,6 +297,105 @@ def test_priority_on_malformed_tag(self, instance, workspace_context, job_handle
 
         assert self.get_run_ids(instance.run_launcher.queue()) == [bad_pri_run_id]
 
+    @pytest.mark.parametrize(
+        "run_coordinator_config",
+        [
+            dict(
+                max_concurrent_runs=10,
+                tag_concurrency_limits=[{"key": "database", "value": "tiny", "limit": 1}],
+            ),
+        ],
+    )
+    def test_queue_changes_between_iterations(
+        self, instance, workspace_context, job_handle, daemon
+    ):
+        run_ids = [make_new_run_id() for _ in range(7)]
+        self.create_queued_run(instance, job_handle, run_id=run_ids[0], tags={"database": "tiny"})
+        self.create_queued_run(instance, job_handle, run_id=run_ids[1], tags={"database": "tiny"})
+
+        list(daemon.run_iteration(workspace_context))
+        assert set(self.get_run_ids(instance.run_launcher.queue())) == {run_ids[0]}
+
+        # runs that are queued or cancelled after the previous iteration are picked up
+        self.create_queued_run(instance, job_handle, run_id=run_ids[2])
+        self.create_queued_run(instance, job_handle, run_id=run_ids[3])
+        self.create_run(instance, job_handle, run_id=run_ids[4], status=DagsterRunStatus.QUEUED)
+        instance.report_run_canceled(instance.get_run_by_id(run_ids[2]))
+
+        list(daemon.run_iteration(workspace_context))
+        assert set(self.get_run_ids(instance.run_launcher.queue())) == {
+            run_ids[0],
+            run_ids[3],
+            run_ids[4],
+        }
+
+        # a deleted run does not take the tag concurrency slot freed up by the finished run
+        instance.delete_run(run_ids[1])
+        self.create_queued_run(instance, job_handle, run_id=run_ids[5], tags={"database": "tiny"})
+        self.create_queued_run(instance, job_handle, run_id=run_ids[6], tags={"database": "tiny"})
+        instance.report_run_failed(instance.get_run_by_id(run_ids[0]))
+
+        list(daemon.run_iteration(workspace_context))
+        assert set(self.get_run_ids(instance.run_launcher.queue())) == {
+            run_ids[0],
+            run_ids[3],
+            run_ids[4],
+            run_ids[5],
+        }
+
+    def test_incremental_queue_matches_full_refresh(self, instance, job_handle, page_size):
+        tag_concurrency_limits = [{"key": "database", "value": "tiny", "limit": 1}]
+        now = time.time()
+        queue = QueuedRunQueue(
+            page_size=page_size, full_refresh_interval_seconds=3600, update_overlap_seconds=10
+        )
+        queue.refresh(instance, tag_concurrency_limits, now)
+
+        rng = random.Random(12345)
+        queued_run_ids = []
+        for _ in range(8):
+            for _ in range(rng.randint(0, 4)):
+                tags = {PRIORITY_TAG: str(rng.randint(-2, 2))}
+                if rng.random() < 0.5:
+                    tags["database"] = "tiny"
+                run = self.create_queued_run(instance, job_handle, tags=tags)
+                queued_run_ids.append(run.run_id)
+
+            for run_id in rng.sample(queued_run_ids, k=min(len(queued_run_ids), 3)):
+                action = rng.choice(["cancel", "fail", "reprioritize", "retag"])
+                if action == "cancel":
+                    instance.report_run_canceled(instance.get_run_by_id(run_id))
+                    queued_run_ids.remove(run_id)
+                elif action == "fail":
+                    instance.report_run_failed(instance.get_run_by_id(run_id))
+                    queued_run_ids.remove(run_id)
+                elif action == "reprioritize":
+                    instance.add_run_tags(run_id, {PRIORITY_TAG: str(rng.randint(-2, 2))})
+                else:
+                    instance.add_run_tags(run_id, {"database": "tiny"})
+
+            # the incrementally refreshed queue holds the same runs, in the same groups and order,
+            # as a queue that is rebuilt from scratch
+            queue.refresh(instance, tag_concurrency_limits, now)
+            full_queue = QueuedRunQueue(
+                page_size=page_size, full_refresh_interval_seconds=3600, update_overlap_seconds=10
+            )
+            full_queue.refresh(instance, tag_concurrency_limits, now)
+
+            assert [entry.run.run_id for entry in queue.iter_by_priority(set())] == [
+                entry.run.run_id for entry in full_queue.iter_by_priority(set())
+            ]
+            assert {
+                entry.run.run_id: (entry.sort_key, entry.group_key)
+                for entry in queue.iter_by_priority(set())
+            } == {
+                entry.run.run_id: (entry.sort_key, entry.group_key)
+                for entry in full_queue.iter_by_priority(set())
+            }
+            assert set(queued_run_ids) == {
+                entry.run.run_id for entry in queue.iter_by_priority(set())
+            }
+
     @pytest.mark.parametrize(
         "run_coordinator_config",
         [
@@ -0,0 +1,100 @@
+from collections import Counter
+from typing import Hashable, Optional
+
+from dagster import (
+    AssetSelection,
+    AssetSpec,
+    AutomationCondition,
+    DagsterInstance,
+    Definitions,
+    multi_asset,
+)
+from dagster._core.definitions.asset_key import AssetKey
+from dagster._core.definitions.declarative_automation import automation_condition_evaluator
+from dagster._core.definitions.declarative_automation.automation_condition import AutomationResult
+from dagster._core.definitions.declarative_automation.automation_condition_tester import (
+    evaluate_automation_conditions,
+)
+from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
+
+
+def get_counting_condition(cacheable: bool):
+    evaluation_counts = Counter()
+
+    class CountingCondition(AutomationCondition):
+        @property
+        def description(self) -> str:
+            return "..."
+
+        def get_context_key(
+            self, context: AutomationContext, asset_key: AssetKey
+        ) -> Optional[Hashable]:
+            return () if cacheable else None
+
+        def evaluate(self, context: AutomationContext) -> AutomationResult:
+            evaluation_counts[context.asset_key] += 1
+            return AutomationResult.create(context, true_slice=context.candidate_slice)
+
+    return CountingCondition(), evaluation_counts
+
+
+def _get_defs(condition: AutomationCondition) -> Definitions:
+    policy = AutomationCondition.any_deps_match(condition).as_auto_materialize_policy()
+
+    @multi_asset(
+        specs=[
+            AssetSpec("A"),
+            *(AssetSpec(key, deps=["A"], auto_materialize_policy=policy) for key in "BCD"),
+        ],
+        can_subset=True,
+    )
+    def assets(): ...
+
+    return Definitions(assets=[assets])
+
+
+def _assert_unique_ids(result: AutomationResult) -> None:
+    for i, child_result in enumerate(result.child_results):
+        assert child_result.condition_unique_id == child_result.condition.get_unique_id(
+            parent_unique_id=result.condition_unique_id, index=i
+        )
+        _assert_unique_ids(child_result)
+
+
+def test_shared_dep_condition_evaluated_once(monkeypatch) -> None:
+    condition, evaluation_counts = get_counting_condition(cacheable=True)
+    results = []
+    evaluate = automation_condition_evaluator.AutomationConditionEvaluator.evaluate
+
+    def _evaluate(self):
+        results_and_requested = evaluate(self)
+        results.extend(results_and_requested[0])
+        return results_and_requested
+
+    monkeypatch.setattr(
+        automation_condition_evaluator.AutomationConditionEvaluator, "evaluate", _evaluate
+    )
+    result = evaluate_automation_conditions(
+        _get_defs(condition),
+        DagsterInstance.ephemeral(),
+        asset_selection=AssetSelection.keys("B", "C", "D"),
+    )
+
+    # the condition is evaluated against A once, and the result is reused for each child of A
+    assert evaluation_counts == {AssetKey("A"): 1}
+    assert result.total_requested == 3
+    assert len(results) == 3
+    for asset_result in results:
+        _assert_unique_ids(asset_result)
+
+
+def test_uncacheable_dep_condition_evaluated_per_child() -> None:
+    condition, evaluation_counts = get_counting_condition(cacheable=False)
+    result = evaluate_automation_conditions(
+        _get_defs(condition),
+        DagsterInstance.ephemeral(),
+        asset_selection=AssetSelection.keys("B", "C", "D"),
+    )
+
+    assert evaluation_counts == {AssetKey("A"): 3}
+    assert result.total_requested == 3
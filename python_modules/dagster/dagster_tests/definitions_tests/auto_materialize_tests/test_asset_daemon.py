@@ -204,6 +204,18 @@ def test_asset_daemon_with_threadpool_without_sensor(scenario: AssetDaemonScenar
             scenario.evaluate_daemon(instance, threadpool_executor=threadpool_executor)
 
 
+@pytest.mark.parametrize(
+    "scenario", basic_scenarios, ids=[scenario.id for scenario in basic_scenarios]
+)
+def test_asset_daemon_with_evaluation_workers_without_sensor(
+    scenario: AssetDaemonScenario,
+) -> None:
+    with get_daemon_instance(
+        extra_overrides={"auto_materialize": {"num_evaluation_workers": 4}}
+    ) as instance:
+        scenario.evaluate_daemon(instance)
+
+
 @pytest.mark.parametrize(
     "scenario",
     auto_materialize_sensor_scenarios,
@@ -1,3 +1,5 @@
+import json
+import time
 from datetime import datetime
 
 import pytest
@@ -18,11 +20,19 @@
 )
 from dagster._check import CheckError
 from dagster._core.definitions.asset_graph import AssetGraph
-from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
+from dagster._core.definitions.multi_dimensional_partitions import (
+    MultiPartitionsDefinition,
+    MultiPartitionsSubset,
+)
+from dagster._core.definitions.partition import DefaultPartitionsSubset
 from dagster._core.definitions.time_window_partitions import TimeWindow, get_time_partitions_def
 from dagster._core.errors import DagsterInvalidDefinitionError, DagsterInvariantViolationError
+from dagster._core.storage.partition_status_cache import (
+    _deserialize_cache_subset,
+    _serialize_cache_subset,
+)
 from dagster._core.storage.tags import get_multidimensional_partition_tag
-from dagster._core.test_utils import instance_for_test
+from dagster._core.test_utils import environ, instance_for_test
 from dagster._time import create_datetime
 
 DATE_FORMAT = "%Y-%m-%d"
@@ -278,6 +288,139 @@ def test_multipartitions_subset_addition(initial, added):
     ) == set(expected_keys_not_in_updated_subset)
 
 
+def test_multipartitions_subset_by_primary_dimension():
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01"),
+            "static": StaticPartitionsDefinition(["a", "b", "c"]),
+        }
+    )
+    keys_a = {f"2015-01-{day:02d}|a" for day in range(1, 31)}
+    keys_b = {"2015-01-01|b", "2015-01-03|b"}
+
+    subset = MultiPartitionsSubset(multipartitions_def).with_partition_keys(keys_a | keys_b)
+    assert set(subset.get_partition_keys()) == keys_a | keys_b
+    assert len(subset) == len(keys_a | keys_b)
+    assert "2015-01-05|a" in subset
+    assert MultiPartitionKey({"date": "2015-01-03", "static": "b"}) in subset
+    assert "2015-01-02|b" not in subset
+    assert "2015-01-01|c" not in subset
+    assert set(subset.subsets_by_secondary_key.keys()) == {"a", "b"}
+
+    other = MultiPartitionsSubset(multipartitions_def).with_partition_keys(
+        {"2015-01-01|a", "2015-01-01|b", "2015-01-01|c"}
+    )
+    assert set((subset | other).get_partition_keys()) == keys_a | keys_b | {"2015-01-01|c"}
+    assert set((subset - other).get_partition_keys()) == (keys_a | keys_b) - {
+        "2015-01-01|a",
+        "2015-01-01|b",
+    }
+    assert set((subset & other).get_partition_keys()) == {"2015-01-01|a", "2015-01-01|b"}
+    assert (subset - subset).is_empty
+
+    serialized = subset.serialize()
+    # contiguous runs of the time dimension are stored as a single time window
+    assert len(serialized) < len(DefaultPartitionsSubset(keys_a | keys_b).serialize())
+    assert MultiPartitionsSubset.can_deserialize(multipartitions_def, serialized, None, None)
+    assert MultiPartitionsSubset.from_serialized(multipartitions_def, serialized) == subset
+    assert MultiPartitionsSubset.is_serialized_by_primary_dimension(json.loads(serialized))
+
+    # subsets in the default format can be read as well
+    default_serialized = DefaultPartitionsSubset(keys_a | keys_b).serialize()
+    assert MultiPartitionsSubset.can_deserialize(
+        multipartitions_def, default_serialized, None, None
+    )
+    assert not MultiPartitionsSubset.is_serialized_by_primary_dimension(
+        json.loads(default_serialized)
+    )
+    assert MultiPartitionsSubset.from_serialized(multipartitions_def, default_serialized) == subset
+    assert subset.to_serializable_subset() == DefaultPartitionsSubset(keys_a | keys_b)
+
+
+def test_multipartitions_status_cache_subset_serialization():
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01"),
+            "static": StaticPartitionsDefinition(["a", "b"]),
+        }
+    )
+    keys = {f"2015-01-{day:02d}|a" for day in range(1, 31)} | {"2015-01-01|b"}
+    subset = MultiPartitionsSubset(multipartitions_def).with_partition_keys(keys)
+
+    # by default, cached subsets are written in the format that readers of older versions expect
+    serialized = _serialize_cache_subset(multipartitions_def, subset)
+    assert set(json.loads(serialized)["subset"]) == keys
+    assert DefaultPartitionsSubset.from_serialized(multipartitions_def, serialized) == (
+        DefaultPartitionsSubset(keys)
+    )
+    assert _deserialize_cache_subset(multipartitions_def, serialized) == DefaultPartitionsSubset(
+        keys
+    )
+
+    with environ({"DAGSTER_COMPACT_MULTI_PARTITIONS_STATUS_CACHE": "1"}):
+        compact_serialized = _serialize_cache_subset(multipartitions_def, subset)
+        assert "subset" not in json.loads(compact_serialized)
+        assert len(compact_serialized) < len(serialized)
+        assert _deserialize_cache_subset(multipartitions_def, compact_serialized) == subset
+        assert _deserialize_cache_subset(multipartitions_def, serialized) == subset
+
+    # subsets written in the compact format are still read once the flag is unset
+    assert _deserialize_cache_subset(
+        multipartitions_def, compact_serialized
+    ) == DefaultPartitionsSubset(keys)
+
+    # the format is told apart by the keys of the subset, not by how its JSON is laid out
+    reformatted = json.dumps(json.loads(compact_serialized), separators=(",", ":"), sort_keys=True)
+    assert _deserialize_cache_subset(multipartitions_def, reformatted) == DefaultPartitionsSubset(
+        keys
+    )
+
+
+def test_multipartitions_status_cache_subset_default_path_timing():
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "date": DailyPartitionsDefinition(start_date="2015-01-01", end_date="2025-01-01"),
+            "static": StaticPartitionsDefinition([str(i) for i in range(20)]),
+        }
+    )
+    serialized = DefaultPartitionsSubset(set(multipartitions_def.get_partition_keys())).serialize()
+
+    def _time(fn) -> float:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+
+    # without the compact flag, reading and rewriting a cached subset does no more work than
+    # deserializing and serializing it with the partitions definition
+    baseline = _time(
+        lambda: multipartitions_def.deserialize_subset(serialized)
+        .to_serializable_subset()
+        .serialize()
+    )
+    cached = _time(
+        lambda: _serialize_cache_subset(
+            multipartitions_def, _deserialize_cache_subset(multipartitions_def, serialized)
+        )
+    )
+    assert not isinstance(
+        _deserialize_cache_subset(multipartitions_def, serialized), MultiPartitionsSubset
+    )
+    assert cached < baseline * 2 + 0.05
+
+
+def test_filter_valid_partition_keys():
+    multipartitions_def = MultiPartitionsDefinition(
+        {
+            "abc": StaticPartitionsDefinition(["a", "b", "c"]),
+            "xyz": StaticPartitionsDefinition(["x", "y", "z"]),
+        }
+    )
+    with instance_for_test() as instance:
+        assert multipartitions_def.filter_valid_partition_keys(
+            {"a|x", "c|z", "x|a", "d|x", "a", "a|x|y"}, instance
+        ) == {"a|x", "c|z"}
+
+
 def test_asset_partition_key_is_multipartition_key():
     class MyIOManager(IOManager):
         def handle_output(self, context, obj):
@@ -20,12 +20,15 @@
 from dagster._check import CheckError
 from dagster._core.definitions.time_window_partitions import (
     BaseTimeWindowPartitionsSubset,
+    FixedCadenceTimeWindowIndex,
+    IteratedTimeWindowIndex,
     PartitionKeysTimeWindowPartitionsSubset,
     PersistedTimeWindow,
     ScheduleType,
     TimeWindow,
     TimeWindowPartitionsSubset,
     dst_safe_strptime,
+    get_fixed_cadence_schedule_type,
 )
 from dagster._core.definitions.timestamp import TimestampWithTimezone
 from dagster._core.errors import DagsterInvariantViolationError
@@ -1843,3 +1846,95 @@ def test_persisted_time_window_serdes():
     deserialized_time_window = deserialize_value(serialized_time_window, PersistedTimeWindow)
     assert isinstance(deserialized_time_window, PersistedTimeWindow)
     assert serialize_value(deserialized_time_window) == serialized_time_window
+
+
+@pytest.mark.parametrize(
+    "cron_schedule, fmt, schedule_type",
+    [
+        ("0 * * * *", "%Y-%m-%d-%H:%M", ScheduleType.HOURLY),
+        ("30 * * * *", "%Y-%m-%d-%H:%M", ScheduleType.HOURLY),
+        ("0 0 * * *", "%Y-%m-%d", ScheduleType.DAILY),
+        ("30 2 * * *", "%Y-%m-%d %H:%M", ScheduleType.DAILY),
+        ("0 1 * * *", "%Y-%m-%d %H:%M", ScheduleType.DAILY),
+        ("15 7 * * *", "%Y-%m-%d", ScheduleType.DAILY),
+        ("0 2 * * 0", "%Y-%m-%d %H:%M", ScheduleType.WEEKLY),
+        ("0 0 15 * *", "%Y-%m-%d", ScheduleType.MONTHLY),
+    ],
+)
+@pytest.mark.parametrize(
+    "timezone", ["UTC", "America/New_York", "Europe/Berlin", "Australia/Lord_Howe"]
+)
+def test_fixed_cadence_time_window_index(cron_schedule, fmt, schedule_type, timezone):
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule=cron_schedule,
+        start=create_datetime(2022, 1, 1, tz=timezone),
+        fmt=fmt,
+        timezone=timezone,
+    )
+    fixed_cadence_index = partitions_def._fixed_cadence_index  # noqa: SLF001
+    assert isinstance(fixed_cadence_index, FixedCadenceTimeWindowIndex)
+    assert get_fixed_cadence_schedule_type(cron_schedule) == schedule_type
+
+    # spans the DST transitions of 2022
+    num_windows = 24 * 400 if schedule_type == ScheduleType.HOURLY else 400
+    iterated_keys = IteratedTimeWindowIndex(partitions_def).keys_for_ordinals(0, num_windows)
+    assert fixed_cadence_index.keys_for_ordinals(0, num_windows) == iterated_keys
+
+    for ordinal in random.Random(0).sample(range(num_windows), 200):
+        partition_key = iterated_keys[ordinal]
+        assert fixed_cadence_index.ordinal_for_key(partition_key) == ordinal
+        start_timestamp = fixed_cadence_index.start_for_ordinal(ordinal).timestamp()
+        assert fixed_cadence_index.floor_ordinal(start_timestamp) == ordinal
+        assert fixed_cadence_index.floor_ordinal(start_timestamp - 1) == ordinal - 1
+
+
+def test_fixed_cadence_time_window_partitions_def():
+    partitions_def = HourlyPartitionsDefinition(
+        start_date="2022-03-12-00:00", timezone="America/New_York", end_offset=1
+    )
+    current_time = create_datetime(2022, 11, 7, 1, tz="America/New_York")
+
+    partition_keys = partitions_def.get_partition_keys(current_time=current_time)
+    assert partition_keys[0] == "2022-03-12-00:00"
+    assert partition_keys[-1] == "2022-11-07-01:00"
+    # no partition for the hour that is skipped in spring, two for the hour that repeats in fall
+    assert "2022-03-13-02:00" not in partition_keys
+    assert "2022-11-06-01:00" in partition_keys and "2022-11-06-01:00-0500" in partition_keys
+    assert partitions_def.get_num_partitions(current_time=current_time) == len(partition_keys)
+
+    assert partitions_def.has_partition_key("2022-11-06-01:00-0500", current_time=current_time)
+    assert not partitions_def.has_partition_key("2022-03-13-02:00", current_time=current_time)
+    assert not partitions_def.has_partition_key("2022-03-11-23:00", current_time=current_time)
+    assert not partitions_def.has_partition_key("2022-11-07-02:00", current_time=current_time)
+    assert not partitions_def.has_partition_key("2022-11-07-02:30", current_time=current_time)
+    assert not partitions_def.has_partition_key("not a key", current_time=current_time)
+
+    assert partitions_def.get_partition_keys_in_range(
+        PartitionKeyRange("2022-11-06-00:00", "2022-11-06-02:00")
+    ) == ["2022-11-06-00:00", "2022-11-06-01:00", "2022-11-06-01:00-0500", "2022-11-06-02:00"]
+
+    # keys are memoized, but every call returns its own list
+    partition_keys.clear()
+    assert partitions_def.get_partition_keys(current_time=current_time)[-1] == "2022-11-07-01:00"
+
+
+def test_non_fixed_cadence_time_window_partitions_def():
+    partitions_def = TimeWindowPartitionsDefinition(
+        cron_schedule="0 0 * * 1-5", start="2023-01-01", fmt="%Y-%m-%d"
+    )
+    assert get_fixed_cadence_schedule_type(partitions_def.cron_schedule) is None
+    assert get_fixed_cadence_schedule_type("0 0 31 * *") is None
+    assert isinstance(partitions_def._time_window_index, IteratedTimeWindowIndex)  # noqa: SLF001
+
+    assert partitions_def.get_partition_keys(current_time=create_datetime(2023, 1, 10, 12)) == [
+        "2023-01-02",
+        "2023-01-03",
+        "2023-01-04",
+        "2023-01-05",
+        "2023-01-06",
+        "2023-01-09",
+    ]
+    assert partitions_def.get_partition_keys(current_time=create_datetime(2023, 1, 4, 12)) == [
+        "2023-01-02",
+        "2023-01-03",
+    ]
@@ -1,6 +1,7 @@
 import multiprocessing
 import os
 import time
+from contextlib import nullcontext
 
 import pytest
 from dagster._core.executor.child_process_executor import (
@@ -10,6 +11,9 @@
     ChildProcessEvent,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
+    ChildProcessWorkerCommand,
+    ChildProcessWorkerPool,
+    ChildProcessWorkerRetiredEvent,
     execute_child_process_command,
 )
 from dagster._utils import segfault
@@ -105,3 +109,60 @@ def test_child_process_segfault():
 @pytest.mark.skip("too long")
 def test_long_running_command():
     list(execute_child_process_command(multiprocessing, LongRunningCommand()))
+
+
+class WorkerPidCommand(ChildProcessWorkerCommand):
+    def execute(self):
+        yield os.getpid()
+
+    def execute_in_worker(self, worker_state):
+        calls = worker_state.get_or_enter("calls", lambda: nullcontext([]))
+        calls.append(1)
+        yield (os.getpid(), len(calls))
+
+
+class CrashyWorkerCommand(WorkerPidCommand):
+    def execute_in_worker(self, worker_state):
+        os._exit(1)
+        yield
+
+
+def _command_results(worker, command):
+    return [
+        x for x in worker.execute_command(command) if x and not isinstance(x, ChildProcessEvent)
+    ]
+
+
+def test_worker_reuses_process_and_state():
+    with ChildProcessWorkerPool(multiprocessing) as pool:
+        worker = pool.acquire()
+        assert _command_results(worker, WorkerPidCommand()) == [(worker.pid, 1)]
+        pool.release(worker)
+
+        assert pool.acquire() is worker
+        assert _command_results(worker, WorkerPidCommand()) == [(worker.pid, 2)]
+        pool.release(worker)
+
+
+def test_worker_retires_after_max_commands():
+    with ChildProcessWorkerPool(multiprocessing, max_commands_per_worker=1) as pool:
+        worker = pool.acquire()
+        events = [x for x in worker.execute_command(WorkerPidCommand()) if x]
+        assert isinstance(events[-2], ChildProcessWorkerRetiredEvent)
+        assert isinstance(events[-1], ChildProcessDoneEvent)
+        assert worker.is_retired
+        pool.release(worker)
+
+        new_worker = pool.acquire()
+        assert new_worker is not worker
+        assert new_worker.pid != worker.pid
+        pool.release(new_worker)
+
+
+def test_worker_crash():
+    with ChildProcessWorkerPool(multiprocessing) as pool:
+        worker = pool.acquire()
+        with pytest.raises(ChildProcessCrashException):
+            list(worker.execute_command(CrashyWorkerCommand()))
+        assert worker.is_retired
+        pool.release(worker)
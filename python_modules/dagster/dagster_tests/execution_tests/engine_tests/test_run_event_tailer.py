@@ -0,0 +1,103 @@
+import time
+
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.executor.step_delegating.event_tailer import RunEventTailer
+from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
+from dagster._core.test_utils import instance_for_test
+from dagster._core.utils import make_new_run_id
+
+
+def _engine_event(run_id: str, message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "nonce",
+            message=message,
+            event_specific_data=EngineEventData(),
+        ),
+    )
+
+
+def _log_event(run_id: str, message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=message,
+        run_id=run_id,
+        timestamp=time.time(),
+    )
+
+
+def test_tailer_reads_each_event_once():
+    run_id = make_new_run_id()
+    with instance_for_test() as instance:
+        tailer = RunEventTailer(run_id, batch_size=2, max_batch_size=8)
+        assert tailer.pop_events(instance) == []
+
+        for i in range(3):
+            instance.handle_new_event(_engine_event(run_id, str(i)))
+            instance.handle_new_event(_log_event(run_id, "not a dagster event"))
+
+        assert [event.message for event in tailer.pop_events(instance)] == ["0", "1"]
+        assert tailer.batch_size == 4
+        assert [event.message for event in tailer.pop_events(instance)] == ["2"]
+        assert tailer.batch_size == 2
+        assert tailer.pop_events(instance) == []
+
+        # a burst of events grows the batch size up to the max
+        for i in range(3, 20):
+            instance.handle_new_event(_engine_event(run_id, str(i)))
+        messages = []
+        while True:
+            events = tailer.pop_events(instance)
+            if not events:
+                break
+            messages.extend(event.message for event in events)
+        assert messages == [str(i) for i in range(3, 20)]
+
+
+def test_tailer_picks_up_late_events():
+    run_id = make_new_run_id()
+    with instance_for_test() as instance:
+        storage = instance.event_log_storage
+        for i in range(4):
+            instance.handle_new_event(_engine_event(run_id, str(i)))
+
+        records = storage.get_records_for_run(run_id).records
+        late_record = records[1]
+
+        # simulate an event whose storage id was assigned before it was committed
+        with storage.run_connection(run_id) as conn:
+            conn.execute(
+                SqlEventLogStorageTable.delete().where(
+                    SqlEventLogStorageTable.c.id == late_record.storage_id
+                )
+            )
+
+        tailer = RunEventTailer(run_id, batch_size=10, rewind_window=100)
+        without_rewind = RunEventTailer(run_id, batch_size=10)
+        assert [event.message for event in tailer.pop_events(instance)] == ["0", "2", "3"]
+        assert [event.message for event in without_rewind.pop_events(instance)] == ["0", "2", "3"]
+
+        with storage.run_connection(run_id) as conn:
+            conn.execute(
+                SqlEventLogStorageTable.insert().values(
+                    id=late_record.storage_id,
+                    **storage._event_to_row(late_record.event_log_entry),  # noqa: SLF001
+                )
+            )
+
+        assert [event.message for event in tailer.pop_events(instance)] == ["1"]
+        assert without_rewind.pop_events(instance) == []
+        assert tailer.pop_events(instance) == []
+
+        # storage ids below the rewind window are forgotten
+        small_window = RunEventTailer(run_id, batch_size=10, rewind_window=1)
+        small_window.pop_events(instance)
+        assert len(small_window._window_storage_ids) == 1  # noqa: SLF001
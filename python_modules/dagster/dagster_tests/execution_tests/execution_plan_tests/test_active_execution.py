@@ -0,0 +1,239 @@
+import time
+
+from dagster import DynamicOut, DynamicOutput, job, op
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.retries import RetryMode
+
+
+def define_independent_job():
+    @op
+    def op_a():
+        pass
+
+    @op
+    def op_b():
+        pass
+
+    @op
+    def op_c():
+        pass
+
+    @job
+    def independent_job():
+        op_a()
+        op_b()
+        op_c()
+
+    return independent_job
+
+
+def define_diamond_job():
+    @op
+    def return_two():
+        return 2
+
+    @op
+    def add_three(num):
+        return num + 3
+
+    @op
+    def mult_three(num):
+        return num * 3
+
+    @op
+    def adder(left, right):
+        return left + right
+
+    @job
+    def diamond_job():
+        two = return_two()
+        adder(left=add_three(two), right=mult_three(two))
+
+    return diamond_job
+
+
+def define_chain_job():
+    @op
+    def first():
+        return 1
+
+    @op
+    def second(num):
+        return num
+
+    @op
+    def third(num):
+        return num
+
+    @op
+    def unrelated():
+        pass
+
+    @job
+    def chain_job():
+        third(second(first()))
+        unrelated()
+
+    return chain_job
+
+
+def define_dynamic_job():
+    @op
+    def upstream():
+        return 1
+
+    @op(out=DynamicOut())
+    def emit():
+        yield DynamicOutput(1, mapping_key="a")
+        yield DynamicOutput(2, mapping_key="b")
+
+    @op
+    def process(num, other):
+        return num + other
+
+    @op
+    def total(nums):
+        return sum(nums)
+
+    @job
+    def dynamic_job():
+        other = upstream()
+        total(emit().map(lambda num: process(num, other)).collect())
+
+    return dynamic_job
+
+
+def _step_keys(steps):
+    return [step.key for step in steps]
+
+
+def _succeed(active_execution, step_key, output_name="result"):
+    active_execution.mark_step_produced_output(StepOutputHandle(step_key, output_name))
+    active_execution.mark_success(step_key)
+
+
+def test_retries_at_time_leave_in_marked_order():
+    plan = create_execution_plan(define_independent_job())
+
+    with plan.start(retry_mode=RetryMode.ENABLED) as active_execution:
+        assert _step_keys(active_execution.get_steps_to_execute()) == ["op_a", "op_b", "op_c"]
+
+        now = time.time()
+        # op_a is due earlier than op_c, but was marked later
+        active_execution.mark_up_for_retry("op_c", at_time=now - 1)
+        active_execution.mark_up_for_retry("op_a", at_time=now - 2)
+        active_execution.mark_up_for_retry("op_b", at_time=now + 0.5)
+
+        assert _step_keys(active_execution.get_steps_to_execute()) == ["op_c", "op_a"]
+        assert [key for _, _, key in active_execution._waiting_to_retry_heap] == ["op_b"]  # noqa: SLF001
+        assert 0 < active_execution.sleep_interval() <= 0.5
+
+        # op_b stays in the heap until it is due
+        assert active_execution.get_steps_to_execute() == []
+        active_execution.sleep_til_ready()
+        assert _step_keys(active_execution.get_steps_to_execute()) == ["op_b"]
+        assert not active_execution._waiting_to_retry_heap  # noqa: SLF001
+
+        for step_key in ["op_a", "op_b", "op_c"]:
+            active_execution.mark_success(step_key)
+        assert active_execution.is_complete
+
+
+def test_retry_without_at_time_reenters_pending():
+    plan = create_execution_plan(define_diamond_job())
+
+    with plan.start(retry_mode=RetryMode.ENABLED) as active_execution:
+        assert _step_keys(active_execution.get_steps_to_execute()) == ["return_two"]
+        _succeed(active_execution, "return_two")
+        assert _step_keys(active_execution.get_steps_to_execute()) == ["add_three", "mult_three"]
+        assert active_execution._num_unresolved_deps == {"adder": 2}  # noqa: SLF001
+
+        # the retried step only depends on a step that already succeeded, so it is ready at once,
+        # and the step that depends on it keeps waiting on it
+        active_execution.mark_up_for_retry("add_three")
+        assert active_execution._num_unresolved_deps == {"add_three": 0, "adder": 2}  # noqa: SLF001
+        assert _step_keys(active_execution.get_steps_to_execute()) == ["add_three"]
+        assert active_execution._num_unresolved_deps == {"adder": 2}  # noqa: SLF001
+
+        _succeed(active_execution, "mult_three")
+        assert active_execution.get_steps_to_execute() == []
+        assert active_execution._num_unresolved_deps == {"adder": 1}  # noqa: SLF001
+
+        _succeed(active_execution, "add_three")
+        assert _step_keys(active_execution.get_steps_to_execute()) == ["adder"]
+
+        _succeed(active_execution, "adder")
+        assert active_execution.is_complete
+
+
+def test_dynamic_steps_added_after_some_deps_finished():
+    job_def = define_dynamic_job()
+    plan = create_execution_plan(job_def)
+
+    with plan.start(retry_mode=RetryMode.DISABLED) as active_execution:
+        assert _step_keys(active_execution.get_steps_to_execute()) == ["emit", "upstream"]
+
+        # emit finishes while upstream is still running
+        for mapping_key in ["a", "b"]:
+            active_execution.handle_event(
+                DagsterEvent(
+                    DagsterEventType.STEP_OUTPUT.value,
+                    job_name=job_def.name,
+                    event_specific_data=StepOutputData(
+                        StepOutputHandle("emit", "result", mapping_key)
+                    ),
+                    step_key="emit",
+                )
+            )
+        active_execution.handle_event(
+            DagsterEvent(
+                DagsterEventType.STEP_SUCCESS.value,
+                job_name=job_def.name,
+                event_specific_data=StepSuccessData(duration_ms=10.0),
+                step_key="emit",
+            )
+        )
+
+        # the mapped steps are added by resolving the plan, and only wait on upstream
+        assert active_execution.get_steps_to_execute() == []
+        assert active_execution._num_unresolved_deps == {  # noqa: SLF001
+            "process[a]": 1,
+            "process[b]": 1,
+            "total": 2,
+        }
+
+        _succeed(active_execution, "upstream")
+        assert _step_keys(active_execution.get_steps_to_execute()) == ["process[a]", "process[b]"]
+        assert active_execution._num_unresolved_deps == {"total": 2}  # noqa: SLF001
+
+        _succeed(active_execution, "process[a]")
+        assert active_execution.get_steps_to_execute() == []
+        _succeed(active_execution, "process[b]")
+        assert _step_keys(active_execution.get_steps_to_execute()) == ["total"]
+
+        _succeed(active_execution, "total")
+        assert active_execution.is_complete
+
+
+def test_steps_with_failed_or_abandoned_deps_are_abandoned():
+    plan = create_execution_plan(define_chain_job())
+
+    with plan.start(retry_mode=RetryMode.DISABLED) as active_execution:
+        assert _step_keys(active_execution.get_steps_to_execute()) == ["first", "unrelated"]
+
+        active_execution.mark_failed("first")
+        assert active_execution.get_steps_to_execute() == []
+        assert _step_keys(active_execution.get_steps_to_abandon()) == ["second"]
+
+        # abandoning a step abandons the steps that depend on it in turn
+        active_execution.mark_abandoned("second")
+        assert active_execution.get_steps_to_execute() == []
+        assert _step_keys(active_execution.get_steps_to_abandon()) == ["third"]
+        active_execution.mark_abandoned("third")
+
+        assert not active_execution.is_complete
+        _succeed(active_execution, "unrelated")
+        assert active_execution.is_complete
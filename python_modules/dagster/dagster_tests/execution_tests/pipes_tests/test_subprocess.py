@@ -7,10 +7,13 @@
 from contextlib import contextmanager
 from multiprocessing import Process
 from tempfile import NamedTemporaryFile
+from threading import Event, Thread
 from typing import Any, Callable, Iterator
+from unittest.mock import patch
 
 import pytest
 from dagster import op
+from dagster._core.definitions.asset_check_result import AssetCheckResult
 from dagster._core.definitions.asset_check_spec import AssetCheckKey, AssetCheckSpec
 from dagster._core.definitions.asset_spec import AssetSpec
 from dagster._core.definitions.data_version import (
@@ -36,22 +39,26 @@
     UrlMetadataValue,
 )
 from dagster._core.definitions.partition import DynamicPartitionsDefinition
+from dagster._core.definitions.result import MaterializeResult
 from dagster._core.errors import DagsterInvariantViolationError, DagsterPipesExecutionError
 from dagster._core.execution.context.compute import AssetExecutionContext, OpExecutionContext
 from dagster._core.execution.context.invocation import build_asset_context
 from dagster._core.instance import DagsterInstance
 from dagster._core.instance_for_test import instance_for_test
+from dagster._core.pipes.context import PipesMessageHandler
 from dagster._core.pipes.subprocess import PipesSubprocessClient
 from dagster._core.pipes.utils import (
     PipesEnvContextInjector,
     PipesTempFileContextInjector,
     PipesTempFileMessageReader,
+    _tail_file_lines,
     open_pipes_session,
 )
 from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecordStatus
+from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 from dagster._utils import process_is_alive
 from dagster._utils.env import environ
-from dagster_pipes import DagsterPipesError
+from dagster_pipes import DagsterPipesError, _make_message
 
 _PYTHON_EXECUTABLE = shutil.which("python")
 
@@ -751,3 +758,98 @@ def test_cancellation():
         assert not p.is_alive()
         assert pid
         assert not process_is_alive(pid)
+
+
+def test_pipes_message_batch():
+    stored_batches = []
+    store_event_batch = SqlEventLogStorage.store_event_batch
+
+    def _store_event_batch(storage, events):
+        stored_batches.append([event.user_message for event in events])
+        store_event_batch(storage, events)
+
+    @op
+    def batch_op(context: OpExecutionContext):
+        handler = PipesMessageHandler(context, PipesTempFileMessageReader())
+        handler.handle_message_batch(
+            [
+                _make_message("log", {"message": "a", "level": "info"}),
+                _make_message("log", {"message": "b", "level": "warning"}),
+                _make_message("log", {"message": "c"}),
+                _make_message("report_custom_message", {"payload": "custom"}),
+                _make_message("log", {"message": "d", "level": "info"}),
+                _make_message("log", {"message": "e", "level": "error"}),
+                _make_message(
+                    "report_asset_materialization",
+                    {"asset_key": "foo", "metadata": None, "data_version": None},
+                ),
+                _make_message(
+                    "report_asset_check",
+                    {
+                        "asset_key": "foo",
+                        "check_name": "foo_check",
+                        "passed": True,
+                        "severity": "ERROR",
+                        "metadata": {},
+                    },
+                ),
+                _make_message("report_custom_message", {"payload": "other"}),
+                _make_message("log", {"message": "f", "level": "info"}),
+            ]
+        )
+        assert handler.get_custom_messages() == ("custom", "other")
+        # results are only queued, and turned into events once the op returns them
+        assert [(type(result), result.asset_key) for result in handler.get_reported_results()] == [
+            (MaterializeResult, AssetKey("foo")),
+            (AssetCheckResult, AssetKey("foo")),
+        ]
+
+    @job
+    def batch_job():
+        batch_op()
+
+    with environ({"DAGSTER_EVENT_BATCH_SIZE": "100"}), instance_for_test() as instance:
+        with patch.object(SqlEventLogStorage, "store_event_batch", _store_event_batch):
+            result = batch_job.execute_in_process(instance=instance)
+        assert result.success
+        assert stored_batches == [["a", "b", "c"], ["d", "e"]]
+        log_messages = [
+            record.event_log_entry.user_message
+            for record in instance.get_records_for_run(result.run_id).records
+            if not record.event_log_entry.is_dagster_event
+        ]
+        assert log_messages == ["a", "b", "c", "d", "e", "f"]
+
+
+@pytest.mark.parametrize("use_file_events", [True, False])
+def test_tail_file_lines(tmp_path, monkeypatch, use_file_events):
+    # read in small chunks so that lines are split across reads
+    monkeypatch.setattr("dagster._core.pipes.utils._TAIL_CHUNK_SIZE", 7)
+    if not use_file_events:
+        monkeypatch.setattr(
+            "dagster._core.pipes.utils._start_file_modified_observer", lambda *_: None
+        )
+
+    path = str(tmp_path / "messages")
+    open(path, "w").close()
+    is_session_closed = Event()
+    is_file_modified = Event()
+    lines = [f"message {i}" for i in range(20)]
+
+    def _write_messages():
+        with open(path, "a") as file:
+            for line in lines:
+                file.write(f"{line}\n\n")
+                file.flush()
+                time.sleep(0.001)
+            file.write("partial")
+        is_session_closed.set()
+        is_file_modified.set()
+
+    writer = Thread(target=_write_messages)
+    writer.start()
+    batches = list(_tail_file_lines(path, is_session_closed.is_set, is_file_modified))
+    writer.join()
+
+    assert all(batches)
+    assert [line for batch in batches for line in batch] == [*lines, "partial"]
@@ -1,4 +1,5 @@
 import dataclasses
+import json
 import re
 import string
 from collections import namedtuple
@@ -16,13 +17,16 @@
     FieldSerializer,
     NamedTupleSerializer,
     SerializableNonScalarKeyMapping,
+    SerializationFormat,
     SetToSequenceFieldSerializer,
     UnpackContext,
     WhitelistMap,
+    _pack_object,
     _whitelist_for_serdes,
     deserialize_value,
     pack_value,
     serialize_value,
+    serialize_value_to_bytes,
     unpack_value,
 )
 from dagster._serdes.utils import hash_str
@@ -992,3 +996,100 @@ class Child(MyRecord): ...
     c = Child(name="kiddo")
     r_str = serialize_value(c, whitelist_map=test_env)
     assert deserialize_value(r_str, whitelist_map=test_env) == c
+
+
+def test_compiled_packer_matches_uncompiled() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "RED"
+
+    @_whitelist_for_serdes(test_env)
+    @record
+    class Inner:
+        name: str
+
+    class OuterSerializer(NamedTupleSerializer):
+        def before_pack(self, value: "Outer") -> "Outer":
+            return value._replace(count=value.count + 1)
+
+    @_whitelist_for_serdes(
+        test_env,
+        serializer=OuterSerializer,
+        storage_name="OldOuter",
+        storage_field_names={"color": "colour"},
+        old_fields={"shape": None},
+        skip_when_empty_fields={"tags"},
+        field_serializers={"labels": SetToSequenceFieldSerializer},
+    )
+    class Outer(NamedTuple):
+        count: int
+        color: Color
+        inner: Inner
+        children: Sequence["Inner"]
+        labels: AbstractSet[str]
+        tags: Optional[Mapping[str, str]] = None
+        ratio: float = 0.5
+
+    serializer = test_env.object_serializers["Outer"]
+    for val in [
+        Outer(1, Color.RED, Inner(name="a"), [Inner(name="b")], {"y", "x"}, None),
+        Outer(2, Color.RED, Inner(name="a"), [], set(), {"k": "v"}, ratio=1.0),
+    ]:
+        compiled = list(serializer.pack_items(val, test_env, _pack_object, "<root>"))
+        uncompiled = list(serializer.pack_items_uncompiled(val, test_env, _pack_object, "<root>"))
+        assert compiled == uncompiled
+        assert serialize_value(val, whitelist_map=test_env) == json.dumps(
+            dict(uncompiled), sort_keys=True
+        )
+        assert deserialize_value(serialize_value(val, whitelist_map=test_env), Outer, test_env) == (
+            val._replace(count=val.count + 1)
+        )
+
+    # descent paths are preserved in errors raised below compiled packers
+    class Unknown(NamedTuple):
+        pass
+
+    with pytest.raises(SerializationError, match=re.escape("Descent path: <root:Outer>.inner")):
+        serialize_value(
+            Outer(1, Color.RED, Unknown(), [], set(), None),  # type: ignore
+            whitelist_map=test_env,
+        )
+
+
+def test_msgpack_serialization_format() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "RED"
+
+    @_whitelist_for_serdes(test_env, storage_field_names={"color": "colour"})
+    class Foo(NamedTuple):
+        color: Color
+        tags: AbstractSet[str]
+        children: Sequence["Foo"]
+        big: int = 0
+
+    val = Foo(Color.RED, {"a", "b"}, [Foo(Color.RED, set(), [])])
+    for serialization_format in SerializationFormat:
+        serialized = serialize_value_to_bytes(val, test_env, serialization_format)
+        assert deserialize_value(serialized, Foo, test_env) == val
+
+    # class and field names are only written once per payload
+    serialized = serialize_value_to_bytes(val, test_env)
+    assert serialized.count(b"colour") == 1
+    assert serialized.count(b"Foo") == 1
+    assert b"__class__" not in serialized
+    assert len(serialized) < len(serialize_value(val, test_env))
+
+    # json is still accepted as bytes, and values that msgpack can't represent are written as json
+    assert deserialize_value(serialize_value(val, test_env).encode(), Foo, test_env) == val
+    big_val = val._replace(big=2**70)
+    serialized = serialize_value_to_bytes(big_val, test_env)
+    assert serialized == serialize_value(big_val, test_env).encode()
+    assert deserialize_value(serialized, Foo, test_env) == big_val
+
+    with pytest.raises(DeserializationError, match="not in the whitelist"):
+        deserialize_value(serialize_value_to_bytes(val, test_env))
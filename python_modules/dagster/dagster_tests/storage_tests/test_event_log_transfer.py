@@ -0,0 +1,217 @@
+import os
+import tempfile
+import time
+
+import pytest
+from dagster import AssetKey, AssetMaterialization
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import ConsolidatedSqliteEventLogStorage, SqliteEventLogStorage
+from dagster._core.storage.event_log.transfer import (
+    ALL_RUNS_STREAM,
+    EVENT_LOG_IMPORT_CURSORS_FILENAME,
+    EventLogChunkFile,
+    export_event_log,
+    get_event_log_chunk_files,
+    import_event_log,
+    stream_for_run_id,
+)
+from dagster._core.utils import make_new_run_id
+
+
+def _log_event(run_id: str, message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=message,
+        run_id=run_id,
+        timestamp=time.time(),
+    )
+
+
+def _materialization_event(run_id: str, asset_key: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "nonce",
+            event_specific_data=StepMaterializationData(AssetMaterialization(asset_key=asset_key)),
+        ),
+    )
+
+
+def _store_events(storage, run_ids, num_logs):
+    for run_id in run_ids:
+        for i in range(num_logs):
+            storage.store_event(_log_event(run_id, f"{run_id} {i}"))
+        storage.store_event(_materialization_event(run_id, "my_asset"))
+
+
+def _messages_by_run(storage, run_ids):
+    return {
+        run_id: [
+            record.event_log_entry.user_message
+            for record in storage.get_records_for_run(run_id).records
+        ]
+        for run_id in run_ids
+    }
+
+
+def test_export_import_storage_id_order():
+    run_ids = [make_new_run_id() for _ in range(3)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = ConsolidatedSqliteEventLogStorage(os.path.join(tmpdir, "source"))
+        destination = ConsolidatedSqliteEventLogStorage(os.path.join(tmpdir, "destination"))
+        export_dir = os.path.join(tmpdir, "export")
+
+        _store_events(source, run_ids, num_logs=5)
+        assert export_event_log(source, export_dir, chunk_size=4, max_workers=2) == 18
+
+        chains, orphans = get_event_log_chunk_files(export_dir)
+        assert list(chains.keys()) == [ALL_RUNS_STREAM]
+        assert len(chains[ALL_RUNS_STREAM]) == 5
+        assert not orphans
+
+        assert import_event_log(destination, export_dir, max_workers=2) == 18
+        assert _messages_by_run(destination, run_ids) == _messages_by_run(source, run_ids)
+        assert (
+            destination.get_latest_materialization_events([AssetKey("my_asset")])[
+                AssetKey("my_asset")
+            ].run_id
+            == run_ids[-1]
+        )
+
+        # exporting and importing again only picks up new events
+        assert export_event_log(source, export_dir, chunk_size=4) == 0
+        assert import_event_log(destination, export_dir) == 0
+
+        new_run_id = make_new_run_id()
+        _store_events(source, [new_run_id], num_logs=2)
+        assert export_event_log(source, export_dir, chunk_size=4) == 3
+        assert import_event_log(destination, export_dir) == 3
+        assert _messages_by_run(destination, [*run_ids, new_run_id]) == _messages_by_run(
+            source, [*run_ids, new_run_id]
+        )
+
+
+def test_export_import_run_sharded():
+    run_ids = [make_new_run_id() for _ in range(3)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = SqliteEventLogStorage(os.path.join(tmpdir, "source"))
+        destination = ConsolidatedSqliteEventLogStorage(os.path.join(tmpdir, "destination"))
+        export_dir = os.path.join(tmpdir, "export")
+
+        _store_events(source, run_ids, num_logs=5)
+        assert (
+            export_event_log(source, export_dir, run_ids=run_ids, chunk_size=4, max_workers=3) == 18
+        )
+
+        chains, _ = get_event_log_chunk_files(export_dir)
+        assert set(chains.keys()) == {stream_for_run_id(run_id) for run_id in run_ids}
+
+        assert import_event_log(destination, export_dir, max_workers=3) == 18
+        assert _messages_by_run(destination, run_ids) == _messages_by_run(source, run_ids)
+
+
+def test_export_resumes_after_gap():
+    run_ids = [make_new_run_id()]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = ConsolidatedSqliteEventLogStorage(os.path.join(tmpdir, "source"))
+        destination = ConsolidatedSqliteEventLogStorage(os.path.join(tmpdir, "destination"))
+        export_dir = os.path.join(tmpdir, "export")
+
+        _store_events(source, run_ids, num_logs=9)
+        export_event_log(source, export_dir, chunk_size=4)
+        chain = get_event_log_chunk_files(export_dir)[0][ALL_RUNS_STREAM]
+        assert len(chain) == 3
+
+        # simulate a parallel export where the second chunk was never written
+        os.remove(chain[1].path)
+        chains, orphans = get_event_log_chunk_files(export_dir)
+        assert chains[ALL_RUNS_STREAM] == [chain[0]]
+        assert orphans == [chain[2]]
+
+        assert export_event_log(source, export_dir, chunk_size=4) == 6
+        chains, orphans = get_event_log_chunk_files(export_dir)
+        assert not orphans
+        assert [EventLogChunkFile.from_path(chunk.path) for chunk in chains[ALL_RUNS_STREAM]] == (
+            chain
+        )
+
+        assert import_event_log(destination, export_dir) == 10
+        assert _messages_by_run(destination, run_ids) == _messages_by_run(source, run_ids)
+
+
+def test_import_resumes_within_chunk(monkeypatch):
+    run_ids = [make_new_run_id() for _ in range(2)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = ConsolidatedSqliteEventLogStorage(os.path.join(tmpdir, "source"))
+        destination = ConsolidatedSqliteEventLogStorage(os.path.join(tmpdir, "destination"))
+        export_dir = os.path.join(tmpdir, "export")
+
+        _store_events(source, run_ids, num_logs=5)
+        assert export_event_log(source, export_dir, chunk_size=100) == 12
+        assert len(get_event_log_chunk_files(export_dir)[0][ALL_RUNS_STREAM]) == 1
+
+        # the chunk is stored in four writes: the logs of the first run as a batch, its
+        # materialization, the logs of the second run as a batch, and its materialization
+        num_writes = 0
+        store_event = destination.store_event
+        store_event_batch = destination.store_event_batch
+
+        def _interrupt_third_write():
+            nonlocal num_writes
+            num_writes += 1
+            if num_writes == 3:
+                raise Exception("interrupted")
+
+        def _store_event(event):
+            _interrupt_third_write()
+            store_event(event)
+
+        def _store_event_batch(events):
+            _interrupt_third_write()
+            store_event_batch(events)
+
+        monkeypatch.setattr(destination, "store_event", _store_event)
+        monkeypatch.setattr(destination, "store_event_batch", _store_event_batch)
+
+        with pytest.raises(Exception, match="interrupted"):
+            import_event_log(destination, export_dir)
+        assert _messages_by_run(destination, run_ids) == {
+            run_ids[0]: _messages_by_run(source, run_ids)[run_ids[0]],
+            run_ids[1]: [],
+        }
+
+        # resuming only stores the events of the chunk that were not stored yet
+        assert import_event_log(destination, export_dir) == 6
+        assert _messages_by_run(destination, run_ids) == _messages_by_run(source, run_ids)
+        assert import_event_log(destination, export_dir) == 0
+
+
+def test_import_run_shards_records_progress_per_chunk():
+    run_ids = [make_new_run_id() for _ in range(50)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = SqliteEventLogStorage(os.path.join(tmpdir, "source"))
+        destination = ConsolidatedSqliteEventLogStorage(os.path.join(tmpdir, "destination"))
+        export_dir = os.path.join(tmpdir, "export")
+
+        _store_events(source, run_ids, num_logs=3)
+        assert export_event_log(source, export_dir, run_ids=run_ids, chunk_size=100) == 200
+
+        assert import_event_log(destination, export_dir, max_workers=4) == 200
+        assert _messages_by_run(destination, run_ids) == _messages_by_run(source, run_ids)
+
+        # each run is a single chunk that is stored as a batch of logs followed by its
+        # materialization, so progress is only recorded once the chunk is complete
+        cursors_path = os.path.join(export_dir, EVENT_LOG_IMPORT_CURSORS_FILENAME)
+        with open(cursors_path) as f:
+            assert len(f.readlines()) == len(run_ids)
+
+        assert import_event_log(destination, export_dir) == 0
+        with open(cursors_path) as f:
+            assert len(f.readlines()) == len(run_ids)
@@ -1,7 +1,9 @@
+import mmap
 import os
 import pickle
 import shutil
 import tempfile
+import uuid
 from datetime import datetime
 from typing import Optional, Tuple
 
@@ -12,6 +14,7 @@
     AssetsDefinition,
     DagsterInstance,
     DailyPartitionsDefinition,
+    FilesystemIOManager,
     In,
     MetadataValue,
     MultiPartitionKey,
@@ -23,6 +26,8 @@
     StaticPartitionsDefinition,
     TimeWindowPartitionMapping,
     _seven as seven,
+    build_input_context,
+    build_output_context,
     define_asset_job,
     graph,
     job,
@@ -39,7 +44,7 @@
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DynamicPartitionsStore
-from dagster._core.storage.fs_io_manager import fs_io_manager
+from dagster._core.storage.fs_io_manager import PickledObjectFilesystemIOManager, fs_io_manager
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.test_utils import instance_for_test
 from dagster._utils import file_relative_path
@@ -629,3 +634,168 @@ def downstream_of_multipartitioned(multipartitioned):
         materializations = result.asset_materializations_for_node("downstream_of_multipartitioned")
         assert len(materializations) == 1
         assert "c/2020-04-22" in get_path_metadata_entry(materializations[0]).path
+
+
+class ZeroCopyBytes:
+    """Pickles its buffer out-of-band with protocol 5, as NumPy arrays do."""
+
+    def __init__(self, buffer):
+        self.buffer = buffer
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return ZeroCopyBytes, (pickle.PickleBuffer(self.buffer),)
+        return ZeroCopyBytes, (bytes(self.buffer),)
+
+
+def test_fs_io_manager_memory_map_buffers():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+
+        @op
+        def op_a():
+            return [ZeroCopyBytes(bytearray(b"abc")), ZeroCopyBytes(bytearray())]
+
+        @op
+        def op_b(values):
+            buffer, empty_buffer = values[0].buffer, values[1].buffer
+            assert isinstance(buffer, mmap.mmap)
+            assert len(empty_buffer) == 0
+            # loaded buffers are copy-on-write
+            buffer[0:1] = b"x"
+            return bytes(buffer)
+
+        @job(
+            resource_defs={
+                "io_manager": FilesystemIOManager(base_dir=tmpdir_path, memory_map_buffers=True)
+            }
+        )
+        def buffers_job():
+            op_b(op_a())
+
+        result = buffers_job.execute_in_process()
+        assert result.success
+        assert result.output_for_node("op_b") == b"xbc"
+
+        op_a_dir = os.path.join(tmpdir_path, result.run_id, "op_a")
+        buffers_dirs = [name for name in os.listdir(op_a_dir) if name.startswith("result.buffers-")]
+        assert len(buffers_dirs) == 1
+        buffers_dir = os.path.join(op_a_dir, buffers_dirs[0])
+        assert sorted(os.listdir(buffers_dir)) == ["0", "1"]
+        with open(os.path.join(buffers_dir, "0"), "rb") as read_obj:
+            assert read_obj.read() == b"abc"
+
+        # values without out-of-band buffers don't get a buffers directory
+        assert os.listdir(os.path.join(tmpdir_path, result.run_id, "op_b")) == ["result"]
+
+
+def test_fs_io_manager_memory_map_buffers_overwrite():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = PickledObjectFilesystemIOManager(base_dir=tmpdir_path, memory_map_buffers=True)
+        input_context = build_input_context(asset_key=AssetKey("buffers"))
+
+        def _buffers_dirs():
+            return [name for name in os.listdir(tmpdir_path) if name.startswith("buffers.buffers-")]
+
+        io_manager.handle_output(
+            build_output_context(asset_key=AssetKey("buffers")),
+            [ZeroCopyBytes(bytearray(b"a")), ZeroCopyBytes(bytearray(b"b"))],
+        )
+        loaded = io_manager.load_input(input_context)
+        [previous_buffers_dir] = _buffers_dirs()
+
+        io_manager.handle_output(
+            build_output_context(asset_key=AssetKey("buffers")),
+            [ZeroCopyBytes(bytearray(b"c"))],
+        )
+        # the new buffers are written to a new directory, and the previous one is removed once
+        # the pickle file that names the new directory is in place
+        [buffers_dir] = _buffers_dirs()
+        assert buffers_dir != previous_buffers_dir
+        assert os.listdir(os.path.join(tmpdir_path, buffers_dir)) == ["0"]
+        assert sorted(os.listdir(tmpdir_path)) == sorted(["buffers", buffers_dir])
+        assert [bytes(value.buffer) for value in io_manager.load_input(input_context)] == [b"c"]
+
+        # the buffers of the previous value were unlinked rather than overwritten
+        assert [bytes(value.buffer) for value in loaded] == [b"a", b"b"]
+
+
+def test_fs_io_manager_memory_map_buffers_load_during_overwrite():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        io_manager = PickledObjectFilesystemIOManager(base_dir=tmpdir_path, memory_map_buffers=True)
+        input_context = build_input_context(asset_key=AssetKey("buffers"))
+        io_manager.handle_output(
+            build_output_context(asset_key=AssetKey("buffers")), [ZeroCopyBytes(bytearray(b"a"))]
+        )
+
+        # a load that reads the pickle file of the previous value, and its buffers only after the
+        # value was overwritten, loads the new value
+        load_buffers = io_manager._load_buffers  # noqa: SLF001
+
+        def _load_buffers_after_overwrite(buffers_path):
+            io_manager._load_buffers = load_buffers  # noqa: SLF001
+            io_manager.handle_output(
+                build_output_context(asset_key=AssetKey("buffers")),
+                [ZeroCopyBytes(bytearray(b"b"))],
+            )
+            return load_buffers(buffers_path)
+
+        io_manager._load_buffers = _load_buffers_after_overwrite  # noqa: SLF001
+        assert [bytes(value.buffer) for value in io_manager.load_input(input_context)] == [b"b"]
+
+
+def test_fs_io_manager_memory_map_buffers_remote_filesystem():
+    io_manager = PickledObjectFilesystemIOManager(
+        base_dir=f"memory://{uuid.uuid4().hex}", memory_map_buffers=True
+    )
+    io_manager.handle_output(
+        build_output_context(asset_key=AssetKey("buffers")),
+        [ZeroCopyBytes(bytearray(b"abc"))],
+    )
+    [value] = io_manager.load_input(build_input_context(asset_key=AssetKey("buffers")))
+
+    # buffers read from a remote filesystem are writable, as memory-mapped buffers are
+    assert not isinstance(value.buffer, mmap.mmap)
+    value.buffer[0:1] = b"x"
+    assert bytes(value.buffer) == b"xbc"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [{"a": 1}, ("a", "b"), [ZeroCopyBytes(bytearray(b"abc"))]],
+    ids=["dict", "tuple", "zero_copy"],
+)
+def test_fs_io_manager_memory_map_buffers_load_plain_pickle(value):
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        PickledObjectFilesystemIOManager(base_dir=tmpdir_path).handle_output(
+            build_output_context(asset_key=AssetKey("value")), value
+        )
+
+        # values written before `memory_map_buffers` was turned on are still loaded
+        loaded = PickledObjectFilesystemIOManager(
+            base_dir=tmpdir_path, memory_map_buffers=True
+        ).load_input(build_input_context(asset_key=AssetKey("value")))
+        if isinstance(value, list):
+            assert [bytes(item.buffer) for item in loaded] == [b"abc"]
+        else:
+            assert loaded == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [{"a": 1}, ("a", "b"), [ZeroCopyBytes(bytearray(b"abc"))]],
+    ids=["dict", "tuple", "zero_copy"],
+)
+def test_fs_io_manager_load_memory_map_buffers_pickle(value):
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        PickledObjectFilesystemIOManager(
+            base_dir=tmpdir_path, memory_map_buffers=True
+        ).handle_output(build_output_context(asset_key=AssetKey("value")), value)
+
+        # values written with `memory_map_buffers` are still loaded after it is turned off
+        loaded = PickledObjectFilesystemIOManager(base_dir=tmpdir_path).load_input(
+            build_input_context(asset_key=AssetKey("value"))
+        )
+        if isinstance(value, list):
+            assert [bytes(item.buffer) for item in loaded] == [b"abc"]
+        else:
+            assert loaded == value
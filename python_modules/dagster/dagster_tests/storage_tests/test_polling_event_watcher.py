@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import time
 from contextlib import contextmanager
 from typing import Any, Callable, Mapping, Optional
@@ -6,7 +7,13 @@
 import dagster._check as check
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
+from dagster._core.storage.event_log import (
+    ConsolidatedSqliteEventLogStorage,
+    EventLogNotifier,
+    SqliteEventLogStorage,
+    SqlPollingEventWatcher,
+    SqlPollingMultiRunEventWatcher,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
@@ -146,3 +153,185 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+class ConsolidatedSqliteMultiRunPollingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Consolidated SQLite-backed event log storage that uses SqlPollingMultiRunEventWatcher,
+    optionally woken up by an EventLogNotifier, for watching runs.
+    """
+
+    def __init__(self, *args, notifier: Optional[EventLogNotifier] = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._notifier = notifier
+        self._multi_run_watcher: Optional[SqlPollingMultiRunEventWatcher] = None
+
+    def watch(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        callback: Callable[[EventLogEntry, str], None],
+    ):
+        if self._multi_run_watcher is None:
+            self._multi_run_watcher = SqlPollingMultiRunEventWatcher(self, self._notifier)
+
+        self._multi_run_watcher.watch_run(run_id, cursor, callback)
+
+    def end_watch(
+        self,
+        run_id: str,
+        handler: Callable[[EventLogEntry, str], None],
+    ):
+        if self._multi_run_watcher:
+            self._multi_run_watcher.unwatch_run(run_id, handler)
+
+    def dispose(self) -> None:
+        if self._multi_run_watcher:
+            self._multi_run_watcher.close()
+            self._multi_run_watcher = None
+
+
+class ManualEventLogNotifier(EventLogNotifier):
+    def __init__(self):
+        self._event = threading.Event()
+
+    def notify(self):
+        self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        notified = self._event.wait(timeout)
+        self._event.clear()
+        return notified
+
+    def close(self):
+        self._event.set()
+
+
+def _wait_for(condition, attempts=50):
+    while not condition() and attempts > 0:
+        time.sleep(0.1)
+        attempts -= 1
+
+
+def test_get_logs_for_all_runs_by_log_id_run_ids_filter():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteEventLogStorage(tmpdir_path)
+        run_id_one, run_id_two = make_new_run_id(), make_new_run_id()
+        storage.store_event(create_event(1, run_id_one))
+        storage.store_event(create_event(2, run_id_two))
+        storage.store_event(create_event(3, run_id_one))
+
+        events = storage.get_logs_for_all_runs_by_log_id(run_ids=[run_id_one])
+        assert [int(event.message) for event in events.values()] == [1, 3]
+        assert storage.get_logs_for_all_runs_by_log_id(run_ids=[]) == {}
+
+
+def test_multi_run_watcher():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteMultiRunPollingEventLogStorage(tmpdir_path)
+        run_id_one, run_id_two = make_new_run_id(), make_new_run_id()
+        watched_one = []
+        watched_two = []
+
+        def watch_one(event, _cursor):
+            watched_one.append(event)
+
+        def watch_two(event, _cursor):
+            watched_two.append(event)
+
+        storage.store_event(create_event(1, run_id_one))
+        storage.store_event(create_event(2, run_id_two))
+
+        # watch run one from the beginning, and run two only after its first event
+        storage.watch(run_id_one, None, watch_one)
+        storage.watch(run_id_two, str(EventLogCursor.from_storage_id(2)), watch_two)
+
+        storage.store_event(create_event(3, run_id_one))
+        storage.store_event(create_event(4, run_id_two))
+        storage.store_event(create_event(5, make_new_run_id()))
+
+        _wait_for(lambda: len(watched_one) >= 2 and len(watched_two) >= 1)
+        assert [int(event.message) for event in watched_one] == [1, 3]
+        assert [int(event.message) for event in watched_two] == [4]
+
+        storage.end_watch(run_id_one, watch_one)
+        storage.store_event(create_event(6, run_id_one))
+        storage.store_event(create_event(7, run_id_two))
+
+        _wait_for(lambda: len(watched_two) >= 2)
+        assert [int(event.message) for event in watched_one] == [1, 3]
+        assert [int(event.message) for event in watched_two] == [4, 7]
+
+        storage.dispose()
+
+
+def test_multi_run_watcher_notifier():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        notifier = ManualEventLogNotifier()
+        storage = ConsolidatedSqliteMultiRunPollingEventLogStorage(tmpdir_path, notifier=notifier)
+        run_id = make_new_run_id()
+        watched = []
+
+        storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+
+        # let the watcher back off well beyond the default poll period
+        time.sleep(2)
+        storage.store_event(create_event(1, run_id))
+        notifier.notify()
+
+        _wait_for(lambda: len(watched) >= 1, attempts=5)
+        assert [int(event.message) for event in watched] == [1]
+
+        storage.dispose()
+
+
+def test_multi_run_watcher_storage_error():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteMultiRunPollingEventLogStorage(tmpdir_path)
+        run_id = make_new_run_id()
+        watched = []
+        get_logs_for_all_runs_by_log_id = storage.get_logs_for_all_runs_by_log_id
+        num_calls = []
+
+        def _flaky_get_logs_for_all_runs_by_log_id(*args, **kwargs):
+            num_calls.append(1)
+            if len(num_calls) == 1:
+                raise Exception("transient storage error")
+            return get_logs_for_all_runs_by_log_id(*args, **kwargs)
+
+        storage.get_logs_for_all_runs_by_log_id = _flaky_get_logs_for_all_runs_by_log_id
+        storage.store_event(create_event(1, run_id))
+        storage.watch(run_id, None, lambda event, _cursor: watched.append(event))
+        storage.store_event(create_event(2, run_id))
+
+        _wait_for(lambda: len(watched) >= 2)
+        assert len(num_calls) > 1
+        assert [int(event.message) for event in watched] == [1, 2]
+
+        storage.dispose()
+
+
+def test_multi_run_watcher_callback_error():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        storage = ConsolidatedSqliteMultiRunPollingEventLogStorage(tmpdir_path)
+        run_id_one, run_id_two = make_new_run_id(), make_new_run_id()
+        watched_one = []
+        watched_two = []
+
+        def failing_watch_one(_event, _cursor):
+            raise Exception("failing subscriber")
+
+        storage.watch(run_id_one, None, failing_watch_one)
+        storage.watch(run_id_one, None, lambda event, _cursor: watched_one.append(event))
+        storage.watch(run_id_two, None, lambda event, _cursor: watched_two.append(event))
+
+        storage.store_event(create_event(1, run_id_one))
+        storage.store_event(create_event(2, run_id_two))
+        _wait_for(lambda: len(watched_one) >= 1 and len(watched_two) >= 1)
+
+        # the watcher thread keeps delivering events after a callback failed
+        storage.store_event(create_event(3, run_id_one))
+        _wait_for(lambda: len(watched_one) >= 2)
+        assert [int(event.message) for event in watched_one] == [1, 3]
+        assert [int(event.message) for event in watched_two] == [2]
+
+        storage.dispose()
@@ -2,9 +2,12 @@
 from contextlib import contextmanager
 
 import pytest
+from dagster import job, op
+from dagster._core.snap import JobSnapshot
 from dagster._core.storage.legacy_storage import LegacyRunStorage
 from dagster._core.storage.runs import InMemoryRunStorage, SqliteRunStorage
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
+from dagster._serdes import SerializationFormat
 
 from dagster_tests.storage_tests.utils.run_storage import TestRunStorage
 
@@ -15,6 +18,14 @@ def create_sqlite_run_storage():
         yield SqliteRunStorage.from_local(tempdir)
 
 
+@contextmanager
+def create_msgpack_sqlite_run_storage():
+    with tempfile.TemporaryDirectory() as tempdir:
+        yield SqliteRunStorage.from_local(
+            tempdir, snapshot_serialization_format=SerializationFormat.MSGPACK
+        )
+
+
 @contextmanager
 def create_in_memory_storage():
     storage = InMemoryRunStorage()
@@ -40,7 +51,9 @@ def create_legacy_run_storage():
 class TestSqliteImplementation(TestRunStorage):
     __test__ = True
 
-    @pytest.fixture(name="storage", params=[create_sqlite_run_storage])
+    @pytest.fixture(
+        name="storage", params=[create_sqlite_run_storage, create_msgpack_sqlite_run_storage]
+    )
     def run_storage(self, request):
         with request.param() as s:
             yield s
@@ -68,3 +81,32 @@ def run_storage(self, request):
 
     def test_storage_telemetry(self, storage):
         pass
+
+
+def test_sqlite_snapshot_serialization_format_change():
+    @op
+    def noop_op(): ...
+
+    @job
+    def noop_job():
+        noop_op()
+
+    @job(tags={"foo": "bar"})
+    def tagged_noop_job():
+        noop_op()
+
+    json_snapshot = JobSnapshot.from_job_def(noop_job)
+    msgpack_snapshot = JobSnapshot.from_job_def(tagged_noop_job)
+    with tempfile.TemporaryDirectory() as tempdir:
+        json_storage = SqliteRunStorage.from_local(tempdir)
+        json_snapshot_id = json_storage.add_job_snapshot(json_snapshot)
+
+        msgpack_storage = SqliteRunStorage.from_config_value(
+            None,
+            {"base_dir": tempdir, "snapshot_serialization_format": SerializationFormat.MSGPACK},
+        )
+        msgpack_snapshot_id = msgpack_storage.add_job_snapshot(msgpack_snapshot)
+
+        for storage in [json_storage, msgpack_storage]:
+            assert storage.get_job_snapshot(json_snapshot_id) == json_snapshot
+            assert storage.get_job_snapshot(msgpack_snapshot_id) == msgpack_snapshot
@@ -0,0 +1,195 @@
+import asyncio
+
+from dagster import AssetKey, AssetMaterialization
+from dagster._core.remote_representation.origin import (
+    InProcessCodeLocationOrigin,
+    RemoteInstigatorOrigin,
+    RemoteRepositoryOrigin,
+)
+from dagster._core.scheduler.instigation import InstigatorState, InstigatorStatus, InstigatorType
+from dagster._core.storage.dagster_run import DagsterRunStatus, RunRecord
+from dagster._core.storage.shared_record_cache import (
+    ASSET_RECORDS,
+    INSTIGATOR_STATES,
+    RECORD_KINDS,
+    RUN_RECORDS,
+    SharedRecordCache,
+    SharedRecordCacheStats,
+)
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
+from dagster._core.workspace.context import WorkspaceProcessContext
+
+
+def _count_calls(monkeypatch, instance, method_name):
+    calls = []
+    method = getattr(instance, method_name)
+
+    def _method(*args, **kwargs):
+        calls.append(args)
+        return method(*args, **kwargs)
+
+    monkeypatch.setattr(instance, method_name, _method)
+    return calls
+
+
+def test_asset_records_shared_across_scopes(monkeypatch):
+    with instance_for_test() as instance:
+        instance.report_runless_asset_event(AssetMaterialization("a"))
+        cache = SharedRecordCache(instance)
+        calls = _count_calls(monkeypatch, instance, "get_asset_records")
+
+        records = cache.scoped().get_asset_records([AssetKey("a"), AssetKey("b")])
+        assert [record.asset_entry.asset_key for record in records] == [AssetKey("a")]
+        assert calls == [([AssetKey("a"), AssetKey("b")],)]
+
+        scope = cache.scoped()
+        assert scope.get_asset_records([AssetKey("a"), AssetKey("b")]) == records
+        assert len(calls) == 1
+
+        # new events only move the cursor of their own asset, so only that asset is refetched
+        instance.report_runless_asset_event(AssetMaterialization("b"))
+        new_records = cache.scoped().get_asset_records([AssetKey("a"), AssetKey("b")])
+        assert [record.asset_entry.asset_key for record in new_records] == [
+            AssetKey("a"),
+            AssetKey("b"),
+        ]
+        assert calls[1:] == [([AssetKey("b")],)]
+
+        instance.report_runless_asset_event(AssetMaterialization("a"))
+        newest_records = cache.scoped().get_asset_records([AssetKey("a")])
+        assert newest_records != new_records[:1]
+        assert calls[2:] == [([AssetKey("a")],)]
+
+        # wipes do not store an event, but still move the cursor of the asset
+        instance.wipe_assets([AssetKey("a")])
+        assert cache.scoped().get_asset_records([AssetKey("a"), AssetKey("b")]) == new_records[1:]
+        assert calls[3:] == [([AssetKey("a")],)]
+
+
+def test_ttl_and_max_entries(monkeypatch):
+    with instance_for_test() as instance:
+        instance.report_runless_asset_event(AssetMaterialization("a"))
+        calls = _count_calls(monkeypatch, instance, "get_asset_records")
+
+        expired_cache = SharedRecordCache(instance, ttl_seconds=0)
+        expired_cache.scoped().get_asset_records([AssetKey("a")])
+        expired_cache.scoped().get_asset_records([AssetKey("a")])
+        assert len(calls) == 2
+
+        bounded_cache = SharedRecordCache(instance, max_entries=2)
+        bounded_cache.scoped().get_asset_records([AssetKey("a"), AssetKey("b"), AssetKey("c")])
+        assert len(bounded_cache) == 2
+        bounded_cache.scoped().get_asset_records([AssetKey("a")])
+        assert calls[3:] == [([AssetKey("a")],)]
+
+
+def test_stats():
+    with instance_for_test() as instance:
+        instance.report_runless_asset_event(AssetMaterialization("a"))
+        run = create_run_for_test(instance, job_name="foo")
+        cache = SharedRecordCache(instance, max_entries=2)
+        assert cache.get_stats() == {
+            kind: SharedRecordCacheStats(hits=0, misses=0, evictions=0) for kind in RECORD_KINDS
+        }
+
+        cache.scoped().get_asset_records([AssetKey("a"), AssetKey("b")])
+        cache.scoped().get_asset_records([AssetKey("a")])
+        assert cache.get_stats()[ASSET_RECORDS] == SharedRecordCacheStats(
+            hits=1, misses=2, evictions=0
+        )
+
+        # the run record evicts the least recently used asset record
+        cache.scoped().get_run_records([run.run_id])
+        stats = cache.get_stats()
+        assert stats[RUN_RECORDS] == SharedRecordCacheStats(hits=0, misses=1, evictions=0)
+        assert stats[ASSET_RECORDS] == SharedRecordCacheStats(hits=1, misses=2, evictions=1)
+        assert stats[INSTIGATOR_STATES] == SharedRecordCacheStats(hits=0, misses=0, evictions=0)
+
+
+def test_run_records(monkeypatch):
+    with instance_for_test() as instance:
+        run = create_run_for_test(instance, job_name="foo", status=DagsterRunStatus.NOT_STARTED)
+        other_run = create_run_for_test(
+            instance, job_name="foo", status=DagsterRunStatus.NOT_STARTED
+        )
+        cache = SharedRecordCache(instance)
+        calls = _count_calls(monkeypatch, instance, "get_run_records")
+
+        records = cache.scoped().get_run_records([run.run_id, other_run.run_id, "missing"])
+        assert set(records.keys()) == {run.run_id, other_run.run_id}
+        assert cache.scoped().get_run_records([run.run_id, other_run.run_id]) == records
+        assert len(calls) == 1
+
+        # run status changes bump the update timestamp of the run, which only invalidates its
+        # own entry
+        instance.report_run_canceled(run)
+        new_records = cache.scoped().get_run_records([run.run_id, other_run.run_id])
+        assert new_records[run.run_id].dagster_run.status == DagsterRunStatus.CANCELED
+        assert new_records[other_run.run_id] == records[other_run.run_id]
+        assert [call[0].run_ids for call in calls[1:]] == [[run.run_id]]
+
+        instance.add_run_tags(other_run.run_id, {"foo": "bar"})
+        new_records = cache.scoped().get_run_records([other_run.run_id])
+        assert new_records[other_run.run_id].dagster_run.tags["foo"] == "bar"
+
+
+def test_instigator_states(monkeypatch):
+    with instance_for_test() as instance:
+        cache = SharedRecordCache(instance)
+        calls = _count_calls(monkeypatch, instance, "all_instigator_state")
+        assert cache.scoped().all_instigator_state() == []
+        assert cache.scoped().all_instigator_state() == []
+        assert len(calls) == 1
+
+        state = InstigatorState(
+            _sensor_origin(),
+            InstigatorType.SENSOR,
+            InstigatorStatus.RUNNING,
+        )
+        instance.add_instigator_state(state)
+        assert cache.scoped().all_instigator_state() == [state]
+        assert (
+            cache.scoped().get_instigator_state(state.instigator_origin_id, state.selector_id)
+            == state
+        )
+
+        stopped_state = state.with_status(InstigatorStatus.STOPPED)
+        instance.update_instigator_state(stopped_state)
+        assert (
+            cache.scoped().get_instigator_state(state.instigator_origin_id, state.selector_id)
+            == stopped_state
+        )
+
+
+def test_request_context_shares_cache(monkeypatch):
+    with instance_for_test() as instance:
+        instance.report_runless_asset_event(AssetMaterialization("a"))
+        run = create_run_for_test(instance, job_name="foo")
+        cache = SharedRecordCache(instance)
+        asset_record_calls = _count_calls(monkeypatch, instance, "get_asset_records")
+        run_record_calls = _count_calls(monkeypatch, instance, "get_run_records")
+        with WorkspaceProcessContext(instance, None, shared_record_cache=cache) as process_context:
+            for _ in range(2):
+                request_context = process_context.create_request_context()
+                loader = request_context.asset_record_loader
+                loader.add_asset_keys([AssetKey("a")])
+                assert loader.get_asset_record(AssetKey("a"))
+
+                record = asyncio.run(RunRecord.gen(request_context, run.run_id))
+                assert record.dagster_run.run_id == run.run_id
+
+            assert len(asset_record_calls) == 1
+            assert len(run_record_calls) == 1
+
+
+def _sensor_origin():
+    return RemoteInstigatorOrigin(
+        RemoteRepositoryOrigin(
+            InProcessCodeLocationOrigin(
+                LoadableTargetOrigin(python_file=__file__, attribute="fake_repo")
+            ),
+            "fake_repo",
+        ),
+        "my_sensor",
+    )
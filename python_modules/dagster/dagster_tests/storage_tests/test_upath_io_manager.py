@@ -2,6 +2,7 @@
 import json
 import pickle
 import sys
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional, cast
@@ -36,6 +37,10 @@
 )
 from dagster._core.events import HandledOutputData
 from dagster._core.storage.io_manager import IOManagerDefinition
+from dagster._core.storage.tags import (
+    ASSET_PARTITION_RANGE_END_TAG,
+    ASSET_PARTITION_RANGE_START_TAG,
+)
 from dagster._core.storage.upath_io_manager import UPathIOManager
 from fsspec.asyn import AsyncFileSystem
 from pydantic import (
@@ -664,3 +669,211 @@ def my_asset():
     assert materialize(
         [my_asset], resources={"io_manager": my_io_manager}, partition_key=start.strftime(daily.fmt)
     ).success
+
+
+class ThreadTrackingPickleIOManager(PickleIOManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.thread_names = set()
+
+    def dump_to_path(self, context: OutputContext, obj: List, path: UPath):
+        self.thread_names.add(threading.current_thread().name)
+        super().dump_to_path(context, obj, path)
+
+    def load_from_path(self, context: InputContext, path: UPath) -> List:
+        self.thread_names.add(threading.current_thread().name)
+        return super().load_from_path(context, path)
+
+
+@pytest.mark.parametrize("max_partition_io_workers", [None, 4])
+def test_upath_io_manager_multi_partition_output(tmp_path: Path, max_partition_io_workers):
+    my_io_manager = ThreadTrackingPickleIOManager(
+        UPath(tmp_path), max_partition_io_workers=max_partition_io_workers
+    )
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+
+    @asset(partitions_def=partitions_def)
+    def upstream_asset(context: AssetExecutionContext) -> Dict[str, List[str]]:
+        return {partition_key: [partition_key] for partition_key in context.partition_keys}
+
+    @asset(ins={"upstream_asset": AssetIn(partition_mapping=AllPartitionMapping())})
+    def downstream_asset(upstream_asset: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        return upstream_asset
+
+    result = materialize(
+        [upstream_asset, downstream_asset],
+        resources={"io_manager": my_io_manager},
+        tags={ASSET_PARTITION_RANGE_START_TAG: "a", ASSET_PARTITION_RANGE_END_TAG: "d"},
+    )
+    assert result.success
+    for partition_key in ["a", "b", "c", "d"]:
+        with (tmp_path / "upstream_asset" / partition_key).open("rb") as file:
+            assert pickle.load(file) == [partition_key]
+
+    assert result.output_for_node("downstream_asset") == {
+        partition_key: [partition_key] for partition_key in ["a", "b", "c", "d"]
+    }
+
+    if max_partition_io_workers:
+        assert any(name.startswith("upath_io_manager") for name in my_io_manager.thread_names)
+    else:
+        assert my_io_manager.thread_names == {threading.current_thread().name}
+
+
+def test_upath_io_manager_multi_partition_output_not_dict(tmp_path: Path):
+    partitions_def = StaticPartitionsDefinition(["a", "b"])
+
+    @asset(partitions_def=partitions_def)
+    def upstream_asset(context: AssetExecutionContext) -> List[str]:
+        return context.partition_keys
+
+    with pytest.raises(Exception, match="dictionary with an entry for each partition key"):
+        materialize(
+            [upstream_asset],
+            resources={"io_manager": PickleIOManager(UPath(tmp_path))},
+            tags={ASSET_PARTITION_RANGE_START_TAG: "a", ASSET_PARTITION_RANGE_END_TAG: "b"},
+        )
+
+
+@pytest.mark.parametrize("allow_missing_partitions", [True, False])
+def test_upath_io_manager_concurrent_missing_partitions(
+    tmp_path: Path, allow_missing_partitions: bool
+):
+    my_io_manager = PickleIOManager(UPath(tmp_path), max_partition_io_workers=4)
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def upstream_asset(context: AssetExecutionContext) -> List[str]:
+        return [context.partition_key]
+
+    @asset(
+        ins={
+            "upstream_asset": AssetIn(
+                partition_mapping=AllPartitionMapping(),
+                metadata={"allow_missing_partitions": allow_missing_partitions},
+            )
+        }
+    )
+    def downstream_asset(upstream_asset: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        return upstream_asset
+
+    for partition_key in ["a", "c"]:
+        materialize(
+            [upstream_asset], resources={"io_manager": my_io_manager}, partition_key=partition_key
+        )
+
+    if allow_missing_partitions:
+        result = materialize(
+            [upstream_asset.to_source_asset(), downstream_asset],
+            resources={"io_manager": my_io_manager},
+        )
+        assert result.output_for_node("downstream_asset") == {"a": ["a"], "c": ["c"]}
+    else:
+        with pytest.raises(FileNotFoundError):
+            materialize(
+                [upstream_asset.to_source_asset(), downstream_asset],
+                resources={"io_manager": my_io_manager},
+            )
+
+
+class LoadTrackingPickleIOManager(PickleIOManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.loaded_paths = []
+
+    def load_from_path(self, context: InputContext, path: UPath) -> List:
+        self.loaded_paths.append(path)
+        return super().load_from_path(context, path)
+
+
+@pytest.mark.parametrize("max_partition_io_workers", [None, 4])
+def test_upath_io_manager_index_partition_paths(tmp_path: Path, max_partition_io_workers):
+    my_io_manager = LoadTrackingPickleIOManager(
+        UPath(tmp_path),
+        max_partition_io_workers=max_partition_io_workers,
+        index_partition_paths=True,
+    )
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+
+    @asset(partitions_def=partitions_def)
+    def upstream_asset(context: AssetExecutionContext) -> List[str]:
+        return [context.partition_key]
+
+    @asset(
+        ins={
+            "upstream_asset": AssetIn(
+                partition_mapping=AllPartitionMapping(),
+                metadata={"allow_missing_partitions": True},
+            )
+        }
+    )
+    def downstream_asset(upstream_asset: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        return upstream_asset
+
+    for partition_key in ["a", "c"]:
+        materialize(
+            [upstream_asset], resources={"io_manager": my_io_manager}, partition_key=partition_key
+        )
+
+    result = materialize(
+        [upstream_asset.to_source_asset(), downstream_asset],
+        resources={"io_manager": my_io_manager},
+    )
+    assert result.output_for_node("downstream_asset") == {"a": ["a"], "c": ["c"]}
+    # the missing partitions were skipped without attempting to load them
+    assert sorted(path.name for path in my_io_manager.loaded_paths) == ["a", "c"]
+
+
+def test_upath_io_manager_index_partition_paths_missing(tmp_path: Path):
+    my_io_manager = PickleIOManager(UPath(tmp_path), index_partition_paths=True)
+    partitions_def = StaticPartitionsDefinition(["a", "b"])
+
+    @asset(partitions_def=partitions_def)
+    def upstream_asset(context: AssetExecutionContext) -> List[str]:
+        return [context.partition_key]
+
+    @asset(ins={"upstream_asset": AssetIn(partition_mapping=AllPartitionMapping())})
+    def downstream_asset(upstream_asset: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        return upstream_asset
+
+    materialize([upstream_asset], resources={"io_manager": my_io_manager}, partition_key="a")
+
+    with pytest.raises(FileNotFoundError):
+        materialize(
+            [upstream_asset.to_source_asset(), downstream_asset],
+            resources={"io_manager": my_io_manager},
+        )
+
+
+def test_upath_io_manager_index_partition_paths_backcompat(tmp_path: Path):
+    my_io_manager = LoadTrackingPickleIOManager(UPath(tmp_path), index_partition_paths=True)
+    partitions_def = MultiPartitionsDefinition(
+        {"abc": StaticPartitionsDefinition(["a", "b"]), "num": StaticPartitionsDefinition(["1"])}
+    )
+
+    @asset(partitions_def=partitions_def)
+    def upstream_asset(context: AssetExecutionContext) -> List[str]:
+        return [context.partition_key]
+
+    @asset
+    def downstream_asset(upstream_asset: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        return upstream_asset
+
+    materialize(
+        [upstream_asset],
+        resources={"io_manager": my_io_manager},
+        partition_key=MultiPartitionKey({"abc": "a", "num": "1"}),
+    )
+    # partitions written by old versions are stored at the backcompat path
+    with (tmp_path / "upstream_asset" / "b|1").open("wb") as file:
+        pickle.dump(["b|1"], file)
+
+    result = materialize(
+        [upstream_asset.to_source_asset(), downstream_asset],
+        resources={"io_manager": my_io_manager},
+    )
+    assert result.output_for_node("downstream_asset") == {"a|1": ["a|1"], "b|1": ["b|1"]}
+    assert sorted(str(path.relative_to(tmp_path)) for path in my_io_manager.loaded_paths) == [
+        "upstream_asset/a/1",
+        "upstream_asset/b|1",
+    ]
@@ -91,7 +91,11 @@
     RemoteRepositoryOrigin,
 )
 from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecordStatus
-from dagster._core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
+from dagster._core.storage.event_log import (
+    InMemoryEventLogStorage,
+    SqlEventLogStorage,
+    base as event_log_base,
+)
 from dagster._core.storage.event_log.base import EventLogStorage
 from dagster._core.storage.event_log.migration import (
     EVENT_LOG_DATA_MIGRATIONS,
@@ -919,6 +923,66 @@ def test_get_logs_for_run_cursor_limit(self, test_run_id, storage):
 
         assert _event_types(out_events) == _event_types(events)
 
+    def test_get_storage_ids_for_run(self, test_run_id, storage):
+        events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
+
+        for event in events:
+            storage.store_event(event)
+
+        event_records = storage.get_records_for_run(
+            result.run_id, of_type=set(DagsterEventType)
+        ).records
+        storage_ids = [r.storage_id for r in event_records]
+        assert len(storage_ids) > 3
+
+        assert (
+            storage.get_storage_ids_for_run(
+                result.run_id, -1, storage_ids[-1], of_type=set(DagsterEventType)
+            )
+            == storage_ids
+        )
+        assert (
+            storage.get_storage_ids_for_run(
+                result.run_id, storage_ids[0], storage_ids[2], of_type=set(DagsterEventType)
+            )
+            == storage_ids[1:3]
+        )
+
+    def test_get_storage_ids_for_run_default_pages(self, test_run_id, storage, monkeypatch):
+        events, result = _synthesize_events(return_one_op_func, run_id=test_run_id)
+
+        for event in events:
+            storage.store_event(event)
+
+        storage_ids = [r.storage_id for r in storage.get_records_for_run(result.run_id).records]
+        assert len(storage_ids) > 5
+
+        limits = []
+        get_records_for_run = storage.get_records_for_run
+
+        def _get_records_for_run(run_id, cursor=None, of_type=None, limit=None, ascending=True):
+            limits.append(limit)
+            return get_records_for_run(run_id, cursor, of_type, limit, ascending)
+
+        monkeypatch.setattr(storage, "get_records_for_run", _get_records_for_run)
+        monkeypatch.setattr(event_log_base, "STORAGE_IDS_FOR_RUN_PAGE_SIZE", 2)
+
+        # the default implementation pages through the run and stops after the range
+        assert (
+            EventLogStorage.get_storage_ids_for_run(
+                storage, result.run_id, storage_ids[0], storage_ids[4]
+            )
+            == storage_ids[1:5]
+        )
+        assert limits == [2, 2]
+
+        limits.clear()
+        assert (
+            EventLogStorage.get_storage_ids_for_run(storage, result.run_id, -1, storage_ids[-1])
+            == storage_ids
+        )
+        assert set(limits) == {2}
+
     def test_get_logs_for_run_cursor_offset_limit(self, test_run_id, storage):
         if not self.supports_offset_cursor_queries():
             pytest.skip("storage does not support deprecated offset cursor queries")
@@ -1260,6 +1324,40 @@ def foo():
             result = storage.fetch_materializations(foo.key, limit=100)
             assert len(result.records) == 2
 
+    def test_store_event_batch_mixed_events(self, storage, test_run_id):
+        asset_key = AssetKey(["path", "to", "batched_asset"])
+
+        @op
+        def materialize(context):
+            context.log.info("before")
+            yield AssetMaterialization(asset_key=asset_key, metadata={"count": 1}, partition="1")
+            context.log.info("between")
+            yield AssetMaterialization(asset_key=asset_key, metadata={"count": 2}, partition="2")
+            yield Output(1)
+
+        def _ops():
+            materialize()
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            events, _ = _synthesize_events(_ops, instance=created_instance, run_id=test_run_id)
+            step_events = [event for event in events if event.step_key]
+            storage.store_event_batch(step_events)
+
+            logs = storage.get_logs_for_run(test_run_id)
+            assert [log.user_message for log in logs] == [
+                event.user_message for event in step_events
+            ]
+
+            result = storage.fetch_materializations(asset_key, limit=100)
+            assert len(result.records) == 2
+
+            latest = storage.get_latest_materialization_events([asset_key])[asset_key]
+            assert latest
+            assert latest.asset_materialization.partition == "2"
+
     def test_asset_materialization_fetch(self, storage, test_run_id):
         asset_key = AssetKey(["path", "to", "asset_one"])
 
@@ -2425,6 +2523,65 @@ def test_asset_wipe(self, storage, instance):
                         assert len(asset_keys) == 1
                         assert storage.has_asset_key(AssetKey("asset_1"))
 
+    def test_asset_event_cursors(self, storage, instance):
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            asset_keys = [AssetKey("asset_1"), AssetKey("asset_2")]
+            if storage.get_asset_event_cursors(asset_keys) is None:
+                pytest.skip("Storage does not have asset event cursors")
+
+            run_id = make_new_run_id()
+            events, _ = _synthesize_events(
+                lambda: one_asset_op(), run_id=run_id, instance=created_instance
+            )
+            with create_and_delete_test_runs(instance, [run_id]):
+                for event in events:
+                    storage.store_event(event)
+
+                cursors = storage.get_asset_event_cursors(asset_keys)
+                assert list(cursors.keys()) == [AssetKey("asset_1")]
+
+                # storing events for another asset leaves the cursor of the first asset alone
+                other_run_id = make_new_run_id()
+                events, _ = _synthesize_events(
+                    lambda: two_asset_ops(), run_id=other_run_id, instance=created_instance
+                )
+                with create_and_delete_test_runs(instance, [other_run_id]):
+                    for event in events:
+                        if event.is_dagster_event and event.dagster_event.asset_key == AssetKey(
+                            "asset_2"
+                        ):
+                            storage.store_event(event)
+
+                    new_cursors = storage.get_asset_event_cursors(asset_keys)
+                    assert set(new_cursors.keys()) == set(asset_keys)
+                    assert new_cursors[AssetKey("asset_1")] == cursors[AssetKey("asset_1")]
+
+                    for event in events:
+                        if event.is_dagster_event and event.dagster_event.asset_key == AssetKey(
+                            "asset_1"
+                        ):
+                            storage.store_event(event)
+                    materialized_cursors = storage.get_asset_event_cursors(asset_keys)
+                    assert (
+                        materialized_cursors[AssetKey("asset_1")]
+                        != new_cursors[AssetKey("asset_1")]
+                    )
+                    assert (
+                        materialized_cursors[AssetKey("asset_2")]
+                        == new_cursors[AssetKey("asset_2")]
+                    )
+
+                    if self.can_wipe():
+                        storage.wipe_asset(AssetKey("asset_2"))
+                        wiped_cursors = storage.get_asset_event_cursors(asset_keys)
+                        assert (
+                            wiped_cursors[AssetKey("asset_2")]
+                            != materialized_cursors[AssetKey("asset_2")]
+                        )
+
     def test_asset_secondary_index(self, storage, instance):
         with instance_for_test() as created_instance:
             if not storage.has_instance:
@@ -1,3 +1,4 @@
+import json
 import time
 
 import pytest
@@ -15,6 +16,7 @@
     define_asset_job,
 )
 from dagster._core.definitions.asset_graph import AssetGraph
+from dagster._core.definitions.partition import DefaultPartitionsSubset
 from dagster._core.definitions.time_window_partitions import HourlyPartitionsDefinition
 from dagster._core.events import (
     AssetMaterializationPlannedData,
@@ -28,7 +30,7 @@
     get_and_update_asset_status_cache_value,
     get_last_planned_storage_id,
 )
-from dagster._core.test_utils import create_run_for_test
+from dagster._core.test_utils import create_run_for_test, environ
 from dagster._core.utils import make_new_run_id
 from dagster._utils import Counter, traced_counter
 
@@ -240,8 +242,8 @@ def asset1():
         assert cached_status.latest_storage_id
         assert cached_status.partitions_def_id
         assert cached_status.serialized_materialized_partition_subset
-        materialized_keys = partitions_def.deserialize_subset(
-            cached_status.serialized_materialized_partition_subset
+        materialized_keys = cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
         ).get_partition_keys()
         assert len(list(materialized_keys)) == 1
         assert MultiPartitionKey({"ab": "a", "12": "1"}) in materialized_keys
@@ -255,8 +257,8 @@ def asset1():
         )
         assert cached_status
         assert cached_status.serialized_materialized_partition_subset
-        materialized_keys = partitions_def.deserialize_subset(
-            cached_status.serialized_materialized_partition_subset
+        materialized_keys = cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
         ).get_partition_keys()
         assert len(list(materialized_keys)) == 2
         assert all(
@@ -267,6 +269,105 @@ def asset1():
             ]
         )
 
+    def test_multipartition_time_window_cached_status(self, instance):
+        with environ({"DAGSTER_COMPACT_MULTI_PARTITIONS_STATUS_CACHE": "1"}):
+            partitions_def = MultiPartitionsDefinition(
+                {
+                    "date": DailyPartitionsDefinition(start_date="2022-01-01"),
+                    "static": StaticPartitionsDefinition(["a", "b"]),
+                }
+            )
+            asset_key = AssetKey("asset1")
+
+            def _materialize(partition_keys):
+                for partition_key in partition_keys:
+                    instance.report_runless_asset_event(
+                        AssetMaterialization(asset_key=asset_key, partition=partition_key)
+                    )
+
+            first_keys = {f"2022-01-{day:02d}|a" for day in range(1, 31)}
+            _materialize(first_keys)
+
+            cached_status = get_and_update_asset_status_cache_value(
+                instance, asset_key, partitions_def
+            )
+            assert cached_status
+            assert cached_status.serialized_materialized_partition_subset
+            assert (
+                set(
+                    cached_status.deserialize_materialized_partition_subsets(
+                        partitions_def
+                    ).get_partition_keys()
+                )
+                == first_keys
+            )
+            # a contiguous range of dates is stored as one time window instead of thirty keys
+            serialized = json.loads(cached_status.serialized_materialized_partition_subset)
+            assert set(serialized["subsets"].keys()) == {"a"}
+
+            second_keys = {"2022-01-31|a", "2022-01-01|b"}
+            _materialize(second_keys)
+
+            cached_status = get_and_update_asset_status_cache_value(
+                instance, asset_key, partitions_def
+            )
+            assert cached_status
+            assert (
+                set(
+                    cached_status.deserialize_materialized_partition_subsets(
+                        partitions_def
+                    ).get_partition_keys()
+                )
+                == first_keys | second_keys
+            )
+
+    def test_multipartition_cached_status_default_format_backcompat(self, instance):
+        with environ({"DAGSTER_COMPACT_MULTI_PARTITIONS_STATUS_CACHE": "1"}):
+            partitions_def = MultiPartitionsDefinition(
+                {
+                    "date": DailyPartitionsDefinition(start_date="2022-01-01"),
+                    "static": StaticPartitionsDefinition(["a", "b"]),
+                }
+            )
+            asset_key = AssetKey("asset1")
+
+            instance.report_runless_asset_event(
+                AssetMaterialization(asset_key=asset_key, partition="2022-01-01|a")
+            )
+            cached_status = get_and_update_asset_status_cache_value(
+                instance, asset_key, partitions_def
+            )
+            assert cached_status
+
+            # cache values written before multi-partitioned subsets were stored by dimension list
+            # every partition key
+            if not instance.event_log_storage.can_write_asset_status_cache():
+                return
+            instance.update_asset_cached_status_data(
+                asset_key,
+                cached_status._replace(
+                    serialized_materialized_partition_subset=DefaultPartitionsSubset(
+                        {"2022-01-01|a"}
+                    ).serialize(),
+                    serialized_failed_partition_subset=DefaultPartitionsSubset().serialize(),
+                    serialized_in_progress_partition_subset=DefaultPartitionsSubset().serialize(),
+                ),
+            )
+
+            instance.report_runless_asset_event(
+                AssetMaterialization(asset_key=asset_key, partition="2022-01-02|b")
+            )
+            cached_status = get_and_update_asset_status_cache_value(
+                instance, asset_key, partitions_def
+            )
+            assert cached_status
+            assert set(
+                cached_status.deserialize_materialized_partition_subsets(
+                    partitions_def
+                ).get_partition_keys()
+            ) == {"2022-01-01|a", "2022-01-02|b"}
+            assert "subsets" in json.loads(cached_status.serialized_materialized_partition_subset)
+
     def test_cached_status_on_wipe(self, instance):
         partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
 
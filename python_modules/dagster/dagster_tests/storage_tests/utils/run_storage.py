@@ -28,7 +28,8 @@
 from dagster._core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.base import RunStorage
-from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
+from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS, RUN_KEYS
+from dagster._core.storage.runs.schema import RunKeysTable, SecondaryIndexMigrationTable
 from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
@@ -37,6 +38,8 @@
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
     RUN_FAILURE_REASON_TAG,
+    RUN_KEY_TAG,
+    SENSOR_NAME_TAG,
 )
 from dagster._core.test_utils import freeze_time
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
@@ -570,6 +573,142 @@ def test_fetch_count_by_tag(self, storage: RunStorage):
             ("mytag2", {"world"}),
         ]
 
+    def test_get_runs_for_run_keys(self, storage: RunStorage):
+        job_name = "some_job"
+        origin_one = self.fake_job_origin(job_name, "fake_repo_one")
+        origin_two = self.fake_job_origin(job_name, "fake_repo_two")
+        selector_id = origin_one.repository_origin.get_selector_id()
+
+        def _add_run(run_key, sensor_name, origin=None):
+            run_id = make_new_run_id()
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    job_name=job_name,
+                    tags={RUN_KEY_TAG: run_key, SENSOR_NAME_TAG: sensor_name},
+                    external_job_origin=origin,
+                )
+            )
+            return run_id
+
+        first_a = _add_run("a", "my_sensor", origin_one)
+        second_a = _add_run("a", "my_sensor", origin_one)
+        b = _add_run("b", "my_sensor")
+        _add_run("c", "my_sensor", origin_one)
+        _add_run("a", "other_sensor", origin_one)
+        _add_run("b", "my_sensor", origin_two)
+        storage.add_run(
+            TestRunStorage.build_run(run_id=make_new_run_id(), job_name=job_name, tags={})
+        )
+
+        def _run_ids(run_keys):
+            return [
+                run.run_id
+                for run in storage.get_runs_for_run_keys(run_keys, "my_sensor", selector_id)
+            ]
+
+        assert _run_ids([]) == []
+        assert _run_ids(["d"]) == []
+        assert _run_ids(["a"]) == [second_a, first_a]
+        assert set(_run_ids(["a", "b", "d"])) == {first_a, second_a, b}
+
+        # run keys added after the run was created are picked up
+        tagged = make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=tagged,
+                job_name=job_name,
+                tags={SENSOR_NAME_TAG: "my_sensor"},
+                external_job_origin=origin_one,
+            )
+        )
+        assert _run_ids(["e"]) == []
+        storage.add_run_tags(tagged, {RUN_KEY_TAG: "e"})
+        assert _run_ids(["e"]) == [tagged]
+
+        if self.can_delete_runs():
+            storage.delete_run(second_a)
+            assert _run_ids(["a"]) == [first_a]
+
+    def test_migrate_run_keys(self, storage: RunStorage):
+        self._skip_in_memory(storage)
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        origin = self.fake_job_origin("some_job", "fake_repo_one")
+        selector_id = origin.repository_origin.get_selector_id()
+        run_ids = [make_new_run_id() for _ in range(3)]
+        for i, run_id in enumerate(run_ids):
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    job_name="some_job",
+                    tags={RUN_KEY_TAG: str(i), SENSOR_NAME_TAG: "my_sensor"},
+                    external_job_origin=origin,
+                )
+            )
+
+        # simulate runs written before the run key index existed
+        with storage.connect() as conn:
+            conn.execute(RunKeysTable.delete())
+        assert storage.get_runs_for_run_keys(["0", "1", "2"], "my_sensor", selector_id) == []
+
+        REQUIRED_DATA_MIGRATIONS[RUN_KEYS]()(storage, None)
+        assert [
+            run.run_id
+            for run in storage.get_runs_for_run_keys(["0", "1", "2"], "my_sensor", selector_id)
+        ] == list(reversed(run_ids))
+
+        # the backfill is idempotent
+        REQUIRED_DATA_MIGRATIONS[RUN_KEYS]()(storage, None)
+        assert len(storage.get_runs_for_run_keys(["0"], "my_sensor", selector_id)) == 1
+
+    def test_run_keys_table_added_while_in_use(self, storage: RunStorage):
+        self._skip_in_memory(storage)
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        origin = self.fake_job_origin("some_job", "fake_repo_one")
+        selector_id = origin.repository_origin.get_selector_id()
+
+        def _add_run(run_key):
+            run_id = make_new_run_id()
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id,
+                    job_name="some_job",
+                    tags={RUN_KEY_TAG: run_key, SENSOR_NAME_TAG: "my_sensor"},
+                    external_job_origin=origin,
+                )
+            )
+            return run_id
+
+        # simulate a storage that was loaded before the run keys table was added
+        with storage.connect() as conn:
+            RunKeysTable.drop(conn)
+            conn.execute(
+                SecondaryIndexMigrationTable.delete().where(
+                    SecondaryIndexMigrationTable.c.name == RUN_KEYS
+                )
+            )
+        assert not storage.has_run_keys_table
+        before = _add_run("before")
+        assert [
+            run.run_id
+            for run in storage.get_runs_for_run_keys(["before"], "my_sensor", selector_id)
+        ] == [before]
+
+        # runs created after another process migrates the storage are written to the new table
+        with storage.connect() as conn:
+            RunKeysTable.create(conn)
+        storage.migrate()
+        after = _add_run("after")
+        assert storage.has_run_keys_table
+        assert [
+            run.run_id
+            for run in storage.get_runs_for_run_keys(["before", "after"], "my_sensor", selector_id)
+        ] == [after, before]
+
     def test_fetch_by_tags(self, storage):
         assert storage
         one = make_new_run_id()
@@ -791,6 +930,35 @@ def _run_ids(records):
         assert _run_ids(storage.get_run_records(cursor=three, limit=1)) == [two]
         assert _run_ids(storage.get_run_records(cursor=one, limit=1, ascending=True)) == [two]
 
+    def test_get_run_record_cursors(self, storage):
+        assert storage
+        [one, two] = [make_new_run_id() for _ in range(2)]
+        if storage.get_run_record_cursors([one, two]) is None:
+            pytest.skip("Storage does not have run record cursors")
+
+        for run_id in [one, two]:
+            storage.add_run(
+                TestRunStorage.build_run(
+                    run_id=run_id, job_name="some_pipeline", status=DagsterRunStatus.STARTED
+                )
+            )
+        cursors = storage.get_run_record_cursors([one, two, "missing"])
+        assert set(cursors.keys()) == {one, two}
+
+        # the status is part of the cursor, so status changes move it even on storages that only
+        # keep update timestamps to the second
+        storage.handle_run_event(
+            one,
+            DagsterEvent(
+                message="a message",
+                event_type_value=DagsterEventType.PIPELINE_SUCCESS.value,
+                job_name="some_pipeline",
+            ),
+        )
+        updated_cursors = storage.get_run_record_cursors([one, two])
+        assert updated_cursors[one] != cursors[one]
+        assert updated_cursors[two] == cursors[two]
+
     def test_fetch_records_by_update_timestamp(self, storage):
         assert storage
         self._skip_in_memory(storage)
@@ -119,11 +119,13 @@ def get_version() -> str:
     ],
     extras_require={
         "docker": ["docker"],
+        "msgpack": ["msgpack"],
         "test": [
             "buildkite-test-collector",
             "docker",
             f"grpcio-tools>={GRPC_VERSION_FLOOR}",
             "mock==3.0.5",
+            "msgpack",
             "mypy-protobuf",
             "objgraph",
             "pytest-cov==5.0.0",
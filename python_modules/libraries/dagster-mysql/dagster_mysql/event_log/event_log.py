@@ -13,7 +13,7 @@
     AssetKeyTable,
     SqlEventLogStorage,
     SqlEventLogStorageMetadata,
-    SqlPollingEventWatcher,
+    SqlPollingMultiRunEventWatcher,
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
@@ -58,7 +58,7 @@ class MySQLEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = check.str_param(mysql_url, "mysql_url")
-        self._event_watcher: Optional[SqlPollingEventWatcher] = None
+        self._event_watcher: Optional[SqlPollingMultiRunEventWatcher] = None
 
         # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
         self._engine = create_engine(
@@ -200,7 +200,7 @@ def watch(self, run_id: str, cursor: Optional[str], callback: EventHandlerFn) ->
             check.failed("Cannot call `watch` with an offset cursor")
 
         if self._event_watcher is None:
-            self._event_watcher = SqlPollingEventWatcher(self)
+            self._event_watcher = SqlPollingMultiRunEventWatcher(self)
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
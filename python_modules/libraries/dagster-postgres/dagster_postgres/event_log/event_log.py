@@ -1,5 +1,17 @@
 from contextlib import contextmanager
-from typing import Any, ContextManager, Iterator, Mapping, Optional, Sequence, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
 
 import dagster._check as check
 import sqlalchemy as db
@@ -8,7 +20,12 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, BATCH_WRITABLE_EVENTS
+from dagster._core.events import (
+    ASSET_CHECK_EVENTS,
+    ASSET_EVENTS,
+    EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
+    DagsterEventType,
+)
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
@@ -20,7 +37,7 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
-from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.polling_event_watcher import SqlPollingMultiRunEventWatcher
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -41,6 +58,10 @@
     retry_pg_creation_fn,
     set_pg_statement_timeout,
 )
+from .notifier import PostgresEventLogNotifier
+
+if TYPE_CHECKING:
+    from dagster._core.definitions.events import AssetKey
 
 CHANNEL_NAME = "run_events"
 
@@ -90,7 +111,7 @@ def __init__(
         self._engine = create_engine(
             self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
         )
-        self._event_watcher: Optional[SqlPollingEventWatcher] = None
+        self._event_watcher: Optional[SqlPollingMultiRunEventWatcher] = None
 
         self._secondary_index_cache = {}
 
@@ -183,7 +204,7 @@ def store_event(self, event: EventLogEntry) -> None:
             res = result.fetchone()
             result.close()
 
-            # LISTEN/NOTIFY no longer used for pg event watch - preserved here to support version skew
+            # wakes up any PostgresEventLogNotifier listening on the channel
             conn.execute(
                 db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
@@ -211,8 +232,12 @@ def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
         check.sequence_param(events, "event", of_type=EventLogEntry)
 
         check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
+            not any(
+                entry.is_dagster_event
+                and entry.get_dagster_event().event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS
+                for entry in events
+            ),
+            "Run status events cannot be written in a batch.",
         )
 
         insert_event_statement = self.prepare_insert_event_batch(events)
@@ -220,13 +245,43 @@ def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
             result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
             event_ids = [cast(int, row[0]) for row in result.fetchall()]
 
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
+            # wake up any PostgresEventLogNotifier listening on the channel, once per run
+            last_event_id_by_run_id = {
+                entry.run_id: event_id for entry, event_id in zip(events, event_ids)
+            }
+            for run_id, event_id in last_event_id_by_run_id.items():
+                conn.execute(
+                    db.text(f"""NOTIFY {CHANNEL_NAME}, :notify_id; """),
+                    {"notify_id": run_id + "_" + str(event_id)},
+                )
 
         if any((event_id is None for event_id in event_ids)):
             raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
 
-        self.store_asset_event_tags(events, event_ids)
+        asset_events: List[EventLogEntry] = []
+        asset_event_ids: List[int] = []
+        # We only update the asset table with the last event of each type for each asset
+        last_asset_events: Dict[Tuple["AssetKey", DagsterEventType], Tuple[EventLogEntry, int]] = {}
+        for entry, event_id in zip(events, event_ids):
+            if not entry.is_dagster_event:
+                continue
+
+            dagster_event = entry.get_dagster_event()
+            if dagster_event.event_type in ASSET_EVENTS and dagster_event.asset_key:
+                asset_events.append(entry)
+                asset_event_ids.append(event_id)
+                last_asset_events[(dagster_event.asset_key, dagster_event.event_type)] = (
+                    entry,
+                    event_id,
+                )
+            elif dagster_event.event_type in ASSET_CHECK_EVENTS:
+                self.store_asset_check_event(entry, event_id)
+
+        for entry, event_id in last_asset_events.values():
+            self.store_asset_event(entry, event_id)
+
+        if asset_events:
+            self.store_asset_event_tags(asset_events, asset_event_ids)
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
@@ -344,7 +399,9 @@ def watch(
         if cursor and EventLogCursor.parse(cursor).is_offset_cursor():
             check.failed("Cannot call `watch` with an offset cursor")
         if self._event_watcher is None:
-            self._event_watcher = SqlPollingEventWatcher(self)
+            self._event_watcher = SqlPollingMultiRunEventWatcher(
+                self, notifier=PostgresEventLogNotifier(self.postgres_url, CHANNEL_NAME)
+            )
 
         self._event_watcher.watch_run(run_id, cursor, callback)
 
@@ -0,0 +1,86 @@
+import logging
+import select
+import socket
+import threading
+from typing import Optional
+
+import dagster._check as check
+import psycopg2.extensions
+from dagster._core.storage.event_log.polling_event_watcher import EventLogNotifier
+
+from ..utils import get_conn
+
+
+class PostgresEventLogNotifier(EventLogNotifier):
+    """Wakes up a SqlPollingMultiRunEventWatcher when PostgresEventLogStorage sends a NOTIFY for a
+    newly stored event.
+
+    Holds a dedicated connection that LISTENs on the notification channel. If the connection cannot
+    be established (e.g. behind a pooler that does not support LISTEN), `wait` degrades to a plain
+    sleep and the watcher falls back to polling.
+    """
+
+    def __init__(self, postgres_url: str, channel: str):
+        self._postgres_url = check.str_param(postgres_url, "postgres_url")
+        self._channel = check.str_param(channel, "channel")
+        self._conn: Optional[psycopg2.extensions.connection] = None
+        self._has_warned = False
+        self._lock = threading.Lock()
+        # used to interrupt a pending select() when the notifier is closed
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._closed = False
+
+    def _get_listening_connection(self) -> Optional[psycopg2.extensions.connection]:
+        if self._conn is None:
+            try:
+                conn = get_conn(self._postgres_url)
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {self._channel};")
+                self._conn = conn
+            except psycopg2.Error:
+                if not self._has_warned:
+                    self._has_warned = True
+                    logging.getLogger("dagster").warning(
+                        "Could not LISTEN for event log notifications, falling back to polling.",
+                        exc_info=True,
+                    )
+        return self._conn
+
+    def _reset_connection(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except psycopg2.Error:
+                pass
+            self._conn = None
+
+    def wait(self, timeout: float) -> bool:
+        with self._lock:
+            if self._closed:
+                return False
+
+            conn = self._get_listening_connection()
+            watched = [self._wakeup_recv, conn] if conn is not None else [self._wakeup_recv]
+            readable, _, _ = select.select(watched, [], [], timeout)
+            if conn is None or conn not in readable:
+                return False
+
+            try:
+                conn.poll()
+            except psycopg2.Error:
+                self._reset_connection()
+                return False
+
+            notified = bool(conn.notifies)
+            conn.notifies.clear()
+            return notified
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup_send.send(b"\0")
+        with self._lock:
+            self._reset_connection()
+            self._wakeup_send.close()
+            self._wakeup_recv.close()